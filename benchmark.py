@@ -0,0 +1,378 @@
+"""
+Performance benchmarks over scaled worlds.
+
+Builds headless games at several world scales and measures world
+generation time, simulation ticks per second (with a per-system
+breakdown), render frame time and save/load time, plus the traffic update
+cost in a busy city. Each run is written as
+JSON tagged with the git commit, so results can be compared across
+commits. Runs on a plain Linux box through SDL's dummy video driver.
+
+Usage:
+    python benchmark.py
+    python benchmark.py --scales small medium --ticks 300 --frames 30
+    python benchmark.py --compare old.json new.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import subprocess
+from contextlib import contextmanager
+
+# Some packages under src/ import their siblings as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import config
+from src.core.game import Game
+from src.systems.save_manager import SaveManager
+from src.systems.road_network import RoadNetwork
+from src.systems.traffic_manager import TrafficManager
+from src.world.grid import Grid
+from src.world.tile import TileType
+
+
+# World scales: grid size in tiles plus population
+SCALES = {
+    'small': {'width': 60, 'height': 45, 'npcs': 300, 'robots': 2, 'traffic': 10, 'props': 50},
+    'medium': {'width': 100, 'height': 75, 'npcs': 1500, 'robots': 10, 'traffic': 20, 'props': 100},
+    'large': {'width': 200, 'height': 150, 'npcs': 5000, 'robots': 40, 'traffic': 25, 'props': 400},
+}
+
+RESULTS_DIRECTORY = 'benchmark_results'
+
+
+@contextmanager
+def scaled_config(scale):
+    """Temporarily apply a world scale to the config module."""
+    overrides = {
+        'WORLD_WIDTH': scale['width'] * config.TILE_SIZE,
+        'WORLD_HEIGHT': scale['height'] * config.TILE_SIZE,
+        'NPC_LIMIT': scale['npcs'],
+        'STARTING_ROBOTS': scale['robots'],
+        'TRAFFIC_VEHICLES': scale['traffic'],
+        'PROP_COUNT': scale['props'],
+    }
+    saved = {name: getattr(config, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+
+
+def _timing_summary(samples_ms):
+    """Summarize durations (milliseconds) as avg/p50/p95/max."""
+    samples = sorted(samples_ms)
+    count = len(samples)
+    if not count:
+        return {'avg_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+    return {
+        'avg_ms': sum(samples) / count,
+        'p50_ms': samples[count // 2],
+        'p95_ms': samples[min(count - 1, int(count * 0.95))],
+        'max_ms': samples[-1],
+    }
+
+
+def _timed(function, *args):
+    """Call a function and return (result, seconds)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_scale(name, scale, ticks=200, frames=20, warmup=10, seed=1):
+    """
+    Run every measurement for one world scale.
+
+    Args:
+        name (str): Scale name
+        scale (dict): Grid size and population (see SCALES)
+        ticks (int): Simulation steps to time
+        frames (int): Rendered frames to time
+        warmup (int): Untimed steps/frames run first
+        seed (int): Seed for the global random module
+
+    Returns:
+        dict: Measurements for this scale
+    """
+    print(f"\n=== Benchmark: {name} ({scale['width']}x{scale['height']} tiles) ===")
+    random.seed(seed)
+
+    with scaled_config(scale):
+        game, generation_time = _timed(Game, True)
+
+        result = {
+            'scale': dict(scale),
+            'world': {
+                'npcs': len(game.npcs.npcs),
+                'robots': len(game.entities.robots),
+                'buildings': len(game.buildings.buildings),
+                'props': len(game.prop_manager.props),
+                'road_tiles': len(game.road_network.road_tiles),
+            },
+            'generation_seconds': generation_time,
+        }
+
+        # Simulation: fixed steps, with a per-system breakdown
+        game.run_ticks(warmup)
+        game.profiler.enable()
+        tick_times = []
+        for _ in range(ticks):
+            _, seconds = _timed(game.tick)
+            tick_times.append(seconds * 1000.0)
+        systems = {label: {'avg_ms': summary['avg_ms'], 'p95_ms': summary['p95_ms']}
+                   for label, summary in game.profiler.get_stats().items()}
+        game.profiler.disable()
+        game.profiler.reset()
+
+        total_seconds = sum(tick_times) / 1000.0
+        result['update'] = dict(_timing_summary(tick_times),
+                                ticks=ticks,
+                                ticks_per_second=ticks / total_seconds if total_seconds else 0.0,
+                                systems=systems)
+        print(f"  update: {result['update']['ticks_per_second']:.1f} ticks/s "
+              f"(p95 {result['update']['p95_ms']:.2f} ms)")
+
+        # Rendering through an off-screen display
+        game.enable_rendering()
+        for _ in range(warmup):
+            game.render()
+        frame_times = []
+        for _ in range(frames):
+            _, seconds = _timed(game.render)
+            frame_times.append(seconds * 1000.0)
+        result['render'] = dict(_timing_summary(frame_times), frames=frames)
+        print(f"  render: {result['render']['avg_ms']:.2f} ms/frame "
+              f"(p95 {result['render']['p95_ms']:.2f} ms)")
+
+        # Save/load round trip in a scratch directory
+        result['save_load'] = benchmark_save_load(game)
+
+        print(f"  generation: {generation_time:.2f} s")
+
+    return result
+
+
+def benchmark_save_load(game):
+    """
+    Time a full save and load of a game through SaveManager.
+
+    Args:
+        game: Game to save (its state is restored from the save afterwards)
+
+    Returns:
+        dict: Serialize/save/load/deserialize seconds and file size, or an
+            'error' entry if the game could not be saved
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_directory=directory)
+        try:
+            state, serialize_time = _timed(SaveManager.serialize_game_state, game)
+            saved, save_time = _timed(manager.save_game, state, 'benchmark')
+            if not saved:
+                raise RuntimeError("save_game failed")
+            size = os.path.getsize(manager._get_save_path('benchmark'))
+            loaded, load_time = _timed(manager.load_game, 'benchmark')
+            restored, deserialize_time = _timed(SaveManager.deserialize_game_state, game, loaded)
+            if not restored:
+                raise RuntimeError("deserialize_game_state failed")
+        except Exception as e:
+            print(f"  save/load: failed ({type(e).__name__}: {e})")
+            return {'error': f"{type(e).__name__}: {e}"}
+
+    print(f"  save: {save_time * 1000:.1f} ms, load: {load_time * 1000:.1f} ms, "
+          f"{size / 1024:.0f} KB")
+    return {
+        'serialize_seconds': serialize_time,
+        'save_seconds': save_time,
+        'load_seconds': load_time,
+        'deserialize_seconds': deserialize_time,
+        'file_bytes': size,
+    }
+
+
+class _Pedestrian:
+    """Stand-in pedestrian with just a world position."""
+
+    def __init__(self, world_x, world_y):
+        self.world_x = world_x
+        self.world_y = world_y
+
+
+def benchmark_traffic(vehicles=250, pedestrians=400, updates=30, size=100, seed=4):
+    """
+    Time TrafficManager updates in a busy grid city.
+
+    Args:
+        vehicles (int): Vehicles spawned on random road tiles
+        pedestrians (int): Pedestrians scattered over the map
+        updates (int): Updates to time
+        size (int): City size in tiles
+        seed (int): Seed for the global random module
+
+    Returns:
+        dict: Update timing summary and population
+    """
+    print(f"\n=== Benchmark: traffic ({vehicles} vehicles, {pedestrians} pedestrians) ===")
+    random.seed(seed)
+
+    grid = Grid(size, size)
+    for i in range(2, size - 2, 6):
+        for j in range(2, size - 2):
+            grid.set_tile_type(j, i, TileType.ROAD_TAR)
+            grid.set_tile_type(i, j, TileType.ROAD_ASPHALT)
+    manager = TrafficManager(grid, RoadNetwork(grid))
+    manager.max_vehicle_count = vehicles
+    manager.target_vehicle_count = 0
+    roads = sorted(manager.road_network.road_tiles)
+    while len(manager.vehicles) < vehicles:
+        manager.spawn_vehicle_at(*random.choice(roads))
+    world_size = size * grid.tile_size
+    npcs = [_Pedestrian(random.uniform(0, world_size), random.uniform(0, world_size))
+            for _ in range(pedestrians)]
+
+    manager.update(0.016, npcs=npcs, time_of_day=12.0)
+    update_times = []
+    for _ in range(updates):
+        _, seconds = _timed(manager.update, 0.016, npcs, 12.0)
+        update_times.append(seconds * 1000.0)
+
+    result = dict(_timing_summary(update_times), updates=updates,
+                  vehicles=len(manager.vehicles), pedestrians=pedestrians)
+    print(f"  update: {result['avg_ms']:.2f} ms (p95 {result['p95_ms']:.2f} ms)")
+    return result
+
+
+def _git_commit():
+    """Get the current commit hash, or 'unknown' outside a git checkout."""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run_benchmarks(scale_names, ticks=200, frames=20, warmup=10, seed=1):
+    """
+    Benchmark several scales.
+
+    Args:
+        scale_names (list): Keys of SCALES to run
+        ticks (int): Simulation steps timed per scale
+        frames (int): Rendered frames timed per scale
+        warmup (int): Untimed steps/frames per scale
+        seed (int): Random seed
+
+    Returns:
+        dict: Run metadata and per-scale results
+    """
+    return {
+        'commit': _git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'settings': {'ticks': ticks, 'frames': frames, 'warmup': warmup, 'seed': seed},
+        'results': {name: benchmark_scale(name, SCALES[name], ticks, frames, warmup, seed)
+                    for name in scale_names},
+        'traffic': benchmark_traffic(),
+    }
+
+
+def compare(old, new):
+    """
+    Print the headline metrics of two runs side by side.
+
+    Args:
+        old (dict): Earlier run
+        new (dict): Later run
+
+    Returns:
+        dict: scale -> metric -> new/old ratio
+    """
+    metrics = [
+        ('generation_seconds', lambda r: r['generation_seconds']),
+        ('update.ticks_per_second', lambda r: r['update']['ticks_per_second']),
+        ('update.p95_ms', lambda r: r['update']['p95_ms']),
+        ('render.avg_ms', lambda r: r['render']['avg_ms']),
+        ('save_seconds', lambda r: r['save_load'].get('save_seconds')),
+        ('load_seconds', lambda r: r['save_load'].get('load_seconds')),
+    ]
+
+    print(f"{old['commit']} -> {new['commit']}")
+    ratios = {}
+    for name in old['results']:
+        if name not in new['results']:
+            continue
+        print(f"\n{name}:")
+        ratios[name] = {}
+        for metric, get in metrics:
+            before = get(old['results'][name])
+            after = get(new['results'][name])
+            if before is None or after is None:
+                print(f"  {metric:26s} {'n/a':>10s}")
+                continue
+            ratio = after / before if before else float('inf')
+            ratios[name][metric] = ratio
+            print(f"  {metric:26s} {before:10.3f} -> {after:10.3f}  ({ratio:.2f}x)")
+
+    if 'traffic' in old and 'traffic' in new:
+        before = old['traffic']['avg_ms']
+        after = new['traffic']['avg_ms']
+        ratio = after / before if before else float('inf')
+        ratios['traffic'] = {'avg_ms': ratio}
+        print(f"\ntraffic:\n  {'update.avg_ms':26s} {before:10.3f} -> {after:10.3f}  ({ratio:.2f}x)")
+    return ratios
+
+
+def main():
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description="Recycling Factory benchmarks")
+    parser.add_argument('--scales', nargs='+', choices=list(SCALES), default=list(SCALES))
+    parser.add_argument('--ticks', type=int, default=200)
+    parser.add_argument('--frames', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="result file (default benchmark_results/<commit>_<time>.json)")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="compare two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        compare(old, new)
+        return 0
+
+    run = run_benchmarks(args.scales, args.ticks, args.frames, args.warmup, args.seed)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIRECTORY, exist_ok=True)
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        output = os.path.join(RESULTS_DIRECTORY, f"{run['commit']}_{stamp}.json")
+    with open(output, 'w') as f:
+        json.dump(run, f, indent=2)
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,6 +7,8 @@ Modify these values to change game settings.
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+SIMULATION_DT = 1.0 / 60  # Fixed simulation step in seconds
+MAX_SIMULATION_STEPS = 5  # Most steps run per frame when catching up
 WINDOW_TITLE = "Recycling Factory"
 
 # Grid settings
@@ -14,12 +16,23 @@ TILE_SIZE = 32
 WORLD_WIDTH = 3200  # 100 tiles wide
 WORLD_HEIGHT = 2400  # 75 tiles tall
 
+# Pathfinding settings
+HIERARCHICAL_PATHFINDING = False  # Use HPA* for robot paths (for large worlds)
+PATH_CLUSTER_SIZE = 10  # Cluster size in tiles for hierarchical pathfinding
+
+# World population
+NPC_LIMIT = None  # Maximum NPCs spawned in the city (None = 1-3 per building)
+TRAFFIC_VEHICLES = 10  # Target number of moving traffic vehicles
+PARKED_VEHICLES = 30
+PROP_COUNT = 100  # Benches, light poles, trash cans, ...
+
 # Game settings
 STARTING_MONEY = 10000
-STARTING_ROBOTS = 2
+STARTING_ROBOTS = 2  # Autonomous robots (plus one manual robot)
 TIME_SCALE = 60  # 1 real second = 1 game minute
 
 # Debug settings
 DEBUG_MODE = True
 SHOW_FPS = True
 SHOW_GRID = True
+PROFILE_SYSTEMS = False  # Time every system's update/render from startup (F3 toggles)
@@ -3,18 +3,40 @@ Main entry point for Recycling Factory game.
 
 To run the game:
     python main.py
+
+To run the simulation without a window:
+    python main.py --headless --ticks 3600
 """
 
+import os
 import sys
+import argparse
+
+# Some packages under src/ import their siblings as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
 import pygame
 from src.core.game import Game
 
 
 def main():
     """Initialize and run the game."""
+    parser = argparse.ArgumentParser(description="Recycling Factory")
+    parser.add_argument('--headless', action='store_true',
+                        help="run the simulation without a window")
+    parser.add_argument('--ticks', type=int, default=3600,
+                        help="simulation steps to run in headless mode")
+    args = parser.parse_args()
+
     try:
-        game = Game()
-        game.run()
+        game = Game(headless=args.headless)
+        if args.headless:
+            stats = game.run_ticks(args.ticks)
+            print(f"Simulated {stats['simulated_seconds']:.1f}s in {stats['wall_seconds']:.2f}s "
+                  f"({stats['ticks_per_second']:.0f} ticks/s)")
+            game.save_manager.wait_for_background_save()
+        else:
+            game.run()
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -5,11 +5,14 @@ This is a starter template. You'll expand this as you progress through
 the development phases.
 """
 
+import os
+import time
 import pygame
 import random
 import config
 from src.world.grid import Grid
 from src.rendering.camera import Camera
+from src.rendering.text_cache import get_font
 from src.systems.entity_manager import EntityManager
 from src.systems.resource_manager import ResourceManager
 from src.systems.building_manager import BuildingManager
@@ -22,10 +25,10 @@ from src.systems.npc_manager import NPCManager
 from src.systems.detection_manager import DetectionManager
 from src.systems.suspicion_manager import SuspicionManager
 from src.systems.police_manager import PoliceManager
+from src.systems.hierarchical_pathfinding import HierarchicalPathfinder
 from src.ui.hud import HUD
 from src.ui.research_ui import ResearchUI
 from src.entities.buildings import Factory, LandfillGasExtraction
-from src.world.river_generator import RiverGenerator
 from src.world.bridge_builder import BridgeBuilder
 from src.systems.road_network import RoadNetwork
 from src.systems.traffic_manager import TrafficManager
@@ -40,25 +43,51 @@ from src.systems.save_manager import SaveManager
 from src.ui.save_load_menu import SaveLoadMenu
 from src.ui.controls_help import ControlsHelp
 from src.ui.minimap import Minimap
+from src.ui.profiler_overlay import ProfilerOverlay
+from src.ui.notification_system import NotificationSystem
+from src.ui.notification_toasts import NotificationToasts
+from src.utils.profiler import FrameProfiler
 
 
 class Game:
     """Main game controller."""
 
-    def __init__(self):
-        """Initialize the game."""
-        # Initialize Pygame
+    def __init__(self, headless: bool = False, game_state: dict = None):
+        """
+        Initialize the game.
+
+        Args:
+            headless (bool): Run without a window or UI, for batch
+                simulations, AI training and benchmarks
+            game_state (dict): Saved state to start from (see
+                SaveManager.load_game); world generation and the starting
+                setup are skipped, which makes loading much faster than
+                starting a new game
+        """
+        self.headless = headless
+
+        # Initialize Pygame (headless uses SDL's dummy drivers)
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
         pygame.init()
 
         # Create game window
-        self.screen = pygame.display.set_mode(
-            (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-        )
-        pygame.display.set_caption(config.WINDOW_TITLE)
+        if headless:
+            self.screen = None
+        else:
+            self.screen = pygame.display.set_mode(
+                (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+            )
+            pygame.display.set_caption(config.WINDOW_TITLE)
 
         # Clock for controlling frame rate
         self.clock = pygame.time.Clock()
 
+        # Fixed-timestep simulation progress
+        self.tick_count = 0
+        self.simulation_time = 0.0
+
         # Game state
         self.running = True
         self.paused = False
@@ -73,52 +102,64 @@ class Game:
         # Initialize camera
         self.camera = Camera(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
 
-        # Initialize grid (world size from config)
+        # Initialize grid (world size from config, or from the save)
         grid_width = config.WORLD_WIDTH // config.TILE_SIZE
         grid_height = config.WORLD_HEIGHT // config.TILE_SIZE
+        if game_state is not None:
+            grid_width = game_state["grid"]["store"]["width"]
+            grid_height = game_state["grid"]["store"]["height"]
         self.grid = Grid(grid_width, grid_height, config.TILE_SIZE)
 
         # Set camera bounds to world size
-        self.camera.set_bounds(config.WORLD_WIDTH, config.WORLD_HEIGHT)
-
-        # Create test world
-        self.grid.create_test_world()
-
-        # Generate procedural city
-        self.grid.generate_city(seed=42)  # Use seed for consistent testing
+        self.camera.set_bounds(grid_width * config.TILE_SIZE, grid_height * config.TILE_SIZE)
 
         # Initialize geographic features (rivers, bridges, ocean)
-        self.river_generator = RiverGenerator(self.grid, seed=42)
+        self.river_generator = None
         self.bridge_builder = BridgeBuilder(self.grid, resource_manager=None)
 
-        # Generate geographic features
-        self._generate_geographic_features()
+        if game_state is None:
+            # Create test world
+            self.grid.create_test_world()
+
+            # Generate procedural city
+            self.grid.generate_city(seed=42)  # Use seed for consistent testing
+
+            # Generate geographic features
+            self._generate_geographic_features()
 
         # Initialize traffic system (road network and traffic manager)
         self.road_network = RoadNetwork(self.grid)
         self.traffic_manager = TrafficManager(self.grid, self.road_network)
-        self.traffic_manager.set_target_vehicle_count(10)  # Moderate traffic
+        self.traffic_manager.set_target_vehicle_count(config.TRAFFIC_VEHICLES)
 
         # Initialize bus system (public transportation)
         self.bus_manager = BusManager(self.grid, self.road_network)
         self.bus_manager.target_routes = 3  # Generate 3 bus routes
         self.bus_manager.buses_per_route = 2  # 2 buses per route
-        self.bus_manager.generate_routes()
-        self.bus_manager.spawn_buses()
 
-        # Generate parked vehicles along roads (static decoration)
-        self.traffic_manager.generate_parked_vehicles(count=30)
+        # Parked vehicles are static decoration, drawn into the terrain
+        # cache since they never move
+        self.traffic_manager.bake_parked_vehicles = True
 
         # Initialize prop system (benches, light poles, trash cans, bicycles)
         self.prop_manager = PropManager(self.grid, self.road_network)
-        self.prop_manager.target_prop_count = 100  # Target number of props
-        self.prop_manager.generate_props()
+        self.prop_manager.target_prop_count = config.PROP_COUNT
 
         # Initialize camera system (security cameras for surveillance)
         self.camera_manager = CameraManager(self.grid, self.road_network)
         self.camera_manager.target_camera_count = 25  # Target number of cameras
-        # Note: Police stations will be added in future phase, for now place on roads/buildings
-        self.camera_manager.place_cameras()
+
+        if game_state is None:
+            self.bus_manager.generate_routes()
+            self.bus_manager.spawn_buses()
+
+            # Generate parked vehicles along roads
+            self.traffic_manager.generate_parked_vehicles(count=config.PARKED_VEHICLES)
+
+            self.prop_manager.generate_props()
+
+            # Note: Police stations will be added in future phase, for now place on roads/buildings
+            self.camera_manager.place_cameras()
 
         # Center camera on factory (middle of world)
         self.camera.center_on(config.WORLD_WIDTH // 2, config.WORLD_HEIGHT // 2)
@@ -134,40 +175,51 @@ class Game:
         self.npcs = NPCManager(self.grid)
         self.detection = DetectionManager(self.grid, self.npcs)
         self.suspicion = SuspicionManager()
-        self.police = PoliceManager(self.grid, self.suspicion)
+        self.police = PoliceManager(self.grid, self.suspicion, self.road_network)
 
         # Initialize material inventory system (tracks materials by source for inspections)
         # Must be created before EntityManager so robots can track material sources
         self.material_inventory = MaterialInventory()
 
+        # Hierarchical pathfinding keeps robot path searches cheap on large worlds
+        pathfinder = None
+        if config.HIERARCHICAL_PATHFINDING:
+            pathfinder = HierarchicalPathfinder(self.grid, cluster_size=config.PATH_CLUSTER_SIZE)
+
         # Initialize entity manager with material inventory for source tracking
         self.entities = EntityManager(
             grid=self.grid,
             resource_manager=self.resources,
             research_manager=self.research,
-            material_inventory=self.material_inventory
+            material_inventory=self.material_inventory,
+            pathfinder=pathfinder
         )
-
-        self.ui = HUD(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-        self.research_ui = ResearchUI(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        # Factory, warehouses and silos become drop-offs for returning robots
+        self.buildings.add_listener(self.entities.on_building_changed)
 
         # Initialize camera hacking system (requires camera_manager, research, and suspicion)
         self.camera_hacking = CameraHackingManager(self.camera_manager, self.research, self.suspicion)
 
         # Initialize inspection system (requires resources, suspicion, and material inventory)
         self.inspection = InspectionManager(self.resources, self.suspicion, self.material_inventory)
-        self.inspection_ui = InspectionUI(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
 
         # Initialize save/load system
         self.save_manager = SaveManager()
-        self.save_load_menu = SaveLoadMenu(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-
-        # Initialize controls/help overlay
-        self.controls_help = ControlsHelp(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
 
-        # Initialize minimap
-        self.minimap = Minimap(config.SCREEN_WIDTH, config.SCREEN_HEIGHT,
-                              config.WORLD_WIDTH, config.WORLD_HEIGHT)
+        # Player-facing notifications (e.g. background save results)
+        self.notifications = NotificationSystem()
+
+        # Initialize UI (HUD, menus, overlays, minimap); headless games have none
+        self.ui = None
+        self.research_ui = None
+        self.inspection_ui = None
+        self.save_load_menu = None
+        self.controls_help = None
+        self.minimap = None
+        self.profiler_overlay = None
+        self.notification_toasts = None
+        if not headless:
+            self._create_ui()
 
         # Game statistics tracking
         self.stats = {
@@ -179,40 +231,146 @@ class Game:
         # Factory reference (for visual upgrades)
         self.factory = None
 
-        # Place starting buildings
-        self._place_starting_buildings()
+        # Connect NPC manager to bus manager for bus passenger behavior
+        self.npcs.bus_manager = self.bus_manager
+
+        if game_state is None:
+            # Place starting buildings
+            self._place_starting_buildings()
 
-        # Create initial game entities
-        self._create_test_entities()
+            # Create initial game entities
+            self._create_test_entities()
 
-        # Add test pollution sources (factory generates pollution)
-        center_grid_x = (config.WORLD_WIDTH // config.TILE_SIZE) // 2
-        center_grid_y = (config.WORLD_HEIGHT // config.TILE_SIZE) // 2
-        self.pollution.add_source(center_grid_x, center_grid_y, 2.0)  # Factory pollution
-        self.pollution.add_source(15, 20, 1.0)  # Landfill gas extraction pollution
+            # Add test pollution sources (factory generates pollution)
+            center_grid_x = (config.WORLD_WIDTH // config.TILE_SIZE) // 2
+            center_grid_y = (config.WORLD_HEIGHT // config.TILE_SIZE) // 2
+            self.pollution.add_source(center_grid_x, center_grid_y, 2.0)  # Factory pollution
+            self.pollution.add_source(15, 20, 1.0)  # Landfill gas extraction pollution
 
-        # Register landfill tiles as pollution sources
-        self._register_landfill_pollution()
+            # Register landfill tiles as pollution sources
+            self._register_landfill_pollution()
 
-        # Spawn vehicles throughout the city
-        self.vehicles.spawn_vehicles_in_city(seed=42, vehicle_density=0.4)
+            # Spawn vehicles throughout the city
+            self.vehicles.spawn_vehicles_in_city(seed=42, vehicle_density=0.4)
 
-        # Spawn fences around buildings
-        self.fences.spawn_fences_around_buildings(seed=42, fence_coverage=0.6)
+            # Spawn fences around buildings
+            self.fences.spawn_fences_around_buildings(seed=42, fence_coverage=0.6)
 
-        # Spawn NPCs in the city
-        self.npcs.spawn_npcs_in_city(seed=42)
+            # Spawn NPCs in the city
+            self.npcs.spawn_npcs_in_city(seed=42, max_npcs=config.NPC_LIMIT)
 
-        # Connect NPC manager to bus manager for bus passenger behavior
-        self.npcs.bus_manager = self.bus_manager
+            # Spawn initial police patrols
+            self.police.spawn_initial_patrols(seed=42)
+        elif not SaveManager.deserialize_game_state(self, game_state):
+            raise ValueError("Saved game state could not be restored")
 
-        # Spawn initial police patrols
-        self.police.spawn_initial_patrols(seed=42)
+        # Per-system timings (costs nothing until enabled, e.g. with F3)
+        self.profiler = FrameProfiler()
+        self._register_profiled_systems()
+        if config.PROFILE_SYSTEMS:
+            self.profiler.enable()
 
         print("Game initialized successfully!")
         print(f"World size: {config.WORLD_WIDTH}x{config.WORLD_HEIGHT} pixels")
         print(f"Grid size: {grid_width}x{grid_height} tiles")
 
+    def _create_ui(self):
+        """Create the HUD, menus, overlays and minimap."""
+        self.ui = HUD(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.research_ui = ResearchUI(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.inspection_ui = InspectionUI(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.save_load_menu = SaveLoadMenu(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.controls_help = ControlsHelp(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.minimap = Minimap(config.SCREEN_WIDTH, config.SCREEN_HEIGHT,
+                               config.WORLD_WIDTH, config.WORLD_HEIGHT)
+        self.profiler_overlay = ProfilerOverlay(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.notification_toasts = NotificationToasts(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+
+    def enable_rendering(self):
+        """
+        Open the display and build the UI for a game started headless.
+
+        Under SDL's dummy video driver this gives an off-screen display, so
+        rendering can still be exercised (e.g. by benchmarks) without a window.
+        """
+        if not self.headless:
+            return
+        self.screen = pygame.display.set_mode(
+            (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        )
+        pygame.display.set_caption(config.WINDOW_TITLE)
+        self._create_ui()
+        self.headless = False
+        self._register_profiled_ui()
+
+    def _register_profiled_systems(self):
+        """Register every system's update and render calls with the profiler."""
+        profiler = self.profiler
+        profiler.watch(self, 'update', 'frame.update')
+        profiler.watch(self, 'render', 'frame.render')
+
+        systems = {
+            'camera': self.camera,
+            'grid': self.grid,
+            'buildings': self.buildings,
+            'power': self.power,
+            'research': self.research,
+            'entities': self.entities,
+            'resources': self.resources,
+            'pollution': self.pollution,
+            'vehicles': self.vehicles,
+            'traffic': self.traffic_manager,
+            'buses': self.bus_manager,
+            'props': self.prop_manager,
+            'cameras': self.camera_manager,
+            'camera_hacking': self.camera_hacking,
+            'fences': self.fences,
+            'npcs': self.npcs,
+            'detection': self.detection,
+            'suspicion': self.suspicion,
+            'police': self.police,
+            'inspection': self.inspection,
+        }
+        for name, system in systems.items():
+            profiler.watch(system, 'update', f"update.{name}")
+            profiler.watch(system, 'render', f"render.{name}")
+
+        # Overlays drawn by methods other than render()
+        profiler.watch(self.detection, 'render_detection_ui', 'render.detection')
+        profiler.watch(self.camera_hacking, 'render_ui', 'render.camera_hacking')
+        profiler.watch(self.pollution, 'render_overlay', 'render.pollution')
+
+        self._register_profiled_ui()
+
+    def _register_profiled_ui(self):
+        """Register the UI panels' render calls with the profiler."""
+        for name, ui in (('hud', self.ui), ('research_ui', self.research_ui),
+                         ('inspection_ui', self.inspection_ui),
+                         ('save_load_menu', self.save_load_menu),
+                         ('controls_help', self.controls_help),
+                         ('minimap', self.minimap)):
+            if ui is not None:
+                self.profiler.watch(ui, 'render', f"render.{name}")
+
+    def dump_profile(self, directory: str = 'profiles'):
+        """
+        Write the current profiler statistics as JSON and CSV.
+
+        Args:
+            directory (str): Output directory (created if needed)
+
+        Returns:
+            tuple: (json_path, csv_path)
+        """
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        json_path = os.path.join(directory, f"profile_{stamp}.json")
+        csv_path = os.path.join(directory, f"profile_{stamp}.csv")
+        self.profiler.dump_json(json_path)
+        self.profiler.dump_csv(csv_path)
+        print(f"Profile written to {json_path} and {csv_path}")
+        return json_path, csv_path
+
     def _place_starting_buildings(self):
         """Place the starting buildings (Factory and Landfill Gas Extraction)."""
         # Calculate center of world in grid coordinates
@@ -240,9 +398,10 @@ class Game:
         center_x = config.WORLD_WIDTH // 2
         center_y = config.WORLD_HEIGHT // 2
 
-        # Create 2 autonomous robots
-        self.entities.create_robot(center_x - 50, center_y + 100, autonomous=True)
-        self.entities.create_robot(center_x + 50, center_y + 100, autonomous=True)
+        # Create autonomous robots in rows of ten below the factory
+        for i in range(config.STARTING_ROBOTS):
+            self.entities.create_robot(center_x - 50 + (i % 10) * 100,
+                                       center_y + 100 + (i // 10) * 40, autonomous=True)
 
         # Create 1 manual robot for player control
         manual_robot = self.entities.create_robot(center_x, center_y + 150, autonomous=False)
@@ -272,80 +431,125 @@ class Game:
 
     def _generate_geographic_features(self):
         """Generate rivers, ocean, and bridges for the game world."""
-        print("Generating geographic features...")
-
-        # Generate ocean at south edge (for aesthetic/gameplay boundary)
-        ocean_stats = self.river_generator.generate_ocean(
-            edges=['south'],
-            depth=4,
-            create_docks=True,
-            dock_spacing=12
-        )
-
-        # Generate 1-2 rivers across the map
+        # Rivers and an ocean edge along the south (gameplay boundary)
         river_count = random.randint(1, 2)
-        for i in range(river_count):
-            self.river_generator.generate_random_river(
-                width_range=(3, 4),
-                length_range=(25, 40),
-                meandering=0.25,
-                avoid_buildings=True
-            )
-
-        # Auto-place bridges at narrow crossing points
-        bridge_results = self.bridge_builder.auto_place_bridges(
-            max_bridges=3,
-            max_width=6,
-            min_width=2,
-            pay_cost=False  # Free bridges during world generation
-        )
+        self.grid.generate_geographic_features(seed=42, num_rivers=river_count,
+                                               ocean_edges=['south'])
+        self.river_generator = self.grid.river_generator
 
-        successful_bridges = sum(1 for success, _, _ in bridge_results if success)
-        print(f"Geographic features generated: {ocean_stats['ocean_tiles']} ocean tiles, "
-              f"{ocean_stats['dock_tiles']} docks, {river_count} rivers, {successful_bridges} bridges")
+        # Bridges where city roads cross the water
+        self.grid.place_bridges_on_roads()
 
     def _register_landfill_pollution(self):
         """Register all landfill tiles as pollution sources based on their fullness."""
         from src.world.tile import TileType
 
         landfill_count = 0
-        for y in range(self.grid.height_tiles):
-            for x in range(self.grid.width_tiles):
-                tile = self.grid.get_tile(x, y)
-                if tile and tile.tile_type == TileType.LANDFILL:
-                    # Calculate pollution based on fullness (inverse of depletion)
-                    fullness = 1.0 - tile.depletion_level
-                    pollution_rate = fullness * 0.5  # Max 0.5 per tile when full
-                    if pollution_rate > 0:
-                        self.pollution.add_source(x, y, pollution_rate)
-                        landfill_count += 1
+        depletion = self.grid.store.depletion_level
+        for x, y in self.grid.find_tiles(TileType.LANDFILL):
+            # Calculate pollution based on fullness (inverse of depletion)
+            fullness = 1.0 - float(depletion[y, x])
+            pollution_rate = fullness * 0.5  # Max 0.5 per tile when full
+            if pollution_rate > 0:
+                self.pollution.add_source(x, y, pollution_rate)
+                landfill_count += 1
 
         print(f"Registered {landfill_count} landfill tiles as pollution sources")
 
     def run(self):
-        """Main game loop."""
+        """
+        Main game loop.
+
+        The simulation advances in fixed steps of config.SIMULATION_DT,
+        however long a frame takes to render; slow frames run several steps
+        (up to config.MAX_SIMULATION_STEPS) to catch up.
+        """
         print("Starting game loop...")
 
+        accumulator = 0.0
+        max_frame_time = config.SIMULATION_DT * config.MAX_SIMULATION_STEPS
+
         while self.running:
-            # Calculate delta time (time since last frame)
-            dt = self.clock.tick(config.FPS) / 1000.0  # Convert to seconds
+            # Calculate frame time (time since last frame)
+            frame_time = self.clock.tick(config.FPS) / 1000.0  # Convert to seconds
 
             # Process events
             self.handle_events()
 
-            # Update game state (unless paused)
+            # Update game state in fixed steps (unless paused)
             if not self.paused:
-                self.update(dt)
+                accumulator += min(frame_time, max_frame_time)
+                while accumulator >= config.SIMULATION_DT:
+                    self.tick()
+                    accumulator -= config.SIMULATION_DT
 
             # Render to screen
-            self.render()
+            if not self.headless:
+                self.render()
 
-        # Clean up
+        # Clean up (let a running background save finish first)
+        if self.save_manager.is_saving():
+            self.save_manager.wait_for_background_save()
         pygame.quit()
         print("Game ended.")
 
+    def tick(self, dt: float = None):
+        """
+        Advance the simulation by one fixed step.
+
+        Args:
+            dt (float, optional): Step length in seconds (default config.SIMULATION_DT)
+        """
+        if dt is None:
+            dt = config.SIMULATION_DT
+        self.update(dt)
+        self.tick_count += 1
+        self.simulation_time += dt
+
+    def run_ticks(self, ticks: int, dt: float = None, on_tick=None) -> dict:
+        """
+        Advance the simulation a number of steps as fast as possible.
+
+        Nothing is rendered and the frame clock is not consulted, so this is
+        the entry point for batch simulations, AI training and benchmarks.
+        The pause flag is ignored.
+
+        Args:
+            ticks (int): Number of steps to run
+            dt (float, optional): Step length in seconds (default config.SIMULATION_DT)
+            on_tick (callable, optional): Called as on_tick(game, dt) after each
+                step (e.g. to update a GameAI); returning False stops early
+
+        Returns:
+            dict: Run statistics (ticks, simulated and wall-clock seconds)
+        """
+        if dt is None:
+            dt = config.SIMULATION_DT
+
+        start = time.perf_counter()
+        completed = 0
+        for _ in range(ticks):
+            self.tick(dt)
+            completed += 1
+            if on_tick is not None and on_tick(self, dt) is False:
+                break
+        wall_time = time.perf_counter() - start
+
+        return {
+            'ticks': completed,
+            'simulated_seconds': completed * dt,
+            'wall_seconds': wall_time,
+            'ticks_per_second': completed / wall_time if wall_time > 0 else 0.0,
+        }
+
     def handle_events(self):
         """Process user input and system events."""
+        if self.headless:
+            # No window: only a quit request can arrive
+            if pygame.event.get(pygame.QUIT):
+                self.running = False
+            return
+
         for event in pygame.event.get():
             # Let controls help handle events first if visible
             if self.controls_help.handle_event(event):
@@ -405,6 +609,15 @@ class Game:
                 elif event.key == pygame.K_m:
                     self.minimap.toggle()
                     print(f"Minimap: {'visible' if self.minimap.visible else 'hidden'}")
+                # F3 key to toggle the profiler and its overlay
+                elif event.key == pygame.K_F3:
+                    self.profiler_overlay.toggle()
+                    if self.profiler_overlay.visible != self.profiler.enabled:
+                        self.profiler.toggle()
+                    print(f"Profiler: {'ON' if self.profiler.enabled else 'OFF'}")
+                # F4 key to write the profile to disk
+                elif event.key == pygame.K_F4:
+                    self.dump_profile()
 
             # Mouse motion (for hover effects)
             elif event.type == pygame.MOUSEMOTION:
@@ -444,15 +657,14 @@ class Game:
 
     def update(self, dt):
         """Update game logic."""
-        # Handle save/load menu requests
-        self._process_save_load_requests()
+        # Handle save/load menu requests and robot movement input
+        if not self.headless:
+            self._process_save_load_requests()
+            self._handle_robot_input()
 
         # Adjust delta time by game speed
         adjusted_dt = dt * self.game_speed
 
-        # Handle robot movement input
-        self._handle_robot_input()
-
         # Update camera
         self.camera.update(adjusted_dt)
 
@@ -558,9 +770,13 @@ class Game:
                     self.hour = 0
                     print(f"\n=== Day {self.day} ===")
 
-                    # Auto-save check (every N days)
-                    game_state = SaveManager.serialize_game_state(self)
-                    self.save_manager.auto_save(game_state, self.day)
+                    # Auto-save check (every N days); the file is written in the background
+                    if self.save_manager.is_auto_save_due(self.day):
+                        try:
+                            game_state = SaveManager.serialize_game_state(self)
+                            self.save_manager.auto_save(game_state, self.day, background=True)
+                        except Exception as e:
+                            self.notifications.error(f"Auto-save failed: {e}")
 
         # Check if police captured any robots (game over condition)
         captured = self.police.check_captures(self.entities.robots)
@@ -568,9 +784,13 @@ class Game:
             # TODO: Implement game over
             print("⚠️ GAME OVER: Police captured robot!")
 
+        # Report finished background saves
+        self._poll_background_save()
+        self.notifications.update(dt)
+
         # Update minimap (hover detection)
-        mouse_pos = pygame.mouse.get_pos()
-        self.minimap.update(mouse_pos)
+        if self.minimap is not None:
+            self.minimap.update(pygame.mouse.get_pos())
 
     def _handle_robot_input(self):
         """Handle arrow key input for controlling the selected robot."""
@@ -596,6 +816,9 @@ class Game:
 
     def render(self):
         """Render game to screen."""
+        if self.headless:
+            return
+
         # Clear screen
         self.screen.fill((20, 20, 20))  # Dark gray background
 
@@ -662,9 +885,15 @@ class Game:
         # Render minimap (if visible)
         self.minimap.render(self.screen, self.grid, self.entities, self.camera, self.buildings)
 
+        # Render profiler timings (if visible)
+        self.profiler_overlay.render(self.screen, self.profiler)
+
+        # Render notification toasts
+        self.notification_toasts.render(self.screen, self.notifications)
+
         # Show paused indicator
         if self.paused:
-            font = pygame.font.Font(None, 72)
+            font = get_font(72)
             text = font.render("PAUSED", True, (255, 255, 0))
             text_rect = text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2))
             # Draw semi-transparent background
@@ -677,11 +906,25 @@ class Game:
         # Update display
         pygame.display.flip()
 
+    def _poll_background_save(self):
+        """Turn a finished background save into a notification."""
+        result = self.save_manager.poll_background_save()
+        if result is None:
+            return
+        if result['success']:
+            self.notifications.success(f"Game saved ({result['save_name']})")
+        else:
+            self.notifications.error(f"Save failed: {result['error']}")
+
     def _quick_save(self):
         """Quick save the game to the quicksave slot."""
         print("\n=== QUICK SAVE ===")
-        game_state = SaveManager.serialize_game_state(self)
-        success = self.save_manager.quick_save(game_state)
+        try:
+            game_state = SaveManager.serialize_game_state(self)
+            success = self.save_manager.quick_save(game_state)
+        except Exception as e:
+            self.notifications.error(f"Quick save failed: {e}")
+            success = False
         if success:
             print("✓ Quick save successful! (Press F9 to load)")
         else:
@@ -4,6 +4,7 @@ Building entity - base class for all factory buildings.
 
 import pygame
 from src.entities.entity import Entity
+from src.rendering.text_cache import get_font
 
 
 class Building(Entity):
@@ -279,7 +280,7 @@ class Building(Entity):
         pygame.draw.rect(screen, (100, 200, 100), (bar_x, bar_y, progress_width, bar_height))
 
         # Progress percentage text
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         progress_text = font.render(f"{int(progress * 100)}%", True, (255, 255, 255))
         text_x = screen_x + (self.width - progress_text.get_width()) // 2
         text_y = screen_y + self.height - bar_height - 18
@@ -326,7 +327,7 @@ class Building(Entity):
 
             # Level indicator (for upgraded buildings)
             if self.level > 1:
-                font = pygame.font.Font(None, 20)
+                font = get_font(20)
                 level_text = font.render(f"L{self.level}", True, (255, 255, 0))
                 screen.blit(level_text, (screen_x + 4, screen_y + 4))
 
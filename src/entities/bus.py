@@ -12,6 +12,7 @@ import pygame
 from typing import List, Optional, Set
 from src.entities.traffic_vehicle import TrafficVehicle
 from src.entities.npc import Activity
+from src.rendering.text_cache import get_font
 
 
 class Bus(TrafficVehicle):
@@ -324,7 +325,7 @@ class Bus(TrafficVehicle):
 
         # Render route number on top of bus
         if camera.zoom >= 0.8:  # Only show when zoomed in enough
-            font = pygame.font.Font(None, max(16, int(20 * camera.zoom)))
+            font = get_font(max(16, int(20 * camera.zoom)))
             route_label = f"#{self.route_id} EXP" if self.is_express else f"#{self.route_id}"
             route_text = font.render(route_label, True, (255, 255, 255))
             text_rect = route_text.get_rect(center=(screen_x, screen_y - height_px // 2 - 8))
@@ -338,7 +339,7 @@ class Bus(TrafficVehicle):
         # Render passenger count indicator with crowding color
         if camera.zoom >= 0.6:
             passenger_count = len(self.passengers)
-            font_small = pygame.font.Font(None, max(14, int(16 * camera.zoom)))
+            font_small = get_font(max(14, int(16 * camera.zoom)))
 
             # Color-code based on crowding level
             crowding = self.get_crowding_level()
@@ -7,6 +7,7 @@ NPCs can wait here for buses to arrive.
 
 import pygame
 from typing import Set
+from src.rendering.text_cache import get_font
 
 
 class BusStop:
@@ -161,7 +162,7 @@ class BusStop:
         route_text = ",".join(str(r) for r in sorted(self.route_ids))
 
         font_size = max(12, int(14 * zoom))
-        font = pygame.font.Font(None, font_size)
+        font = get_font(font_size)
         text_surface = font.render(route_text, True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(center_x, center_y - int(15 * zoom)))
 
@@ -7,6 +7,7 @@ Represents a building under construction, showing progress and requirements.
 import pygame
 from src.entities.entity import Entity
 from typing import Dict, Optional
+from src.rendering.text_cache import get_font
 
 
 class ConstructionSite(Entity):
@@ -282,7 +283,7 @@ class ConstructionSite(Entity):
 
     def _render_worker_count(self, screen, screen_x, screen_y):
         """Render number of robots working."""
-        font = pygame.font.Font(None, 18)
+        font = get_font(18)
         worker_text = f"👷 {len(self.robots_working)}/{self.max_workers}"
         text_surface = font.render(worker_text, True, (255, 255, 255))
 
@@ -315,7 +316,7 @@ class ConstructionSite(Entity):
         pygame.draw.rect(screen, (80, 80, 80), (bar_x, bar_y, bar_width, bar_height), 1)
 
         # Progress percentage
-        font = pygame.font.Font(None, 16)
+        font = get_font(16)
         progress_text = f"{int(self.progress * 100)}%"
         text_surface = font.render(progress_text, True, (255, 255, 255))
         text_x = screen_x + (self.width - text_surface.get_width()) // 2
@@ -9,6 +9,8 @@ import pygame
 import random
 import math
 from typing import Tuple, Optional, Dict
+from src.graphics.sprite_generator import SpriteType, direction_from_angle, get_sprite_generator
+from src.rendering.text_cache import get_font
 
 
 class Activity:
@@ -33,6 +35,9 @@ class NPC:
     illegal robot activities within their vision range.
     """
 
+    # Draw cached SpriteGenerator sprites (False: draw shapes every frame)
+    use_sprites = True
+
     def __init__(self, world_x: float, world_y: float, home_x: int, home_y: int,
                  work_x: int = None, work_y: int = None):
         """
@@ -74,6 +79,7 @@ class NPC:
 
         # Detection tracking (tracks robots being watched)
         self.detecting_robots = {}  # robot_id -> detection_progress (0.0-1.0)
+        self.detection_flags = {}  # robot_id -> notice/observe report bits already sent
 
         # Visual properties
         self.width = 16
@@ -363,6 +369,63 @@ class NPC:
             screen_y + height_px < 0 or screen_y > screen.get_height()):
             return
 
+        if self.use_sprites:
+            self._render_sprite(screen, screen_x, screen_y, camera.zoom)
+        else:
+            self._render_shapes(screen, screen_x, screen_y, width_px, height_px)
+
+        # Activity indicator (small text above NPC for debugging)
+        if camera.zoom >= 0.8:  # Only show when zoomed in enough
+            font = get_font(14)
+            activity_short = {
+                Activity.SLEEPING: 'ZZZ',
+                Activity.MORNING_ROUTINE: 'MR',
+                Activity.COMMUTING_TO_WORK: '→W',
+                Activity.WORKING: 'W',
+                Activity.COMMUTING_HOME: '→H',
+                Activity.EVENING_ACTIVITIES: 'EA',
+                Activity.HOME_ROUTINE: 'HR',
+                Activity.WALKING_TO_BUS_STOP: '→🚏',
+                Activity.WAITING_FOR_BUS: '🚏',
+                Activity.RIDING_BUS: '🚌',
+            }
+            text = activity_short.get(self.current_activity, '?')
+            text_surface = font.render(text, True, (255, 255, 255))
+            text_rect = text_surface.get_rect(center=(screen_x, screen_y - height_px - 8))
+            # Background for text
+            bg_rect = text_rect.inflate(4, 2)
+            pygame.draw.rect(screen, (0, 0, 0), bg_rect)
+            screen.blit(text_surface, text_rect)
+
+    def get_sprite_options(self) -> Dict:
+        """
+        Get the SpriteGenerator options describing this NPC's look.
+
+        Returns:
+            dict: Keyword arguments for the NPC sprite
+        """
+        return {'clothing_color': self.clothing_color, 'skin_color': self.skin_color}
+
+    def _render_sprite(self, screen: pygame.Surface, screen_x: int, screen_y: int, zoom: float):
+        """
+        Draw the cached sprite for the current direction, walking frame and zoom.
+
+        Args:
+            screen: Pygame surface
+            screen_x (int): Screen X of the NPC centre
+            screen_y (int): Screen Y of the NPC centre
+            zoom (float): Camera zoom
+        """
+        # Frame 0 is standing; frames 1 and 2 are the two walking steps
+        frame = 1 + self.animation_frame if self.moving else 0
+        sprite = get_sprite_generator().get_scaled_sprite(
+            SpriteType.NPC, direction_from_angle(self.facing_angle), frame, 0, zoom,
+            **self.get_sprite_options())
+        screen.blit(sprite, sprite.get_rect(center=(screen_x, screen_y)))
+
+    def _render_shapes(self, screen: pygame.Surface, screen_x: int, screen_y: int,
+                       width_px: int, height_px: int):
+        """Draw the NPC from shapes (fallback when use_sprites is off)."""
         # Determine direction (8-way) based on facing_angle
         # 0=E, 45=SE, 90=S, 135=SW, 180=W, 225=NW, 270=N, 315=NE
         angle = self.facing_angle % 360
@@ -424,29 +487,6 @@ class NPC:
         indicator_y = int(head_pos[1] + sin_a * indicator_dist)
         pygame.draw.circle(screen, (50, 50, 50), (indicator_x, indicator_y), 2)
 
-        # Activity indicator (small text above NPC for debugging)
-        if camera.zoom >= 0.8:  # Only show when zoomed in enough
-            font = pygame.font.Font(None, 14)
-            activity_short = {
-                Activity.SLEEPING: 'ZZZ',
-                Activity.MORNING_ROUTINE: 'MR',
-                Activity.COMMUTING_TO_WORK: '→W',
-                Activity.WORKING: 'W',
-                Activity.COMMUTING_HOME: '→H',
-                Activity.EVENING_ACTIVITIES: 'EA',
-                Activity.HOME_ROUTINE: 'HR',
-                Activity.WALKING_TO_BUS_STOP: '→🚏',
-                Activity.WAITING_FOR_BUS: '🚏',
-                Activity.RIDING_BUS: '🚌',
-            }
-            text = activity_short.get(self.current_activity, '?')
-            text_surface = font.render(text, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=(screen_x, screen_y - height_px - 8))
-            # Background for text
-            bg_rect = text_rect.inflate(4, 2)
-            pygame.draw.rect(screen, (0, 0, 0), bg_rect)
-            screen.blit(text_surface, text_rect)
-
     def start_bus_journey(self, bus_stop_pos: Tuple[int, int], destination_stop: Tuple[int, int],
                           final_dest: Tuple[float, float]):
         """
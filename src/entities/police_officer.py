@@ -8,8 +8,9 @@ chase robots performing illegal activities.
 import pygame
 import random
 import math
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from src.entities.npc import NPC, Activity
+from src.rendering.text_cache import get_font
 
 
 class PoliceBehavior:
@@ -275,6 +276,45 @@ class PoliceOfficer(NPC):
             screen_y + height_px < 0 or screen_y > screen.get_height()):
             return
 
+        if self.use_sprites:
+            self._render_sprite(screen, screen_x, screen_y, camera.zoom)
+        else:
+            self._render_shapes(screen, screen_x, screen_y, width_px, height_px, camera.zoom)
+
+        # Behavior indicator (when zoomed in)
+        if camera.zoom >= 0.8:
+            font = get_font(14)
+            behavior_icons = {
+                PoliceBehavior.PATROL: '👮',
+                PoliceBehavior.SUSPICIOUS: '🔍',
+                PoliceBehavior.ALERT: '🚨',
+                PoliceBehavior.CAPTURE: '⚠️',
+            }
+            icon = behavior_icons.get(self.behavior, 'P')
+            text = font.render(icon, True, (255, 255, 255))
+            text_rect = text.get_rect(center=(screen_x, screen_y - height_px - 8))
+            # Background
+            bg_rect = text_rect.inflate(4, 2)
+            pygame.draw.rect(screen, (0, 0, 0), bg_rect)
+            screen.blit(text, text_rect)
+
+    def get_sprite_options(self) -> Dict:
+        """
+        Get the SpriteGenerator options describing the uniform.
+
+        Returns:
+            dict: Keyword arguments for the NPC sprite
+        """
+        return {
+            'clothing_color': self.clothing_color,
+            'skin_color': self.skin_color,
+            'badge_color': self.badge_color,
+            'hat_color': self.clothing_color,
+        }
+
+    def _render_shapes(self, screen: pygame.Surface, screen_x: int, screen_y: int,
+                       width_px: int, height_px: int, zoom: float = 1.0):
+        """Draw the officer from shapes (fallback when use_sprites is off)."""
         # Determine direction based on facing_angle
         angle = self.facing_angle % 360
         angle_rad = math.radians(angle)
@@ -318,7 +358,7 @@ class PoliceOfficer(NPC):
         pygame.draw.rect(screen, self.outline_color, body_rect, 1)
 
         # Draw badge (small gold rectangle on chest)
-        badge_size = max(2, int(3 * camera.zoom))
+        badge_size = max(2, int(3 * zoom))
         badge_x = screen_x - badge_size // 2
         badge_y = screen_y - body_height//4
         pygame.draw.rect(screen, self.badge_color, (badge_x, badge_y, badge_size, badge_size))
@@ -332,9 +372,9 @@ class PoliceOfficer(NPC):
         pygame.draw.circle(screen, self.outline_color, head_pos, head_radius, 1)
 
         # Police hat indicator (small rectangle on top of head)
-        if camera.zoom >= 0.8:
+        if zoom >= 0.8:
             hat_width = head_radius * 2
-            hat_height = max(2, int(3 * camera.zoom))
+            hat_height = max(2, int(3 * zoom))
             hat_rect = pygame.Rect(head_pos[0] - hat_width//2, head_pos[1] - head_radius - hat_height,
                                   hat_width, hat_height)
             pygame.draw.rect(screen, self.clothing_color, hat_rect)
@@ -345,23 +385,6 @@ class PoliceOfficer(NPC):
         indicator_y = int(head_pos[1] + sin_a * indicator_dist)
         pygame.draw.circle(screen, (200, 180, 0), (indicator_x, indicator_y), 2)  # Gold for police
 
-        # Behavior indicator (when zoomed in)
-        if camera.zoom >= 0.8:
-            font = pygame.font.Font(None, 14)
-            behavior_icons = {
-                PoliceBehavior.PATROL: '👮',
-                PoliceBehavior.SUSPICIOUS: '🔍',
-                PoliceBehavior.ALERT: '🚨',
-                PoliceBehavior.CAPTURE: '⚠️',
-            }
-            icon = behavior_icons.get(self.behavior, 'P')
-            text = font.render(icon, True, (255, 255, 255))
-            text_rect = text.get_rect(center=(screen_x, screen_y - height_px - 8))
-            # Background
-            bg_rect = text_rect.inflate(4, 2)
-            pygame.draw.rect(screen, (0, 0, 0), bg_rect)
-            screen.blit(text, text_rect)
-
     def __repr__(self):
         """String representation for debugging."""
         return f"PoliceOfficer(pos=({self.world_x:.0f}, {self.world_y:.0f}), behavior={self.behavior})"
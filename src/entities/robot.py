@@ -6,6 +6,8 @@ import pygame
 import math
 from src.entities.entity import Entity
 from src.core.constants import Colors, RobotState
+from src.graphics.sprite_generator import SpriteType, direction_from_angle, get_sprite_generator
+from src.rendering.text_cache import get_font
 
 
 class Robot(Entity):
@@ -15,6 +17,12 @@ class Robot(Entity):
     Robots can move around the world, collect materials, and build structures.
     """
 
+    # Draw cached SpriteGenerator sprites (False: draw shapes every frame)
+    use_sprites = True
+
+    # Body width the generated robot sprite is drawn for (level 1)
+    SPRITE_BODY_WIDTH = 20
+
     def __init__(self, x, y, autonomous=True):
         """
         Initialize a robot.
@@ -63,6 +71,7 @@ class Robot(Entity):
         self.current_path_index = 0
         self.target_object = None  # CollectibleObject we're moving towards
         self.factory_pos = None  # Position of factory for returning
+        self.path_pending = False  # Waiting on a queued PathService request
         self.collection_radius = 50.0  # How close we need to be to collect
 
         # Upgrade level (1-5, affects visuals and capabilities)
@@ -211,11 +220,11 @@ class Robot(Entity):
         if self.state == RobotState.IDLE:
             self._state_idle(entity_manager)
         elif self.state == RobotState.MOVING_TO_OBJECT:
-            self._state_moving_to_object(dt, grid)
+            self._state_moving_to_object(dt, grid, entity_manager)
         elif self.state == RobotState.COLLECTING:
             self._state_collecting()
         elif self.state == RobotState.RETURNING_TO_FACTORY:
-            self._state_returning(dt, grid)
+            self._state_returning(dt, grid, entity_manager)
         elif self.state == RobotState.UNLOADING:
             self._state_unloading(entity_manager)
 
@@ -240,7 +249,7 @@ class Robot(Entity):
             self.target_object = closest
             self.state = RobotState.MOVING_TO_OBJECT
 
-    def _state_moving_to_object(self, dt, grid):
+    def _state_moving_to_object(self, dt, grid, entity_manager=None):
         """MOVING_TO_OBJECT state: Follow path to target."""
         if self.target_object is None or not self.target_object.active:
             # Target disappeared
@@ -256,9 +265,9 @@ class Robot(Entity):
             return
 
         # Follow path or recalculate if needed
-        if not self.path or self.current_path_index >= len(self.path):
+        if (not self.path or self.current_path_index >= len(self.path)) and not self.path_pending:
             # Need new path
-            self._calculate_path_to_target(grid)
+            self._calculate_path_to_target(grid, getattr(entity_manager, 'path_service', None))
 
         # Move along path
         if self.path and self.current_path_index < len(self.path):
@@ -284,8 +293,14 @@ class Robot(Entity):
             self.target_object = None
             self.state = RobotState.IDLE
 
-    def _state_returning(self, dt, grid):
+    def _state_returning(self, dt, grid, entity_manager=None):
         """RETURNING_TO_FACTORY state: Navigate back to factory."""
+        # Follow the shared flow field toward the nearest drop-off
+        flow_field = getattr(entity_manager, 'flow_field', None)
+        if flow_field is not None and flow_field.has_targets():
+            self._follow_flow_field(dt, grid, flow_field)
+            return
+
         if not self.factory_pos:
             # No factory set, just go idle
             self.state = RobotState.IDLE
@@ -302,12 +317,31 @@ class Robot(Entity):
             return
 
         # Follow path to factory
-        if not self.path or self.current_path_index >= len(self.path):
-            self._calculate_path_to_factory(grid)
+        if (not self.path or self.current_path_index >= len(self.path)) and not self.path_pending:
+            self._calculate_path_to_factory(grid, getattr(entity_manager, 'path_service', None))
 
         if self.path and self.current_path_index < len(self.path):
             self._follow_path(dt, grid)
 
+    def _follow_flow_field(self, dt, grid, flow_field):
+        """Step toward the nearest drop-off one tile at a time."""
+        if not self.path or self.current_path_index >= len(self.path):
+            grid_x, grid_y = grid.world_to_grid(self.x, self.y)
+            if flow_field.is_drop_off(grid_x, grid_y):
+                self.state = RobotState.UNLOADING
+                return
+
+            next_tile = flow_field.next_step(grid_x, grid_y)
+            if next_tile is None:
+                # No drop-off reachable, just idle
+                self.state = RobotState.IDLE
+                return
+
+            self.path = [next_tile]
+            self.current_path_index = 0
+
+        self._follow_path(dt, grid)
+
     def _state_unloading(self, entity_manager):
         """UNLOADING state: Deposit materials at factory."""
         if self.current_load > 0 and entity_manager:
@@ -326,22 +360,46 @@ class Robot(Entity):
         # Go back to idle
         self.state = RobotState.IDLE
 
-    def _calculate_path_to_target(self, grid):
-        """Calculate path to target object."""
+    def _calculate_path_to_target(self, grid, path_service=None):
+        """
+        Calculate path to target object.
+
+        Args:
+            grid: Grid object
+            path_service: Shared PathService; if given, the request may be
+                answered on a later frame
+        """
         if not self.target_object or not grid:
             return
 
-        from src.systems.pathfinding import Pathfinder
-
         # Convert positions to grid coordinates
         start_grid = grid.world_to_grid(self.x, self.y)
         target_center = self.target_object.get_center()
         goal_grid = grid.world_to_grid(target_center[0], target_center[1])
 
+        if path_service is not None:
+            target = self.target_object
+            self.path_pending = True
+            path_service.request_path(self, start_grid, goal_grid,
+                                      lambda path: self._on_target_path(path, target))
+            return
+
+        from src.systems.pathfinding import Pathfinder
+
         # Find path
         pathfinder = Pathfinder(grid)
-        path = pathfinder.find_path(start_grid, goal_grid)
+        self._apply_target_path(pathfinder.find_path(start_grid, goal_grid))
 
+    def _on_target_path(self, path, target):
+        """PathService callback for a path to a target object."""
+        self.path_pending = False
+        # Ignore answers that arrive after the robot moved on
+        if self.state != RobotState.MOVING_TO_OBJECT or self.target_object is not target:
+            return
+        self._apply_target_path(path)
+
+    def _apply_target_path(self, path):
+        """Start following a path to the target, or give up on it."""
         if path:
             self.path = path
             self.current_path_index = 0
@@ -350,21 +408,42 @@ class Robot(Entity):
             self.target_object = None
             self.state = RobotState.IDLE
 
-    def _calculate_path_to_factory(self, grid):
-        """Calculate path to factory."""
+    def _calculate_path_to_factory(self, grid, path_service=None):
+        """
+        Calculate path to factory.
+
+        Args:
+            grid: Grid object
+            path_service: Shared PathService; if given, the request may be
+                answered on a later frame
+        """
         if not self.factory_pos or not grid:
             return
 
-        from src.systems.pathfinding import Pathfinder
-
         # Convert positions to grid coordinates
         start_grid = grid.world_to_grid(self.x, self.y)
         goal_grid = grid.world_to_grid(self.factory_pos[0], self.factory_pos[1])
 
+        if path_service is not None:
+            self.path_pending = True
+            path_service.request_path(self, start_grid, goal_grid, self._on_factory_path)
+            return
+
+        from src.systems.pathfinding import Pathfinder
+
         # Find path
         pathfinder = Pathfinder(grid)
-        path = pathfinder.find_path(start_grid, goal_grid)
+        self._apply_factory_path(pathfinder.find_path(start_grid, goal_grid))
 
+    def _on_factory_path(self, path):
+        """PathService callback for a path to the factory."""
+        self.path_pending = False
+        if self.state != RobotState.RETURNING_TO_FACTORY:
+            return
+        self._apply_factory_path(path)
+
+    def _apply_factory_path(self, path):
+        """Start following a path to the factory, or idle if there is none."""
         if path:
             self.path = path
             self.current_path_index = 0
@@ -461,7 +540,77 @@ class Robot(Entity):
 
         # Get upgrade level visual properties
         level_props = self._get_level_visuals()
+        body_width = level_props['body_width']
+        body_height = level_props['body_height']
+
+        if self.use_sprites:
+            self._render_sprite(screen, screen_x, screen_y, camera.zoom, level_props)
+        else:
+            self._render_shapes(screen, screen_x, screen_y, width_px, level_props)
+
+        # Draw selection indicator if selected
+        if self.selected:
+            selection_rect = pygame.Rect(screen_x - body_width//2 - 2, screen_y - body_height//2 - 2,
+                                        body_width + 4, body_height + 4)
+            pygame.draw.rect(screen, Colors.YELLOW, selection_rect, 2)
+
+        # Draw capacity indicator (small bar showing how full)
+        if self.max_capacity > 0:
+            bar_width = body_width
+            bar_height = 3
+            bar_x = screen_x - bar_width//2
+            bar_y = screen_y - body_height//2 - 8
+
+            # Background (gray)
+            pygame.draw.rect(screen, (60, 60, 60),
+                           (bar_x, bar_y, bar_width, bar_height))
+
+            # Fill (green -> yellow -> red as it fills)
+            fill_ratio = self.current_load / self.max_capacity
+            fill_width = int(bar_width * fill_ratio)
+
+            if fill_ratio < 0.5:
+                fill_color = (0, 255, 0)  # Green
+            elif fill_ratio < 0.8:
+                fill_color = (255, 255, 0)  # Yellow
+            else:
+                fill_color = (255, 100, 0)  # Orange
+
+            if fill_width > 0:
+                pygame.draw.rect(screen, fill_color,
+                               (bar_x, bar_y, fill_width, bar_height))
 
+        # Draw upgrade level indicator (when zoomed in)
+        if camera.zoom >= 0.8:
+            font = get_font(12)
+            level_text = f"L{self.upgrade_level}"
+            text_surface = font.render(level_text, True, (0, 255, 0))
+            text_rect = text_surface.get_rect(center=(screen_x, screen_y + body_height//2 + 8))
+            # Background
+            bg_rect = text_rect.inflate(4, 2)
+            pygame.draw.rect(screen, (0, 0, 0), bg_rect)
+            screen.blit(text_surface, text_rect)
+
+    def _render_sprite(self, screen, screen_x, screen_y, zoom, level_props):
+        """
+        Draw the cached sprite for the current direction, frame, level and zoom.
+
+        Args:
+            screen: Pygame surface
+            screen_x (int): Screen X of the robot centre
+            screen_y (int): Screen Y of the robot centre
+            zoom (float): Camera zoom
+            level_props (dict): Visual properties of the upgrade level
+        """
+        # Sprites are drawn at level 1 size; bigger levels use a larger zoom bucket
+        scale = level_props['body_width'] / self.SPRITE_BODY_WIDTH
+        sprite = get_sprite_generator().get_scaled_sprite(
+            SpriteType.ROBOT, direction_from_angle(self.facing_angle), self.animation_frame, 0,
+            zoom * scale, body_color=level_props['body_color'])
+        screen.blit(sprite, sprite.get_rect(center=(screen_x, screen_y)))
+
+    def _render_shapes(self, screen, screen_x, screen_y, width_px, level_props):
+        """Draw the robot from shapes (fallback when use_sprites is off)."""
         # Calculate direction
         angle = self.facing_angle % 360
         angle_rad = math.radians(angle)
@@ -541,49 +690,6 @@ class Robot(Entity):
             pygame.draw.line(screen, (120, 120, 120), (right_arm_x, right_arm_y),
                            (right_arm_end_x, right_arm_end_y), arm_width)
 
-        # Draw selection indicator if selected
-        if self.selected:
-            selection_rect = pygame.Rect(screen_x - body_width//2 - 2, screen_y - body_height//2 - 2,
-                                        body_width + 4, body_height + 4)
-            pygame.draw.rect(screen, Colors.YELLOW, selection_rect, 2)
-
-        # Draw capacity indicator (small bar showing how full)
-        if self.max_capacity > 0:
-            bar_width = body_width
-            bar_height = 3
-            bar_x = screen_x - bar_width//2
-            bar_y = screen_y - body_height//2 - 8
-
-            # Background (gray)
-            pygame.draw.rect(screen, (60, 60, 60),
-                           (bar_x, bar_y, bar_width, bar_height))
-
-            # Fill (green -> yellow -> red as it fills)
-            fill_ratio = self.current_load / self.max_capacity
-            fill_width = int(bar_width * fill_ratio)
-
-            if fill_ratio < 0.5:
-                fill_color = (0, 255, 0)  # Green
-            elif fill_ratio < 0.8:
-                fill_color = (255, 255, 0)  # Yellow
-            else:
-                fill_color = (255, 100, 0)  # Orange
-
-            if fill_width > 0:
-                pygame.draw.rect(screen, fill_color,
-                               (bar_x, bar_y, fill_width, bar_height))
-
-        # Draw upgrade level indicator (when zoomed in)
-        if camera.zoom >= 0.8:
-            font = pygame.font.Font(None, 12)
-            level_text = f"L{self.upgrade_level}"
-            text_surface = font.render(level_text, True, (0, 255, 0))
-            text_rect = text_surface.get_rect(center=(screen_x, screen_y + body_height//2 + 8))
-            # Background
-            bg_rect = text_rect.inflate(4, 2)
-            pygame.draw.rect(screen, (0, 0, 0), bg_rect)
-            screen.blit(text_surface, text_rect)
-
     def _get_level_visuals(self):
         """
         Get visual properties based on upgrade level.
@@ -9,6 +9,10 @@ import pygame
 import math
 import random
 from typing import Optional, List, Tuple
+from src.rendering.vehicle_sprites import (
+    get_vehicle_sprite_cache, LIGHT_HEADLIGHTS, LIGHT_BRAKES,
+    LIGHT_SIGNAL_LEFT, LIGHT_SIGNAL_RIGHT, LIGHT_EMERGENCY_RED, LIGHT_EMERGENCY_BLUE
+)
 
 
 class TrafficVehicle:
@@ -566,124 +570,46 @@ class TrafficVehicle:
         # Calculate screen position
         screen_x, screen_y = camera.world_to_screen(self.world_x, self.world_y)
 
-        # Apply camera zoom
-        width_px = int(self.width * camera.zoom)
-        height_px = int(self.height * camera.zoom)
-
         # Don't render if off screen
-        margin = max(width_px, height_px)
+        margin = max(self.width, self.height) * camera.zoom
         if (screen_x + margin < 0 or screen_x - margin > screen.get_width() or
             screen_y + margin < 0 or screen_y - margin > screen.get_height()):
             return
 
-        # Create temporary surface for rotation
-        temp_size = int(max(width_px, height_px) * 1.5)
-        temp_surface = pygame.Surface((temp_size, temp_size), pygame.SRCALPHA)
-
-        # Center position on temp surface
-        temp_x = temp_size // 2 - width_px // 2
-        temp_y = temp_size // 2 - height_px // 2
-
-        # Draw vehicle body
-        body_rect = pygame.Rect(temp_x, temp_y, width_px, height_px)
-        pygame.draw.rect(temp_surface, self.body_color, body_rect)
-        pygame.draw.rect(temp_surface, self.outline_color, body_rect, 2)
-
-        # Draw vehicle details
-        self._render_vehicle_details(temp_surface, temp_x, temp_y, width_px, height_px)
-
-        # Rotate based on facing angle
-        rotated_surface = pygame.transform.rotate(temp_surface, -self.facing_angle)
-        rotated_rect = rotated_surface.get_rect(center=(screen_x, screen_y))
-
-        # Blit to screen
-        screen.blit(rotated_surface, rotated_rect.topleft)
-
-    def _render_vehicle_details(self, surface, base_x, base_y, width, height):
-        """Render vehicle details (windows, wheels, lights)."""
-        # Windows
-        window_width = int(width * 0.3)
-        window_height = int(height * 0.5)
-        window_y = base_y + int(height * 0.15)
-
-        if window_width > 4 and window_height > 4:
-            # Front window
-            front_window_x = base_x + width - window_width - 2
-            pygame.draw.rect(surface, self.window_color,
-                           (front_window_x, window_y, window_width, window_height))
-
-            # Rear window
-            rear_window_x = base_x + 2
-            pygame.draw.rect(surface, self.window_color,
-                           (rear_window_x, window_y, window_width, window_height))
-
-        # Wheels
-        wheel_radius = max(2, int(height * 0.25))
-        wheel_y = base_y + height - wheel_radius
-
-        if wheel_radius > 1:
-            # Front wheel
-            front_wheel_x = base_x + width - int(width * 0.2)
-            pygame.draw.circle(surface, (40, 40, 40), (front_wheel_x, wheel_y), wheel_radius)
-
-            # Rear wheel
-            rear_wheel_x = base_x + int(width * 0.2)
-            pygame.draw.circle(surface, (40, 40, 40), (rear_wheel_x, wheel_y), wheel_radius)
-
-        # Headlights (front of vehicle)
-        if self.headlights_on and width > 10:
-            light_size = max(2, int(height * 0.15))
-            light_x = base_x + width - 2
-            light_y1 = base_y + int(height * 0.25)
-            light_y2 = base_y + int(height * 0.75) - light_size
-
-            # Two headlights
-            pygame.draw.circle(surface, (255, 255, 200), (light_x, light_y1), light_size)
-            pygame.draw.circle(surface, (255, 255, 200), (light_x, light_y2), light_size)
-
-        # Brake lights (rear of vehicle)
-        if self.braking and width > 10:
-            light_size = max(2, int(height * 0.15))
-            light_x = base_x + 2
-            light_y1 = base_y + int(height * 0.25)
-            light_y2 = base_y + int(height * 0.75) - light_size
-
-            # Two brake lights (red)
-            pygame.draw.circle(surface, (255, 50, 50), (light_x, light_y1), light_size)
-            pygame.draw.circle(surface, (255, 50, 50), (light_x, light_y2), light_size)
-
-        # Turn signals (blink on/off)
-        if self.turn_signal and width > 10:
-            # Blink every 0.5 seconds
-            if self.turn_signal_blink_timer < 0.5:
-                light_size = max(3, int(height * 0.2))
-                light_color = (255, 180, 0)  # Orange/amber
-
-                if self.turn_signal == 'left':
-                    # Left side light
-                    light_x = base_x + width - 4
-                    light_y = base_y + 2
-                    pygame.draw.circle(surface, light_color, (light_x, light_y), light_size)
-                elif self.turn_signal == 'right':
-                    # Right side light
-                    light_x = base_x + width - 4
-                    light_y = base_y + height - 2
-                    pygame.draw.circle(surface, light_color, (light_x, light_y), light_size)
-
-        # Emergency lights (police) - flash red and blue
-        if self.is_emergency and self.emergency_active and width > 10:
-            light_size = max(3, int(height * 0.25))
-            # Flash at different rates
+        sprite = get_vehicle_sprite_cache().get_sprite(
+            self.vehicle_type, self.width, self.height, self.body_color,
+            camera.zoom, self.facing_angle, self.get_light_state()
+        )
+        screen.blit(sprite, sprite.get_rect(center=(screen_x, screen_y)).topleft)
+
+    def get_light_state(self) -> int:
+        """
+        Get which lights are currently lit.
+
+        Returns:
+            int: LIGHT_* bits from src.rendering.vehicle_sprites
+        """
+        lights = 0
+        if self.headlights_on:
+            lights |= LIGHT_HEADLIGHTS
+        if self.braking:
+            lights |= LIGHT_BRAKES
+
+        # Turn signals blink every 0.5 seconds
+        if self.turn_signal and self.turn_signal_blink_timer < 0.5:
+            if self.turn_signal == 'left':
+                lights |= LIGHT_SIGNAL_LEFT
+            elif self.turn_signal == 'right':
+                lights |= LIGHT_SIGNAL_RIGHT
+
+        # Emergency lights (police) alternate red and blue
+        if self.is_emergency and self.emergency_active:
             if int(self.emergency_timer * 4) % 2 == 0:
-                # Red light (left)
-                light_x = base_x + width // 2 - light_size
-                light_y = base_y + 2
-                pygame.draw.circle(surface, (255, 0, 0), (light_x, light_y), light_size)
+                lights |= LIGHT_EMERGENCY_RED
             else:
-                # Blue light (right)
-                light_x = base_x + width // 2 + light_size
-                light_y = base_y + 2
-                pygame.draw.circle(surface, (0, 100, 255), (light_x, light_y), light_size)
+                lights |= LIGHT_EMERGENCY_BLUE
+
+        return lights
 
     def is_off_map(self, grid) -> bool:
         """
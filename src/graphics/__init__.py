@@ -2,19 +2,24 @@
 Graphics module - Sprite generation and animation systems.
 """
 
-from graphics.sprite_generator import SpriteGenerator, SpriteType, Direction, get_sprite_generator
-from graphics.animation_controller import (
+from .sprite_generator import (
+    SpriteGenerator, SpriteType, Direction, SpriteAtlas, direction_from_angle,
+    get_sprite_generator
+)
+from .animation_controller import (
     AnimationController, AnimationType,
     NPCAnimationController, VehicleAnimationController,
     RobotAnimationController, DroneAnimationController,
     AnimalAnimationController, BirdAnimationController, FishAnimationController
 )
-from graphics.render_effects import RenderEffects, get_render_effects
+from .render_effects import RenderEffects, get_render_effects
 
 __all__ = [
     'SpriteGenerator',
     'SpriteType',
     'Direction',
+    'SpriteAtlas',
+    'direction_from_angle',
     'get_sprite_generator',
     'AnimationController',
     'AnimationType',
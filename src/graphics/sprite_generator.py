@@ -3,13 +3,31 @@ Sprite Generator - Creates procedural sprite graphics for game entities.
 
 Generates high-quality sprites for NPCs, vehicles, robots, and other moving assets.
 All sprites are created programmatically and cached for performance.
+
+The cache is a least-recently-used cache bounded by the bytes its surfaces
+actually use. Besides the base sprites it holds copies pre-scaled to camera
+zoom buckets, so entities never rescale per frame, and sprite atlases: all
+directions and frames of one look packed into a single surface.
 """
 
 import pygame
 import math
-from typing import Dict, List, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple, Optional
 from enum import Enum
 
+from src.rendering.vehicle_sprites import quantize_zoom
+
+
+# Default memory budget of the sprite cache
+DEFAULT_CACHE_BYTES = 16 * 1024 * 1024
+
+# Maximum width of a packed atlas surface
+ATLAS_MAX_WIDTH = 1024
+
+# Transparent pixels kept between packed sprites
+ATLAS_PADDING = 1
+
 
 class Direction(Enum):
     """8-way directional sprites."""
@@ -23,6 +41,23 @@ class Direction(Enum):
     NORTHEAST = 315
 
 
+# Directions in 45 degree steps, starting east
+_DIRECTIONS_BY_STEP = tuple(Direction)
+
+
+def direction_from_angle(angle: float) -> Direction:
+    """
+    Snap a facing angle to the nearest of the 8 sprite directions.
+
+    Args:
+        angle: Degrees (0 = east, 90 = south, as used by entities)
+
+    Returns:
+        Direction: Nearest sprite direction
+    """
+    return _DIRECTIONS_BY_STEP[int(round(angle / 45.0)) % 8]
+
+
 class SpriteType(Enum):
     """Types of sprites that can be generated."""
     NPC = "npc"
@@ -44,18 +79,130 @@ class SpriteType(Enum):
     BIRD_OF_PREY = "bird_of_prey"
 
 
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Get the bytes of pixel memory a surface uses."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class SpriteAtlas:
+    """
+    Directions and frames of one sprite look packed into a single surface.
+
+    Frames are handed out as subsurfaces, which share the atlas pixels.
+    """
+
+    def __init__(self, surface: pygame.Surface, rects: Dict[Tuple[Direction, int], pygame.Rect]):
+        """
+        Initialize the atlas.
+
+        Args:
+            surface: Surface holding every packed sprite
+            rects: (direction, frame) -> area of the sprite in surface
+        """
+        self.surface = surface
+        self.rects = rects
+        self._frames: Dict[Tuple[Direction, int], pygame.Surface] = {}
+
+    def get_frame(self, direction: Direction, frame: int) -> pygame.Surface:
+        """
+        Get one packed sprite.
+
+        Args:
+            direction: Facing direction
+            frame: Animation frame number
+
+        Returns:
+            pygame.Surface: Subsurface of the atlas
+        """
+        key = (direction, frame)
+        sprite = self._frames.get(key)
+        if sprite is None:
+            sprite = self._frames[key] = self.surface.subsurface(self.rects[key])
+        return sprite
+
+    def blit(self, target: pygame.Surface, direction: Direction, frame: int,
+             center: Tuple[int, int]):
+        """
+        Draw one packed sprite centred on a position.
+
+        Args:
+            target: Surface to draw on
+            direction: Facing direction
+            frame: Animation frame number
+            center: Screen position of the sprite centre
+        """
+        rect = self.rects[(direction, frame)]
+        target.blit(self.surface, (center[0] - rect.width // 2, center[1] - rect.height // 2), rect)
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"SpriteAtlas(sprites={len(self.rects)}, size={self.surface.get_size()})"
+
+
+def pack_atlas(sprites: Dict[Tuple[Direction, int], pygame.Surface],
+               max_width: int = ATLAS_MAX_WIDTH, padding: int = ATLAS_PADDING) -> SpriteAtlas:
+    """
+    Pack sprites into one atlas surface, in rows sorted by height.
+
+    Args:
+        sprites: (direction, frame) -> sprite
+        max_width: Maximum atlas width in pixels
+        padding: Transparent pixels between sprites
+
+    Returns:
+        SpriteAtlas: The packed sprites
+    """
+    order = sorted(sprites, key=lambda key: -sprites[key].get_height())
+    rects = {}
+    x = y = row_height = width = 0
+    for key in order:
+        sprite_width, sprite_height = sprites[key].get_size()
+        if x and x + sprite_width > max_width:
+            x = 0
+            y += row_height + padding
+            row_height = 0
+        rects[key] = pygame.Rect(x, y, sprite_width, sprite_height)
+        x += sprite_width + padding
+        row_height = max(row_height, sprite_height)
+        width = max(width, x - padding)
+
+    surface = pygame.Surface((max(1, width), max(1, y + row_height)), pygame.SRCALPHA)
+    for key, rect in rects.items():
+        # RGBA_MAX onto transparent pixels copies the sprite exactly
+        surface.blit(sprites[key], rect, special_flags=pygame.BLEND_RGBA_MAX)
+    return SpriteAtlas(surface, rects)
+
+
 class SpriteGenerator:
     """
     Generates procedural sprites for game entities.
 
     All sprites are cached after first generation for performance.
     Supports multiple directions and animation frames.
+
+    Cache keys are (sprite_type, direction, frame, variant, options, zoom)
+    tuples, where options are the sorted extra keyword arguments. Hot
+    callers can build one with make_key once and reuse it with
+    get_sprite_for_key.
     """
 
-    def __init__(self):
-        """Initialize the sprite generator."""
-        # Sprite cache: {(sprite_type, direction, frame, variant): Surface}
-        self._cache: Dict[Tuple, pygame.Surface] = {}
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """
+        Initialize the sprite generator.
+
+        Args:
+            max_bytes (int): Memory budget of the sprite cache; the least
+                recently used sprites are dropped beyond it
+        """
+        # Sprite cache: {key: (Surface or SpriteAtlas, bytes)}, oldest first
+        self._cache: OrderedDict = OrderedDict()
+        self.max_bytes = max_bytes
+        self.cache_bytes = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
         # Default sizes for each sprite type
         self.sprite_sizes = {
@@ -78,6 +225,27 @@ class SpriteGenerator:
             SpriteType.BIRD_OF_PREY: (20, 18),
         }
 
+    @staticmethod
+    def make_key(sprite_type: SpriteType, direction: Direction = Direction.SOUTH,
+                 frame: int = 0, variant: int = 0, zoom: float = 1.0, **kwargs) -> Tuple:
+        """
+        Build the cache key of a sprite.
+
+        Args:
+            sprite_type: Type of sprite
+            direction: Facing direction (8-way)
+            frame: Animation frame number
+            variant: Color/style variant number
+            zoom: Camera zoom (snapped to a zoom bucket)
+            **kwargs: Additional generator parameters
+
+        Returns:
+            tuple: Key for get_sprite_for_key
+        """
+        options = tuple(sorted(kwargs.items())) if kwargs else ()
+        return (sprite_type, direction, frame, variant, options,
+                1.0 if zoom == 1.0 else quantize_zoom(zoom))
+
     def get_sprite(self, sprite_type: SpriteType, direction: Direction = Direction.SOUTH,
                    frame: int = 0, variant: int = 0, **kwargs) -> pygame.Surface:
         """
@@ -93,12 +261,109 @@ class SpriteGenerator:
         Returns:
             pygame.Surface: The generated sprite
         """
-        cache_key = (sprite_type, direction, frame, variant, tuple(sorted(kwargs.items())))
+        options = tuple(sorted(kwargs.items())) if kwargs else ()
+        return self.get_sprite_for_key((sprite_type, direction, frame, variant, options, 1.0))
+
+    def get_scaled_sprite(self, sprite_type: SpriteType, direction: Direction = Direction.SOUTH,
+                          frame: int = 0, variant: int = 0, zoom: float = 1.0,
+                          **kwargs) -> pygame.Surface:
+        """
+        Get a sprite scaled for a camera zoom.
 
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        Zoom is snapped to buckets (see quantize_zoom), so each bucket is
+        scaled once and then reused.
+
+        Args:
+            sprite_type: Type of sprite to generate
+            direction: Facing direction (8-way)
+            frame: Animation frame number
+            variant: Color/style variant number
+            zoom: Camera zoom
+            **kwargs: Additional parameters (colors, special flags, etc.)
 
-        # Generate the sprite
+        Returns:
+            pygame.Surface: The scaled sprite
+        """
+        return self.get_sprite_for_key(self.make_key(sprite_type, direction, frame, variant, zoom, **kwargs))
+
+    def get_sprite_for_key(self, key: Tuple) -> pygame.Surface:
+        """
+        Get or generate the sprite for a key from make_key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            pygame.Surface: The sprite
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        sprite_type, direction, frame, variant, options, zoom = key
+        if zoom == 1.0:
+            sprite = self._generate(sprite_type, direction, frame, variant, dict(options))
+        else:
+            base = self.get_sprite_for_key(key[:5] + (1.0,))
+            width, height = base.get_size()
+            sprite = pygame.transform.scale(base, (max(1, round(width * zoom)),
+                                                   max(1, round(height * zoom))))
+        self._store(key, sprite, surface_bytes(sprite))
+        return sprite
+
+    def get_atlas(self, sprite_type: SpriteType, frames: Iterable[int],
+                  directions: Optional[Iterable[Direction]] = None, variant: int = 0,
+                  zoom: float = 1.0, **kwargs) -> SpriteAtlas:
+        """
+        Get every direction and frame of a sprite look packed into one atlas.
+
+        Args:
+            sprite_type: Type of sprite
+            frames: Animation frame numbers to pack
+            directions: Directions to pack (default: all 8)
+            variant: Color/style variant number
+            zoom: Camera zoom (snapped to a zoom bucket)
+            **kwargs: Additional generator parameters
+
+        Returns:
+            SpriteAtlas: Atlas with one sprite per (direction, frame)
+        """
+        frames = tuple(frames)
+        directions = tuple(Direction) if directions is None else tuple(directions)
+        base_key = self.make_key(sprite_type, Direction.SOUTH, 0, variant, zoom, **kwargs)
+        key = ('atlas', sprite_type, directions, frames, variant, base_key[4], base_key[5])
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        sprites = {}
+        for direction in directions:
+            for frame in frames:
+                frame_key = (sprite_type, direction, frame, variant) + base_key[4:]
+                sprites[(direction, frame)] = self.get_sprite_for_key(frame_key)
+        atlas = pack_atlas(sprites)
+        self._store(key, atlas, surface_bytes(atlas.surface))
+        return atlas
+
+    def _store(self, key: Tuple, item, size: int):
+        """Add a cache entry and drop the least recently used ones beyond the budget."""
+        self._cache[key] = (item, size)
+        self.cache_bytes += size
+        while self.cache_bytes > self.max_bytes and len(self._cache) > 1:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self.cache_bytes -= evicted_size
+            self.evictions += 1
+
+    def _generate(self, sprite_type: SpriteType, direction: Direction, frame: int,
+                  variant: int, kwargs: Dict) -> pygame.Surface:
+        """Draw a sprite at its native size."""
         if sprite_type == SpriteType.NPC:
             sprite = self._generate_npc_sprite(direction, frame, variant, **kwargs)
         elif sprite_type in (SpriteType.CAR, SpriteType.TRUCK, SpriteType.VAN,
@@ -130,14 +395,14 @@ class SpriteGenerator:
             sprite = pygame.Surface(size, pygame.SRCALPHA)
             sprite.fill((255, 0, 255))  # Magenta for missing sprites
 
-        # Cache and return
-        self._cache[cache_key] = sprite
         return sprite
 
     def _generate_npc_sprite(self, direction: Direction, frame: int, variant: int,
                             clothing_color: Tuple[int, int, int] = None,
-                            skin_color: Tuple[int, int, int] = (220, 180, 140)) -> pygame.Surface:
-        """Generate NPC sprite with walking animation."""
+                            skin_color: Tuple[int, int, int] = (220, 180, 140),
+                            badge_color: Tuple[int, int, int] = None,
+                            hat_color: Tuple[int, int, int] = None) -> pygame.Surface:
+        """Generate NPC sprite with walking animation (badge and hat for uniforms)."""
         width, height = self.sprite_sizes[SpriteType.NPC]
         sprite = pygame.Surface((width, height), pygame.SRCALPHA)
 
@@ -188,6 +453,10 @@ class SpriteGenerator:
             pygame.draw.circle(sprite, (50, 50, 50), (cx - 2, cy - 7), 1)
             pygame.draw.circle(sprite, (50, 50, 50), (cx + 2, cy - 7), 1)
 
+            # Badge on the chest
+            if badge_color is not None:
+                pygame.draw.rect(sprite, badge_color, (cx - 1, cy - 2, 2, 2))
+
         elif 225 <= angle_deg < 315:  # North (back view)
             # Legs
             pygame.draw.rect(sprite, clothing_color, (cx - 4, cy + 2 + leg_offset, 3, 6))  # Left leg
@@ -233,6 +502,16 @@ class SpriteGenerator:
             # Eye
             pygame.draw.circle(sprite, (50, 50, 50), (cx + 2, cy - 7), 1)
 
+        # Hat covering the top of the head
+        if hat_color is not None:
+            if 45 <= angle_deg < 135 or 225 <= angle_deg < 315:
+                head_x = cx
+            elif 135 <= angle_deg < 225:
+                head_x = cx - 1
+            else:
+                head_x = cx + 1
+            pygame.draw.rect(sprite, hat_color, (head_x - 4, cy - 11, 8, 3))
+
         # Add shadow below
         shadow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         pygame.draw.ellipse(shadow_surface, (0, 0, 0, 80), (cx - 6, cy + 7, 12, 4))
@@ -356,8 +635,8 @@ class SpriteGenerator:
         return rotated
 
     def _generate_robot_sprite(self, direction: Direction, frame: int, variant: int,
-                               **kwargs) -> pygame.Surface:
-        """Generate robot sprite with animation."""
+                               body_color: Tuple[int, int, int] = None) -> pygame.Surface:
+        """Generate robot sprite with animation (body_color overrides the variant color)."""
         width, height = self.sprite_sizes[SpriteType.ROBOT]
         sprite = pygame.Surface((width, height), pygame.SRCALPHA)
 
@@ -370,7 +649,7 @@ class SpriteGenerator:
             (120, 120, 120),  # Dark gray
             (180, 100, 100),  # Copper
         ]
-        robot_color = robot_colors[variant % len(robot_colors)]
+        robot_color = body_color if body_color is not None else robot_colors[variant % len(robot_colors)]
         outline_color = tuple(max(0, c - 60) for c in robot_color)
 
         # Animation: bobbing up and down
@@ -1216,12 +1495,33 @@ class SpriteGenerator:
     def clear_cache(self):
         """Clear the sprite cache to free memory."""
         self._cache.clear()
+        self.cache_bytes = 0
+
+    def set_memory_budget(self, max_bytes: int):
+        """
+        Change the cache's memory budget, dropping sprites beyond it.
+
+        Args:
+            max_bytes (int): New budget in bytes
+        """
+        self.max_bytes = max_bytes
+        while self.cache_bytes > self.max_bytes and self._cache:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self.cache_bytes -= evicted_size
+            self.evictions += 1
 
     def get_cache_info(self) -> Dict:
         """Get information about cached sprites."""
+        atlases = sum(1 for key in self._cache if key[0] == 'atlas')
         return {
-            'cached_sprites': len(self._cache),
-            'memory_estimate_kb': len(self._cache) * 2  # Rough estimate
+            'cached_sprites': len(self._cache) - atlases,
+            'atlases': atlases,
+            'memory_bytes': self.cache_bytes,
+            'memory_kb': self.cache_bytes / 1024,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
         }
 
 
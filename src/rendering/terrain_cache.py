@@ -0,0 +1,296 @@
+"""
+TerrainCache - pre-rendered terrain chunks for fast grid rendering.
+
+The grid is split into fixed-size chunks of tiles. Each chunk is drawn once
+onto its own surface and then blitted as a single image every frame. Tiles
+are only redrawn when the TileStore reports a change, and water tiles are
+only redrawn when the shared water palette step advances.
+
+Static sprites that never move (parked cars, say) can be registered as
+decals; they are drawn into the chunks they overlap and cost nothing per
+frame afterwards.
+"""
+
+from collections import OrderedDict
+import numpy as np
+import pygame
+from src.world.tile import Tile, ANIMATED_TERRAIN, water_phase_step
+
+
+class TerrainChunk:
+    """
+    One pre-rendered block of tiles.
+
+    Attributes:
+        chunk_x (int): Chunk column
+        chunk_y (int): Chunk row
+        surface: Pygame surface holding the rendered tiles
+        dirty_tiles (set): (grid_x, grid_y) tiles that need redrawing
+        water_tiles (list): (grid_x, grid_y) animated tiles in this chunk
+        water_step (int): Water palette step the water tiles were drawn at
+    """
+
+    def __init__(self, chunk_x, chunk_y, surface):
+        self.chunk_x = chunk_x
+        self.chunk_y = chunk_y
+        self.surface = surface
+        self.dirty_tiles = set()
+        self.water_tiles = []
+        self.water_step = None
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"TerrainChunk({self.chunk_x}, {self.chunk_y}, water={len(self.water_tiles)})"
+
+
+class TerrainCache:
+    """
+    Caches static terrain as chunk surfaces plus a grid-line overlay.
+
+    Chunks are built lazily when they first become visible and the least
+    recently drawn ones are dropped once more than max_chunks exist, so
+    memory stays bounded on very large maps.
+    """
+
+    GRID_LINE_COLOR = (30, 30, 30)
+
+    def __init__(self, grid, chunk_size=16, max_chunks=64):
+        """
+        Initialize the terrain cache.
+
+        Args:
+            grid: Grid whose TileStore is rendered
+            chunk_size (int): Chunk width/height in tiles
+            max_chunks (int): Maximum number of chunk surfaces kept alive
+        """
+        self.grid = grid
+        self.store = grid.store
+        self.tile_size = grid.tile_size
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+
+        self.chunks = OrderedDict()  # (chunk_x, chunk_y) -> TerrainChunk
+
+        # Static sprites drawn on top of the tiles, by group name
+        self.decals = {}        # group -> [(surface, world_x, world_y)]
+        self._chunk_decals = {}  # (chunk_x, chunk_y) -> [(surface, world_x, world_y)]
+
+        # Grid-line overlay, rebuilt only when the viewport size changes
+        self._grid_overlay = None
+        self._grid_overlay_key = None
+
+        # Statistics
+        self.chunks_built = 0
+        self.tiles_redrawn = 0
+
+        self.store.add_listener(self._on_tile_changed)
+
+    def _on_tile_changed(self, grid_x, grid_y):
+        """Mark a tile dirty in its chunk (if that chunk is cached)."""
+        chunk = self.chunks.get((grid_x // self.chunk_size, grid_y // self.chunk_size))
+        if chunk is not None:
+            chunk.dirty_tiles.add((grid_x, grid_y))
+
+    def invalidate_all(self):
+        """Drop every cached chunk (e.g. after loading a save)."""
+        self.chunks.clear()
+
+    def set_decals(self, group, decals):
+        """
+        Replace a group of static sprites baked into the terrain.
+
+        Args:
+            group (str): Group name (e.g. 'parked_vehicles')
+            decals (list): (surface, world_x, world_y) tuples, positions being
+                the sprite's top-left corner in world pixels
+        """
+        touched = set(self._decal_chunks(self.decals.get(group, ())))
+        if decals:
+            self.decals[group] = list(decals)
+        else:
+            self.decals.pop(group, None)
+        touched.update(self._decal_chunks(self.decals.get(group, ())))
+
+        self._chunk_decals = {}
+        for group_decals in self.decals.values():
+            for key, decal in self._decal_chunks(group_decals):
+                self._chunk_decals.setdefault(key, []).append(decal)
+
+        # Affected chunks are rebuilt from scratch the next time they are drawn
+        for key, _ in touched:
+            self.chunks.pop(key, None)
+
+    def _decal_chunks(self, decals):
+        """Yield (chunk key, decal) for every chunk each decal overlaps."""
+        chunk_pixels = self.chunk_size * self.tile_size
+        for decal in decals:
+            surface, world_x, world_y = decal
+            width, height = surface.get_size()
+            for chunk_y in range(int(world_y // chunk_pixels),
+                                 int((world_y + height) // chunk_pixels) + 1):
+                for chunk_x in range(int(world_x // chunk_pixels),
+                                     int((world_x + width) // chunk_pixels) + 1):
+                    yield (chunk_x, chunk_y), decal
+
+    def _draw_decals(self, chunk):
+        """Blit the decals overlapping a chunk over its tiles."""
+        decals = self._chunk_decals.get((chunk.chunk_x, chunk.chunk_y))
+        if not decals:
+            return
+        origin_x = chunk.chunk_x * self.chunk_size * self.tile_size
+        origin_y = chunk.chunk_y * self.chunk_size * self.tile_size
+        for surface, world_x, world_y in decals:
+            chunk.surface.blit(surface, (world_x - origin_x, world_y - origin_y))
+
+    def _chunk_bounds(self, chunk_x, chunk_y):
+        """Get the (x0, y0, x1, y1) tile bounds of a chunk, clipped to the grid."""
+        x0 = chunk_x * self.chunk_size
+        y0 = chunk_y * self.chunk_size
+        x1 = min(x0 + self.chunk_size, self.store.width)
+        y1 = min(y0 + self.chunk_size, self.store.height)
+        return x0, y0, x1, y1
+
+    def _build_chunk(self, chunk_x, chunk_y):
+        """Render every tile of a chunk onto a new surface."""
+        x0, y0, x1, y1 = self._chunk_bounds(chunk_x, chunk_y)
+        size = self.tile_size
+        surface = pygame.Surface(((x1 - x0) * size, (y1 - y0) * size))
+
+        chunk = TerrainChunk(chunk_x, chunk_y, surface)
+        for grid_y in range(y0, y1):
+            for grid_x in range(x0, x1):
+                self._draw_tile(chunk, grid_x, grid_y)
+
+        self._index_water(chunk)
+        chunk.water_step = water_phase_step(self.store.water_phase)
+        self._draw_decals(chunk)
+
+        self.chunks_built += 1
+        return chunk
+
+    def _index_water(self, chunk):
+        """Refresh the list of animated tiles inside a chunk."""
+        x0, y0, x1, y1 = self._chunk_bounds(chunk.chunk_x, chunk.chunk_y)
+        ys, xs = np.nonzero(np.isin(self.store.terrain_type[y0:y1, x0:x1], ANIMATED_TERRAIN))
+        chunk.water_tiles = list(zip((xs + x0).tolist(), (ys + y0).tolist()))
+
+    def _draw_tile(self, chunk, grid_x, grid_y):
+        """Draw one tile at its position inside the chunk surface."""
+        local_x = (grid_x - chunk.chunk_x * self.chunk_size) * self.tile_size
+        local_y = (grid_y - chunk.chunk_y * self.chunk_size) * self.tile_size
+        Tile.view(self.store, grid_x, grid_y).render(
+            chunk.surface, local_x, local_y, self.tile_size, show_grid=False
+        )
+
+    def _get_chunk(self, chunk_x, chunk_y, water_step):
+        """Get an up-to-date chunk, building or patching it as needed."""
+        key = (chunk_x, chunk_y)
+        chunk = self.chunks.get(key)
+
+        if chunk is None:
+            chunk = self._build_chunk(chunk_x, chunk_y)
+            self.chunks[key] = chunk
+        else:
+            self.chunks.move_to_end(key)
+
+            redrawn = False
+            if chunk.dirty_tiles:
+                for grid_x, grid_y in chunk.dirty_tiles:
+                    self._draw_tile(chunk, grid_x, grid_y)
+                self.tiles_redrawn += len(chunk.dirty_tiles)
+                chunk.dirty_tiles.clear()
+                self._index_water(chunk)
+                redrawn = True
+
+            if chunk.water_tiles and chunk.water_step != water_step:
+                for grid_x, grid_y in chunk.water_tiles:
+                    self._draw_tile(chunk, grid_x, grid_y)
+                self.tiles_redrawn += len(chunk.water_tiles)
+                redrawn = True
+            chunk.water_step = water_step
+
+            # Redrawn tiles may have painted over part of a decal
+            if redrawn:
+                self._draw_decals(chunk)
+
+        return chunk
+
+    def render(self, screen, camera):
+        """
+        Blit the visible terrain chunks.
+
+        Args:
+            screen: Pygame surface to draw on
+            camera: Camera object for view transformation
+        """
+        chunk_pixels = self.chunk_size * self.tile_size
+        start_cx = max(0, int(camera.x // chunk_pixels))
+        start_cy = max(0, int(camera.y // chunk_pixels))
+        end_cx = min((self.store.width - 1) // self.chunk_size,
+                     int((camera.x + camera.width) // chunk_pixels))
+        end_cy = min((self.store.height - 1) // self.chunk_size,
+                     int((camera.y + camera.height) // chunk_pixels))
+
+        water_step = water_phase_step(self.store.water_phase)
+
+        for chunk_y in range(start_cy, end_cy + 1):
+            for chunk_x in range(start_cx, end_cx + 1):
+                chunk = self._get_chunk(chunk_x, chunk_y, water_step)
+                screen.blit(chunk.surface, (chunk_x * chunk_pixels - camera.x,
+                                            chunk_y * chunk_pixels - camera.y))
+
+        # Drop least recently drawn chunks beyond the budget
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+
+    def _get_grid_overlay(self, width, height):
+        """Get the cached grid-line overlay covering a viewport of this size."""
+        key = (width, height, self.tile_size)
+        if self._grid_overlay_key != key:
+            size = self.tile_size
+            cols = width // size + 2
+            rows = height // size + 2
+            overlay = pygame.Surface((cols * size, rows * size), pygame.SRCALPHA)
+            for row in range(rows):
+                for col in range(cols):
+                    rect = pygame.Rect(col * size, row * size, size, size)
+                    pygame.draw.rect(overlay, self.GRID_LINE_COLOR, rect, 1)
+            self._grid_overlay = overlay
+            self._grid_overlay_key = key
+        return self._grid_overlay
+
+    def render_grid_lines(self, screen, camera):
+        """
+        Blit the grid-line overlay, clipped to the world.
+
+        Args:
+            screen: Pygame surface to draw on
+            camera: Camera object for view transformation
+        """
+        overlay = self._get_grid_overlay(camera.width, camera.height)
+        size = self.tile_size
+
+        world_rect = pygame.Rect(-camera.x, -camera.y,
+                                 self.store.width * size, self.store.height * size)
+        old_clip = screen.get_clip()
+        screen.set_clip(world_rect.clip(old_clip))
+        screen.blit(overlay, (-(camera.x % size), -(camera.y % size)))
+        screen.set_clip(old_clip)
+
+    def get_stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Cache statistics
+        """
+        return {
+            'cached_chunks': len(self.chunks),
+            'chunks_built': self.chunks_built,
+            'tiles_redrawn': self.tiles_redrawn,
+            'decals': sum(len(decals) for decals in self.decals.values()),
+        }
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"TerrainCache(chunks={len(self.chunks)}, chunk_size={self.chunk_size})"
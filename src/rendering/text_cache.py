@@ -0,0 +1,189 @@
+"""
+TextCache - shared fonts and pre-rendered text.
+
+Entity labels and UI panels used to create a pygame Font (which loads and
+parses the font file) and rasterize their strings every frame. Fonts now
+come from one registry, created once per (font file, size), and the
+strings they render are kept in an LRU cache keyed by (text, size, colour,
+antialias), so a label that does not change is drawn once.
+
+Cached text surfaces are shared between callers: blit them, never draw on
+them or change their alpha. Registry fonts are shared too, so do not
+restyle them (set_bold, set_italic, ...) and fetch them again after
+pygame.quit(), which empties the registry.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import pygame
+
+
+class CachedFont(pygame.font.Font):
+    """
+    Font whose render() results come from the shared text cache.
+
+    Behaves like pygame.font.Font everywhere else (size, get_height, ...).
+    """
+
+    def __init__(self, name: Optional[str], size: int, text_cache: 'TextCache'):
+        """
+        Initialize the font.
+
+        Args:
+            name: Font file (None for the pygame default font)
+            size (int): Font size in pixels
+            text_cache: Cache the rendered text is kept in
+        """
+        super().__init__(name, size)
+        self.font_file = name
+        self.font_size = size
+        self.text_cache = text_cache
+
+    def render(self, text, antialias, color, background=None) -> pygame.Surface:
+        """
+        Render text, reusing the surface from an earlier identical call.
+
+        Args:
+            text (str): Text to draw
+            antialias (bool): Whether to smooth the glyph edges
+            color: Text colour
+            background: Background colour (None for transparent)
+
+        Returns:
+            pygame.Surface: Shared text surface (do not modify)
+        """
+        return self.text_cache.render(self, text, antialias, color, background)
+
+    def render_uncached(self, text, antialias, color, background=None) -> pygame.Surface:
+        """Rasterize text without the cache (a new surface the caller owns)."""
+        return super().render(text, antialias, color, background)
+
+
+class TextCache:
+    """
+    Font registry plus an LRU cache of rendered text.
+
+    Surfaces are keyed by (text, font size, colour, antialias, background,
+    font file). The least recently used ones are dropped once more than
+    max_surfaces exist.
+    """
+
+    def __init__(self, max_surfaces=2048):
+        """
+        Initialize the text cache.
+
+        Args:
+            max_surfaces (int): Maximum number of text surfaces kept alive
+        """
+        self.max_surfaces = max_surfaces
+        self.fonts: Dict[Tuple[Optional[str], int], CachedFont] = {}
+        self.surfaces = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size: int, name: Optional[str] = None) -> CachedFont:
+        """
+        Get the shared font for a size, creating it on first use.
+
+        Args:
+            size (int): Font size in pixels
+            name: Font file (None for the pygame default font)
+
+        Returns:
+            CachedFont: Shared font
+        """
+        font = self.fonts.get((name, size))
+        if font is None:
+            if not self.fonts:
+                # Fonts are invalid after pygame.quit(); start afresh on the next init
+                pygame.register_quit(self._forget_fonts)
+            font = self.fonts[(name, size)] = CachedFont(name, size, self)
+        return font
+
+    def _forget_fonts(self):
+        """Drop every font and text surface (called by pygame.quit)."""
+        self.fonts.clear()
+        self.surfaces.clear()
+
+    def render(self, font: CachedFont, text, antialias, color, background=None) -> pygame.Surface:
+        """
+        Get the rendered surface for a string, drawing it on first use.
+
+        Args:
+            font: Registry font to draw with
+            text (str): Text to draw
+            antialias (bool): Whether to smooth the glyph edges
+            color: Text colour
+            background: Background colour (None for transparent)
+
+        Returns:
+            pygame.Surface: Shared text surface (do not modify)
+        """
+        # pygame.Color and lists are not hashable
+        if color.__class__ is not tuple:
+            color = tuple(color)
+        if background is not None and background.__class__ is not tuple:
+            background = tuple(background)
+
+        key = (text, font.font_size, color, bool(antialias), background, font.font_file)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        surface = font.render_uncached(text, antialias, color, background)
+        self.surfaces[key] = surface
+        self.misses += 1
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop all cached text surfaces (fonts are kept)."""
+        self.surfaces.clear()
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Font count, surface count, hits and misses
+        """
+        return {
+            'fonts': len(self.fonts),
+            'cached_surfaces': len(self.surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"TextCache(fonts={len(self.fonts)}, surfaces={len(self.surfaces)}, max={self.max_surfaces})"
+
+
+# Global text cache instance
+_text_cache = None
+
+def get_text_cache() -> TextCache:
+    """Get the global text cache."""
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache()
+    return _text_cache
+
+
+def get_font(size: int, name: Optional[str] = None) -> CachedFont:
+    """
+    Get a shared font from the global registry.
+
+    Args:
+        size (int): Font size in pixels
+        name: Font file (None for the pygame default font)
+
+    Returns:
+        CachedFont: Font whose render() is cached
+    """
+    return get_text_cache().get_font(size, name)
@@ -0,0 +1,245 @@
+"""
+VehicleSprites - pre-rendered, pre-rotated vehicle images.
+
+Vehicles used to be drawn onto a fresh surface and rotated every frame.
+Everything that affects their look is a small discrete set (type, colour,
+zoom, heading, which lights are on), so each combination is drawn and
+rotated once and then reused. Headings are snapped to ANGLE_STEPS
+directions and zoom to ZOOM_STEP buckets; lane headings are multiples of
+90 degrees, so road traffic renders exactly as before.
+"""
+
+from collections import OrderedDict
+import pygame
+
+
+# Number of distinct headings kept per vehicle look
+ANGLE_STEPS = 32
+
+# Zoom levels are rounded to multiples of this before drawing
+ZOOM_STEP = 0.125
+
+WINDOW_COLOR = (100, 150, 200)
+WHEEL_COLOR = (40, 40, 40)
+
+# Light state bits
+LIGHT_HEADLIGHTS = 1
+LIGHT_BRAKES = 2
+LIGHT_SIGNAL_LEFT = 4
+LIGHT_SIGNAL_RIGHT = 8
+LIGHT_EMERGENCY_RED = 16
+LIGHT_EMERGENCY_BLUE = 32
+
+
+def quantize_angle(angle: float) -> int:
+    """
+    Snap a heading to the nearest of ANGLE_STEPS directions.
+
+    Args:
+        angle (float): Heading in degrees (0=East, 90=South)
+
+    Returns:
+        int: Direction index in [0, ANGLE_STEPS)
+    """
+    return int(round(angle * ANGLE_STEPS / 360.0)) % ANGLE_STEPS
+
+
+def quantize_zoom(zoom: float) -> float:
+    """
+    Snap a camera zoom to its ZOOM_STEP bucket.
+
+    Args:
+        zoom (float): Camera zoom
+
+    Returns:
+        float: Bucketed zoom (never below ZOOM_STEP)
+    """
+    return max(1, int(round(zoom / ZOOM_STEP))) * ZOOM_STEP
+
+
+def draw_vehicle(surface, base_x, base_y, width, height, body_color,
+                 lights=0, rear_window=True):
+    """
+    Draw an unrotated, east-facing vehicle.
+
+    Args:
+        surface: Pygame surface to draw on
+        base_x, base_y (int): Top-left corner of the body
+        width, height (int): Body size in pixels
+        body_color (tuple): RGB body colour
+        lights (int): LIGHT_* bits that are lit
+        rear_window (bool): Whether to draw the rear window
+    """
+    outline_color = tuple(max(0, c - 40) for c in body_color)
+    body_rect = pygame.Rect(base_x, base_y, width, height)
+    pygame.draw.rect(surface, body_color, body_rect)
+    pygame.draw.rect(surface, outline_color, body_rect, 2)
+
+    # Windows
+    window_width = int(width * 0.3)
+    window_height = int(height * 0.5)
+    window_y = base_y + int(height * 0.15)
+
+    if window_width > 4 and window_height > 4:
+        # Front window
+        front_window_x = base_x + width - window_width - 2
+        pygame.draw.rect(surface, WINDOW_COLOR,
+                         (front_window_x, window_y, window_width, window_height))
+
+        # Rear window
+        if rear_window:
+            rear_window_x = base_x + 2
+            pygame.draw.rect(surface, WINDOW_COLOR,
+                             (rear_window_x, window_y, window_width, window_height))
+
+    # Wheels
+    wheel_radius = max(2, int(height * 0.25))
+    wheel_y = base_y + height - wheel_radius
+
+    if wheel_radius > 1:
+        front_wheel_x = base_x + width - int(width * 0.2)
+        pygame.draw.circle(surface, WHEEL_COLOR, (front_wheel_x, wheel_y), wheel_radius)
+
+        rear_wheel_x = base_x + int(width * 0.2)
+        pygame.draw.circle(surface, WHEEL_COLOR, (rear_wheel_x, wheel_y), wheel_radius)
+
+    if not lights or width <= 10:
+        return
+
+    # Headlights (front of vehicle)
+    if lights & LIGHT_HEADLIGHTS:
+        light_size = max(2, int(height * 0.15))
+        light_x = base_x + width - 2
+        light_y1 = base_y + int(height * 0.25)
+        light_y2 = base_y + int(height * 0.75) - light_size
+        pygame.draw.circle(surface, (255, 255, 200), (light_x, light_y1), light_size)
+        pygame.draw.circle(surface, (255, 255, 200), (light_x, light_y2), light_size)
+
+    # Brake lights (rear of vehicle)
+    if lights & LIGHT_BRAKES:
+        light_size = max(2, int(height * 0.15))
+        light_x = base_x + 2
+        light_y1 = base_y + int(height * 0.25)
+        light_y2 = base_y + int(height * 0.75) - light_size
+        pygame.draw.circle(surface, (255, 50, 50), (light_x, light_y1), light_size)
+        pygame.draw.circle(surface, (255, 50, 50), (light_x, light_y2), light_size)
+
+    # Turn signals (amber, front corners)
+    if lights & (LIGHT_SIGNAL_LEFT | LIGHT_SIGNAL_RIGHT):
+        light_size = max(3, int(height * 0.2))
+        light_x = base_x + width - 4
+        light_y = base_y + 2 if lights & LIGHT_SIGNAL_LEFT else base_y + height - 2
+        pygame.draw.circle(surface, (255, 180, 0), (light_x, light_y), light_size)
+
+    # Emergency lights (police) - red on the left, blue on the right
+    if lights & (LIGHT_EMERGENCY_RED | LIGHT_EMERGENCY_BLUE):
+        light_size = max(3, int(height * 0.25))
+        light_y = base_y + 2
+        if lights & LIGHT_EMERGENCY_RED:
+            pygame.draw.circle(surface, (255, 0, 0),
+                               (base_x + width // 2 - light_size, light_y), light_size)
+        else:
+            pygame.draw.circle(surface, (0, 100, 255),
+                               (base_x + width // 2 + light_size, light_y), light_size)
+
+
+class VehicleSpriteCache:
+    """
+    LRU cache of rotated vehicle sprites.
+
+    Sprites are keyed by (vehicle type, body size, colour, window style,
+    zoom bucket, direction index, light bits). The least recently used ones
+    are dropped once more than max_sprites exist.
+    """
+
+    def __init__(self, max_sprites=1024):
+        """
+        Initialize the sprite cache.
+
+        Args:
+            max_sprites (int): Maximum number of sprites kept alive
+        """
+        self.max_sprites = max_sprites
+        self.sprites = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get_sprite(self, vehicle_type, width, height, body_color, zoom, angle,
+                   lights=0, rear_window=True):
+        """
+        Get the rotated sprite for a vehicle look, drawing it on first use.
+
+        Args:
+            vehicle_type (str): Vehicle type name
+            width, height (int): Body size in world pixels
+            body_color (tuple): RGB body colour
+            zoom (float): Camera zoom
+            angle (float): Heading in degrees (0=East, 90=South)
+            lights (int): LIGHT_* bits that are lit
+            rear_window (bool): Whether to draw the rear window
+
+        Returns:
+            pygame.Surface: Sprite to blit centred on the vehicle position
+        """
+        key = (vehicle_type, width, height, body_color, rear_window,
+               quantize_zoom(zoom), quantize_angle(angle), lights)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        sprite = self._render_sprite(*key[1:])
+        self.sprites[key] = sprite
+        self.misses += 1
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def _render_sprite(self, width, height, body_color, rear_window, zoom, angle_index, lights):
+        """Draw and rotate one sprite."""
+        width_px = int(width * zoom)
+        height_px = int(height * zoom)
+
+        temp_size = int(max(width_px, height_px) * 1.5)
+        surface = pygame.Surface((temp_size, temp_size), pygame.SRCALPHA)
+        draw_vehicle(surface, temp_size // 2 - width_px // 2, temp_size // 2 - height_px // 2,
+                     width_px, height_px, body_color, lights, rear_window)
+
+        if angle_index == 0:
+            return surface
+        return pygame.transform.rotate(surface, -angle_index * 360.0 / ANGLE_STEPS)
+
+    def clear(self):
+        """Drop every cached sprite."""
+        self.sprites.clear()
+
+    def get_stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Cache statistics
+        """
+        return {
+            'cached_sprites': len(self.sprites),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"VehicleSpriteCache(sprites={len(self.sprites)}, max={self.max_sprites})"
+
+
+# Global vehicle sprite cache instance
+_vehicle_sprite_cache = None
+
+def get_vehicle_sprite_cache() -> VehicleSpriteCache:
+    """Get the global vehicle sprite cache."""
+    global _vehicle_sprite_cache
+    if _vehicle_sprite_cache is None:
+        _vehicle_sprite_cache = VehicleSpriteCache()
+    return _vehicle_sprite_cache
@@ -2,6 +2,6 @@
 Game systems (resource management, detection, research, etc.).
 """
 
-from systems.save_manager import SaveManager
+from .save_manager import SaveManager
 
 __all__ = ['SaveManager']
@@ -2,7 +2,10 @@
 BuildingManager - manages all buildings in the factory.
 """
 
+from typing import Dict
+
 from src.entities.building import Building
+from src.utils.serialization import pack_objects, unpack_objects
 
 
 class BuildingManager:
@@ -23,6 +26,17 @@ class BuildingManager:
         self.buildings = {}  # building_id -> Building
         self.buildings_by_type = {}  # building_type -> list of buildings
         self.grid_occupancy = {}  # (grid_x, grid_y) -> building_id
+        self.listeners = []  # callback(building, placed) on place/remove
+
+    def add_listener(self, callback):
+        """
+        Register a callback for building placement and removal.
+
+        Args:
+            callback: Called as callback(building, placed) where placed is
+                True after placement and False after removal
+        """
+        self.listeners.append(callback)
 
     def place_building(self, building):
         """
@@ -59,6 +73,9 @@ class BuildingManager:
                 if tile:
                     tile.occupied = True
 
+        for listener in self.listeners:
+            listener(building, True)
+
         print(f"Placed {building}")
         return True
 
@@ -96,6 +113,10 @@ class BuildingManager:
 
         # Remove building
         del self.buildings[building_id]
+
+        for listener in self.listeners:
+            listener(building, False)
+
         print(f"Removed {building}")
         return True
 
@@ -241,6 +262,44 @@ class BuildingManager:
             if hasattr(building, 'apply_research_effects'):
                 building.apply_research_effects(research_manager)
 
+    def save_state(self) -> Dict:
+        """
+        Save building manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'buildings': pack_objects(list(self.buildings.values())),
+        }
+
+    def load_state(self, state: Dict):
+        """
+        Load building manager state, replacing the current buildings.
+
+        Tile occupancy is part of the saved grid, so tiles are not touched.
+        Listeners see the old buildings removed and the loaded ones placed.
+
+        Args:
+            state (dict): Serialized state
+        """
+        for building in self.buildings.values():
+            for listener in self.listeners:
+                listener(building, False)
+
+        self.buildings = {}
+        self.buildings_by_type = {}
+        self.grid_occupancy = {}
+        for building in unpack_objects(state['buildings']):
+            self.buildings[building.id] = building
+            self.buildings_by_type.setdefault(building.building_type, []).append(building)
+            for dy in range(building.height_tiles):
+                for dx in range(building.width_tiles):
+                    self.grid_occupancy[(building.grid_x + dx, building.grid_y + dy)] = building.id
+
+            for listener in self.listeners:
+                listener(building, True)
+
     def __repr__(self):
         """String representation for debugging."""
         return f"BuildingManager(buildings={len(self.buildings)})"
@@ -13,6 +13,7 @@ from typing import List, Dict, Optional
 from src.entities.bus import Bus
 from src.entities.bus_stop import BusStop
 from src.systems.bus_route import BusRoute
+from src.utils.serialization import pack_objects, unpack_objects, reassign_identity_ids
 
 
 class BusManager:
@@ -338,6 +339,57 @@ class BusManager:
         """Get number of bus stops."""
         return len(self.bus_stops)
 
+    def save_state(self) -> Dict:
+        """
+        Save bus system state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'routes': pack_objects(list(self.routes.values())),
+            'next_route_id': self.next_route_id,
+            'buses': pack_objects(self.buses),
+            'bus_stops': pack_objects(self.bus_stops),
+            'game_time': self.game_time,
+            'spawn_timers': [[route_id, timer] for route_id, timer in self.spawn_timers.items()],
+        }
+
+    def load_state(self, state: Dict, npc_id_map: Optional[Dict[int, int]] = None, npcs=()):
+        """
+        Load bus system state, replacing the current routes, buses and stops.
+
+        Buses and NPCs get new ids when loaded, so passenger and waiting
+        lists are translated with npc_id_map, and riding NPCs are pointed
+        at their bus's new id.
+
+        Args:
+            state (dict): Serialized state
+            npc_id_map (dict): Saved NPC id -> new id (from NPCManager.load_state)
+            npcs: Loaded NPCs
+        """
+        npc_id_map = npc_id_map or {}
+
+        routes = unpack_objects(state['routes'])
+        self.routes = {route.route_id: route for route in routes}
+        self.next_route_id = state.get('next_route_id', len(self.routes))
+
+        self.buses = unpack_objects(state['buses'])
+        bus_id_map = reassign_identity_ids(self.buses)
+        for bus in self.buses:
+            bus.passengers = {npc_id_map[npc_id] for npc_id in bus.passengers if npc_id in npc_id_map}
+
+        self.bus_stops = unpack_objects(state['bus_stops'])
+        for stop in self.bus_stops:
+            stop.waiting_npcs = {npc_id_map[npc_id] for npc_id in stop.waiting_npcs if npc_id in npc_id_map}
+
+        for npc in npcs:
+            if npc.current_bus_id is not None:
+                npc.current_bus_id = bus_id_map.get(npc.current_bus_id)
+
+        self.game_time = state.get('game_time', 0.0)
+        self.spawn_timers = {route_id: timer for route_id, timer in state.get('spawn_timers', [])}
+
     def __repr__(self):
         """String representation for debugging."""
         return (f"BusManager(routes={len(self.routes)}, buses={len(self.buses)}, "
@@ -11,8 +11,10 @@ Handles:
 """
 
 import pygame
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from src.entities.security_camera import SecurityCamera
+from src.utils.serialization import pack_attributes, unpack_attributes
+from src.rendering.text_cache import get_font
 
 
 class CameraHackingManager:
@@ -23,6 +25,13 @@ class CameraHackingManager:
     but tracks hacking activity and triggers consequences.
     """
 
+    # Attributes saved by save_state (camera references are saved separately)
+    SAVED_ATTRIBUTES = (
+        'hacking_enabled', 'hack_count_limit', 'hack_duration',
+        'currently_hacking', 'hack_progress', 'total_hacks',
+        'security_upgrade_triggered', 'fbi_investigation_triggered',
+    )
+
     def __init__(self, camera_manager, research_manager, suspicion_manager):
         """
         Initialize camera hacking manager.
@@ -298,7 +307,7 @@ class CameraHackingManager:
             font: Font for text (optional)
         """
         if font is None:
-            font = pygame.font.Font(None, 24)
+            font = get_font(24)
 
         # Render hacking progress
         if self.currently_hacking and self.hack_target:
@@ -375,7 +384,7 @@ class CameraHackingManager:
         pygame.draw.rect(screen, (100, 100, 100), (box_x, box_y, box_width, box_height), 1)
 
         # Draw text
-        small_font = pygame.font.Font(None, 18)
+        small_font = get_font(18)
         for i, line in enumerate(info_lines):
             text = small_font.render(line, True, (200, 200, 200))
             screen.blit(text, (box_x + 5, box_y + 5 + i * line_height))
@@ -384,6 +393,48 @@ class CameraHackingManager:
         """Update which camera is being hovered."""
         self.mouse_hover_camera = self._get_camera_at_position(world_x, world_y)
 
+    def save_state(self) -> Dict:
+        """
+        Save camera hacking state.
+
+        Cameras are referred to by their position in the camera manager's list.
+
+        Returns:
+            dict: Serialized state
+        """
+        camera_index = {id(camera): index for index, camera in enumerate(self.camera_manager.cameras)}
+
+        def index_of(camera):
+            return None if camera is None else camera_index.get(id(camera))
+
+        state = pack_attributes(self, self.SAVED_ATTRIBUTES)
+        state['hack_target'] = index_of(self.hack_target)
+        state['selected_camera'] = index_of(self.selected_camera)
+        state['recent_hacks'] = [[index_of(camera), timestamp] for camera, timestamp in self.recent_hacks
+                                 if index_of(camera) is not None]
+        return state
+
+    def load_state(self, state: Dict):
+        """
+        Load camera hacking state (after the cameras are loaded).
+
+        Args:
+            state (dict): Serialized state
+        """
+        cameras = self.camera_manager.cameras
+
+        def camera_at(index):
+            return cameras[index] if index is not None and index < len(cameras) else None
+
+        unpack_attributes(self, state, self.SAVED_ATTRIBUTES)
+        self.hack_target = camera_at(state.get('hack_target'))
+        self.selected_camera = camera_at(state.get('selected_camera'))
+        self.mouse_hover_camera = None
+        self.recent_hacks = [(camera_at(index), timestamp) for index, timestamp in state.get('recent_hacks', [])
+                             if camera_at(index) is not None]
+        if self.hack_target is None:
+            self.currently_hacking = False
+
     def __repr__(self):
         """String representation for debugging."""
         return (f"CameraHackingManager(enabled={self.hacking_enabled}, "
@@ -9,8 +9,9 @@ Handles:
 """
 
 import random
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from src.entities.security_camera import SecurityCamera, CameraStatus
+from src.utils.serialization import pack_objects, unpack_objects, reassign_identity_ids
 
 
 class CameraManager:
@@ -297,6 +298,36 @@ class CameraManager:
         self.cameras.clear()
         self.recent_detections.clear()
 
+    def save_state(self) -> Dict:
+        """
+        Save camera manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'cameras': pack_objects(self.cameras),
+            'recent_detections': [[camera_id, robot_id, timestamp]
+                                  for (camera_id, robot_id), timestamp in self.recent_detections.items()],
+        }
+
+    def load_state(self, state: Dict) -> Dict[int, int]:
+        """
+        Load camera manager state, replacing the current cameras.
+
+        Args:
+            state (dict): Serialized state
+
+        Returns:
+            dict: Saved camera id -> new id
+        """
+        self.cameras = unpack_objects(state['cameras'])
+        id_map = reassign_identity_ids(self.cameras)
+        self.recent_detections = {(id_map[camera_id], robot_id): timestamp
+                                  for camera_id, robot_id, timestamp in state.get('recent_detections', [])
+                                  if camera_id in id_map}
+        return id_map
+
     def __repr__(self):
         """String representation for debugging."""
         return (f"CameraManager(total={self.get_camera_count()}, "
@@ -12,6 +12,17 @@ Handles:
 import pygame
 import math
 from typing import List, Tuple, Optional, Dict
+from src.entities.npc import Activity
+from src.utils.spatial_hash import SpatialHash
+from src.rendering.text_cache import get_font
+
+# Below this many rays per update, tracing them one by one is faster than
+# the batched NumPy tracer
+BATCH_LOS_MIN_RAYS = 384
+
+# Per-NPC threshold flags (NPC.detection_flags: robot_id -> bits)
+NOTICED_FLAG = 1
+OBSERVED_FLAG = 2
 
 
 class DetectionLevel:
@@ -40,6 +51,7 @@ class DetectionManager:
         """
         self.grid = grid
         self.npc_manager = npc_manager
+        self.visibility = grid.get_visibility()
 
         # Detection tracking
         self.detection_reports: List[Dict] = []
@@ -61,6 +73,13 @@ class DetectionManager:
             DetectionLevel.REPORT: (255, 50, 50),     # Red
         }
 
+        # Robots bucketed by position, rebuilt every update
+        self.robot_hash = SpatialHash(cell_size=128)
+
+        # Statistics from the last update
+        self.last_pairs_checked = 0
+        self.last_los_checks = 0
+
     def get_detection_level(self, detection_progress: float) -> str:
         """
         Get detection level based on progress.
@@ -85,7 +104,8 @@ class DetectionManager:
         """
         Check if NPC has line-of-sight to robot (no obstacles blocking).
 
-        Uses simple raycasting to check for buildings and walls.
+        Traces the exact tiles between the two points against the grid's
+        shared visibility map.
 
         Args:
             npc_x (float): NPC world X
@@ -96,45 +116,10 @@ class DetectionManager:
         Returns:
             bool: True if line-of-sight is clear
         """
-        # Calculate ray direction
-        dx = robot_x - npc_x
-        dy = robot_y - npc_y
-        distance = math.sqrt(dx * dx + dy * dy)
-
-        if distance < 1:
-            return True  # Too close to matter
-
-        # Normalize direction
-        dx /= distance
-        dy /= distance
-
-        # Step along ray and check for obstacles
-        step_size = self.grid.tile_size / 2  # Check every half tile
-        steps = int(distance / step_size)
-
-        for i in range(1, steps):
-            # Calculate point along ray
-            check_x = npc_x + dx * step_size * i
-            check_y = npc_y + dy * step_size * i
-
-            # Convert to grid coordinates
-            grid_x = int(check_x / self.grid.tile_size)
-            grid_y = int(check_y / self.grid.tile_size)
-
-            # Check if position is valid
-            if not (0 <= grid_x < self.grid.width_tiles and 0 <= grid_y < self.grid.height_tiles):
-                continue
-
-            tile = self.grid.get_tile(grid_x, grid_y)
-            if not tile:
-                continue
-
-            # Check for blocking obstacles
-            from src.world.tile import TileType
-            if tile.tile_type in [TileType.BUILDING, TileType.FACTORY]:
-                return False  # Building blocks line-of-sight
-
-        return True  # No obstacles found
+        tile_size = self.grid.tile_size
+        return self.visibility.has_line_of_sight(
+            npc_x / tile_size, npc_y / tile_size, robot_x / tile_size, robot_y / tile_size
+        )
 
     def update(self, robots: List, dt: float) -> List[Dict]:
         """
@@ -151,97 +136,151 @@ class DetectionManager:
         game_time = self.npc_manager.game_time
         is_daytime = 6 <= game_time < 20  # Day is 6am-8pm
 
+        robot_hash = self.robot_hash
+        robot_hash.clear()
+        robots_by_id = {}
+        for robot in robots:
+            robot_hash.insert(robot, robot.x, robot.y)
+            robots_by_id[robot.id] = robot
+
+        self.last_pairs_checked = 0
+        self.last_los_checks = 0
+
+        # Gather pairs that need a line-of-sight test, then trace them
+        # together (batched when there are many)
+        pairs = []
         for npc in self.npc_manager.npcs:
             # Skip if sleeping (can't detect)
-            from src.entities.npc import Activity
             if npc.current_activity == Activity.SLEEPING:
                 continue
 
-            for robot in robots:
-                # Get robot stealth level (default to 0.5 if not present)
-                robot_stealth = getattr(robot, 'stealth_level', 0.5)
+            # Robots in vision range, plus any this NPC is still watching
+            # (their progress has to decay even out of range)
+            nearby = list(robot_hash.query(npc.world_x, npc.world_y, npc.vision_range))
+            if npc.detecting_robots:
+                nearby_ids = {robot.id for robot in nearby}
+                for robot_id in list(npc.detecting_robots):
+                    robot = robots_by_id.get(robot_id)
+                    if robot is not None and robot_id not in nearby_ids:
+                        nearby.append(robot)
+
+            self.last_pairs_checked += len(nearby)
+            for robot in nearby:
+                # Range and cone are checked before line-of-sight; pairs that
+                # are out of view and have no progress are skipped outright
+                in_view = npc.is_in_vision_cone(robot.x, robot.y)
+                if in_view or robot.id in npc.detecting_robots:
+                    pairs.append((npc, robot, in_view))
+
+        if not pairs:
+            return reports
+
+        self.last_los_checks = len(pairs)
+        tile_size = self.grid.tile_size
+        if len(pairs) >= BATCH_LOS_MIN_RAYS:
+            visible = self.visibility.has_line_of_sight_many(
+                [npc.world_x / tile_size for npc, _, _ in pairs],
+                [npc.world_y / tile_size for npc, _, _ in pairs],
+                [robot.x / tile_size for _, robot, _ in pairs],
+                [robot.y / tile_size for _, robot, _ in pairs],
+            ).tolist()
+        else:
+            visible = [self.check_line_of_sight(npc.world_x, npc.world_y, robot.x, robot.y)
+                       for npc, robot, _ in pairs]
 
-                # Check line-of-sight first
-                has_los = self.check_line_of_sight(npc.world_x, npc.world_y,
-                                                   robot.x, robot.y)
+        for (npc, robot, in_view), has_los in zip(pairs, visible):
+            self._update_pair(npc, robot, in_view, has_los, dt, game_time, is_daytime, reports)
 
-                if not has_los:
-                    # No line-of-sight, decay detection
-                    if robot.id in npc.detecting_robots:
-                        npc.detecting_robots[robot.id] -= 0.2 * dt
-                        if npc.detecting_robots[robot.id] <= 0:
-                            npc.clear_detection(robot.id)
-                    continue
+        return reports
 
-                # Calculate detection chance
-                detection_chance = npc.calculate_detection_chance(
-                    robot.x, robot.y, is_daytime, robot_stealth
-                )
-
-                if detection_chance > 0:
-                    # Update detection progress
-                    detected = npc.update_detection(robot.id, detection_chance, dt)
-
-                    # Get current detection level
-                    detection_progress = npc.detecting_robots.get(robot.id, 0.0)
-                    detection_level = self.get_detection_level(detection_progress)
-
-                    if detected:
-                        # Full detection! Generate report
-                        report = {
-                            'npc': npc,
-                            'robot': robot,
-                            'time': game_time,
-                            'location': (robot.x, robot.y),
-                            'suspicion_increase': 15.0,  # Base suspicion increase
-                            'detection_level': DetectionLevel.REPORT
-                        }
-                        reports.append(report)
-                        self.detection_reports.append(report)
-
-                        # Reset detection for this robot
-                        npc.clear_detection(robot.id)
-                    elif detection_level in [DetectionLevel.NOTICE, DetectionLevel.OBSERVE]:
-                        # Partial detection - generate minor suspicion
-                        if detection_level == DetectionLevel.NOTICE and detection_progress >= 0.25:
-                            # Just crossed notice threshold
-                            if not hasattr(npc, f'_noticed_{robot.id}'):
-                                report = {
-                                    'npc': npc,
-                                    'robot': robot,
-                                    'time': game_time,
-                                    'location': (robot.x, robot.y),
-                                    'suspicion_increase': 2.0,
-                                    'detection_level': DetectionLevel.NOTICE
-                                }
-                                reports.append(report)
-                                setattr(npc, f'_noticed_{robot.id}', True)
-                        elif detection_level == DetectionLevel.OBSERVE and detection_progress >= 0.50:
-                            # Just crossed observe threshold
-                            if not hasattr(npc, f'_observed_{robot.id}'):
-                                report = {
-                                    'npc': npc,
-                                    'robot': robot,
-                                    'time': game_time,
-                                    'location': (robot.x, robot.y),
-                                    'suspicion_increase': 5.0,
-                                    'detection_level': DetectionLevel.OBSERVE
-                                }
-                                reports.append(report)
-                                setattr(npc, f'_observed_{robot.id}', True)
-                else:
-                    # Robot not in vision, decay detection
-                    if robot.id in npc.detecting_robots:
-                        npc.detecting_robots[robot.id] -= 0.1 * dt
-                        if npc.detecting_robots[robot.id] <= 0:
-                            npc.clear_detection(robot.id)
-                            # Clear threshold flags
-                            if hasattr(npc, f'_noticed_{robot.id}'):
-                                delattr(npc, f'_noticed_{robot.id}')
-                            if hasattr(npc, f'_observed_{robot.id}'):
-                                delattr(npc, f'_observed_{robot.id}')
+    def _update_pair(self, npc, robot, in_view: bool, has_los: bool, dt: float,
+                     game_time: float, is_daytime: bool, reports: List[Dict]):
+        """
+        Update one NPC's detection of one robot.
 
-        return reports
+        Args:
+            npc: Watching NPC
+            robot: Robot being watched
+            in_view (bool): Whether the robot is in the NPC's vision cone
+            has_los (bool): Whether line-of-sight is clear
+            dt (float): Delta time in seconds
+            game_time (float): Current game hour
+            is_daytime (bool): Whether it is day
+            reports (list): Reports generated this update are appended here
+        """
+        watching = robot.id in npc.detecting_robots
+
+        # Get robot stealth level (default to 0.5 if not present)
+        robot_stealth = getattr(robot, 'stealth_level', 0.5)
+
+        if not has_los:
+            # No line-of-sight, decay detection
+            if watching:
+                npc.detecting_robots[robot.id] -= 0.2 * dt
+                if npc.detecting_robots[robot.id] <= 0:
+                    npc.clear_detection(robot.id)
+            return
+
+        # Calculate detection chance
+        detection_chance = 0.0
+        if in_view:
+            detection_chance = npc.calculate_detection_chance(
+                robot.x, robot.y, is_daytime, robot_stealth
+            )
+
+        if detection_chance > 0:
+            # Update detection progress
+            detected = npc.update_detection(robot.id, detection_chance, dt)
+
+            # Get current detection level
+            detection_progress = npc.detecting_robots.get(robot.id, 0.0)
+            detection_level = self.get_detection_level(detection_progress)
+            flags = npc.detection_flags.get(robot.id, 0)
+
+            if detected:
+                # Full detection! Generate report
+                report = {
+                    'npc': npc,
+                    'robot': robot,
+                    'time': game_time,
+                    'location': (robot.x, robot.y),
+                    'suspicion_increase': 15.0,  # Base suspicion increase
+                    'detection_level': DetectionLevel.REPORT
+                }
+                reports.append(report)
+                self.detection_reports.append(report)
+
+                # Reset detection for this robot
+                npc.clear_detection(robot.id)
+            elif detection_level == DetectionLevel.NOTICE and not flags & NOTICED_FLAG:
+                # Just crossed notice threshold - minor suspicion
+                reports.append({
+                    'npc': npc,
+                    'robot': robot,
+                    'time': game_time,
+                    'location': (robot.x, robot.y),
+                    'suspicion_increase': 2.0,
+                    'detection_level': DetectionLevel.NOTICE
+                })
+                npc.detection_flags[robot.id] = flags | NOTICED_FLAG
+            elif detection_level == DetectionLevel.OBSERVE and not flags & OBSERVED_FLAG:
+                # Just crossed observe threshold - moderate suspicion
+                reports.append({
+                    'npc': npc,
+                    'robot': robot,
+                    'time': game_time,
+                    'location': (robot.x, robot.y),
+                    'suspicion_increase': 5.0,
+                    'detection_level': DetectionLevel.OBSERVE
+                })
+                npc.detection_flags[robot.id] = flags | OBSERVED_FLAG
+        elif watching:
+            # Robot not in vision, decay detection
+            npc.detecting_robots[robot.id] -= 0.1 * dt
+            if npc.detecting_robots[robot.id] <= 0:
+                npc.clear_detection(robot.id)
+                # Clear threshold flags
+                npc.detection_flags.pop(robot.id, None)
 
     def render_detection_ui(self, screen: pygame.Surface, camera, robots: List):
         """
@@ -252,17 +291,15 @@ class DetectionManager:
             camera: Camera for world-to-screen transformation
             robots: List of robot entities
         """
-        for robot in robots:
-            # Check if any NPC is detecting this robot
-            max_detection = 0.0
-            detecting_npcs = []
+        # Highest detection progress per robot, in one pass over the NPCs
+        max_by_robot = {}
+        for npc in self.npc_manager.npcs:
+            for robot_id, detection in npc.detecting_robots.items():
+                if detection > max_by_robot.get(robot_id, 0.0):
+                    max_by_robot[robot_id] = detection
 
-            for npc in self.npc_manager.npcs:
-                if robot.id in npc.detecting_robots:
-                    detection = npc.detecting_robots[robot.id]
-                    if detection > 0:
-                        detecting_npcs.append(npc)
-                        max_detection = max(max_detection, detection)
+        for robot in robots:
+            max_detection = max_by_robot.get(robot.id, 0.0)
 
             if max_detection > 0.05:  # Only show if > 5% detected
                 # Get screen position
@@ -349,7 +386,7 @@ class DetectionManager:
 
         # Draw exclamation mark
         if zoom >= 0.8:
-            font = pygame.font.Font(None, int(14 * zoom))
+            font = get_font(int(14 * zoom))
             text = font.render('!', True, (0, 0, 0))
             text_rect = text.get_rect(center=(x, y + icon_size // 2))
             screen.blit(text, text_rect)
@@ -392,3 +429,50 @@ class DetectionManager:
             'by_level': by_level,
             'currently_being_detected': being_detected,
         }
+
+    def save_state(self) -> Dict:
+        """
+        Save detection manager state.
+
+        Reports refer to their NPC by position in the NPC list and to their
+        robot by id.
+
+        Returns:
+            dict: Serialized state
+        """
+        npc_index = {id(npc): index for index, npc in enumerate(self.npc_manager.npcs)}
+        reports = []
+        for report in self.detection_reports:
+            saved = {key: value for key, value in report.items() if key not in ('npc', 'robot')}
+            saved['location'] = list(report['location'])
+            saved['npc'] = npc_index.get(id(report['npc']))
+            saved['robot'] = report['robot'].id
+            reports.append(saved)
+
+        return {
+            'detection_reports': reports,
+            'last_report_time': self.last_report_time,
+        }
+
+    def load_state(self, state: Dict, robots: List = ()):
+        """
+        Load detection manager state (after the NPCs and robots are loaded).
+
+        Args:
+            state (dict): Serialized state
+            robots: Loaded robots, for resolving report robot ids
+        """
+        robots_by_id = {robot.id: robot for robot in robots}
+        npcs = self.npc_manager.npcs
+
+        self.detection_reports = []
+        for saved in state.get('detection_reports', []):
+            npc_index = saved.get('npc')
+            npc = npcs[npc_index] if npc_index is not None and npc_index < len(npcs) else None
+            robot = robots_by_id.get(saved.get('robot'))
+            if npc is None or robot is None:
+                continue
+            report = dict(saved, npc=npc, robot=robot, location=tuple(saved['location']))
+            self.detection_reports.append(report)
+
+        self.last_report_time = state.get('last_report_time', 0.0)
@@ -4,6 +4,13 @@ EntityManager - manages all entities in the game.
 
 from src.entities.robot import Robot
 from src.entities.collectible import CollectibleObject
+from src.systems.path_service import PathService
+from src.systems.flow_field import FlowField
+from src.utils.serialization import pack_objects, unpack_objects
+
+
+# Buildings robots can unload at
+DROP_OFF_BUILDING_TYPES = ('factory', 'warehouse', 'silo')
 
 
 class EntityManager:
@@ -13,7 +20,8 @@ class EntityManager:
     Handles creation, updating, rendering, and removal of entities.
     """
 
-    def __init__(self, grid=None, resource_manager=None, research_manager=None, material_inventory=None):
+    def __init__(self, grid=None, resource_manager=None, research_manager=None, material_inventory=None,
+                 pathfinder=None):
         """Initialize the entity manager.
 
         Args:
@@ -21,6 +29,7 @@ class EntityManager:
             resource_manager: ResourceManager (for depositing materials)
             research_manager: ResearchManager (for applying bonuses to new entities)
             material_inventory: MaterialInventory (for tracking material sources)
+            pathfinder: Planner for robot paths (default: plain A* Pathfinder)
         """
         # All entities by ID
         self.entities = {}
@@ -39,6 +48,12 @@ class EntityManager:
         self.research_manager = research_manager
         self.material_inventory = material_inventory
 
+        # Shared path cache and request queue for all robots
+        self.path_service = PathService(grid, pathfinder=pathfinder) if grid is not None else None
+
+        # Distance field toward drop-off buildings for returning robots
+        self.flow_field = FlowField(grid) if grid is not None else None
+
         # Factory position (for robots to return to)
         self.factory_pos = None
 
@@ -163,6 +178,10 @@ class EntityManager:
         for robot in self.robots:
             robot.update(dt, grid=self.grid, entity_manager=self)
 
+        # Answer queued path requests within this frame's budget
+        if self.path_service:
+            self.path_service.process()
+
         # Update other entities (collectibles don't need special context)
         for collectible in self.collectibles:
             collectible.update(dt)
@@ -186,6 +205,46 @@ class EntityManager:
         for robot in self.robots:
             robot.factory_pos = self.factory_pos
 
+        if self.flow_field:
+            grid_x, grid_y = self.grid.world_to_grid(x, y)
+            self.flow_field.set_target('factory_pos', grid_x, grid_y)
+
+    def add_drop_off(self, building):
+        """
+        Let returning robots unload at a building.
+
+        Args:
+            building: Building whose surrounding tiles become drop-off tiles
+        """
+        if self.flow_field:
+            self.flow_field.set_target(building.id, building.grid_x, building.grid_y,
+                                       building.width_tiles, building.height_tiles)
+
+    def remove_drop_off(self, building):
+        """
+        Stop using a building as a drop-off.
+
+        Args:
+            building: Building previously passed to add_drop_off
+        """
+        if self.flow_field:
+            self.flow_field.remove_target(building.id)
+
+    def on_building_changed(self, building, placed):
+        """
+        BuildingManager listener: track factory, warehouse and silo drop-offs.
+
+        Args:
+            building: Building that was placed or removed
+            placed (bool): True if placed, False if removed
+        """
+        if building.building_type not in DROP_OFF_BUILDING_TYPES:
+            return
+        if placed:
+            self.add_drop_off(building)
+        else:
+            self.remove_drop_off(building)
+
     def apply_research_effects_to_robots(self, research_manager):
         """
         Apply research effects to all robots.
@@ -252,6 +311,8 @@ class EntityManager:
             # Remove from specific lists
             if isinstance(entity, Robot):
                 self.robots.remove(entity)
+                if self.path_service:
+                    self.path_service.cancel(entity)
                 if self.selected_robot == entity:
                     self.selected_robot = None
             elif isinstance(entity, CollectibleObject):
@@ -288,8 +349,54 @@ class EntityManager:
             'robots': len(self.robots),
             'collectibles': len(self.collectibles),
             'buildings': len(self.buildings),
+            'pending_paths': len(self.path_service.pending) if self.path_service else 0,
+        }
+
+    def save_state(self):
+        """
+        Save robots and collectibles.
+
+        Robots refer to the collectible they are heading for by its id.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'robots': pack_objects(self.robots, exclude=('target_object',)),
+            'robot_targets': [robot.target_object.id if robot.target_object is not None else -1
+                              for robot in self.robots],
+            'collectibles': pack_objects(self.collectibles),
+            'selected_robot': self.robots.index(self.selected_robot) if self.selected_robot in self.robots else -1,
+            'factory_pos': list(self.factory_pos) if self.factory_pos else None,
         }
 
+    def load_state(self, state):
+        """
+        Load robots and collectibles, replacing the current ones.
+
+        Args:
+            state (dict): Serialized state
+        """
+        if self.path_service:
+            for robot in self.robots:
+                self.path_service.cancel(robot)
+
+        self.robots = unpack_objects(state['robots'])
+        self.collectibles = unpack_objects(state['collectibles'])
+        self.entities = {entity.id: entity for entity in self.robots + self.collectibles}
+
+        collectibles_by_id = {collectible.id: collectible for collectible in self.collectibles}
+        for robot, target_id in zip(self.robots, state.get('robot_targets', [])):
+            robot.target_object = collectibles_by_id.get(target_id)
+            # Queued path requests were not saved; ask again
+            robot.path_pending = False
+
+        selected = state.get('selected_robot', -1)
+        self.selected_robot = self.robots[selected] if 0 <= selected < len(self.robots) else None
+
+        if state.get('factory_pos'):
+            self.set_factory_position(*state['factory_pos'])
+
     def __repr__(self):
         """String representation for debugging."""
         return (f"EntityManager(robots={len(self.robots)}, "
@@ -9,9 +9,10 @@ Handles:
 """
 
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from src.entities.fence import Fence, FenceType
 from src.world.tile import TileType
+from src.utils.serialization import pack_objects, unpack_objects, reassign_identity_ids
 
 
 class FenceManager:
@@ -326,3 +327,27 @@ class FenceManager:
             'by_type': by_type,
             'being_deconstructed': being_deconstructed,
         }
+
+    def save_state(self) -> Dict:
+        """
+        Save fence manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'fences': pack_objects(self.fences),
+        }
+
+    def load_state(self, state: Dict) -> Dict[int, int]:
+        """
+        Load fence manager state, replacing the current fences.
+
+        Args:
+            state (dict): Serialized state
+
+        Returns:
+            dict: Saved fence id -> new id
+        """
+        self.fences = unpack_objects(state['fences'])
+        return reassign_identity_ids(self.fences)
@@ -0,0 +1,352 @@
+"""
+FlowField - shared distance field toward robot drop-off points.
+"""
+
+import heapq
+from typing import Optional, Tuple
+
+from src.systems.pathfinding import STRAIGHT_COST, DIAGONAL_COST
+
+
+INFINITY = float('inf')
+
+# More queued tile changes than this are cheaper to handle with a rebuild
+REBUILD_THRESHOLD = 256
+
+
+class FlowField:
+    """
+    Reverse Dijkstra field rooted at every drop-off target.
+
+    Each walkable tile stores its distance to the nearest drop-off and the
+    neighbouring tile that leads there, so a returning robot reads its next
+    step in O(1) no matter how many robots are returning.
+
+    Targets are rectangles of tiles (usually a building footprint). Since a
+    building's own tiles are occupied, the walkable ring around the rectangle
+    counts as the drop-off.
+
+    The field uses the same moves as Pathfinder (8 directions, no corner
+    cutting) over the grid's padded walkability bitmap. Tile changes are
+    queued and repaired on the next query: blocking a tile resets only the
+    tiles whose route went through it, opening a tile only propagates
+    shorter distances outwards from it.
+    """
+
+    def __init__(self, grid):
+        """
+        Initialize the flow field.
+
+        Args:
+            grid: Grid object containing tile information
+        """
+        self.grid = grid
+        self.store = grid.store
+        self.stride = grid.width_tiles + 2
+
+        # key -> (grid_x, grid_y, width_tiles, height_tiles)
+        self.targets = {}
+
+        # Flat padded index -> number of targets using it as a goal
+        self._goals = {}
+
+        # Per-tile distance and next tile index (-1 at goals/unreachable)
+        self._dist = []
+        self._next = []
+
+        # Tile indices whose passability changed since the last sync
+        self._changed = []
+        self._version = self.store.passable_version
+        self._needs_rebuild = True
+
+        # Statistics
+        self.rebuilds = 0
+        self.repairs = 0
+
+        # (index offset, cost, orthogonal offsets that must be open)
+        stride = self.stride
+        self._moves = (
+            (-stride, STRAIGHT_COST, 0, 0),
+            (1, STRAIGHT_COST, 0, 0),
+            (stride, STRAIGHT_COST, 0, 0),
+            (-1, STRAIGHT_COST, 0, 0),
+            (1 - stride, DIAGONAL_COST, 1, -stride),
+            (1 + stride, DIAGONAL_COST, 1, stride),
+            (stride - 1, DIAGONAL_COST, -1, stride),
+            (-stride - 1, DIAGONAL_COST, -1, -stride),
+        )
+
+        self.store.add_passability_listener(self._on_passability_changed)
+
+    # Targets
+
+    def set_target(self, key, grid_x: int, grid_y: int, width_tiles: int = 1, height_tiles: int = 1):
+        """
+        Add or move a drop-off target.
+
+        Args:
+            key: Identifier for the target (e.g. a building id)
+            grid_x: Left tile of the target
+            grid_y: Top tile of the target
+            width_tiles: Target width in tiles
+            height_tiles: Target height in tiles
+        """
+        rect = (grid_x, grid_y, width_tiles, height_tiles)
+        if self.targets.get(key) == rect:
+            return
+        if key in self.targets:
+            self._remove_goals(self.targets[key])
+        self.targets[key] = rect
+        self._add_goals(rect)
+        self._needs_rebuild = True
+
+    def remove_target(self, key):
+        """
+        Remove a drop-off target.
+
+        Args:
+            key: Identifier passed to set_target
+        """
+        rect = self.targets.pop(key, None)
+        if rect is not None:
+            self._remove_goals(rect)
+            self._needs_rebuild = True
+
+    def has_targets(self) -> bool:
+        """Check whether any drop-off target is registered."""
+        return bool(self.targets)
+
+    def _goal_indices(self, rect):
+        """Get padded indices of a target's tiles and the ring around it."""
+        grid_x, grid_y, width_tiles, height_tiles = rect
+        x0 = max(grid_x - 1, 0)
+        y0 = max(grid_y - 1, 0)
+        x1 = min(grid_x + width_tiles, self.grid.width_tiles - 1)
+        y1 = min(grid_y + height_tiles, self.grid.height_tiles - 1)
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                yield (y + 1) * self.stride + x + 1
+
+    def _add_goals(self, rect):
+        for index in self._goal_indices(rect):
+            self._goals[index] = self._goals.get(index, 0) + 1
+
+    def _remove_goals(self, rect):
+        for index in self._goal_indices(rect):
+            count = self._goals.get(index, 0) - 1
+            if count > 0:
+                self._goals[index] = count
+            else:
+                self._goals.pop(index, None)
+
+    # Queries
+
+    def next_step(self, grid_x: int, grid_y: int) -> Optional[Tuple[int, int]]:
+        """
+        Get the tile to move to next on the way to the nearest drop-off.
+
+        Args:
+            grid_x: Current grid X coordinate
+            grid_y: Current grid Y coordinate
+
+        Returns:
+            (grid_x, grid_y) of the next tile, or None if the tile is already
+            a drop-off or no drop-off can be reached
+        """
+        index = self._index(grid_x, grid_y)
+        if index is None:
+            return None
+        self.sync()
+        next_index = self._next[index]
+        if next_index < 0:
+            return None
+        y, x = divmod(next_index, self.stride)
+        return (x - 1, y - 1)
+
+    def distance(self, grid_x: int, grid_y: int) -> float:
+        """
+        Get the path cost from a tile to the nearest drop-off.
+
+        Args:
+            grid_x: Grid X coordinate
+            grid_y: Grid Y coordinate
+
+        Returns:
+            float: Distance in tiles (inf if unreachable)
+        """
+        index = self._index(grid_x, grid_y)
+        if index is None:
+            return INFINITY
+        self.sync()
+        return self._dist[index]
+
+    def is_drop_off(self, grid_x: int, grid_y: int) -> bool:
+        """Check whether a tile is a reachable drop-off tile."""
+        return self.distance(grid_x, grid_y) == 0.0
+
+    def _index(self, grid_x, grid_y):
+        """Convert grid coordinates to a padded index (None if outside)."""
+        if not (0 <= grid_x < self.grid.width_tiles and 0 <= grid_y < self.grid.height_tiles):
+            return None
+        return (grid_y + 1) * self.stride + grid_x + 1
+
+    # Maintenance
+
+    def _on_passability_changed(self, grid_x, grid_y, passable):
+        """Queue a tile for repair on the next query."""
+        if self._needs_rebuild:
+            return
+        if len(self._changed) >= REBUILD_THRESHOLD:
+            self._needs_rebuild = True
+            self._changed = []
+        else:
+            self._changed.append((grid_y + 1) * self.stride + grid_x + 1)
+
+    def sync(self):
+        """Bring the field up to date with the grid."""
+        version = self.store.passable_version
+        if not self._needs_rebuild and version == self._version:
+            return
+
+        # Bulk changes (no per-tile events) or too many events: start over
+        if self._needs_rebuild or version - self._version != len(self._changed):
+            self.rebuild()
+        else:
+            self._repair(self._changed)
+            self._changed = []
+            self._version = version
+
+    def rebuild(self):
+        """Recompute the whole field from the drop-off targets."""
+        passable = self.store.passable_bitmap()
+        size = len(passable)
+        self._dist = [INFINITY] * size
+        self._next = [-1] * size
+
+        heap = []
+        for index in self._goals:
+            if passable[index]:
+                self._dist[index] = 0.0
+                heap.append((0.0, index))
+        heapq.heapify(heap)
+        self._propagate(heap, passable)
+
+        self._changed = []
+        self._version = self.store.passable_version
+        self._needs_rebuild = False
+        self.rebuilds += 1
+
+    def _repair(self, changed):
+        """Update the field for a batch of tiles whose passability flipped."""
+        passable = self.store.passable_bitmap()
+        dist = self._dist
+        next_tile = self._next
+        stride = self.stride
+
+        blocked = [index for index in changed if not passable[index]]
+        opened = [index for index in changed if passable[index]]
+
+        heap = []
+
+        if blocked:
+            # Tiles that routed through a blocked tile, or diagonally past
+            # its corner, lose their distance along with everything behind them
+            seeds = []
+            for index in blocked:
+                if dist[index] != INFINITY:
+                    seeds.append(index)
+                for a, b in ((1, stride), (stride, -1), (-1, -stride), (-stride, 1)):
+                    if next_tile[index + a] == index + b:
+                        seeds.append(index + a)
+                    if next_tile[index + b] == index + a:
+                        seeds.append(index + b)
+
+            invalid = set(seeds)
+            queue = list(invalid)
+            while queue:
+                current = queue.pop()
+                for offset, _, _, _ in self._moves:
+                    neighbor = current + offset
+                    if next_tile[neighbor] == current and neighbor not in invalid:
+                        invalid.add(neighbor)
+                        queue.append(neighbor)
+
+            for index in invalid:
+                dist[index] = INFINITY
+                next_tile[index] = -1
+
+            # Re-seed the invalidated tiles from their intact neighbours
+            for index in invalid:
+                if not passable[index]:
+                    continue
+                if index in self._goals:
+                    dist[index] = 0.0
+                    heap.append((0.0, index))
+                    continue
+                for offset, cost, side_x, side_y in self._moves:
+                    neighbor = index + offset
+                    if not passable[neighbor] or dist[neighbor] == INFINITY:
+                        continue
+                    if side_x and (not passable[index + side_x] or not passable[index + side_y]):
+                        continue
+                    if dist[neighbor] + cost < dist[index]:
+                        dist[index] = dist[neighbor] + cost
+                        next_tile[index] = neighbor
+                if dist[index] != INFINITY:
+                    heap.append((dist[index], index))
+
+        for index in opened:
+            if index in self._goals:
+                dist[index] = 0.0
+                next_tile[index] = -1
+                heap.append((0.0, index))
+            # The new tile may also open diagonal moves between its neighbours
+            for offset, _, _, _ in self._moves:
+                neighbor = index + offset
+                if dist[neighbor] != INFINITY:
+                    heap.append((dist[neighbor], neighbor))
+
+        heapq.heapify(heap)
+        self._propagate(heap, passable)
+        self.repairs += 1
+
+    def _propagate(self, heap, passable):
+        """Run Dijkstra outwards from the tiles in the heap."""
+        dist = self._dist
+        next_tile = self._next
+        moves = self._moves
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        while heap:
+            d, current = heappop(heap)
+            if d > dist[current]:
+                continue
+            for offset, cost, side_x, side_y in moves:
+                neighbor = current + offset
+                if not passable[neighbor]:
+                    continue
+                if side_x and (not passable[current + side_x] or not passable[current + side_y]):
+                    continue
+                new_dist = d + cost
+                if new_dist < dist[neighbor]:
+                    dist[neighbor] = new_dist
+                    next_tile[neighbor] = current
+                    heappush(heap, (new_dist, neighbor))
+
+    def get_stats(self):
+        """
+        Get flow field statistics.
+
+        Returns:
+            dict: Target and maintenance statistics
+        """
+        return {
+            'targets': len(self.targets),
+            'rebuilds': self.rebuilds,
+            'repairs': self.repairs,
+        }
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"FlowField(targets={len(self.targets)})"
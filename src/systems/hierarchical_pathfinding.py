@@ -0,0 +1,515 @@
+"""
+Hierarchical pathfinding (HPA*) for large maps.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from src.systems.pathfinding import Pathfinder, STRAIGHT_COST, DIAGONAL_COST, DEFAULT_MAX_NODES
+
+
+# Entrances at least this wide get a transition at each end instead of
+# a single one in the middle
+WIDE_ENTRANCE = 6
+
+INFINITY = float('inf')
+
+# More queued tile changes than this are cheaper to handle with a rebuild
+REBUILD_THRESHOLD = 1024
+
+
+class HierarchicalPathfinder(Pathfinder):
+    """
+    HPA* pathfinding over square clusters of tiles.
+
+    The grid is split into clusters. Wherever two neighbouring clusters
+    share a run of walkable tiles along their border, transition tiles are
+    placed on both sides; these form an abstract graph together with the
+    shortest in-cluster distances between transitions of the same cluster.
+
+    A search links start and goal to their clusters' transitions, runs A*
+    on the small abstract graph, then refines each abstract leg with a
+    search confined to one cluster. With refine_legs set, only the first
+    legs are refined and the path is returned as partial; asking again from
+    its end refines the rest on demand. Goals within one cluster width are
+    tried with a small plain A* search first.
+
+    Tile passability changes mark the touched cluster (and the border it
+    sits on) dirty; only dirty clusters are rebuilt before the next search.
+
+    Paths are close to optimal but not guaranteed to be shortest, since
+    they cross cluster borders at transition tiles.
+    """
+
+    def __init__(self, grid, cluster_size: int = 10, max_nodes: int = DEFAULT_MAX_NODES,
+                 allow_partial: bool = True, refine_legs: Optional[int] = None):
+        """
+        Initialize the hierarchical pathfinder.
+
+        Args:
+            grid: Grid object containing tile information
+            cluster_size: Cluster width/height in tiles
+            max_nodes: Maximum abstract node expansions per search
+            allow_partial: If True, a search that runs out of budget returns
+                the path to the abstract node closest to the goal
+            refine_legs: Number of abstract legs to refine per search
+                (None refines the whole path)
+        """
+        super().__init__(grid, max_nodes=max_nodes, allow_partial=allow_partial)
+        self.store = grid.store
+        self.cluster_size = cluster_size
+        self.refine_legs = refine_legs
+        self.stride = grid.width_tiles + 2
+
+        self.clusters_x = (grid.width_tiles + cluster_size - 1) // cluster_size
+        self.clusters_y = (grid.height_tiles + cluster_size - 1) // cluster_size
+
+        # Border key ((cx, cy), (cx2, cy2)) -> list of (tile, tile) transitions
+        self._borders = {}
+        # Cluster -> set of transition tiles inside it
+        self._cluster_nodes = {}
+        # Cluster -> {node: {node: cost}} shortest in-cluster distances
+        self._intra = {}
+        # Transition tile -> set of tiles across the border
+        self._inter = {}
+
+        # Tiles whose passability changed since the last sync
+        self._changed = []
+        self._version = self.store.passable_version
+        self._needs_rebuild = True
+
+        # Statistics
+        self.rebuilds = 0
+        self.clusters_repaired = 0
+
+        self.store.add_passability_listener(self._on_passability_changed)
+
+    # Cluster geometry
+
+    def cluster_of(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        """Get the (cluster_x, cluster_y) containing a tile."""
+        return (position[0] // self.cluster_size, position[1] // self.cluster_size)
+
+    def _cluster_bounds(self, cluster):
+        """Get (x0, y0, x1, y1) tile bounds of a cluster (x1/y1 exclusive)."""
+        x0 = cluster[0] * self.cluster_size
+        y0 = cluster[1] * self.cluster_size
+        return (x0, y0, min(x0 + self.cluster_size, self.grid.width_tiles),
+                min(y0 + self.cluster_size, self.grid.height_tiles))
+
+    def _cluster_borders(self, cluster):
+        """Get the keys of the (up to four) borders around a cluster."""
+        cx, cy = cluster
+        borders = []
+        if cx > 0:
+            borders.append(((cx - 1, cy), cluster))
+        if cx + 1 < self.clusters_x:
+            borders.append((cluster, (cx + 1, cy)))
+        if cy > 0:
+            borders.append(((cx, cy - 1), cluster))
+        if cy + 1 < self.clusters_y:
+            borders.append((cluster, (cx, cy + 1)))
+        return borders
+
+    def _tile_borders(self, grid_x, grid_y):
+        """Get the keys of borders whose transitions could use a tile."""
+        cluster = self.cluster_of((grid_x, grid_y))
+        x0, y0, x1, y1 = self._cluster_bounds(cluster)
+        borders = []
+        for key in self._cluster_borders(cluster):
+            first, second = key
+            if first[1] == second[1]:
+                # Vertical border: tiles in the touching columns
+                if (second == cluster and grid_x == x0) or (first == cluster and grid_x == x1 - 1):
+                    borders.append(key)
+            elif (second == cluster and grid_y == y0) or (first == cluster and grid_y == y1 - 1):
+                borders.append(key)
+        return borders
+
+    # Abstract graph maintenance
+
+    def _on_passability_changed(self, grid_x, grid_y, passable):
+        """Queue a tile so its cluster is repaired before the next search."""
+        if self._needs_rebuild:
+            return
+        if len(self._changed) >= REBUILD_THRESHOLD:
+            self._needs_rebuild = True
+            self._changed = []
+        else:
+            self._changed.append((grid_x, grid_y))
+
+    def sync(self):
+        """Bring the abstract graph up to date with the grid."""
+        version = self.store.passable_version
+        if not self._needs_rebuild and version == self._version:
+            return
+
+        if self._needs_rebuild or version - self._version != len(self._changed):
+            # Bulk changes without per-tile events: start over
+            self.rebuild()
+            return
+
+        clusters = set()
+        borders = set()
+        for grid_x, grid_y in self._changed:
+            clusters.add(self.cluster_of((grid_x, grid_y)))
+            borders.update(self._tile_borders(grid_x, grid_y))
+        for first, second in borders:
+            clusters.add(first)
+            clusters.add(second)
+
+        passable = self.store.passable_bitmap()
+        for key in borders:
+            self._build_border(key, passable)
+        for cluster in clusters:
+            self._build_cluster(cluster, passable)
+
+        self.clusters_repaired += len(clusters)
+        self._changed = []
+        self._version = version
+
+    def rebuild(self):
+        """Rebuild every border and cluster."""
+        passable = self.store.passable_bitmap()
+        self._borders = {}
+        self._cluster_nodes = {}
+        self._intra = {}
+        self._inter = {}
+
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                for key in self._cluster_borders((cx, cy)):
+                    if key[0] == (cx, cy):
+                        self._build_border(key, passable)
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                self._build_cluster((cx, cy), passable)
+
+        self._changed = []
+        self._version = self.store.passable_version
+        self._needs_rebuild = False
+        self.rebuilds += 1
+
+    def _build_border(self, key, passable):
+        """Place transitions along the open runs of one border."""
+        # Drop the old transitions
+        for a, b in self._borders.get(key, ()):
+            self._inter.get(a, set()).discard(b)
+            self._inter.get(b, set()).discard(a)
+
+        first, second = key
+        stride = self.stride
+        x0, y0, x1, y1 = self._cluster_bounds(first)
+        if first[1] == second[1]:
+            # Columns x1 - 1 | x1, along y
+            pairs = [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+        else:
+            # Rows y1 - 1 | y1, along x
+            pairs = [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+
+        transitions = []
+        run = []
+        for pair in pairs + [None]:
+            if pair is not None and (passable[(pair[0][1] + 1) * stride + pair[0][0] + 1]
+                                     and passable[(pair[1][1] + 1) * stride + pair[1][0] + 1]):
+                run.append(pair)
+                continue
+            if run:
+                if len(run) >= WIDE_ENTRANCE:
+                    transitions.append(run[0])
+                    transitions.append(run[-1])
+                else:
+                    transitions.append(run[len(run) // 2])
+                run = []
+
+        self._borders[key] = transitions
+        for a, b in transitions:
+            self._inter.setdefault(a, set()).add(b)
+            self._inter.setdefault(b, set()).add(a)
+
+    def _build_cluster(self, cluster, passable):
+        """Collect a cluster's transitions and their in-cluster distances."""
+        nodes = set()
+        for key in self._cluster_borders(cluster):
+            side = 0 if key[0] == cluster else 1
+            for pair in self._borders.get(key, ()):
+                nodes.add(pair[side])
+
+        bounds = self._cluster_bounds(cluster)
+        local = self._local_bitmap(bounds, passable)
+        edges = {}
+        for node in nodes:
+            dist, _ = self._search_cluster(node, bounds, passable, nodes, local)
+            edges[node] = {other: cost for other, cost in dist.items()
+                           if other in nodes and other != node}
+
+        self._cluster_nodes[cluster] = nodes
+        self._intra[cluster] = edges
+
+    # Low-level search inside one cluster
+
+    def _local_bitmap(self, bounds, passable):
+        """Copy a cluster's rows out of the walkability bitmap, padded by one."""
+        x0, y0, x1, y1 = bounds
+        stride = self.stride
+        local_stride = x1 - x0 + 2
+        local = bytearray(local_stride * (y1 - y0 + 2))
+        for y in range(y0, y1):
+            row = (y - y0 + 1) * local_stride + 1
+            local[row:row + x1 - x0] = passable[(y + 1) * stride + x0 + 1:(y + 1) * stride + x1 + 1]
+        return local
+
+    def _search_cluster(self, source, bounds, passable, targets=None, local=None):
+        """
+        Dijkstra from a tile, confined to a cluster.
+
+        Args:
+            source: Starting tile
+            bounds: (x0, y0, x1, y1) cluster bounds
+            passable: Padded walkability bitmap
+            targets: Optional set of tiles; the search stops once all are settled
+            local: Cluster bitmap from _local_bitmap (built if not given)
+
+        Returns:
+            tuple: (dist, parent) dicts keyed by tile
+        """
+        x0, y0, x1, y1 = bounds
+        if local is None:
+            local = self._local_bitmap(bounds, passable)
+        stride = x1 - x0 + 2
+
+        def to_index(tile):
+            return (tile[1] - y0 + 1) * stride + tile[0] - x0 + 1
+
+        def to_tile(index):
+            y, x = divmod(index, stride)
+            return (x + x0 - 1, y + y0 - 1)
+
+        straight = ((-stride, STRAIGHT_COST), (1, STRAIGHT_COST),
+                    (stride, STRAIGHT_COST), (-1, STRAIGHT_COST))
+        diagonal = ((1 - stride, 1, -stride), (1 + stride, 1, stride),
+                    (stride - 1, -1, stride), (-stride - 1, -1, -stride))
+
+        wanted = {to_index(tile) for tile in targets} if targets else None
+        remaining = len(wanted) if wanted else -1
+
+        source_index = to_index(source)
+        dist = {source_index: 0.0}
+        parent = {source_index: -1}
+        settled = []
+        closed = set()
+        heap = [(0.0, source_index)]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        while heap:
+            d, current = heappop(heap)
+            if current in closed:
+                continue
+            closed.add(current)
+            settled.append(current)
+            if wanted and current in wanted:
+                remaining -= 1
+                if remaining == 0:
+                    break
+
+            for offset, cost in straight:
+                neighbor = current + offset
+                if local[neighbor] and d + cost < dist.get(neighbor, INFINITY):
+                    dist[neighbor] = d + cost
+                    parent[neighbor] = current
+                    heappush(heap, (d + cost, neighbor))
+            for offset, side_x, side_y in diagonal:
+                neighbor = current + offset
+                if (local[neighbor] and local[current + side_x] and local[current + side_y]
+                        and d + DIAGONAL_COST < dist.get(neighbor, INFINITY)):
+                    dist[neighbor] = d + DIAGONAL_COST
+                    parent[neighbor] = current
+                    heappush(heap, (d + DIAGONAL_COST, neighbor))
+
+        tiles = {index: to_tile(index) for index in settled}
+        return ({tiles[index]: dist[index] for index in settled},
+                {tiles[index]: tiles.get(parent[index]) for index in settled})
+
+    @staticmethod
+    def _trace(parent, tile):
+        """Follow parent links from a tile back to the search source."""
+        path = []
+        while tile is not None:
+            path.append(tile)
+            tile = parent[tile]
+        return path
+
+    # Search
+
+    def find_path(self, start_pos: Tuple[int, int], goal_pos: Tuple[int, int],
+                  max_nodes: Optional[int] = None) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a path from start to goal using HPA*.
+
+        Args:
+            start_pos: Starting position (grid_x, grid_y)
+            goal_pos: Goal position (grid_x, grid_y)
+            max_nodes: Override for the abstract node expansion budget
+
+        Returns:
+            List of positions forming a path, or None if no path exists.
+            If the budget runs out (or only refine_legs legs were refined)
+            and partial paths are allowed, the path ends at an intermediate
+            transition tile instead and last_partial is set.
+        """
+        self.last_expanded = 0
+        self.last_partial = False
+
+        if not self.is_walkable(start_pos[0], start_pos[1]):
+            return None
+        if not self.is_walkable(goal_pos[0], goal_pos[1]):
+            return None
+        if start_pos == goal_pos:
+            return [start_pos]
+
+        # Nearby goals: a small plain A* search gives the shortest path
+        if self.heuristic(start_pos, goal_pos) <= self.cluster_size:
+            path = super().find_path(start_pos, goal_pos, max_nodes=self.cluster_size ** 2)
+            if path is not None and not self.last_partial:
+                return path
+            self.last_partial = False
+
+        self.sync()
+        passable = self.store.passable_bitmap()
+
+        start_cluster = self.cluster_of(start_pos)
+        goal_cluster = self.cluster_of(goal_pos)
+        start_nodes = self._cluster_nodes.get(start_cluster, set())
+        goal_nodes = self._cluster_nodes.get(goal_cluster, set())
+
+        # Link start and goal to their clusters' transitions
+        start_dist, start_parent = self._search_cluster(
+            start_pos, self._cluster_bounds(start_cluster), passable,
+            start_nodes | {goal_pos} if start_cluster == goal_cluster else start_nodes)
+        goal_dist, goal_parent = self._search_cluster(
+            goal_pos, self._cluster_bounds(goal_cluster), passable, goal_nodes)
+
+        abstract = self._abstract_search(start_pos, goal_pos, start_dist, goal_dist,
+                                         start_nodes, goal_nodes,
+                                         self.max_nodes if max_nodes is None else max_nodes)
+        if abstract is None:
+            return None
+        waypoints, partial = abstract
+        if partial and not self.allow_partial:
+            return None
+
+        return self._refine(waypoints, partial, start_parent, goal_parent, passable)
+
+    def _abstract_search(self, start, goal, start_dist, goal_dist, start_nodes, goal_nodes, budget):
+        """
+        A* over transitions, with start and goal linked in temporarily.
+
+        Returns:
+            tuple: (waypoints, partial) or None if the goal is unreachable
+        """
+        start_edges = {node: start_dist[node] for node in start_nodes if node in start_dist}
+        if goal in start_dist:
+            start_edges[goal] = start_dist[goal]
+        goal_edges = {node: goal_dist[node] for node in goal_nodes if node in goal_dist}
+
+        g_score = {start: 0.0}
+        parent = {start: None}
+        closed = set()
+        start_h = self.heuristic(start, goal)
+        heap = [(start_h, start_h, 0.0, start)]
+        best, best_h = start, start_h
+        expanded = 0
+
+        while heap:
+            _, h, g, current = heapq.heappop(heap)
+            if current in closed or g > g_score[current]:
+                continue
+            closed.add(current)
+
+            if current == goal:
+                self.last_expanded = expanded
+                return self._trace(parent, goal)[::-1], False
+
+            if h < best_h:
+                best, best_h = current, h
+
+            expanded += 1
+            if expanded > budget:
+                break
+
+            for neighbor, cost in self._abstract_neighbors(current, start, start_edges, goal, goal_edges):
+                if neighbor in closed:
+                    continue
+                tentative_g = g + cost
+                if tentative_g < g_score.get(neighbor, INFINITY):
+                    g_score[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    neighbor_h = self.heuristic(neighbor, goal)
+                    heapq.heappush(heap, (tentative_g + neighbor_h, neighbor_h, tentative_g, neighbor))
+
+        self.last_expanded = expanded
+        if heap and best != start:
+            return self._trace(parent, best)[::-1], True
+        return None
+
+    def _abstract_neighbors(self, node, start, start_edges, goal, goal_edges):
+        """Yield (neighbor, cost) pairs in the abstract graph."""
+        if node == start:
+            yield from start_edges.items()
+            # A start on a transition can also cross the border directly
+            for other in self._inter.get(node, ()):
+                yield other, STRAIGHT_COST
+            return
+
+        cluster = self.cluster_of(node)
+        yield from self._intra.get(cluster, {}).get(node, {}).items()
+        for other in self._inter.get(node, ()):
+            yield other, STRAIGHT_COST
+        if node in goal_edges:
+            yield goal, goal_edges[node]
+
+    def _refine(self, waypoints, partial, start_parent, goal_parent, passable):
+        """Turn abstract waypoints into a tile path, leg by leg."""
+        start, goal = waypoints[0], waypoints[-1]
+        path = [start]
+        legs = len(waypoints) - 1
+        limit = legs if self.refine_legs is None else min(self.refine_legs, legs)
+
+        for i in range(limit):
+            a, b = waypoints[i], waypoints[i + 1]
+            if self.cluster_of(a) != self.cluster_of(b):
+                # Border crossing between two transitions
+                leg = [a, b]
+            elif a == start and b in start_parent:
+                leg = self._trace(start_parent, b)[::-1]
+            elif b == goal and not partial and a in goal_parent:
+                leg = self._trace(goal_parent, a)
+            else:
+                _, parent = self._search_cluster(a, self._cluster_bounds(self.cluster_of(a)),
+                                                 passable, {b})
+                leg = self._trace(parent, b)[::-1]
+            path.extend(leg[1:])
+
+        if limit < legs or partial:
+            self.last_partial = True
+        return path
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get abstract graph statistics.
+
+        Returns:
+            dict: Cluster, transition and maintenance counts
+        """
+        return {
+            'clusters': self.clusters_x * self.clusters_y,
+            'transitions': sum(len(nodes) for nodes in self._cluster_nodes.values()),
+            'rebuilds': self.rebuilds,
+            'clusters_repaired': self.clusters_repaired,
+        }
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return (f"HierarchicalPathfinder({self.clusters_x}x{self.clusters_y} clusters "
+                f"of {self.cluster_size})")
@@ -13,6 +13,8 @@ import random
 from enum import Enum
 from typing import Optional, Dict
 
+from src.utils.serialization import pack_attributes, unpack_attributes
+
 
 class InspectionStatus(Enum):
     """Inspection status states."""
@@ -38,6 +40,15 @@ class InspectionManager:
     Players get 24-48 game hours warning before inspection.
     """
 
+    # Attributes saved by save_state (the rest are tuning constants)
+    SAVED_ATTRIBUTES = (
+        'status', 'inspection_scheduled', 'inspection_time', 'countdown',
+        'inspection_progress', 'last_result', 'last_inspection_time',
+        'illegal_material_count', 'illegal_material_value',
+        'has_restrictions', 'production_penalty', 'restrictions_end_time',
+        'game_over', 'game_over_reason',
+    )
+
     def __init__(self, resource_manager, suspicion_manager, material_inventory=None):
         """
         Initialize inspection manager.
@@ -463,6 +474,24 @@ class InspectionManager:
         """
         return self.production_penalty if self.has_restrictions else 0.0
 
+    def save_state(self) -> Dict:
+        """
+        Save inspection manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return pack_attributes(self, self.SAVED_ATTRIBUTES)
+
+    def load_state(self, state: Dict):
+        """
+        Load inspection manager state.
+
+        Args:
+            state (dict): Serialized state
+        """
+        unpack_attributes(self, state, self.SAVED_ATTRIBUTES)
+
     def __repr__(self):
         """String representation for debugging."""
         restrictions_str = f", restrictions={self.has_restrictions}" if self.has_restrictions else ""
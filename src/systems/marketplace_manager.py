@@ -10,6 +10,7 @@ import pygame
 import random
 from typing import List, Dict, Tuple, Optional
 from enum import Enum
+from src.rendering.text_cache import get_font
 
 
 class DeliveryVehicleType(Enum):
@@ -240,7 +241,7 @@ class DeliveryVehicle:
 
         # Draw status indicator (above vehicle)
         if camera.zoom >= 0.5:
-            font = pygame.font.Font(None, 12)
+            font = get_font(12)
             status_text = {
                 DeliveryStatus.EN_ROUTE_TO_PICKUP: "→ Pickup",
                 DeliveryStatus.LOADING: "Loading...",
@@ -269,6 +269,31 @@ class MaterialInventory:
         self.materials_by_source.clear()
         self.total_materials.clear()
 
+    def save_state(self) -> Dict:
+        """
+        Save material inventory state.
+
+        Returns:
+            dict: Serialized state ({source value: {material_type: quantity}})
+        """
+        return {
+            'materials_by_source': {source.value: dict(materials)
+                                    for source, materials in self.materials_by_source.items()},
+            'total_materials': dict(self.total_materials),
+        }
+
+    def load_state(self, state: Dict):
+        """
+        Load material inventory state.
+
+        Args:
+            state (dict): Serialized state
+        """
+        self.clear_all()
+        for source_value, materials in state.get('materials_by_source', {}).items():
+            self.materials_by_source[MaterialSource(source_value)].update(materials)
+        self.total_materials.update(state.get('total_materials', {}))
+
     def __repr__(self):
         """String representation for debugging."""
         illegal_count = self.get_illegal_material_count()
@@ -10,9 +10,10 @@ Handles:
 """
 
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from src.entities.npc import NPC, Activity
 from src.world.tile import TileType
+from src.utils.serialization import pack_objects, unpack_objects, reassign_identity_ids
 
 
 class NPCManager:
@@ -44,12 +45,14 @@ class NPCManager:
         self.bus_manager = None  # Set externally after bus system is initialized
         self.bus_usage_rate = 0.4  # 40% of NPCs prefer buses for commuting
 
-    def spawn_npcs_in_city(self, seed: int = 42):
+    def spawn_npcs_in_city(self, seed: int = 42, max_npcs: Optional[int] = None):
         """
         Spawn NPCs in houses throughout the city.
 
         Args:
             seed (int): Random seed for reproducible spawning
+            max_npcs (int, optional): Stop after this many NPCs (houses are
+                then filled in random order so the cap spreads over the city)
         """
         rng = random.Random(seed)
 
@@ -58,11 +61,20 @@ class NPCManager:
 
         print(f"Found {len(houses)} buildings for NPC housing")
 
+        homes = houses
+        if max_npcs is not None:
+            homes = list(houses)
+            rng.shuffle(homes)
+
         # Spawn NPCs in houses
         npc_count = 0
-        for house_x, house_y in houses:
+        for house_x, house_y in homes:
             # Random number of NPCs per house (1-3)
             num_npcs = rng.randint(1, 3)
+            if max_npcs is not None:
+                num_npcs = min(num_npcs, max_npcs - npc_count)
+                if num_npcs <= 0:
+                    break
 
             for i in range(num_npcs):
                 # Calculate spawn position (center of house tile)
@@ -99,15 +111,7 @@ class NPCManager:
         Returns:
             List of (grid_x, grid_y) tuples
         """
-        buildings = []
-
-        for y in range(self.grid.height_tiles):
-            for x in range(self.grid.width_tiles):
-                tile = self.grid.get_tile(x, y)
-                if tile and tile.tile_type == tile_type:
-                    buildings.append((x, y))
-
-        return buildings
+        return self.grid.find_tiles(tile_type)
 
     def update(self, dt: float):
         """
@@ -331,3 +335,29 @@ class NPCManager:
             if stop.grid_x == grid_x and stop.grid_y == grid_y:
                 return stop
         return None
+
+    def save_state(self) -> Dict:
+        """
+        Save NPC manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'npcs': pack_objects(self.npcs),
+            'game_time': self.game_time,
+        }
+
+    def load_state(self, state: Dict) -> Dict[int, int]:
+        """
+        Load NPC manager state, replacing the current NPCs.
+
+        Args:
+            state (dict): Serialized state
+
+        Returns:
+            dict: Saved NPC id -> new id (bus passenger lists refer to NPCs by id)
+        """
+        self.npcs = unpack_objects(state['npcs'])
+        self.game_time = state.get('game_time', 8.0)
+        return reassign_identity_ids(self.npcs)
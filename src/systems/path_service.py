@@ -0,0 +1,249 @@
+"""
+PathService - shared path cache and request queue for robot navigation.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from src.systems.pathfinding import Pathfinder
+
+
+class PathService:
+    """
+    Shared pathfinding for all robots.
+
+    Owns a single Pathfinder (so its search arrays are reused), caches
+    finished paths keyed by (start, goal), and spreads new searches over
+    several frames with a per-frame time budget.
+
+    Cached paths are dropped when a tile they pass through becomes blocked;
+    when a tile opens up, the whole cache is cleared since a shorter path
+    may now exist. Buildings (BuildingManager.place_building/remove_building)
+    and construction sites (ConstructionManager) change tile occupancy
+    through the grid, so they invalidate the cache automatically.
+    """
+
+    def __init__(self, grid, max_entries: int = 512, frame_budget: float = 0.002,
+                 pathfinder=None):
+        """
+        Initialize the path service.
+
+        Args:
+            grid: Grid object containing tile information
+            max_entries: Maximum number of cached paths
+            frame_budget: Seconds of pathfinding allowed per frame
+            pathfinder: Planner to use (e.g. a HierarchicalPathfinder);
+                defaults to a plain A* Pathfinder
+        """
+        self.grid = grid
+        self.pathfinder = pathfinder if pathfinder is not None else Pathfinder(grid)
+        self.max_entries = max_entries
+        self.frame_budget = frame_budget
+
+        # (start, goal) -> path (None for unreachable goals)
+        self.cache = OrderedDict()
+        # tile -> set of cache keys whose path crosses it
+        self._keys_by_tile = {}
+        # goal -> set of cache keys ending there (for suffix reuse)
+        self._keys_by_goal = {}
+        # cache key -> set of tiles its path crosses
+        self._tiles_for_key = {}
+
+        # requester id -> (start, goal, callback), in arrival order
+        self.pending = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.searches = 0
+
+        self._passable_version = grid.store.passable_version
+        grid.store.add_passability_listener(self._on_passability_changed)
+
+    def get_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Get a path immediately, from the cache or by searching now.
+
+        Args:
+            start: Starting position (grid_x, grid_y)
+            goal: Goal position (grid_x, grid_y)
+
+        Returns:
+            List of positions forming a path, or None if no path exists
+        """
+        found, path = self._lookup(start, goal)
+        if found:
+            return list(path) if path else None
+        return self._solve(start, goal)
+
+    def request_path(self, requester, start: Tuple[int, int], goal: Tuple[int, int],
+                     callback: Callable[[Optional[List[Tuple[int, int]]]], None]) -> bool:
+        """
+        Request a path, answered now if cached or queued for a later frame.
+
+        A requester has at most one pending request; asking again replaces
+        it but keeps its place in the queue.
+
+        Args:
+            requester: Object asking for the path (e.g. a Robot)
+            start: Starting position (grid_x, grid_y)
+            goal: Goal position (grid_x, grid_y)
+            callback: Called with the path (or None) once it is known
+
+        Returns:
+            bool: True if the callback was called immediately
+        """
+        found, path = self._lookup(start, goal)
+        if found:
+            self.pending.pop(id(requester), None)
+            callback(list(path) if path else None)
+            return True
+
+        self.pending[id(requester)] = (start, goal, callback)
+        return False
+
+    def cancel(self, requester):
+        """Drop a requester's pending request, if any."""
+        self.pending.pop(id(requester), None)
+
+    def process(self):
+        """
+        Solve queued requests until this frame's time budget is used.
+
+        At least one request is solved per call so the queue always drains.
+
+        Returns:
+            int: Number of requests answered
+        """
+        answered = 0
+        deadline = time.perf_counter() + self.frame_budget
+
+        while self.pending:
+            _, (start, goal, callback) = self.pending.popitem(last=False)
+
+            found, path = self._lookup(start, goal)
+            if found:
+                path = list(path) if path else None
+            else:
+                path = self._solve(start, goal)
+
+            callback(path)
+            answered += 1
+
+            if time.perf_counter() >= deadline:
+                break
+
+        return answered
+
+    def _lookup(self, start, goal):
+        """
+        Look for a cached answer.
+
+        Besides exact (start, goal) hits, a cached path to the same goal
+        that passes through start can be reused from start onwards.
+
+        Returns:
+            tuple: (found, path)
+        """
+        if self._passable_version != self.grid.store.passable_version:
+            # Changed in bulk without per-tile events
+            self.clear()
+
+        key = (start, goal)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return True, self.cache[key]
+
+        for other_key in self._keys_by_goal.get(goal, ()):
+            path = self.cache[other_key]
+            if path and start in self._path_tiles(other_key):
+                self.hits += 1
+                return True, path[path.index(start):]
+
+        self.misses += 1
+        return False, None
+
+    def _path_tiles(self, key):
+        """Get the set of tiles a cached path crosses."""
+        return self._tiles_for_key.get(key, ())
+
+    def _solve(self, start, goal):
+        """Run a search and cache the result (unless it was partial)."""
+        path = self.pathfinder.find_path(start, goal)
+        self.searches += 1
+        if not self.pathfinder.last_partial:
+            self._store(start, goal, path)
+        return path
+
+    def _store(self, start, goal, path):
+        """Add a path to the cache, evicting the least recently used."""
+        key = (start, goal)
+        self.cache[key] = path
+        self._keys_by_goal.setdefault(goal, set()).add(key)
+
+        tiles = set(path) if path else set()
+        self._tiles_for_key[key] = tiles
+        for tile in tiles:
+            self._keys_by_tile.setdefault(tile, set()).add(key)
+
+        while len(self.cache) > self.max_entries:
+            oldest_key = next(iter(self.cache))
+            self._evict(oldest_key)
+
+    def _evict(self, key):
+        """Remove one cached path and its index entries."""
+        self.cache.pop(key, None)
+
+        goal_keys = self._keys_by_goal.get(key[1])
+        if goal_keys is not None:
+            goal_keys.discard(key)
+            if not goal_keys:
+                del self._keys_by_goal[key[1]]
+
+        for tile in self._tiles_for_key.pop(key, ()):
+            tile_keys = self._keys_by_tile.get(tile)
+            if tile_keys is not None:
+                tile_keys.discard(key)
+                if not tile_keys:
+                    del self._keys_by_tile[tile]
+
+    def _on_passability_changed(self, grid_x, grid_y, passable):
+        """Invalidate cached paths affected by a tile change."""
+        if passable:
+            # A new opening can shorten any path or connect a failed search
+            self.clear()
+        else:
+            for key in list(self._keys_by_tile.get((grid_x, grid_y), ())):
+                self._evict(key)
+        self._passable_version = self.grid.store.passable_version
+
+    def clear(self):
+        """Drop every cached path."""
+        self.cache.clear()
+        self._keys_by_tile = {}
+        self._keys_by_goal = {}
+        self._tiles_for_key = {}
+        self._passable_version = self.grid.store.passable_version
+
+    def get_stats(self):
+        """
+        Get path service statistics.
+
+        Returns:
+            dict: Cache and queue statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            'cached_paths': len(self.cache),
+            'pending_requests': len(self.pending),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'searches': self.searches,
+        }
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"PathService(cached={len(self.cache)}, pending={len(self.pending)})"
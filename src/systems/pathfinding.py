@@ -5,25 +5,16 @@ A* pathfinding system for robot navigation.
 import heapq
 from typing import List, Tuple, Optional
 
+from src.world.visibility import trace_clear
 
-class Node:
-    """A node in the pathfinding graph."""
 
-    def __init__(self, position: Tuple[int, int], parent=None):
-        self.position = position  # (grid_x, grid_y)
-        self.parent = parent
-        self.g = 0  # Cost from start to this node
-        self.h = 0  # Heuristic cost from this node to goal
-        self.f = 0  # Total cost (g + h)
+# Movement costs
+STRAIGHT_COST = 1.0
+DIAGONAL_COST = 1.414
 
-    def __eq__(self, other):
-        return self.position == other.position
-
-    def __lt__(self, other):
-        return self.f < other.f
-
-    def __hash__(self):
-        return hash(self.position)
+# Default number of node expansions before giving up (or returning a
+# partial path); roughly a 70x70 open area
+DEFAULT_MAX_NODES = 5000
 
 
 class Pathfinder:
@@ -31,20 +22,45 @@ class Pathfinder:
     A* pathfinding implementation.
 
     Finds optimal paths through a grid, avoiding obstacles.
+
+    The search runs over the grid's padded walkability bitmap using flat
+    integer tile indices. Scores and parents live in arrays that are reused
+    between searches (stamped with a search id instead of being cleared),
+    and the open list is a heap with lazy deletion: improved nodes are pushed
+    again and stale entries are skipped when popped.
     """
 
-    def __init__(self, grid):
+    def __init__(self, grid, max_nodes: int = DEFAULT_MAX_NODES, allow_partial: bool = True):
         """
         Initialize pathfinder.
 
         Args:
             grid: Grid object containing tile information
+            max_nodes: Maximum node expansions per search
+            allow_partial: If True, a search that runs out of budget returns
+                the path to the expanded node closest to the goal
         """
         self.grid = grid
+        self.max_nodes = max_nodes
+        self.allow_partial = allow_partial
+
+        # Reusable search arrays (sized on first search)
+        self._size = 0
+        self._g = []
+        self._parent = []
+        self._seen = []
+        self._closed = []
+        self._search_id = 0
+
+        # Statistics from the last search
+        self.last_expanded = 0
+        self.last_partial = False
 
     def heuristic(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
         """
-        Calculate heuristic (Manhattan distance).
+        Calculate heuristic (octile distance).
+
+        Admissible for 8-directional movement with diagonal cost 1.414.
 
         Args:
             pos1: Starting position (grid_x, grid_y)
@@ -53,7 +69,9 @@ class Pathfinder:
         Returns:
             float: Estimated distance
         """
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+        dx = abs(pos1[0] - pos2[0])
+        dy = abs(pos1[1] - pos2[1])
+        return (dx + dy) + (DIAGONAL_COST - 2 * STRAIGHT_COST) * min(dx, dy)
 
     def get_neighbors(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
@@ -106,22 +124,38 @@ class Pathfinder:
         Returns:
             bool: True if walkable, False otherwise
         """
-        tile = self.grid.get_tile(grid_x, grid_y)
-        if tile is None:
-            return False
-        return tile.walkable and not tile.occupied
-
-    def find_path(self, start_pos: Tuple[int, int], goal_pos: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        return self.grid.is_passable(grid_x, grid_y)
+
+    def _prepare_search(self, size: int) -> int:
+        """Make sure the search arrays fit the grid and start a new search id."""
+        if size != self._size:
+            self._size = size
+            self._g = [0.0] * size
+            self._parent = [-1] * size
+            self._seen = [0] * size
+            self._closed = [0] * size
+            self._search_id = 0
+        self._search_id += 1
+        return self._search_id
+
+    def find_path(self, start_pos: Tuple[int, int], goal_pos: Tuple[int, int],
+                  max_nodes: Optional[int] = None) -> Optional[List[Tuple[int, int]]]:
         """
         Find a path from start to goal using A*.
 
         Args:
             start_pos: Starting position (grid_x, grid_y)
             goal_pos: Goal position (grid_x, grid_y)
+            max_nodes: Override for the node expansion budget
 
         Returns:
-            List of positions forming a path, or None if no path exists
+            List of positions forming a path, or None if no path exists.
+            If the budget runs out and partial paths are allowed, the path
+            ends at the explored tile closest to the goal instead.
         """
+        self.last_expanded = 0
+        self.last_partial = False
+
         # Quick check: are start and goal valid?
         if not self.is_walkable(start_pos[0], start_pos[1]):
             return None
@@ -132,80 +166,120 @@ class Pathfinder:
         if start_pos == goal_pos:
             return [start_pos]
 
-        # Initialize
-        start_node = Node(start_pos)
-        goal_node = Node(goal_pos)
-
-        open_list = []
-        heapq.heappush(open_list, start_node)
-        closed_set = set()
-        open_dict = {start_pos: start_node}  # For quick lookup
-
-        # A* search
-        max_iterations = 1000  # Prevent infinite loops
-        iterations = 0
-
-        while open_list and iterations < max_iterations:
-            iterations += 1
-
-            # Get node with lowest f score
-            current_node = heapq.heappop(open_list)
-            if current_node.position in open_dict:
-                del open_dict[current_node.position]
-            closed_set.add(current_node.position)
-
-            # Found the goal?
-            if current_node.position == goal_pos:
-                return self._reconstruct_path(current_node)
+        budget = self.max_nodes if max_nodes is None else max_nodes
+
+        passable = self.grid.store.passable_bitmap()
+        stride = self.grid.width_tiles + 2
+        search_id = self._prepare_search(len(passable))
+        g_score = self._g
+        parent = self._parent
+        seen = self._seen
+        closed = self._closed
+
+        start = (start_pos[1] + 1) * stride + start_pos[0] + 1
+        goal = (goal_pos[1] + 1) * stride + goal_pos[0] + 1
+        goal_x, goal_y = goal_pos[0] + 1, goal_pos[1] + 1
+
+        # (index offset, cost, orthogonal offsets that must be open)
+        straight = ((-stride, STRAIGHT_COST), (1, STRAIGHT_COST),
+                    (stride, STRAIGHT_COST), (-1, STRAIGHT_COST))
+        diagonal = ((1 - stride, 1, -stride), (1 + stride, 1, stride),
+                    (stride - 1, -1, stride), (-stride - 1, -1, -stride))
+        diagonal_saving = DIAGONAL_COST - 2 * STRAIGHT_COST
+
+        def octile(index):
+            dy, dx = divmod(index, stride)
+            dx = abs(dx - goal_x)
+            dy = abs(dy - goal_y)
+            return dx + dy + diagonal_saving * (dx if dx < dy else dy)
+
+        start_h = octile(start)
+        g_score[start] = 0.0
+        parent[start] = -1
+        seen[start] = search_id
+
+        # Heap entries: (f, h, g, index); ties favour nodes nearer the goal
+        open_heap = [(start_h, start_h, 0.0, start)]
+        best_index = start
+        best_h = start_h
+        expanded = 0
+
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        while open_heap:
+            _, h, g, current = heappop(open_heap)
+
+            # Lazy deletion: skip entries superseded by a cheaper push
+            if closed[current] == search_id or g > g_score[current]:
+                continue
+            closed[current] = search_id
+
+            if current == goal:
+                self.last_expanded = expanded
+                return self._reconstruct_path(goal, stride)
+
+            if h < best_h:
+                best_h = h
+                best_index = current
+
+            expanded += 1
+            if expanded > budget:
+                break
 
-            # Check neighbors
-            for neighbor_pos in self.get_neighbors(current_node.position):
-                if neighbor_pos in closed_set:
+            for offset, cost in straight:
+                neighbor = current + offset
+                if not passable[neighbor] or closed[neighbor] == search_id:
                     continue
+                tentative_g = g + cost
+                if seen[neighbor] != search_id or tentative_g < g_score[neighbor]:
+                    seen[neighbor] = search_id
+                    g_score[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    neighbor_h = octile(neighbor)
+                    heappush(open_heap, (tentative_g + neighbor_h, neighbor_h, tentative_g, neighbor))
+
+            for offset, side_x, side_y in diagonal:
+                neighbor = current + offset
+                # No corner cutting: both orthogonal tiles must be open
+                if (not passable[neighbor] or not passable[current + side_x]
+                        or not passable[current + side_y] or closed[neighbor] == search_id):
+                    continue
+                tentative_g = g + DIAGONAL_COST
+                if seen[neighbor] != search_id or tentative_g < g_score[neighbor]:
+                    seen[neighbor] = search_id
+                    g_score[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    neighbor_h = octile(neighbor)
+                    heappush(open_heap, (tentative_g + neighbor_h, neighbor_h, tentative_g, neighbor))
 
-                # Calculate costs
-                # Diagonal movement costs more (1.414) than straight (1.0)
-                dx = abs(neighbor_pos[0] - current_node.position[0])
-                dy = abs(neighbor_pos[1] - current_node.position[1])
-                movement_cost = 1.414 if (dx + dy) == 2 else 1.0
-
-                tentative_g = current_node.g + movement_cost
-
-                # Check if this is a better path
-                if neighbor_pos in open_dict:
-                    neighbor_node = open_dict[neighbor_pos]
-                    if tentative_g < neighbor_node.g:
-                        neighbor_node.g = tentative_g
-                        neighbor_node.h = self.heuristic(neighbor_pos, goal_pos)
-                        neighbor_node.f = neighbor_node.g + neighbor_node.h
-                        neighbor_node.parent = current_node
-                        heapq.heapify(open_list)  # Re-sort
-                else:
-                    neighbor_node = Node(neighbor_pos, current_node)
-                    neighbor_node.g = tentative_g
-                    neighbor_node.h = self.heuristic(neighbor_pos, goal_pos)
-                    neighbor_node.f = neighbor_node.g + neighbor_node.h
-                    heapq.heappush(open_list, neighbor_node)
-                    open_dict[neighbor_pos] = neighbor_node
+        self.last_expanded = expanded
+
+        # Out of budget: head towards the most promising explored tile
+        if open_heap and self.allow_partial and best_index != start:
+            self.last_partial = True
+            return self._reconstruct_path(best_index, stride)
 
         # No path found
         return None
 
-    def _reconstruct_path(self, node: Node) -> List[Tuple[int, int]]:
+    def _reconstruct_path(self, index: int, stride: int) -> List[Tuple[int, int]]:
         """
-        Reconstruct path from goal node back to start.
+        Reconstruct path from the goal index back to start.
 
         Args:
-            node: Goal node
+            index: Padded bitmap index of the last tile
+            stride: Row length of the padded bitmap
 
         Returns:
             List of positions from start to goal
         """
+        parent = self._parent
         path = []
-        current = node
-        while current is not None:
-            path.append(current.position)
-            current = current.parent
+        while index != -1:
+            y, x = divmod(index, stride)
+            path.append((x - 1, y - 1))
+            index = parent[index]
         path.reverse()
         return path
 
@@ -246,7 +320,8 @@ class Pathfinder:
         """
         Check if there's a clear line of sight between two positions.
 
-        Uses Bresenham's line algorithm.
+        Traces every tile the segment between the two tile centres touches,
+        so a straight move between them never clips a blocked corner.
 
         Args:
             pos1: Starting position
@@ -255,31 +330,9 @@ class Pathfinder:
         Returns:
             bool: True if clear line of sight
         """
-        x0, y0 = pos1
-        x1, y1 = pos2
-
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx - dy
-
-        x, y = x0, y0
-
-        while True:
-            # Check if current position is walkable
-            if not self.is_walkable(x, y):
-                return False
-
-            if x == x1 and y == y1:
-                break
-
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x += sx
-            if e2 < dx:
-                err += dx
-                y += sy
-
-        return True
+        if not self.is_walkable(*pos1) or not self.is_walkable(*pos2):
+            return False
+        return trace_clear(
+            self.grid.store.passable_bitmap(), self.grid.width_tiles, self.grid.height_tiles,
+            pos1[0] + 0.5, pos1[1] + 0.5, pos2[0] + 0.5, pos2[1] + 0.5
+        )
@@ -9,9 +9,10 @@ Handles:
 """
 
 import random
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from src.entities.police_officer import PoliceOfficer, PoliceBehavior
 from src.world.tile import TileType
+from src.utils.serialization import pack_objects, unpack_objects, reassign_identity_ids
 
 
 class PoliceManager:
@@ -22,16 +23,19 @@ class PoliceManager:
     responses to illegal activities.
     """
 
-    def __init__(self, grid, suspicion_manager):
+    def __init__(self, grid, suspicion_manager, road_network=None):
         """
         Initialize the police manager.
 
         Args:
             grid: The game world grid
             suspicion_manager: SuspicionManager instance
+            road_network: Optional RoadNetwork; patrols then follow streets
+                between road graph nodes
         """
         self.grid = grid
         self.suspicion_manager = suspicion_manager
+        self.road_network = road_network
         self.police_officers: List[PoliceOfficer] = []
 
         # Base patrol count (increases with suspicion)
@@ -67,6 +71,9 @@ class PoliceManager:
         Returns:
             List of patrol routes (each route is a list of waypoints)
         """
+        if self.road_network is not None and len(self.road_network.graph) > 1:
+            return self._generate_street_patrol_routes(rng, count)
+
         routes = []
 
         # Find road tiles for patrol routes
@@ -113,6 +120,49 @@ class PoliceManager:
 
         return routes
 
+    def _generate_street_patrol_routes(self, rng: random.Random, count: int) -> List[List[Tuple[int, int]]]:
+        """
+        Generate patrol routes as walks over the road graph.
+
+        Consecutive waypoints are graph nodes joined by a straight road, so
+        officers walking directly between them stay on the street.
+
+        Args:
+            rng: Random number generator
+            count (int): Number of routes to generate
+
+        Returns:
+            List of patrol routes (each route is a list of waypoints)
+        """
+        graph = self.road_network.graph
+        connected = sorted(node for node, edges in graph.items() if edges)
+        if not connected:
+            return []
+
+        routes = []
+        for i in range(count):
+            route_length = rng.randint(8, 16)  # 8-16 waypoints per route
+
+            current = rng.choice(connected)
+            previous = None
+            route = [current]
+            for j in range(route_length - 1):
+                # Keep going rather than turning straight back, unless at a dead end
+                options = [edge[0] for edge in graph[current] if edge[0] != previous]
+                if not options:
+                    options = [edge[0] for edge in graph[current]]
+                previous, current = current, rng.choice(options)
+                route.append(current)
+
+            # Officers loop back to the start, so close the route along roads
+            closing = self.road_network.find_route(current[0], current[1], route[0][0], route[0][1])
+            if closing:
+                route.extend(closing[1:-1])
+
+            routes.append(route)
+
+        return routes
+
     def _spawn_patrol(self, route: List[Tuple[int, int]], rng: random.Random):
         """
         Spawn a police patrol along a route.
@@ -292,3 +342,27 @@ class PoliceManager:
             'patrol_count': len(self.police_officers) // self.officers_per_patrol,
             'by_behavior': by_behavior,
         }
+
+    def save_state(self) -> Dict:
+        """
+        Save police manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'police_officers': pack_objects(self.police_officers),
+        }
+
+    def load_state(self, state: Dict) -> Dict[int, int]:
+        """
+        Load police manager state, replacing the current police_officers.
+
+        Args:
+            state (dict): Serialized state
+
+        Returns:
+            dict: Saved officer id -> new id
+        """
+        self.police_officers = unpack_objects(state['police_officers'])
+        return reassign_identity_ids(self.police_officers)
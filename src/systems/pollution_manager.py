@@ -7,8 +7,12 @@ Handles:
 - Pollution decay over time
 - Pollution level tracking per tile
 - Visual overlay rendering (Factorio-style)
+
+Pollution levels live in a dense NumPy array indexed [y, x]; spreading and
+decay are whole-array stencil operations rather than per-tile Python loops.
 """
 
+import numpy as np
 import pygame
 from typing import Dict, Tuple, List, Optional
 
@@ -32,15 +36,30 @@ class PollutionManager:
         self.grid_width = grid_width
         self.grid_height = grid_height
 
-        # Pollution levels per tile (0.0 - 100.0)
-        self.pollution: Dict[Tuple[int, int], float] = {}
+        # Pollution levels per tile (0.0 - 100.0), indexed [y, x]
+        self.levels = np.zeros((grid_height, grid_width), dtype=np.float64)
 
         # Pollution sources (position -> generation rate per second)
         self.sources: Dict[Tuple[int, int], float] = {}
 
+        # Sparse index arrays for injecting source pollution, rebuilt
+        # whenever the sources change
+        self._source_ys = np.zeros(0, dtype=np.intp)
+        self._source_xs = np.zeros(0, dtype=np.intp)
+        self._source_rates = np.zeros(0, dtype=np.float64)
+        self._sources_dirty = False
+
         # Pollution overlay visibility
         self.overlay_visible = False
 
+        # Overlay texture: one RGBA pixel per tile, refreshed lazily after
+        # pollution changes and scaled up to the visible viewport
+        self._overlay_texture = None
+        self._overlay_dirty = True
+        self._overlay_scaled = None
+        self._overlay_scaled_key = None
+        self._color_lut = None
+
         # Spreading and decay parameters
         self.spread_rate = 0.15  # How much pollution spreads to neighbors per second
         self.decay_rate = 0.5    # How much pollution decays per second
@@ -62,6 +81,7 @@ class PollutionManager:
             rate (float): Pollution generation per second
         """
         self.sources[(grid_x, grid_y)] = rate
+        self._sources_dirty = True
 
     def remove_source(self, grid_x: int, grid_y: int):
         """
@@ -73,6 +93,7 @@ class PollutionManager:
         """
         if (grid_x, grid_y) in self.sources:
             del self.sources[(grid_x, grid_y)]
+            self._sources_dirty = True
 
     def update_source(self, grid_x: int, grid_y: int, rate: float):
         """
@@ -85,9 +106,40 @@ class PollutionManager:
         """
         if rate > 0:
             self.sources[(grid_x, grid_y)] = rate
+            self._sources_dirty = True
         elif (grid_x, grid_y) in self.sources:
             # Remove if rate is 0
             del self.sources[(grid_x, grid_y)]
+            self._sources_dirty = True
+
+    def _rebuild_source_index(self):
+        """Rebuild the sparse source arrays from the sources dict."""
+        positions = [(pos, rate) for pos, rate in self.sources.items()
+                     if 0 <= pos[0] < self.grid_width and 0 <= pos[1] < self.grid_height]
+        self._source_xs = np.array([pos[0] for pos, _ in positions], dtype=np.intp)
+        self._source_ys = np.array([pos[1] for pos, _ in positions], dtype=np.intp)
+        self._source_rates = np.array([rate for _, rate in positions], dtype=np.float64)
+        self._sources_dirty = False
+
+    @property
+    def pollution(self) -> Dict[Tuple[int, int], float]:
+        """
+        Polluted tiles as a dict (position -> level).
+
+        Built from the dense array on access; use get_pollution or
+        levels directly in hot code.
+        """
+        ys, xs = np.nonzero(self.levels)
+        values = self.levels[ys, xs]
+        return {(x, y): v for x, y, v in zip(xs.tolist(), ys.tolist(), values.tolist())}
+
+    @pollution.setter
+    def pollution(self, values: Dict[Tuple[int, int], float]):
+        self._overlay_dirty = True
+        self.levels.fill(0.0)
+        for (x, y), value in values.items():
+            if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
+                self.levels[y, x] = value
 
     def add_pollution(self, grid_x: int, grid_y: int, amount: float):
         """
@@ -101,9 +153,8 @@ class PollutionManager:
         if not (0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height):
             return
 
-        pos = (grid_x, grid_y)
-        current = self.pollution.get(pos, 0.0)
-        self.pollution[pos] = min(self.max_pollution, current + amount)
+        self.levels[grid_y, grid_x] = min(self.max_pollution, self.levels[grid_y, grid_x] + amount)
+        self._overlay_dirty = True
 
     def get_pollution(self, grid_x: int, grid_y: int) -> float:
         """
@@ -116,7 +167,9 @@ class PollutionManager:
         Returns:
             float: Pollution level (0.0 - 100.0)
         """
-        return self.pollution.get((grid_x, grid_y), 0.0)
+        if not (0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height):
+            return 0.0
+        return float(self.levels[grid_y, grid_x])
 
     def toggle_overlay(self):
         """Toggle pollution overlay visibility."""
@@ -140,71 +193,68 @@ class PollutionManager:
         self.update_timer = 0.0
 
         # Generate pollution from sources
-        for pos, rate in self.sources.items():
-            self.add_pollution(pos[0], pos[1], rate * dt)
+        self._inject_sources(dt)
 
         # Spread and decay pollution
         self._spread_pollution(dt)
         self._decay_pollution(dt)
+        self._overlay_dirty = True
 
-    def _spread_pollution(self, dt: float):
-        """Spread pollution to neighboring tiles."""
-        # Create new pollution dict for spreading
-        spread_changes: Dict[Tuple[int, int], float] = {}
-
-        # Iterate through all polluted tiles
-        for pos, amount in list(self.pollution.items()):
-            if amount < 1.0:
-                continue
-
-            grid_x, grid_y = pos
-
-            # Spread to 4 neighbors (not diagonal)
-            neighbors = [
-                (grid_x - 1, grid_y),
-                (grid_x + 1, grid_y),
-                (grid_x, grid_y - 1),
-                (grid_x, grid_y + 1),
-            ]
-
-            spread_amount = amount * self.spread_rate * dt / 4.0
-
-            for nx, ny in neighbors:
-                if 0 <= nx < self.grid_width and 0 <= ny < self.grid_height:
-                    neighbor_pos = (nx, ny)
-                    neighbor_amount = self.pollution.get(neighbor_pos, 0.0)
-
-                    # Only spread if neighbor has less pollution
-                    if neighbor_amount < amount:
-                        spread_changes[neighbor_pos] = spread_changes.get(neighbor_pos, 0.0) + spread_amount
-                        spread_changes[pos] = spread_changes.get(pos, 0.0) - spread_amount
-
-        # Apply spread changes
-        for pos, change in spread_changes.items():
-            current = self.pollution.get(pos, 0.0)
-            new_amount = max(0.0, min(self.max_pollution, current + change))
-            if new_amount > 0.1:
-                self.pollution[pos] = new_amount
-            elif pos in self.pollution:
-                del self.pollution[pos]
+    def _inject_sources(self, dt: float):
+        """Add each source's output to its tile."""
+        if self._sources_dirty:
+            self._rebuild_source_index()
+        if len(self._source_rates) == 0:
+            return
 
-    def _decay_pollution(self, dt: float):
-        """Decay pollution over time."""
-        to_remove = []
+        ys, xs = self._source_ys, self._source_xs
+        self.levels[ys, xs] = np.minimum(self.max_pollution,
+                                         self.levels[ys, xs] + self._source_rates * dt)
 
-        for pos, amount in self.pollution.items():
-            # Decay
-            decay_amount = self.decay_rate * dt
-            new_amount = max(0.0, amount - decay_amount)
+    def _spread_pollution(self, dt: float):
+        """
+        Spread pollution to neighboring tiles.
 
-            if new_amount < 0.1:
-                to_remove.append(pos)
-            else:
-                self.pollution[pos] = new_amount
+        Each tile with at least 1.0 pollution sends a quarter of
+        spread_rate * dt of its level to each of its 4 neighbours that has
+        less pollution. Tiles that sent or received pollution are clamped
+        to [0, max] and cleared if they end up at 0.1 or below.
+        """
+        levels = self.levels
+        active = levels >= 1.0
+        spread = np.where(active, levels * (self.spread_rate * dt / 4.0), 0.0)
+
+        change = np.zeros_like(levels)
+        touched = np.zeros(levels.shape, dtype=bool)
+
+        # (source slice, neighbour slice) for east, west, south and north
+        whole = slice(None)
+        head = slice(None, -1)
+        tail = slice(1, None)
+        directions = (
+            ((whole, head), (whole, tail)),
+            ((whole, tail), (whole, head)),
+            ((head, whole), (tail, whole)),
+            ((tail, whole), (head, whole)),
+        )
+
+        for src, dst in directions:
+            flows = active[src] & (levels[dst] < levels[src])
+            amount = np.where(flows, spread[src], 0.0)
+            change[src] -= amount
+            change[dst] += amount
+            touched[src] |= flows
+            touched[dst] |= flows
+
+        updated = np.clip(levels + change, 0.0, self.max_pollution)
+        updated[updated <= 0.1] = 0.0
+        np.copyto(levels, updated, where=touched)
 
-        # Remove negligible pollution
-        for pos in to_remove:
-            del self.pollution[pos]
+    def _decay_pollution(self, dt: float):
+        """Decay pollution over time, clearing negligible levels."""
+        levels = self.levels
+        np.maximum(levels - self.decay_rate * dt, 0.0, out=levels)
+        levels[levels < 0.1] = 0.0
 
     def render_overlay(self, screen: pygame.Surface, camera, tile_size: int):
         """
@@ -223,32 +273,60 @@ class PollutionManager:
         start_y = max(0, int(camera.y // tile_size))
         end_x = min(self.grid_width, int((camera.x + camera.width) // tile_size) + 2)
         end_y = min(self.grid_height, int((camera.y + camera.height) // tile_size) + 2)
+        if start_x >= end_x or start_y >= end_y:
+            return
 
-        # Create overlay surface with alpha
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-
-        # Render pollution
-        for grid_y in range(start_y, end_y):
-            for grid_x in range(start_x, end_x):
-                pollution = self.get_pollution(grid_x, grid_y)
-
-                if pollution < 1.0:
-                    continue
-
-                # Convert to screen coordinates
-                world_x = grid_x * tile_size
-                world_y = grid_y * tile_size
-                screen_x = world_x - camera.x
-                screen_y = world_y - camera.y
-
-                # Calculate color based on pollution level
-                color = self._get_pollution_color(pollution)
-
-                # Draw pollution tile
-                pygame.draw.rect(overlay, color, (screen_x, screen_y, tile_size, tile_size))
+        texture = self._get_overlay_texture()
+
+        # Scale the visible tiles up to screen size (reused while the
+        # view and pollution are unchanged)
+        key = (start_x, start_y, end_x, end_y, tile_size)
+        if self._overlay_scaled_key != key:
+            visible = texture.subsurface((start_x, start_y, end_x - start_x, end_y - start_y))
+            self._overlay_scaled = pygame.transform.scale(
+                visible, ((end_x - start_x) * tile_size, (end_y - start_y) * tile_size))
+            self._overlay_scaled_key = key
+
+        screen.blit(self._overlay_scaled, (start_x * tile_size - camera.x,
+                                           start_y * tile_size - camera.y))
+
+    def _get_overlay_texture(self) -> pygame.Surface:
+        """Get the tile-resolution overlay texture, refreshing it if stale."""
+        if self._overlay_texture is None:
+            self._overlay_texture = pygame.Surface((self.grid_width, self.grid_height), pygame.SRCALPHA)
+            self._overlay_dirty = True
+
+        if self._overlay_dirty:
+            if self._color_lut is None:
+                self._color_lut = self._build_color_lut()
+
+            # Quantize levels to LUT indices; tiles under 1.0 stay clear
+            indices = np.clip(self.levels * (255.0 / self.max_pollution), 0, 255).astype(np.uint8)
+            rgba = self._color_lut[indices]
+            rgba[self.levels < 1.0] = 0
+
+            # surfarray views are indexed [x, y]
+            pixels = pygame.surfarray.pixels3d(self._overlay_texture)
+            pixels[...] = rgba[:, :, :3].transpose(1, 0, 2)
+            del pixels
+            alpha = pygame.surfarray.pixels_alpha(self._overlay_texture)
+            alpha[...] = rgba[:, :, 3].T
+            del alpha
+
+            self._overlay_dirty = False
+            self._overlay_scaled_key = None
+
+        return self._overlay_texture
+
+    def _build_color_lut(self) -> np.ndarray:
+        """
+        Build the 256-entry colour ramp used by the overlay.
 
-        # Blit overlay to screen
-        screen.blit(overlay, (0, 0))
+        Returns:
+            np.ndarray: (256, 4) uint8 RGBA colours indexed by level / max * 255
+        """
+        return np.array([self._get_pollution_color(i * self.max_pollution / 255.0)
+                         for i in range(256)], dtype=np.uint8)
 
     def _get_pollution_color(self, pollution: float) -> Tuple[int, int, int, int]:
         """
@@ -302,7 +380,8 @@ class PollutionManager:
         Returns:
             dict: Statistics
         """
-        if not self.pollution:
+        polluted = self.levels[self.levels != 0.0]
+        if polluted.size == 0:
             return {
                 'total_tiles': 0,
                 'avg_pollution': 0.0,
@@ -311,12 +390,12 @@ class PollutionManager:
                 'sources': len(self.sources)
             }
 
-        total = sum(self.pollution.values())
-        max_level = max(self.pollution.values())
-        avg = total / len(self.pollution)
+        total = float(polluted.sum())
+        max_level = float(polluted.max())
+        avg = total / polluted.size
 
         return {
-            'total_tiles': len(self.pollution),
+            'total_tiles': int(polluted.size),
             'avg_pollution': avg,
             'max_pollution_level': max_level,
             'total_pollution': total,
@@ -326,28 +405,38 @@ class PollutionManager:
     def to_dict(self) -> Dict:
         """Serialize pollution state for saving."""
         return {
-            'pollution': {f"{x},{y}": v for (x, y), v in self.pollution.items()},
-            'sources': {f"{x},{y}": v for (x, y), v in self.sources.items()},
-            'overlay_visible': self.overlay_visible
+            'levels': self.levels,
+            'sources': [[x, y, rate] for (x, y), rate in self.sources.items()],
+            'overlay_visible': self.overlay_visible,
+            'update_timer': self.update_timer,
         }
 
     def from_dict(self, data: Dict):
         """Load pollution state from saved data."""
-        # Load pollution
-        pollution_data = data.get('pollution', {})
-        self.pollution = {}
-        for key, value in pollution_data.items():
-            x, y = map(int, key.split(','))
-            self.pollution[(x, y)] = value
+        self._overlay_dirty = True
+        if 'levels' in data:
+            levels = np.asarray(data['levels'], dtype=np.float64)
+            if levels.shape != self.levels.shape:
+                raise ValueError(f"Saved pollution grid is {levels.shape[1]}x{levels.shape[0]}, "
+                                 f"expected {self.grid_width}x{self.grid_height}")
+            self.levels[...] = levels
+        else:
+            # Older saves: sparse "x,y" -> level
+            self.levels.fill(0.0)
+            for key, value in data.get('pollution', {}).items():
+                x, y = map(int, key.split(','))
+                if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
+                    self.levels[y, x] = value
 
         # Load sources
-        sources_data = data.get('sources', {})
-        self.sources = {}
-        for key, value in sources_data.items():
-            x, y = map(int, key.split(','))
-            self.sources[(x, y)] = value
+        sources_data = data.get('sources', [])
+        if isinstance(sources_data, dict):
+            sources_data = [list(map(int, key.split(','))) + [value] for key, value in sources_data.items()]
+        self.sources = {(int(x), int(y)): rate for x, y, rate in sources_data}
+        self._sources_dirty = True
 
         self.overlay_visible = data.get('overlay_visible', False)
+        self.update_timer = data.get('update_timer', 0.0)
 
     def __repr__(self):
         """String representation for debugging."""
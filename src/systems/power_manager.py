@@ -2,6 +2,8 @@
 PowerManager - manages power generation, consumption, and distribution.
 """
 
+from typing import Dict
+
 
 class PowerManager:
     """
@@ -166,6 +168,35 @@ class PowerManager:
             'blackout': self.blackout,
         }
 
+    def save_state(self) -> Dict:
+        """
+        Save power manager state.
+
+        Generation, consumption and capacity are recalculated from the
+        buildings every update; only the stored power and status flags are saved.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'current_power': self.current_power,
+            'has_power': self.has_power,
+            'brownout': self.brownout,
+            'blackout': self.blackout,
+        }
+
+    def load_state(self, state: Dict):
+        """
+        Load power manager state.
+
+        Args:
+            state (dict): Serialized state
+        """
+        self.current_power = state.get('current_power', 0.0)
+        self.has_power = state.get('has_power', True)
+        self.brownout = state.get('brownout', False)
+        self.blackout = state.get('blackout', False)
+
     def __repr__(self):
         """String representation for debugging."""
         return (f"PowerManager(gen={self.total_generation:.1f}, "
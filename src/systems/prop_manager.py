@@ -8,11 +8,12 @@ Handles:
 """
 
 import random
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.entities.prop import (Prop, Bench, LightPole, TrashCan, Bicycle, Tree,
                                 FlowerBed, FireHydrant, Mailbox, ParkingMeter,
                                 NewspaperStand, PropType)
 from src.world.tile import TileType
+from src.utils.serialization import pack_objects, unpack_objects, reassign_identity_ids
 
 
 class PropManager:
@@ -432,6 +433,30 @@ class PropManager:
         if prop in self.props:
             self.props.remove(prop)
 
+    def save_state(self) -> Dict:
+        """
+        Save prop manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'props': pack_objects(self.props),
+        }
+
+    def load_state(self, state: Dict) -> Dict[int, int]:
+        """
+        Load prop manager state, replacing the current props.
+
+        Args:
+            state (dict): Serialized state
+
+        Returns:
+            dict: Saved prop id -> new id
+        """
+        self.props = unpack_objects(state['props'])
+        return reassign_identity_ids(self.props)
+
     def __repr__(self):
         """String representation for debugging."""
         return f"PropManager(props={len(self.props)})"
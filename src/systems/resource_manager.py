@@ -2,6 +2,8 @@
 ResourceManager - tracks materials, money, and resources.
 """
 
+from typing import Dict
+
 
 class ResourceManager:
     """
@@ -210,6 +212,32 @@ class ResourceManager:
             'material_types_stored': len([q for q in self.stored_materials.values() if q > 0]),
         }
 
+    def save_state(self) -> Dict:
+        """
+        Save resource manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'money': self.money,
+            'stored_materials': dict(self.stored_materials),
+            'total_materials_collected': self.total_materials_collected,
+            'total_money_earned': self.total_money_earned,
+        }
+
+    def load_state(self, state: Dict):
+        """
+        Load resource manager state.
+
+        Args:
+            state (dict): Serialized state
+        """
+        self.money = state.get('money', 1000.0)
+        self.stored_materials = dict(state.get('stored_materials', {}))
+        self.total_materials_collected = state.get('total_materials_collected', 0.0)
+        self.total_money_earned = state.get('total_money_earned', 0.0)
+
     def __repr__(self):
         """String representation for debugging."""
         return (f"ResourceManager(money=${self.money:.2f}, "
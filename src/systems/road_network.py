@@ -8,10 +8,36 @@ Provides:
 - Pathfinding support for vehicles
 """
 
+import heapq
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Set, Optional
+import numpy as np
 from src.world.tile import TileType
 
 
+# Tile types vehicles can drive on
+ROAD_TILE_TYPES = (TileType.ROAD_DIRT, TileType.ROAD_TAR, TileType.ROAD_ASPHALT)
+
+# Routing table rows (one per destination node) kept before the least
+# recently used are dropped
+DEFAULT_MAX_ROUTING_ROWS = 512
+
+# Graph changes remembered for repairing rows lazily; rows that fall
+# further behind are rebuilt instead
+MAX_PENDING_GRAPH_CHANGES = 32
+
+INFINITY = float('inf')
+
+
+# Cardinal directions as (name, dx, dy)
+DIRECTION_OFFSETS = (
+    ('north', 0, -1),
+    ('south', 0, 1),
+    ('east', 1, 0),
+    ('west', -1, 0),
+)
+
+
 class RoadSegment:
     """
     Represents a connected segment of road tiles.
@@ -58,12 +84,13 @@ class RoadNetwork:
     with segments, intersections, and lane information.
     """
 
-    def __init__(self, grid):
+    def __init__(self, grid, max_routing_rows: int = DEFAULT_MAX_ROUTING_ROWS):
         """
         Initialize road network.
 
         Args:
             grid: World grid containing road tiles
+            max_routing_rows: Destination rows kept in the routing table
         """
         self.grid = grid
 
@@ -77,9 +104,46 @@ class RoadNetwork:
         # Maps (x, y) -> {'north': (lane_x, lane_y), 'south': (lane_x, lane_y), ...}
         self.lane_centers: Dict[Tuple[int, int], Dict[str, Tuple[float, float]]] = {}
 
+        # Node-level graph for routing. Nodes are intersections, corners and
+        # dead ends, so every edge is a straight run of road tiles.
+        # node -> list of (neighbor_node, length_in_tiles, direction)
+        self.graph: Dict[Tuple[int, int], List[Tuple[Tuple[int, int], int, str]]] = {}
+        # Road tile between two nodes -> (node_a, tiles_to_a, node_b, tiles_to_b)
+        self.tile_edges: Dict[Tuple[int, int], Tuple[Tuple[int, int], int, Tuple[int, int], int]] = {}
+
+        # Next-hop routing table, filled lazily one destination at a time:
+        # destination node -> [distance per node, next node per node,
+        # graph version the row matches]
+        self.routing_rows: OrderedDict = OrderedDict()
+        self.max_routing_rows = max_routing_rows
+
+        # Recent graph edits as (version, removed, added, vanished); rows
+        # are brought up to date with them when next used
+        self._graph_version = 0
+        self._graph_changes = []
+
+        # Road changes are applied to tiles/lanes as they happen; the graph
+        # and routing table catch up on the next route query. Single tile
+        # changes only re-walk the runs around them; bulk changes rebuild.
+        self._graph_dirty = False
+        self._changed_roads = set()
+        self._store_version = grid.store.version
+        self._tile_events = 0
+
+        # Statistics
+        self.graph_rebuilds = 0
+        self.graph_repairs = 0
+        self.rows_built = 0
+        self.rows_repaired = 0
+        self.rows_dropped = 0
+
         # Build the network
         self._build_network()
 
+        # Bridges, construction sites, buildings and road edits all arrive
+        # as tile changes
+        grid.store.add_listener(self._on_tile_changed)
+
     def _build_network(self):
         """Build the road network graph from grid tiles."""
         print("Building road network...")
@@ -90,26 +154,30 @@ class RoadNetwork:
         # Step 2: Identify intersections
         self._identify_intersections()
 
-        # Step 3: Build road segments (not implemented in this version,
-        #         but could segment roads between intersections)
+        # Step 3: Compile straight road runs into a node graph
+        self._build_graph()
 
         # Step 4: Calculate lane centers for each road tile
         self._calculate_lane_centers()
 
         print(f"Road network built: {len(self.road_tiles)} road tiles, "
-              f"{len(self.intersections)} intersections")
+              f"{len(self.intersections)} intersections, {len(self.graph)} route nodes")
 
     def _find_road_tiles(self):
-        """Scan grid and find all road tiles."""
-        for y in range(self.grid.height_tiles):
-            for x in range(self.grid.width_tiles):
-                tile = self.grid.get_tile(x, y)
-                if tile and self._is_road_tile(tile):
-                    self.road_tiles.add((x, y))
+        """Scan grid and find all drivable road tiles."""
+        store = self.grid.store
+        mask = np.isin(store.tile_type, ROAD_TILE_TYPES) & store.passable_mask()
+        ys, xs = np.nonzero(mask)
+        self.road_tiles = set(zip(xs.tolist(), ys.tolist()))
 
     def _is_road_tile(self, tile) -> bool:
         """Check if a tile is a road."""
-        return tile.tile_type in [TileType.ROAD_DIRT, TileType.ROAD_TAR, TileType.ROAD_ASPHALT]
+        return tile.tile_type in ROAD_TILE_TYPES
+
+    def _is_drivable(self, grid_x: int, grid_y: int) -> bool:
+        """Check if a tile is a road that vehicles can currently use."""
+        store = self.grid.store
+        return store.tile_type[grid_y, grid_x] in ROAD_TILE_TYPES and store.is_passable(grid_x, grid_y)
 
     def _identify_intersections(self):
         """
@@ -117,6 +185,7 @@ class RoadNetwork:
 
         An intersection is defined as a road tile with 3 or 4 neighboring roads.
         """
+        self.intersections = set()
         for road_pos in self.road_tiles:
             x, y = road_pos
 
@@ -158,6 +227,86 @@ class RoadNetwork:
 
         return neighbors
 
+    def _is_graph_node(self, grid_x: int, grid_y: int) -> bool:
+        """
+        Check whether a road tile is a routing node.
+
+        Every tile except the middle of a straight run is a node: junctions,
+        corners, dead ends and isolated tiles.
+        """
+        road_tiles = self.road_tiles
+        north = (grid_x, grid_y - 1) in road_tiles
+        south = (grid_x, grid_y + 1) in road_tiles
+        east = (grid_x + 1, grid_y) in road_tiles
+        west = (grid_x - 1, grid_y) in road_tiles
+        if north + south + east + west != 2:
+            return True
+        return not ((north and south) or (east and west))
+
+    def _build_graph(self):
+        """
+        Build the node graph by walking each straight run once.
+
+        Edges are stored in both directions with their length in tiles, and
+        every tile inside a run remembers the two nodes at its ends.
+        """
+        self.graph = {}
+        self.tile_edges = {}
+
+        nodes = [pos for pos in self.road_tiles if self._is_graph_node(*pos)]
+        for node in nodes:
+            self.graph[node] = []
+
+        road_tiles = self.road_tiles
+        for node_x, node_y in nodes:
+            for direction, dx, dy in DIRECTION_OFFSETS:
+                # Walk each run from its west/north end only
+                if direction in ('south', 'east') and (node_x + dx, node_y + dy) in road_tiles:
+                    self._add_run((node_x, node_y), direction, dx, dy)
+
+    def _add_run(self, node, direction: str, dx: int, dy: int):
+        """
+        Walk the straight run leaving a node and add it to the graph.
+
+        Args:
+            node (tuple): Node the run starts at
+            direction (str): Direction of the first step (a road tile)
+            dx (int): X step
+            dy (int): Y step
+
+        Returns:
+            tuple: (west/north node, east/south node, length) of the run
+        """
+        x, y = node[0] + dx, node[1] + dy
+        run = []
+        while (x, y) not in self.graph:
+            run.append((x, y))
+            x += dx
+            y += dy
+        other = (x, y)
+        length = len(run) + 1
+
+        # Store runs from their west/north end
+        if direction in ('north', 'west'):
+            node, other = other, node
+            run.reverse()
+            direction = 'south' if direction == 'north' else 'east'
+
+        reverse = 'north' if direction == 'south' else 'west'
+        self.graph[node].append((other, length, direction))
+        self.graph[other].append((node, length, reverse))
+
+        for i, tile in enumerate(run):
+            self.tile_edges[tile] = (node, i + 1, other, length - i - 1)
+        return node, other, length
+
+    def _attachments(self, pos: Tuple[int, int]) -> List[Tuple[Tuple[int, int], int]]:
+        """Get the nodes a road tile connects to, with their distances."""
+        if pos in self.graph:
+            return [(pos, 0)]
+        node_a, dist_a, node_b, dist_b = self.tile_edges[pos]
+        return [(node_a, dist_a), (node_b, dist_b)]
+
     def _calculate_lane_centers(self):
         """
         Calculate lane center positions for each road tile.
@@ -169,44 +318,396 @@ class RoadNetwork:
         - Horizontal roads: north lane goes east, south lane goes west
         - Vertical roads: west lane goes south, east lane goes north
         """
+        self.lane_centers = {}
+        for road_pos in self.road_tiles:
+            self.lane_centers[road_pos] = self._get_lane_centers(*road_pos)
+
+    def _get_lane_centers(self, grid_x: int, grid_y: int) -> Dict[str, Tuple[float, float]]:
+        """
+        Calculate the lane centers of one road tile.
+
+        Args:
+            grid_x (int): Grid X position
+            grid_y (int): Grid Y position
+
+        Returns:
+            dict: direction -> (world_x, world_y) of that lane's center
+        """
         # Get tile size from grid
         tile_size = self.grid.tile_size
 
         # Lane offset from center (1/4 of tile size)
         lane_offset = tile_size / 4.0
 
-        for road_pos in self.road_tiles:
-            grid_x, grid_y = road_pos
+        # World position of tile center
+        world_x = grid_x * tile_size + tile_size / 2
+        world_y = grid_y * tile_size + tile_size / 2
+
+        # Determine road orientation
+        neighbors = self._get_road_neighbors(grid_x, grid_y)
+
+        # Check if horizontal road (has east/west neighbors)
+        has_horizontal = 'east' in neighbors or 'west' in neighbors
+        # Check if vertical road (has north/south neighbors)
+        has_vertical = 'north' in neighbors or 'south' in neighbors
+
+        lanes = {}
+
+        # Horizontal road lanes
+        if has_horizontal:
+            # North lane (goes east, right-side driving)
+            lanes['east'] = (world_x, world_y - lane_offset)
+            # South lane (goes west)
+            lanes['west'] = (world_x, world_y + lane_offset)
+
+        # Vertical road lanes
+        if has_vertical:
+            # West lane (goes south)
+            lanes['south'] = (world_x - lane_offset, world_y)
+            # East lane (goes north)
+            lanes['north'] = (world_x + lane_offset, world_y)
+
+        return lanes
+
+    # Road changes
+
+    def _on_tile_changed(self, grid_x: int, grid_y: int):
+        """Apply a tile change to the road tiles, intersections and lanes."""
+        self._tile_events += 1
+
+        pos = (grid_x, grid_y)
+        drivable = self._is_drivable(grid_x, grid_y)
+        if drivable == (pos in self.road_tiles):
+            return
+
+        if drivable:
+            self.road_tiles.add(pos)
+        else:
+            self.road_tiles.discard(pos)
+
+        # The tile and its neighbours may change lanes or junction status
+        for _, dx, dy in ((None, 0, 0),) + DIRECTION_OFFSETS:
+            tile = (grid_x + dx, grid_y + dy)
+            if tile not in self.road_tiles:
+                self.intersections.discard(tile)
+                self.lane_centers.pop(tile, None)
+                continue
+            if len(self._get_road_neighbors(*tile)) >= 3:
+                self.intersections.add(tile)
+            else:
+                self.intersections.discard(tile)
+            self.lane_centers[tile] = self._get_lane_centers(*tile)
+
+        self._changed_roads.add(pos)
+
+    def sync(self):
+        """
+        Bring the node graph and routing table up to date with the grid.
+
+        Called by the route queries. Tile changes reported one by one only
+        repair the parts of each routing row that used a changed road (when
+        that row is next used); bulk grid changes (no per-tile events)
+        rescan every road tile.
+        """
+        version = self.grid.store.version
+        if version != self._store_version:
+            if version - self._store_version != self._tile_events:
+                self._find_road_tiles()
+                self._identify_intersections()
+                self._calculate_lane_centers()
+                self._graph_dirty = True
+            self._store_version = version
+            self._tile_events = 0
+
+        if self._graph_dirty:
+            self._rebuild_graph()
+        elif self._changed_roads:
+            self._repair_graph()
+
+    def _edge_set(self):
+        """Get every directed graph edge as (node, neighbor, length)."""
+        return {(node, other, length)
+                for node, edges in self.graph.items()
+                for other, length, _ in edges}
+
+    def _rebuild_graph(self):
+        """Rebuild the whole node graph and log how its edges changed."""
+        old_nodes = set(self.graph)
+        old_edges = self._edge_set()
+        self._build_graph()
+        self._graph_dirty = False
+        self._changed_roads = set()
+        self.graph_rebuilds += 1
+
+        new_edges = self._edge_set()
+        self._log_graph_change(old_edges - new_edges, new_edges - old_edges,
+                               old_nodes.difference(self.graph))
+
+    def _repair_graph(self):
+        """
+        Re-walk only the runs touching changed road tiles.
+
+        Every run through a changed tile or one of its neighbours is taken
+        out, node status is re-checked for those tiles, and runs are walked
+        again from the affected nodes and the old run ends. The rest of the
+        graph is left alone.
+        """
+        graph = self.graph
+        affected = set()
+        for x, y in self._changed_roads:
+            affected.add((x, y))
+            for _, dx, dy in DIRECTION_OFFSETS:
+                affected.add((x + dx, y + dy))
+        self._changed_roads = set()
+        self.graph_repairs += 1
+
+        # Runs as (west/north node, east/south node, length)
+        old_runs = set()
+        for tile in affected:
+            if tile in graph:
+                for other, length, direction in graph[tile]:
+                    if direction in ('south', 'east'):
+                        old_runs.add((tile, other, length))
+                    else:
+                        old_runs.add((other, tile, length))
+            elif tile in self.tile_edges:
+                node_a, dist_a, node_b, dist_b = self.tile_edges[tile]
+                old_runs.add((node_a, node_b, dist_a + dist_b))
+
+        ends = set()
+        for node_a, node_b, length in old_runs:
+            graph[node_a] = [edge for edge in graph[node_a] if edge[0] != node_b]
+            graph[node_b] = [edge for edge in graph[node_b] if edge[0] != node_a]
+            dx = (node_b[0] > node_a[0]) - (node_b[0] < node_a[0])
+            dy = (node_b[1] > node_a[1]) - (node_b[1] < node_a[1])
+            for i in range(1, length):
+                self.tile_edges.pop((node_a[0] + i * dx, node_a[1] + i * dy), None)
+            ends.add(node_a)
+            ends.add(node_b)
+
+        # Affected tiles may have become (or stopped being) nodes
+        vanished = set()
+        for tile in affected:
+            if tile in self.road_tiles and self._is_graph_node(*tile):
+                graph.setdefault(tile, [])
+            elif tile in graph:
+                del graph[tile]
+                vanished.add(tile)
+
+        new_runs = set()
+        for node in ends | affected:
+            if node not in graph:
+                continue
+            taken = {direction for _, _, direction in graph[node]}
+            for direction, dx, dy in DIRECTION_OFFSETS:
+                if direction not in taken and (node[0] + dx, node[1] + dy) in self.road_tiles:
+                    new_runs.add(self._add_run(node, direction, dx, dy))
+
+        old_edges = self._run_edges(old_runs)
+        new_edges = self._run_edges(new_runs)
+        self._log_graph_change(old_edges - new_edges, new_edges - old_edges, vanished)
+
+    @staticmethod
+    def _run_edges(runs):
+        """Get both directed edges of each run as (node, neighbor, length)."""
+        edges = set()
+        for node_a, node_b, length in runs:
+            edges.add((node_a, node_b, length))
+            edges.add((node_b, node_a, length))
+        return edges
+
+    def _log_graph_change(self, removed, added, vanished):
+        """Record a graph edit for the routing rows to catch up on."""
+        if not removed and not added:
+            return
+
+        self._graph_version += 1
+        self._graph_changes.append((self._graph_version, removed, added, vanished))
+        del self._graph_changes[:-MAX_PENDING_GRAPH_CHANGES]
+
+    def _catch_up_row(self, destination, row) -> bool:
+        """
+        Apply the graph edits a routing row has not seen yet.
+
+        Returns:
+            bool: False if the row is too far behind or its destination is gone
+        """
+        if not self._graph_changes or row[2] < self._graph_changes[0][0] - 1:
+            return False
+        for version, removed, added, vanished in self._graph_changes:
+            if version <= row[2]:
+                continue
+            if not self._repair_row(destination, row, removed, added, vanished):
+                return False
+            self.rows_repaired += 1
+        row[2] = self._graph_version
+        return True
 
-            # World position of tile center
-            world_x = grid_x * tile_size + tile_size / 2
-            world_y = grid_y * tile_size + tile_size / 2
+    def _repair_row(self, destination, row, removed, added, vanished) -> bool:
+        """
+        Update one routing row for one batch of changed edges.
+
+        Nodes whose route ran along a removed edge lose their entry along
+        with every node routed through them, and are re-seeded from their
+        intact neighbours; shorter routes through new edges are then
+        propagated. Nodes that no longer exist are forgotten.
+
+        Returns:
+            bool: False if the destination itself is gone
+        """
+        if destination not in self.graph:
+            return False
+
+        dist, next_hop = row[0], row[1]
+        graph = self.graph
+
+        # Entries routed over a removed edge, plus everything behind them
+        invalid = {other for node, other, _ in removed if next_hop.get(other) == node}
+        if invalid:
+            children = {}
+            for node, hop in next_hop.items():
+                if hop is not None:
+                    children.setdefault(hop, []).append(node)
+            queue = list(invalid)
+            while queue:
+                for child in children.get(queue.pop(), ()):
+                    if child not in invalid:
+                        invalid.add(child)
+                        queue.append(child)
+
+        for node in invalid.union(vanished):
+            if node in dist:
+                del dist[node]
+                del next_hop[node]
+
+        heap = []
+        for node in invalid:
+            if node not in graph:
+                continue
+            best = INFINITY
+            for neighbor, length, _ in graph[node]:
+                if neighbor in dist and dist[neighbor] + length < best:
+                    best = dist[neighbor] + length
+                    next_hop[node] = neighbor
+            if best != INFINITY:
+                dist[node] = best
+                heap.append((best, node))
+
+        for node, other, length in added:
+            if node in dist and dist[node] + length < dist.get(other, INFINITY):
+                dist[other] = dist[node] + length
+                next_hop[other] = node
+                heap.append((dist[other], other))
+
+        heapq.heapify(heap)
+        self._propagate_row(dist, next_hop, heap)
+        return True
+
+    # Routing table
+
+    def _get_routing_row(self, destination):
+        """Get (or build) the routing row toward a destination node."""
+        row = self.routing_rows.get(destination)
+        if row is not None:
+            if row[2] == self._graph_version or self._catch_up_row(destination, row):
+                self.routing_rows.move_to_end(destination)
+                return row
+            del self.routing_rows[destination]
+            self.rows_dropped += 1
+
+        dist = {destination: 0}
+        next_hop = {destination: None}
+        self._propagate_row(dist, next_hop, [(0, destination)])
+        row = [dist, next_hop, self._graph_version]
+
+        self.routing_rows[destination] = row
+        self.rows_built += 1
+        while len(self.routing_rows) > self.max_routing_rows:
+            self.routing_rows.popitem(last=False)
+        return row
+
+    def _propagate_row(self, dist, next_hop, heap):
+        """Run Dijkstra outwards from the nodes in the heap."""
+        graph = self.graph
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        while heap:
+            d, current = heappop(heap)
+            if d > dist[current]:
+                continue
+            for neighbor, length, _ in graph[current]:
+                new_dist = d + length
+                if new_dist < dist.get(neighbor, INFINITY):
+                    dist[neighbor] = new_dist
+                    next_hop[neighbor] = current
+                    heappush(heap, (new_dist, neighbor))
+
+    def lookup_route(self, start_x: int, start_y: int, end_x: int, end_y: int) -> Optional[List[Tuple[int, int]]]:
+        """
+        Look up a shortest road route in the next-hop routing table.
 
-            # Determine road orientation
-            neighbors = self._get_road_neighbors(grid_x, grid_y)
+        Same result format as find_route. The first route to a destination
+        builds that destination's row; later lookups only follow next hops,
+        so their cost is the number of turns in the route.
 
-            # Check if horizontal road (has east/west neighbors)
-            has_horizontal = 'east' in neighbors or 'west' in neighbors
-            # Check if vertical road (has north/south neighbors)
-            has_vertical = 'north' in neighbors or 'south' in neighbors
+        Args:
+            start_x (int): Start grid X
+            start_y (int): Start grid Y
+            end_x (int): End grid X
+            end_y (int): End grid Y
 
-            lanes = {}
+        Returns:
+            list: Start, the nodes passed through, and end; or None if no path
+        """
+        self.sync()
 
-            # Horizontal road lanes
-            if has_horizontal:
-                # North lane (goes east, right-side driving)
-                lanes['east'] = (world_x, world_y - lane_offset)
-                # South lane (goes west)
-                lanes['west'] = (world_x, world_y + lane_offset)
+        # Validate start and end are roads
+        if not self.is_road(start_x, start_y) or not self.is_road(end_x, end_y):
+            return None
 
-            # Vertical road lanes
-            if has_vertical:
-                # West lane (goes south)
-                lanes['south'] = (world_x - lane_offset, world_y)
-                # East lane (goes north)
-                lanes['north'] = (world_x + lane_offset, world_y)
+        start = (start_x, start_y)
+        goal = (end_x, end_y)
+        if start == goal:
+            return [start]
+
+        best_cost = INFINITY
+        best = None
+        if self._same_run(start, goal):
+            best_cost = abs(end_x - start_x) + abs(end_y - start_y)
+
+        start_links = self._attachments(start)
+        for destination, goal_distance in self._attachments(goal):
+            dist, next_hop, _ = self._get_routing_row(destination)
+            for node, start_distance in start_links:
+                if node not in dist:
+                    continue
+                cost = start_distance + dist[node] + goal_distance
+                if cost < best_cost:
+                    best_cost = cost
+                    best = (node, next_hop)
 
-            self.lane_centers[road_pos] = lanes
+        if best_cost == INFINITY:
+            return None
+        if best is None:
+            return [start, goal]
+
+        node, next_hop = best
+        route = [start] if node != start else []
+        while node is not None:
+            route.append(node)
+            node = next_hop[node]
+        if route[-1] != goal:
+            route.append(goal)
+        return route
+
+    def _same_run(self, start, goal) -> bool:
+        """Check whether two non-node tiles lie on the same straight run."""
+        if start in self.graph or goal in self.graph:
+            return False
+        start_edge = self.tile_edges[start]
+        goal_edge = self.tile_edges[goal]
+        return start_edge[0] == goal_edge[0] and start_edge[2] == goal_edge[2]
 
     def is_road(self, grid_x: int, grid_y: int) -> bool:
         """
@@ -339,7 +840,8 @@ class RoadNetwork:
         """
         Find a path from start to end using roads.
 
-        Uses A* pathfinding on the road network.
+        Looks the route up in the routing table and expands it into every
+        road tile along the way.
 
         Args:
             start_x (int): Start grid X
@@ -350,51 +852,130 @@ class RoadNetwork:
         Returns:
             list: List of (grid_x, grid_y) waypoints, or None if no path
         """
-        import heapq
+        route = self.lookup_route(start_x, start_y, end_x, end_y)
+        if route is None:
+            return None
+        return self.expand_route(route)
+
+    def find_route(self, start_x: int, start_y: int, end_x: int, end_y: int) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a shortest road route as a list of turning points.
+
+        Uses A* over the node graph (Manhattan heuristic, parent pointers)
+        without touching the routing table. Consecutive points in the result
+        always share a row or column with only road between them.
+
+        Args:
+            start_x (int): Start grid X
+            start_y (int): Start grid Y
+            end_x (int): End grid X
+            end_y (int): End grid Y
+
+        Returns:
+            list: Start, the nodes passed through, and end; or None if no path
+        """
+        self.sync()
 
         # Validate start and end are roads
         if not self.is_road(start_x, start_y) or not self.is_road(end_x, end_y):
             return None
 
-        # A* pathfinding
         start = (start_x, start_y)
         goal = (end_x, end_y)
+        if start == goal:
+            return [start]
+
+        goal_links = dict(self._attachments(goal))
+
+        def heuristic(pos):
+            return abs(pos[0] - end_x) + abs(pos[1] - end_y)
+
+        # The goal is a virtual node (None) reached from the nodes it links
+        # to; start and goal inside the same run also link directly
+        g_score = {start: 0}
+        parent = {start: None}
+        open_set = []
+        counter = 0
+
+        start_links = self._attachments(start)
+        if self._same_run(start, goal):
+            g_score[None] = heuristic(start)
+            parent[None] = start
+            heapq.heappush(open_set, (g_score[None], 0, counter, None))
+
+        for node, distance in start_links:
+            if node != start:
+                if distance >= g_score.get(node, float('inf')):
+                    continue
+                g_score[node] = distance
+                parent[node] = start
+            counter += 1
+            heapq.heappush(open_set, (distance + heuristic(node), distance, counter, node))
 
-        # Priority queue: (f_score, g_score, position, path)
-        open_set = [(0, 0, start, [start])]
         closed_set = set()
-
         while open_set:
-            f_score, g_score, current, path = heapq.heappop(open_set)
+            _, g, _, current = heapq.heappop(open_set)
 
-            if current in closed_set:
+            if current is None:
+                return self._trace_route(parent, goal)
+            if current in closed_set or g > g_score.get(current, float('inf')):
                 continue
-
-            if current == goal:
-                return path
-
             closed_set.add(current)
 
-            # Check all neighboring road tiles
-            cx, cy = current
-            for direction in ['north', 'south', 'east', 'west']:
-                neighbor = self.get_next_road_tile(cx, cy, direction)
+            if current in goal_links:
+                new_g = g + goal_links[current]
+                if new_g < g_score.get(None, float('inf')):
+                    g_score[None] = new_g
+                    parent[None] = current
+                    counter += 1
+                    heapq.heappush(open_set, (new_g, new_g, counter, None))
 
-                if neighbor is None or neighbor in closed_set:
+            for neighbor, length, _ in self.graph[current]:
+                if neighbor in closed_set:
                     continue
-
-                # Calculate scores
-                new_g_score = g_score + 1
-                nx, ny = neighbor
-                h_score = abs(nx - end_x) + abs(ny - end_y)  # Manhattan distance
-                new_f_score = new_g_score + h_score
-
-                new_path = path + [neighbor]
-                heapq.heappush(open_set, (new_f_score, new_g_score, neighbor, new_path))
+                new_g = g + length
+                if new_g < g_score.get(neighbor, float('inf')):
+                    g_score[neighbor] = new_g
+                    parent[neighbor] = current
+                    counter += 1
+                    heapq.heappush(open_set, (new_g + heuristic(neighbor), new_g, counter, neighbor))
 
         # No path found
         return None
 
+    def _trace_route(self, parent, goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Follow parent pointers back from the virtual goal node."""
+        route = []
+        current = parent[None]
+        while current is not None:
+            route.append(current)
+            current = parent[current]
+        route.reverse()
+        if route[-1] != goal:
+            route.append(goal)
+        return route
+
+    def expand_route(self, route: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Expand a route from find_route into individual road tiles.
+
+        Args:
+            route: Turning points from find_route
+
+        Returns:
+            list: Every (grid_x, grid_y) tile along the route
+        """
+        path = [route[0]]
+        for (x0, y0), (x1, y1) in zip(route, route[1:]):
+            dx = (x1 > x0) - (x1 < x0)
+            dy = (y1 > y0) - (y1 < y0)
+            x, y = x0, y0
+            while (x, y) != (x1, y1):
+                x += dx
+                y += dy
+                path.append((x, y))
+        return path
+
     def get_random_road_tile(self) -> Optional[Tuple[int, int]]:
         """
         Get a random road tile position.
@@ -417,6 +998,27 @@ class RoadNetwork:
         """Get total number of intersections."""
         return len(self.intersections)
 
+    def get_node_count(self) -> int:
+        """Get number of routing graph nodes."""
+        return len(self.graph)
+
+    def get_routing_stats(self) -> Dict:
+        """
+        Get routing table statistics.
+
+        Returns:
+            dict: Graph size, cached rows and maintenance counters
+        """
+        return {
+            'nodes': len(self.graph),
+            'rows': len(self.routing_rows),
+            'rows_built': self.rows_built,
+            'rows_repaired': self.rows_repaired,
+            'rows_dropped': self.rows_dropped,
+            'graph_rebuilds': self.graph_rebuilds,
+            'graph_repairs': self.graph_repairs,
+        }
+
     def __repr__(self):
         """String representation for debugging."""
         return (f"RoadNetwork(roads={len(self.road_tiles)}, "
@@ -0,0 +1,288 @@
+"""
+SaveFormat - versioned binary container for save files.
+
+Layout:
+    MAGIC (4 bytes) | format version (uint16) | header length (uint32)
+    header (UTF-8 JSON, uncompressed)
+    body (zlib-compressed chunks, located through the header)
+
+The header holds the save summary (name, timestamp, day, money) and a table
+of entries, so save menus can list saves by reading only the first few
+hundred bytes of each file.
+
+Each top-level key of the game state becomes one entry, stored as compact
+JSON. NumPy arrays anywhere inside it (tile layers, pollution grids, ...)
+are pulled out into their own entries and stored as raw bytes, split into
+row chunks of about CHUNK_BYTES. Every chunk records a hash of its
+uncompressed bytes, which is what makes delta files possible: a delta file
+only stores chunks whose hash differs from its base file and points at the
+base for the rest.
+"""
+
+import hashlib
+import json
+import struct
+import uuid
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+MAGIC = b'RFSV'
+FORMAT_VERSION = 1
+
+# Target uncompressed size of one array chunk
+CHUNK_BYTES = 64 * 1024
+
+# zlib level: 1 is several times faster than the default for ~10% larger files
+COMPRESSION_LEVEL = 1
+
+_PREAMBLE = struct.Struct('<4sHI')
+
+# Chunk table offset marking a chunk that lives in the base file
+FROM_BASE = -1
+
+
+class SaveFormatError(Exception):
+    """Raised when a file is not a save file or is damaged."""
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _json_default(value):
+    """Encode NumPy scalars that end up in game state."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _extract_arrays(value, section, arrays):
+    """Replace ndarrays in a structure with {'__array__': entry} placeholders."""
+    if isinstance(value, np.ndarray):
+        name = f"{section}/{len(arrays)}"
+        arrays[name] = value
+        return {'__array__': name}
+    if isinstance(value, dict):
+        return {key: _extract_arrays(item, section, arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_extract_arrays(item, section, arrays) for item in value]
+    return value
+
+
+def _restore_arrays(value, arrays):
+    """Put decoded arrays back in place of their placeholders."""
+    if isinstance(value, dict):
+        if len(value) == 1 and '__array__' in value:
+            return arrays[value['__array__']]
+        return {key: _restore_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_restore_arrays(item, arrays) for item in value]
+    return value
+
+
+def snapshot(game_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a game state so it can be encoded while the game keeps running.
+
+    Containers and arrays are copied (arrays are usually views of live
+    world grids); other values are immutable and shared.
+
+    Args:
+        game_state: State dictionary
+
+    Returns:
+        dict: Independent copy of the state
+    """
+    def copy(value):
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        if isinstance(value, dict):
+            return {key: copy(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [copy(item) for item in value]
+        return value
+
+    return copy(game_state)
+
+
+def _split_entries(game_state: Dict[str, Any]):
+    """
+    Flatten a game state into raw entries.
+
+    Returns:
+        dict: entry name -> (meta dict, list of uncompressed chunk bytes)
+    """
+    entries = {}
+    for section, value in game_state.items():
+        arrays = {}
+        document = _extract_arrays(value, section, arrays)
+        encoded = json.dumps(document, separators=(',', ':'), default=_json_default).encode('utf-8')
+        entries[section] = ({'kind': 'json'}, [encoded])
+
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            if array.ndim == 0 or array.shape[0] == 0:
+                chunks = [array.tobytes()]
+                chunk_rows = max(1, array.shape[0] if array.ndim else 1)
+            else:
+                row_bytes = max(1, array.nbytes // array.shape[0])
+                chunk_rows = max(1, CHUNK_BYTES // row_bytes)
+                chunks = [array[start:start + chunk_rows].tobytes()
+                          for start in range(0, array.shape[0], chunk_rows)]
+            meta = {
+                'kind': 'array',
+                'dtype': array.dtype.str,
+                'shape': list(array.shape),
+                'chunk_rows': chunk_rows,
+            }
+            entries[name] = (meta, chunks)
+    return entries
+
+
+def encode(game_state: Dict[str, Any], summary: Dict[str, Any],
+           base_header: Optional[Dict[str, Any]] = None) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Encode a game state as a save file.
+
+    Args:
+        game_state: State dictionary (JSON-compatible values and ndarrays)
+        summary: Small header fields (save_name, timestamp, day, money, ...)
+        base_header: Header of a full save to write a delta against; chunks
+            whose hash matches the base are not stored
+
+    Returns:
+        tuple: (file bytes, stats dict with chunks_written/chunks_reused/body_bytes)
+    """
+    base_entries = base_header['entries'] if base_header else {}
+
+    body = []
+    offset = 0
+    written = reused = 0
+    table = {}
+    for name, (meta, chunks) in _split_entries(game_state).items():
+        base = base_entries.get(name)
+        same_layout = base is not None and all(base.get(key) == value for key, value in meta.items())
+
+        chunk_table = []
+        for index, data in enumerate(chunks):
+            digest = _digest(data)
+            if (same_layout and index < len(base['chunks']) and
+                    base['chunks'][index][2] == digest):
+                chunk_table.append([FROM_BASE, 0, digest])
+                reused += 1
+                continue
+            compressed = zlib.compress(data, COMPRESSION_LEVEL)
+            chunk_table.append([offset, len(compressed), digest])
+            body.append(compressed)
+            offset += len(compressed)
+            written += 1
+
+        table[name] = dict(meta, chunks=chunk_table)
+
+    header = dict(summary)
+    header['save_id'] = uuid.uuid4().hex
+    header['base_id'] = base_header['save_id'] if base_header else None
+    header['entries'] = table
+
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    data = b''.join([_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)), header_bytes] + body)
+    stats = {'chunks_written': written, 'chunks_reused': reused, 'body_bytes': offset}
+    return data, stats
+
+
+def read_header(file) -> Dict[str, Any]:
+    """
+    Read only the header of a save file.
+
+    Args:
+        file: Binary file object positioned at the start of the file
+
+    Returns:
+        dict: Header, plus 'body_offset' (where the chunk data starts)
+
+    Raises:
+        SaveFormatError: If the file is not a save file of a known version
+    """
+    preamble = file.read(_PREAMBLE.size)
+    if len(preamble) < _PREAMBLE.size:
+        raise SaveFormatError("File too short")
+    magic, version, header_length = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a save file")
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Save format {version} is newer than supported ({FORMAT_VERSION})")
+
+    header = json.loads(file.read(header_length).decode('utf-8'))
+    header['format_version'] = version
+    header['body_offset'] = _PREAMBLE.size + header_length
+    return header
+
+
+def body_size(header: Dict[str, Any]) -> int:
+    """
+    Get the number of compressed body bytes stored in a save file itself.
+
+    Args:
+        header: Save header
+
+    Returns:
+        int: Bytes of chunk data (chunks taken from a base file excluded)
+    """
+    return sum(chunk[1] for entry in header['entries'].values()
+               for chunk in entry['chunks'] if chunk[0] != FROM_BASE)
+
+
+def _read_chunk(file, body_offset, chunk):
+    offset, length, digest = chunk
+    file.seek(body_offset + offset)
+    data = zlib.decompress(file.read(length))
+    if _digest(data) != digest:
+        raise SaveFormatError("Chunk checksum mismatch")
+    return data
+
+
+def decode(file, header: Dict[str, Any], base_file=None,
+           base_header: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Decode the game state of a save file.
+
+    Args:
+        file: Binary file object of the save
+        header: Its header (from read_header)
+        base_file: Binary file object of the base save, for delta files
+        base_header: Header of the base save
+
+    Returns:
+        dict: Game state with arrays restored as writable ndarrays
+
+    Raises:
+        SaveFormatError: If a chunk is damaged or the base is missing
+    """
+    if header.get('base_id') and (base_header is None or
+                                  base_header.get('save_id') != header['base_id']):
+        raise SaveFormatError("Delta save does not match its base save")
+
+    def entry_bytes(name, entry):
+        parts = []
+        for index, chunk in enumerate(entry['chunks']):
+            if chunk[0] == FROM_BASE:
+                base_chunk = base_header['entries'][name]['chunks'][index]
+                parts.append(_read_chunk(base_file, base_header['body_offset'], base_chunk))
+            else:
+                parts.append(_read_chunk(file, header['body_offset'], chunk))
+        return b''.join(parts)
+
+    documents = {}
+    arrays = {}
+    for name, entry in header['entries'].items():
+        data = entry_bytes(name, entry)
+        if entry['kind'] == 'array':
+            array = np.frombuffer(bytearray(data), dtype=np.dtype(entry['dtype']))
+            arrays[name] = array.reshape(entry['shape'])
+        else:
+            documents[name] = json.loads(data.decode('utf-8'))
+
+    return {section: _restore_arrays(document, arrays) for section, document in documents.items()}
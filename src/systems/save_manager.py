@@ -2,34 +2,53 @@
 SaveManager - Manages saving and loading game state.
 
 Handles:
-- Serializing game state to JSON
-- Saving to file
+- Serializing game state
+- Saving to file (binary, compressed; see save_format)
 - Loading from file
-- Auto-save functionality
+- Delta saves (only chunks changed since the last full save)
+- Auto-save functionality (on a background thread)
 - Multiple save slots
 """
 
 import json
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+from src.entities.entity import Entity
+from . import save_format
+from .save_format import SaveFormatError
+
 
 class SaveManager:
     """
     Manages the save/load system for the game.
 
-    Serializes all game state to JSON and saves to disk.
+    Serializes all game state and saves it to disk in the save_format
+    binary container.
     Loads saved games and reconstructs game state.
     """
 
     SAVE_VERSION = "1.0"
     SAVE_DIRECTORY = "data/saves"
+    SAVE_EXTENSION = ".sav"
+    DELTA_EXTENSION = ".delta.sav"
     AUTO_SAVE_NAME = "autosave"
     QUICK_SAVE_NAME = "quicksave"
 
-    def __init__(self):
-        """Initialize the save manager."""
+    def __init__(self, save_directory: str = None):
+        """
+        Initialize the save manager.
+
+        Args:
+            save_directory: Where save files live (default SAVE_DIRECTORY)
+        """
+        if save_directory is not None:
+            self.SAVE_DIRECTORY = save_directory
+
         # Ensure save directory exists
         os.makedirs(self.SAVE_DIRECTORY, exist_ok=True)
 
@@ -41,13 +60,24 @@ class SaveManager:
         # Current save file name (for quick save)
         self.current_save_name: Optional[str] = None
 
-    def save_game(self, game_state: Dict[str, Any], save_name: str = None) -> bool:
+        # Size/timing of the last save (bytes, chunks_written, chunks_reused, delta, seconds)
+        self.last_save_stats: Dict[str, Any] = {}
+
+        # Background saves: one worker at a time, results handed back via a queue
+        self._save_thread: Optional[threading.Thread] = None
+        self._save_results: queue.Queue = queue.Queue()
+
+    def save_game(self, game_state: Dict[str, Any], save_name: str = None,
+                  delta: bool = False) -> bool:
         """
         Save the game state to a file.
 
         Args:
             game_state: Dictionary containing all game state data
             save_name: Name of the save file (without extension). If None, uses current_save_name.
+            delta: Only write the chunks that changed since the last full
+                save of this name. Falls back to a full save when there is
+                no base save or most of the state changed.
 
         Returns:
             True if save successful, False otherwise
@@ -58,29 +88,151 @@ class SaveManager:
         # Update current save name
         self.current_save_name = save_name
 
-        # Create save data structure
-        save_data = {
+        try:
+            target = self._write_save(game_state, save_name, delta)
+            print(f"Game saved to: {target}")
+            return True
+        except Exception as e:
+            print(f"Error saving game: {e}")
+            return False
+
+    def save_game_async(self, game_state: Dict[str, Any], save_name: str = None,
+                        delta: bool = False) -> bool:
+        """
+        Save the game state on a background thread.
+
+        The state is snapshotted before returning, so the game can keep
+        changing it; encoding, compression and the file write happen on the
+        worker. Collect the outcome with poll_background_save().
+
+        Args:
+            game_state: Dictionary containing all game state data
+            save_name: Name of the save file (without extension). If None, uses current_save_name.
+            delta: Write a delta save (see save_game)
+
+        Returns:
+            True if the save was started, False if another background save
+            is still running
+        """
+        if self.is_saving():
+            print("Background save already in progress, skipping")
+            return False
+
+        if save_name is None:
+            save_name = self.current_save_name or self.AUTO_SAVE_NAME
+        self.current_save_name = save_name
+
+        snapshot = save_format.snapshot(game_state)
+
+        def worker():
+            result = {"save_name": save_name, "success": False, "error": None}
+            try:
+                result["file_path"] = self._write_save(snapshot, save_name, delta)
+                result["success"] = True
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+            self._save_results.put(result)
+
+        self._save_thread = threading.Thread(target=worker, name=f"save-{save_name}", daemon=True)
+        self._save_thread.start()
+        return True
+
+    def is_saving(self) -> bool:
+        """Check whether a background save is running."""
+        return self._save_thread is not None and self._save_thread.is_alive()
+
+    def poll_background_save(self) -> Optional[Dict[str, Any]]:
+        """
+        Collect the outcome of a finished background save.
+
+        Returns:
+            dict with save_name, success, error (and file_path on success)
+            once per finished save; None while nothing has finished
+        """
+        try:
+            result = self._save_results.get_nowait()
+        except queue.Empty:
+            return None
+
+        if result["success"]:
+            print(f"Game saved to: {result['file_path']}")
+        else:
+            print(f"Error saving game: {result['error']}")
+        return result
+
+    def wait_for_background_save(self, timeout: float = None) -> Optional[Dict[str, Any]]:
+        """
+        Block until a running background save finishes.
+
+        Args:
+            timeout: Longest time to wait in seconds (None waits forever)
+
+        Returns:
+            The save's outcome (see poll_background_save), or None if no
+            save finished in time
+        """
+        if self._save_thread is not None:
+            self._save_thread.join(timeout)
+        return self.poll_background_save()
+
+    def _write_save(self, game_state: Dict[str, Any], save_name: str, delta: bool) -> str:
+        """
+        Encode and write a save; safe to call from a worker thread.
+
+        The file is written to a temporary file and renamed into place, so
+        an interrupted save never leaves a half-written file behind.
+
+        Args:
+            game_state: Dictionary containing all game state data
+            save_name: Name of the save file
+            delta: Write a delta save (see save_game)
+
+        Returns:
+            Path of the written file
+        """
+        start = time.perf_counter()
+        summary = {
             "version": self.SAVE_VERSION,
             "timestamp": datetime.now().isoformat(),
             "save_name": save_name,
-            "game_state": game_state
+            "day": game_state.get("time", {}).get("day", 0),
+            "money": game_state.get("resources", {}).get("money", 0),
         }
 
-        # Save to file
         file_path = self._get_save_path(save_name)
-        try:
-            with open(file_path, 'w') as f:
-                json.dump(save_data, f, indent=2)
-            print(f"Game saved to: {file_path}")
-            return True
-        except Exception as e:
-            print(f"Error saving game: {e}")
-            return False
+        delta_path = self._get_delta_path(save_name)
+
+        base_header = self._read_header_or_none(file_path) if delta else None
+        data, stats = save_format.encode(game_state, summary, base_header)
+
+        if base_header is not None and stats['body_bytes'] * 2 > save_format.body_size(base_header):
+            # Most of the state changed; a delta would not save much
+            base_header = None
+            data, stats = save_format.encode(game_state, summary)
+
+        target = delta_path if base_header is not None else file_path
+        temp_path = f"{target}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, target)
+
+        if base_header is None and os.path.exists(delta_path):
+            # Deltas are relative to the full save just replaced
+            os.remove(delta_path)
+
+        stats['delta'] = base_header is not None
+        stats['bytes'] = len(data)
+        stats['seconds'] = time.perf_counter() - start
+        self.last_save_stats = stats
+        return target
 
     def load_game(self, save_name: str) -> Optional[Dict[str, Any]]:
         """
         Load a game state from a file.
 
+        Uses the save's delta file when there is one for the current full
+        save. Older JSON saves are still read.
+
         Args:
             save_name: Name of the save file (without extension)
 
@@ -88,26 +240,66 @@ class SaveManager:
             Game state dictionary if successful, None otherwise
         """
         file_path = self._get_save_path(save_name)
+        legacy_path = self._get_legacy_path(save_name)
 
         if not os.path.exists(file_path):
+            if os.path.exists(legacy_path):
+                return self._load_legacy(save_name, legacy_path)
             print(f"Save file not found: {file_path}")
             return None
 
         try:
-            with open(file_path, 'r') as f:
-                save_data = json.load(f)
+            with open(file_path, 'rb') as base_file:
+                base_header = save_format.read_header(base_file)
+                header, game_state = base_header, None
+
+                delta_path = self._get_delta_path(save_name)
+                if os.path.exists(delta_path):
+                    with open(delta_path, 'rb') as delta_file:
+                        delta_header = save_format.read_header(delta_file)
+                        if delta_header.get("base_id") == base_header["save_id"]:
+                            game_state = save_format.decode(delta_file, delta_header,
+                                                            base_file, base_header)
+                            header = delta_header
+
+                if game_state is None:
+                    game_state = save_format.decode(base_file, base_header)
 
             # Validate save version
-            if save_data.get("version") != self.SAVE_VERSION:
-                print(f"Warning: Save file version mismatch. Expected {self.SAVE_VERSION}, got {save_data.get('version')}")
+            if header.get("version") != self.SAVE_VERSION:
+                print(f"Warning: Save file version mismatch. Expected {self.SAVE_VERSION}, got {header.get('version')}")
                 # Could implement version migration here
 
             # Update current save name
             self.current_save_name = save_name
 
             print(f"Game loaded from: {file_path}")
-            print(f"Save timestamp: {save_data.get('timestamp')}")
+            print(f"Save timestamp: {header.get('timestamp')}")
+
+            return game_state
+
+        except Exception as e:
+            print(f"Error loading game: {e}")
+            return None
+
+    def _load_legacy(self, save_name: str, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a save written by the old JSON format.
+
+        Args:
+            save_name: Name of the save
+            file_path: Path of the .json file
 
+        Returns:
+            Game state dictionary if successful, None otherwise
+        """
+        try:
+            with open(file_path, 'r') as f:
+                save_data = json.load(f)
+
+            self.current_save_name = save_name
+            print(f"Game loaded from: {file_path}")
+            print(f"Save timestamp: {save_data.get('timestamp')}")
             return save_data.get("game_state")
 
         except Exception as e:
@@ -135,33 +327,77 @@ class SaveManager:
         """
         return self.load_game(self.QUICK_SAVE_NAME)
 
-    def auto_save(self, game_state: Dict[str, Any], current_day: int) -> bool:
+    def is_auto_save_due(self, current_day: int) -> bool:
+        """
+        Check whether an auto-save should happen on this day.
+
+        Args:
+            current_day: Current game day
+
+        Returns:
+            True if auto-save is enabled and enough game days have passed
+        """
+        return (self.auto_save_enabled and
+                current_day - self.last_auto_save_day >= self.auto_save_interval_days)
+
+    def auto_save(self, game_state: Dict[str, Any], current_day: int,
+                  background: bool = False) -> bool:
         """
         Auto-save if enough game days have passed.
 
+        Auto-saves are written as deltas against the last full auto-save.
+
         Args:
             game_state: Dictionary containing all game state data
             current_day: Current game day
+            background: Write the save on a worker thread (see save_game_async)
 
         Returns:
-            True if auto-save was performed, False otherwise
+            True if auto-save was performed (or started), False otherwise
         """
-        if not self.auto_save_enabled:
+        if not self.is_auto_save_due(current_day):
             return False
 
-        if current_day - self.last_auto_save_day >= self.auto_save_interval_days:
-            success = self.save_game(game_state, self.AUTO_SAVE_NAME)
-            if success:
-                self.last_auto_save_day = current_day
-                print(f"Auto-save completed at day {current_day}")
-            return success
+        if background:
+            success = self.save_game_async(game_state, self.AUTO_SAVE_NAME, delta=True)
+        else:
+            success = self.save_game(game_state, self.AUTO_SAVE_NAME, delta=True)
+        if success:
+            self.last_auto_save_day = current_day
+            print(f"Auto-save {'started' if background else 'completed'} at day {current_day}")
+        return success
 
-        return False
+    @staticmethod
+    def read_header(file_path: str) -> Dict[str, Any]:
+        """
+        Read the header of a save file without decoding its body.
+
+        Args:
+            file_path: Path of a .sav file
+
+        Returns:
+            Header dictionary (version, timestamp, save_name, day, money, ...)
+
+        Raises:
+            SaveFormatError: If the file is not a valid save file
+        """
+        with open(file_path, 'rb') as f:
+            return save_format.read_header(f)
+
+    def _read_header_or_none(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Read a save header, or None if the file is missing or invalid."""
+        try:
+            return self.read_header(file_path)
+        except (OSError, ValueError, SaveFormatError):
+            return None
 
     def get_save_list(self) -> list:
         """
         Get list of all save files.
 
+        Only file headers are read, so listing is fast however large the
+        saves are.
+
         Returns:
             List of save file info dictionaries
         """
@@ -170,41 +406,63 @@ class SaveManager:
         if not os.path.exists(self.SAVE_DIRECTORY):
             return save_files
 
-        for filename in os.listdir(self.SAVE_DIRECTORY):
-            if filename.endswith('.json'):
-                save_name = filename[:-5]  # Remove .json extension
-                file_path = os.path.join(self.SAVE_DIRECTORY, filename)
+        filenames = os.listdir(self.SAVE_DIRECTORY)
+        binary_names = {filename[:-len(self.SAVE_EXTENSION)] for filename in filenames
+                        if filename.endswith(self.SAVE_EXTENSION)}
 
-                try:
-                    with open(file_path, 'r') as f:
-                        save_data = json.load(f)
+        for filename in filenames:
+            if filename.endswith(self.DELTA_EXTENSION):
+                continue
+            file_path = os.path.join(self.SAVE_DIRECTORY, filename)
 
-                    save_info = {
-                        "name": save_name,
-                        "timestamp": save_data.get("timestamp", "Unknown"),
-                        "version": save_data.get("version", "Unknown"),
-                        "file_path": file_path
-                    }
-
-                    # Extract some game state info if available
-                    game_state = save_data.get("game_state", {})
-                    if game_state:
-                        save_info["day"] = game_state.get("time", {}).get("day", 0)
-                        save_info["money"] = game_state.get("resources", {}).get("money", 0)
-
-                    save_files.append(save_info)
+            try:
+                if filename.endswith(self.SAVE_EXTENSION):
+                    save_name = filename[:-len(self.SAVE_EXTENSION)]
+                    header = self.read_header(file_path)
+                    delta_header = self._read_header_or_none(self._get_delta_path(save_name))
+                    if delta_header and delta_header.get("base_id") == header["save_id"]:
+                        header = delta_header
+                elif filename.endswith('.json'):
+                    save_name = filename[:-5]  # Remove .json extension
+                    if save_name in binary_names:
+                        continue
+                    header = self._read_legacy_summary(file_path)
+                else:
+                    continue
+
+                save_files.append({
+                    "name": save_name,
+                    "timestamp": header.get("timestamp", "Unknown"),
+                    "version": header.get("version", "Unknown"),
+                    "file_path": file_path,
+                    "day": header.get("day", 0),
+                    "money": header.get("money", 0),
+                })
 
-                except Exception as e:
-                    print(f"Error reading save file {filename}: {e}")
+            except Exception as e:
+                print(f"Error reading save file {filename}: {e}")
 
         # Sort by timestamp (newest first)
         save_files.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
 
         return save_files
 
+    @staticmethod
+    def _read_legacy_summary(file_path: str) -> Dict[str, Any]:
+        """Read name/day/money from an old JSON save (parses the whole file)."""
+        with open(file_path, 'r') as f:
+            save_data = json.load(f)
+        game_state = save_data.get("game_state", {})
+        return {
+            "timestamp": save_data.get("timestamp", "Unknown"),
+            "version": save_data.get("version", "Unknown"),
+            "day": game_state.get("time", {}).get("day", 0),
+            "money": game_state.get("resources", {}).get("money", 0),
+        }
+
     def delete_save(self, save_name: str) -> bool:
         """
-        Delete a save file.
+        Delete a save file, along with its delta file and any old JSON save.
 
         Args:
             save_name: Name of the save file to delete
@@ -212,11 +470,15 @@ class SaveManager:
         Returns:
             True if deleted successfully, False otherwise
         """
-        file_path = self._get_save_path(save_name)
+        paths = [path for path in (self._get_save_path(save_name),
+                                   self._get_delta_path(save_name),
+                                   self._get_legacy_path(save_name))
+                 if os.path.exists(path)]
 
-        if os.path.exists(file_path):
+        if paths:
             try:
-                os.remove(file_path)
+                for path in paths:
+                    os.remove(path)
                 print(f"Deleted save: {save_name}")
                 return True
             except Exception as e:
@@ -236,6 +498,14 @@ class SaveManager:
         Returns:
             Full path to the save file
         """
+        return os.path.join(self.SAVE_DIRECTORY, f"{save_name}{self.SAVE_EXTENSION}")
+
+    def _get_delta_path(self, save_name: str) -> str:
+        """Get the path of a save's delta file."""
+        return os.path.join(self.SAVE_DIRECTORY, f"{save_name}{self.DELTA_EXTENSION}")
+
+    def _get_legacy_path(self, save_name: str) -> str:
+        """Get the path of a save in the old JSON format."""
         return os.path.join(self.SAVE_DIRECTORY, f"{save_name}.json")
 
     @staticmethod
@@ -243,137 +513,63 @@ class SaveManager:
         """
         Serialize the entire game state to a dictionary.
 
+        Every manager contributes its own section (see their save_state
+        methods); tile layers and the pollution grid stay NumPy arrays,
+        which the save format stores as raw chunks.
+
         Args:
             game: The Game object
 
         Returns:
             Dictionary containing all game state
         """
-        game_state = {
-            # Time
+        return {
             "time": {
                 "day": game.day,
                 "hour": game.hour,
                 "minute": game.minute,
-                "time_speed": game.time_speed,
-                "paused": game.paused
-            },
-
-            # Resources
-            "resources": {
-                "money": game.resource_manager.money,
-                "materials": game.resource_manager.materials.copy()
+                "time_elapsed": game.time_elapsed,
             },
-
-            # Buildings
-            "buildings": [
-                {
-                    "id": building.id,
-                    "type": building.building_type.name,
-                    "x": building.x,
-                    "y": building.y,
-                    "level": building.level,
-                    "powered": building.powered,
-                    "active": building.active,
-                    # Add building-specific data if available
-                    "data": building.to_dict() if hasattr(building, 'to_dict') else {}
-                }
-                for building in game.building_manager.buildings.values()
-            ],
-
-            # Robots
-            "robots": [
-                {
-                    "id": robot.id,
-                    "x": robot.x,
-                    "y": robot.y,
-                    "speed": robot.speed,
-                    "capacity": robot.capacity,
-                    "battery": robot.battery if hasattr(robot, 'battery') else 100,
-                    "inventory": robot.inventory.copy() if hasattr(robot, 'inventory') else {},
-                    "state": robot.state.name if hasattr(robot.state, 'name') else str(robot.state),
-                    "target_x": robot.target_x if hasattr(robot, 'target_x') else None,
-                    "target_y": robot.target_y if hasattr(robot, 'target_y') else None
-                }
-                for robot in game.entity_manager.get_entities_by_type("robot")
-            ],
-
-            # Research
-            "research": {
-                "completed": list(game.research_manager.completed_research),
-                "current": game.research_manager.current_research,
-                "progress": game.research_manager.research_progress,
-                "time_required": game.research_manager.research_time_required
-            },
-
-            # Suspicion and Detection
-            "suspicion": {
-                "level": game.suspicion_manager.suspicion_level if hasattr(game, 'suspicion_manager') else 0,
-                "sources": game.suspicion_manager.suspicion_sources.copy() if hasattr(game, 'suspicion_manager') else {}
-            },
-
-            # Police
-            "police": {
-                "patrol_routes": [
-                    {
-                        "route": route.waypoints if hasattr(route, 'waypoints') else [],
-                        "active": route.active if hasattr(route, 'active') else True
-                    }
-                    for route in (game.police_manager.patrol_routes if hasattr(game, 'police_manager') else [])
-                ]
-            },
-
-            # Cameras
-            "cameras": [
-                {
-                    "id": camera.id,
-                    "x": camera.x,
-                    "y": camera.y,
-                    "angle": camera.angle if hasattr(camera, 'angle') else 0,
-                    "active": camera.active if hasattr(camera, 'active') else True,
-                    "hacked": camera.hacked if hasattr(camera, 'hacked') else False
-                }
-                for camera in (game.camera_manager.cameras if hasattr(game, 'camera_manager') else [])
-            ],
-
-            # Inspection
-            "inspection": {
-                "scheduled": game.inspection_manager.inspection_scheduled if hasattr(game, 'inspection_manager') else False,
-                "countdown": game.inspection_manager.inspection_countdown if hasattr(game, 'inspection_manager') else 0
-            },
-
-            # FBI
-            "fbi": {
-                "investigation_level": game.fbi_manager.investigation_level if hasattr(game, 'fbi_manager') else 0,
-                "active": game.fbi_manager.investigation_active if hasattr(game, 'fbi_manager') else False
+            "game": {
+                "game_speed": game.game_speed,
+                "paused": game.paused,
+                "tick_count": game.tick_count,
+                "simulation_time": game.simulation_time,
+                "stats": dict(game.stats),
+                "camera": [game.camera.x, game.camera.y],
+                "next_entity_id": Entity._next_id,
             },
-
-            # Weather
-            "weather": {
-                "current": game.weather_manager.current_weather.name if hasattr(game, 'weather_manager') else "CLEAR",
-                "intensity": game.weather_manager.weather_intensity if hasattr(game, 'weather_manager') else 0
-            },
-
-            # Material Inventory (if exists)
-            "material_inventory": {
-                "tagged_materials": game.material_inventory.tagged_materials.copy() if hasattr(game, 'material_inventory') else {}
-            },
-
-            # Statistics
-            "stats": {
-                "total_materials_collected": game.stats.get("materials_collected", 0) if hasattr(game, 'stats') else 0,
-                "total_money_earned": game.stats.get("money_earned", 0) if hasattr(game, 'stats') else 0,
-                "total_buildings_built": game.stats.get("buildings_built", 0) if hasattr(game, 'stats') else 0
-            }
+            "grid": game.grid.to_dict(),
+            "resources": game.resources.save_state(),
+            "research": game.research.save_state(),
+            "power": game.power.save_state(),
+            "pollution": game.pollution.to_dict(),
+            "material_inventory": game.material_inventory.save_state(),
+            "suspicion": game.suspicion.save_state(),
+            "inspection": game.inspection.save_state(),
+            "buildings": game.buildings.save_state(),
+            "entities": game.entities.save_state(),
+            "npcs": game.npcs.save_state(),
+            "buses": game.bus_manager.save_state(),
+            "traffic": game.traffic_manager.save_state(),
+            "vehicles": game.vehicles.save_state(),
+            "fences": game.fences.save_state(),
+            "props": game.prop_manager.save_state(),
+            "cameras": game.camera_manager.save_state(),
+            "camera_hacking": game.camera_hacking.save_state(),
+            "police": game.police.save_state(),
+            "detection": game.detection.save_state(),
         }
 
-        return game_state
-
     @staticmethod
     def deserialize_game_state(game, game_state: Dict[str, Any]) -> bool:
         """
         Restore the game state from a dictionary.
 
+        Works on a running game as well as on one created with the saved
+        state (see Game), which skips world generation. The saved world
+        must have the same size as the game's grid.
+
         Args:
             game: The Game object to restore state to
             game_state: Dictionary containing saved game state
@@ -381,76 +577,59 @@ class SaveManager:
         Returns:
             True if successful, False otherwise
         """
+        if "grid" not in game_state:
+            print("Error restoring game state: save does not contain a world")
+            return False
+
         try:
-            # Restore time
-            time_data = game_state.get("time", {})
-            game.day = time_data.get("day", 1)
-            game.hour = time_data.get("hour", 6)
-            game.minute = time_data.get("minute", 0)
-            game.time_speed = time_data.get("time_speed", 1)
-            game.paused = time_data.get("paused", False)
-
-            # Restore resources
-            resources_data = game_state.get("resources", {})
-            game.resource_manager.money = resources_data.get("money", 10000)
-            game.resource_manager.materials = resources_data.get("materials", {}).copy()
-
-            # Clear existing entities
-            game.entity_manager.clear_all()
-            game.building_manager.buildings.clear()
-
-            # Restore buildings
-            for building_data in game_state.get("buildings", []):
-                # This would need to call building_manager.create_building() with proper parameters
-                # Implementation depends on your building creation system
-                pass
-
-            # Restore robots
-            for robot_data in game_state.get("robots", []):
-                # This would need to call entity_manager.create_robot() with proper parameters
-                # Implementation depends on your robot creation system
-                pass
-
-            # Restore research
-            research_data = game_state.get("research", {})
-            game.research_manager.completed_research = set(research_data.get("completed", []))
-            game.research_manager.current_research = research_data.get("current")
-            game.research_manager.research_progress = research_data.get("progress", 0)
-            game.research_manager.research_time_required = research_data.get("time_required", 0)
-
-            # Restore suspicion
-            if hasattr(game, 'suspicion_manager'):
-                suspicion_data = game_state.get("suspicion", {})
-                game.suspicion_manager.suspicion_level = suspicion_data.get("level", 0)
-                game.suspicion_manager.suspicion_sources = suspicion_data.get("sources", {}).copy()
-
-            # Restore cameras
-            if hasattr(game, 'camera_manager'):
-                for camera_data in game_state.get("cameras", []):
-                    # Restore camera states
-                    pass
-
-            # Restore inspection
-            if hasattr(game, 'inspection_manager'):
-                inspection_data = game_state.get("inspection", {})
-                game.inspection_manager.inspection_scheduled = inspection_data.get("scheduled", False)
-                game.inspection_manager.inspection_countdown = inspection_data.get("countdown", 0)
-
-            # Restore FBI
-            if hasattr(game, 'fbi_manager'):
-                fbi_data = game_state.get("fbi", {})
-                game.fbi_manager.investigation_level = fbi_data.get("investigation_level", 0)
-                game.fbi_manager.investigation_active = fbi_data.get("active", False)
-
-            # Restore weather
-            if hasattr(game, 'weather_manager'):
-                weather_data = game_state.get("weather", {})
-                # This would need to set weather state properly
-                pass
-
-            # Restore statistics
-            if hasattr(game, 'stats'):
-                game.stats = game_state.get("stats", {}).copy()
+            # World first: everything else refers to tiles
+            game.grid.from_dict(game_state["grid"])
+            game.road_network.sync()
+
+            game.resources.load_state(game_state["resources"])
+            game.research.load_state(game_state["research"])
+            game.power.load_state(game_state["power"])
+            game.pollution.from_dict(game_state["pollution"])
+            game.material_inventory.load_state(game_state["material_inventory"])
+            game.suspicion.load_state(game_state["suspicion"])
+            game.inspection.load_state(game_state["inspection"])
+
+            game.buildings.load_state(game_state["buildings"])
+            game.entities.load_state(game_state["entities"])
+
+            # NPCs and buses get new ids; the bus system translates its
+            # references to them
+            npc_id_map = game.npcs.load_state(game_state["npcs"])
+            game.bus_manager.load_state(game_state["buses"], npc_id_map, game.npcs.npcs)
+            game.traffic_manager.load_state(game_state["traffic"])
+            game.vehicles.load_state(game_state["vehicles"])
+            game.fences.load_state(game_state["fences"])
+            game.prop_manager.load_state(game_state["props"])
+            game.camera_manager.load_state(game_state["cameras"])
+            game.camera_hacking.load_state(game_state["camera_hacking"])
+            game.police.load_state(game_state["police"])
+            game.detection.load_state(game_state["detection"], game.entities.robots)
+
+            time_data = game_state["time"]
+            game.day = time_data["day"]
+            game.hour = time_data["hour"]
+            game.minute = time_data["minute"]
+            game.time_elapsed = time_data.get("time_elapsed", 0.0)
+
+            game_data = game_state["game"]
+            game.game_speed = game_data.get("game_speed", 1.0)
+            game.paused = game_data.get("paused", False)
+            game.tick_count = game_data.get("tick_count", 0)
+            game.simulation_time = game_data.get("simulation_time", 0.0)
+            game.stats = dict(game_data.get("stats", game.stats))
+            camera_x, camera_y = game_data.get("camera", (game.camera.x, game.camera.y))
+            game.camera.x, game.camera.y = camera_x, camera_y
+
+            # Ids of entities created from now on must not clash with loaded ones
+            Entity._next_id = max(Entity._next_id, game_data.get("next_entity_id", 0))
+
+            factories = game.buildings.get_buildings_by_type('factory')
+            game.factory = factories[0] if factories else None
 
             print("Game state restored successfully")
             return True
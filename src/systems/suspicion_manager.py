@@ -376,6 +376,32 @@ class SuspicionManager:
         else:
             return 1.0
 
+    def save_state(self) -> Dict:
+        """
+        Save suspicion manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'suspicion_level': self.suspicion_level,
+            'current_tier': self.current_tier,
+            'suspicion_events': [dict(event) for event in self.suspicion_events],
+            'tier_changes': [dict(change) for change in self.tier_changes],
+        }
+
+    def load_state(self, state: Dict):
+        """
+        Load suspicion manager state.
+
+        Args:
+            state (dict): Serialized state
+        """
+        self.suspicion_level = state.get('suspicion_level', 0.0)
+        self.current_tier = state.get('current_tier', self.get_current_tier())
+        self.suspicion_events = list(state.get('suspicion_events', []))
+        self.tier_changes = list(state.get('tier_changes', []))
+
     def __repr__(self):
         """String representation for debugging."""
         return f"SuspicionManager(level={self.suspicion_level:.1f}, tier={self.tier_names[self.current_tier]})"
@@ -10,8 +10,24 @@ Handles:
 """
 
 import random
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from src.entities.traffic_vehicle import TrafficVehicle
+from src.rendering.vehicle_sprites import get_vehicle_sprite_cache
+from src.utils.spatial_hash import SpatialHash
+from src.utils.serialization import pack_objects, unpack_objects, reassign_identity_ids
+
+
+# Tile step for each lane direction
+LANE_STEPS = {
+    'north': (0, -1),
+    'south': (0, 1),
+    'east': (1, 0),
+    'west': (-1, 0),
+}
+
+# How far ahead (pixels) vehicles look for pedestrians; matches
+# TrafficVehicle._detect_pedestrian_crossing
+PEDESTRIAN_CHECK_DISTANCE = 30.0
 
 
 class ParkedVehicle:
@@ -49,6 +65,21 @@ class ParkedVehicle:
         direction_angles = {'east': 0, 'south': 90, 'west': 180, 'north': 270}
         self.facing_angle = direction_angles.get(facing_direction, 0)
 
+    def get_sprite(self, zoom: float = 1.0):
+        """
+        Get the cached sprite for this vehicle.
+
+        Args:
+            zoom (float): Camera zoom
+
+        Returns:
+            pygame.Surface: Sprite to blit centred on the vehicle position
+        """
+        return get_vehicle_sprite_cache().get_sprite(
+            self.vehicle_type, self.width, self.height, self.body_color,
+            zoom, self.facing_angle, rear_window=False
+        )
+
     def render(self, screen, camera):
         """
         Render the parked vehicle.
@@ -57,64 +88,17 @@ class ParkedVehicle:
             screen: Pygame surface
             camera: Camera for world-to-screen transformation
         """
-        import pygame
-
         # Calculate screen position
         screen_x, screen_y = camera.world_to_screen(self.world_x, self.world_y)
 
-        # Apply camera zoom
-        width_px = int(self.width * camera.zoom)
-        height_px = int(self.height * camera.zoom)
-
         # Don't render if off screen
-        margin = max(width_px, height_px)
+        margin = max(self.width, self.height) * camera.zoom
         if (screen_x + margin < 0 or screen_x - margin > screen.get_width() or
             screen_y + margin < 0 or screen_y - margin > screen.get_height()):
             return
 
-        # Create temporary surface for rotation
-        temp_size = int(max(width_px, height_px) * 1.5)
-        temp_surface = pygame.Surface((temp_size, temp_size), pygame.SRCALPHA)
-
-        # Center position on temp surface
-        temp_x = temp_size // 2 - width_px // 2
-        temp_y = temp_size // 2 - height_px // 2
-
-        # Draw vehicle body
-        body_rect = pygame.Rect(temp_x, temp_y, width_px, height_px)
-        pygame.draw.rect(temp_surface, self.body_color, body_rect)
-        pygame.draw.rect(temp_surface, self.outline_color, body_rect, 2)
-
-        # Draw windows
-        window_width = int(width_px * 0.3)
-        window_height = int(height_px * 0.5)
-        window_y = temp_y + int(height_px * 0.15)
-
-        if window_width > 4 and window_height > 4:
-            # Front window
-            front_window_x = temp_x + width_px - window_width - 2
-            pygame.draw.rect(temp_surface, self.window_color,
-                           (front_window_x, window_y, window_width, window_height))
-
-        # Draw wheels
-        wheel_radius = max(2, int(height_px * 0.25))
-        wheel_y = temp_y + height_px - wheel_radius
-
-        if wheel_radius > 1:
-            # Front wheel
-            front_wheel_x = temp_x + width_px - int(width_px * 0.2)
-            pygame.draw.circle(temp_surface, (40, 40, 40), (front_wheel_x, wheel_y), wheel_radius)
-
-            # Rear wheel
-            rear_wheel_x = temp_x + int(width_px * 0.2)
-            pygame.draw.circle(temp_surface, (40, 40, 40), (rear_wheel_x, wheel_y), wheel_radius)
-
-        # Rotate based on facing angle
-        rotated_surface = pygame.transform.rotate(temp_surface, -self.facing_angle)
-        rotated_rect = rotated_surface.get_rect(center=(screen_x, screen_y))
-
-        # Blit to screen
-        screen.blit(rotated_surface, rotated_rect.topleft)
+        sprite = self.get_sprite(camera.zoom)
+        screen.blit(sprite, sprite.get_rect(center=(screen_x, screen_y)).topleft)
 
 
 class TrafficManager:
@@ -142,6 +126,19 @@ class TrafficManager:
         # Parked vehicles (static decorative vehicles)
         self.parked_vehicles: List[ParkedVehicle] = []
 
+        # Draw parked vehicles into the grid's terrain cache instead of every
+        # frame. Baked vehicles ignore camera zoom, like the terrain itself.
+        self.bake_parked_vehicles = False
+        self._baked_into = None  # TerrainCache holding the current decals
+
+        # Moving vehicles by (grid_x, grid_y, lane), updated as they cross
+        # tile boundaries, so each vehicle only looks at its own lane ahead
+        self.lane_occupancy: Dict[Tuple[int, int, str], List[TrafficVehicle]] = {}
+        self._occupancy_keys: Dict[int, Tuple[int, int, str]] = {}
+
+        # NPCs bucketed per tile, rebuilt every update
+        self.npc_index = SpatialHash(cell_size=grid.tile_size)
+
         # Spawn configuration
         self.target_vehicle_count = 15  # Target number of active vehicles
         self.max_vehicle_count = 25     # Maximum vehicles allowed
@@ -175,15 +172,25 @@ class TrafficManager:
             self._spawn_vehicle()
             self.spawn_timer = 0.0
 
+        # Index vehicles (new spawns, turns at intersections) and NPCs
+        self._sync_occupancy()
+        self.npc_index.clear()
+        if npcs:
+            for npc in npcs:
+                if hasattr(npc, 'world_x') and hasattr(npc, 'world_y'):
+                    self.npc_index.insert(npc, npc.world_x, npc.world_y)
+
         # Update all vehicles
         vehicles_to_remove = []
 
         for vehicle in self.vehicles:
-            # Pass other vehicles for collision avoidance
+            # Pass nearby vehicles in the same lane for collision avoidance,
+            # and nearby NPCs for pedestrian detection
             vehicle.update(dt, self.road_network,
-                          other_vehicles=self.vehicles,
-                          npcs=npcs,
+                          other_vehicles=self._get_lane_ahead(vehicle),
+                          npcs=self._get_pedestrians_near(vehicle) if npcs else None,
                           time_of_day=time_of_day)
+            self._update_occupancy(vehicle)
 
             # Check if vehicle is off map (despawn)
             if vehicle.is_off_map(self.grid):
@@ -201,7 +208,88 @@ class TrafficManager:
 
         # Remove despawned vehicles
         for vehicle in vehicles_to_remove:
-            self.vehicles.remove(vehicle)
+            if vehicle in self.vehicles:
+                self.vehicles.remove(vehicle)
+                self._remove_occupancy(vehicle)
+
+    # Occupancy index
+
+    def _occupancy_key(self, vehicle) -> Tuple[int, int, str]:
+        """Get the (grid_x, grid_y, lane) a vehicle currently occupies."""
+        tile_size = self.grid.tile_size
+        return (int(vehicle.world_x // tile_size), int(vehicle.world_y // tile_size), vehicle.current_lane)
+
+    def _update_occupancy(self, vehicle):
+        """Move a vehicle to its current tile/lane bucket if it changed."""
+        key = self._occupancy_key(vehicle)
+        old_key = self._occupancy_keys.get(vehicle.id)
+        if key == old_key:
+            return
+        if old_key is not None:
+            self._remove_occupancy(vehicle)
+        self.lane_occupancy.setdefault(key, []).append(vehicle)
+        self._occupancy_keys[vehicle.id] = key
+
+    def _remove_occupancy(self, vehicle):
+        """Take a vehicle out of the occupancy index."""
+        key = self._occupancy_keys.pop(vehicle.id, None)
+        if key is None:
+            return
+        bucket = self.lane_occupancy.get(key)
+        if bucket is not None:
+            if vehicle in bucket:
+                bucket.remove(vehicle)
+            if not bucket:
+                del self.lane_occupancy[key]
+
+    def _sync_occupancy(self):
+        """Index vehicles added or changed outside update()."""
+        if len(self._occupancy_keys) > len(self.vehicles):
+            # Vehicles were removed behind our back; start over
+            self.lane_occupancy.clear()
+            self._occupancy_keys.clear()
+        for vehicle in self.vehicles:
+            self._update_occupancy(vehicle)
+
+    def _get_lane_ahead(self, vehicle) -> List[TrafficVehicle]:
+        """
+        Get vehicles in the same lane on the tiles ahead of a vehicle.
+
+        Covers the vehicle's own tile and enough tiles ahead to reach the
+        range at which it reacts to a vehicle ahead.
+
+        Args:
+            vehicle (TrafficVehicle): Vehicle looking ahead
+
+        Returns:
+            list: Candidate vehicles (may include the vehicle itself)
+        """
+        step = LANE_STEPS.get(vehicle.current_lane)
+        if step is None:
+            return []
+        tile_size = self.grid.tile_size
+        look_ahead = int(vehicle.safe_following_distance * 3 // tile_size) + 1
+
+        grid_x, grid_y, lane = self._occupancy_key(vehicle)
+        occupancy = self.lane_occupancy
+        nearby = []
+        for i in range(look_ahead + 1):
+            bucket = occupancy.get((grid_x + step[0] * i, grid_y + step[1] * i, lane))
+            if bucket:
+                nearby.extend(bucket)
+        return nearby
+
+    def _get_pedestrians_near(self, vehicle) -> List:
+        """
+        Get NPCs close enough to step in front of a vehicle.
+
+        Args:
+            vehicle (TrafficVehicle): Vehicle looking ahead
+
+        Returns:
+            list: NPCs within pedestrian check distance of the vehicle
+        """
+        return list(self.npc_index.query(vehicle.world_x, vehicle.world_y, PEDESTRIAN_CHECK_DISTANCE))
 
     def _spawn_vehicle(self) -> Optional[TrafficVehicle]:
         """
@@ -433,6 +521,7 @@ class TrafficManager:
             count (int): Number of parked vehicles to generate
         """
         self.parked_vehicles.clear()
+        self._baked_into = None
 
         tile_size = self.grid.tile_size
 
@@ -503,13 +592,36 @@ class TrafficManager:
             camera: Camera for rendering
         """
         # Render parked vehicles first (behind moving traffic)
-        for parked in self.parked_vehicles:
-            parked.render(screen, camera)
+        terrain_cache = getattr(self.grid, 'terrain_cache', None)
+        if self.bake_parked_vehicles and terrain_cache is not None:
+            if self._baked_into is not terrain_cache:
+                self._bake_parked_vehicles(terrain_cache)
+        else:
+            for parked in self.parked_vehicles:
+                parked.render(screen, camera)
 
         # Render moving vehicles
         for vehicle in self.vehicles:
             vehicle.render(screen, camera)
 
+    def _bake_parked_vehicles(self, terrain_cache):
+        """
+        Register the parked vehicles as terrain decals.
+
+        Args:
+            terrain_cache: TerrainCache to draw them into
+        """
+        decals = []
+        for parked in self.parked_vehicles:
+            sprite = parked.get_sprite()
+            rect = sprite.get_rect(center=(parked.world_x, parked.world_y))
+            decals.append((sprite, rect.x, rect.y))
+
+        if self._baked_into is not None and self._baked_into is not terrain_cache:
+            self._baked_into.set_decals('parked_vehicles', [])
+        terrain_cache.set_decals('parked_vehicles', decals)
+        self._baked_into = terrain_cache
+
     def get_vehicle_count(self) -> int:
         """Get current number of active vehicles."""
         return len(self.vehicles)
@@ -526,6 +638,50 @@ class TrafficManager:
     def clear_all_vehicles(self):
         """Remove all traffic vehicles."""
         self.vehicles.clear()
+        self.lane_occupancy.clear()
+        self._occupancy_keys.clear()
+
+    def save_state(self) -> Dict:
+        """
+        Save traffic manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        # vehicle_ahead refers to another vehicle and is found again next update
+        return {
+            'vehicles': pack_objects(self.vehicles, exclude=('vehicle_ahead',)),
+            'parked_vehicles': pack_objects(self.parked_vehicles, exclude=('vehicle_ahead',)),
+            'target_vehicle_count': self.target_vehicle_count,
+            'spawn_timer': self.spawn_timer,
+        }
+
+    def load_state(self, state: Dict) -> Dict[int, int]:
+        """
+        Load traffic manager state, replacing the current vehicles.
+
+        Args:
+            state (dict): Serialized state
+
+        Returns:
+            dict: Saved vehicle id -> new id
+        """
+        self.clear_all_vehicles()
+        self.vehicles = unpack_objects(state['vehicles'])
+        id_map = reassign_identity_ids(self.vehicles)
+        for vehicle in self.vehicles:
+            vehicle.vehicle_ahead = None
+            self._update_occupancy(vehicle)
+
+        # Parked vehicles are baked again on the next render
+        self.parked_vehicles = unpack_objects(state['parked_vehicles'])
+        if self._baked_into is not None:
+            self._baked_into.set_decals('parked_vehicles', [])
+        self._baked_into = None
+
+        self.target_vehicle_count = state.get('target_vehicle_count', self.target_vehicle_count)
+        self.spawn_timer = state.get('spawn_timer', 0.0)
+        return id_map
 
     def __repr__(self):
         """String representation for debugging."""
@@ -9,9 +9,10 @@ Handles:
 """
 
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from src.entities.vehicle import Vehicle
 from src.world.tile import TileType
+from src.utils.serialization import pack_objects, unpack_objects, reassign_identity_ids
 
 
 class VehicleManager:
@@ -202,3 +203,27 @@ class VehicleManager:
             'working': working_count,
             'being_deconstructed': being_deconstructed,
         }
+
+    def save_state(self) -> Dict:
+        """
+        Save vehicle manager state.
+
+        Returns:
+            dict: Serialized state
+        """
+        return {
+            'vehicles': pack_objects(self.vehicles),
+        }
+
+    def load_state(self, state: Dict) -> Dict[int, int]:
+        """
+        Load vehicle manager state, replacing the current vehicles.
+
+        Args:
+            state (dict): Serialized state
+
+        Returns:
+            dict: Saved vehicle id -> new id
+        """
+        self.vehicles = unpack_objects(state['vehicles'])
+        return reassign_identity_ids(self.vehicles)
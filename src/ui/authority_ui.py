@@ -9,8 +9,11 @@ Handles:
 - Game ending screens
 """
 
+import time
 import pygame
+from src.rendering.text_cache import get_font
 from src.systems.authority_manager import AuthorityTier, GameEnding
+from src.ui.panel import Panel
 
 
 class AuthorityUI:
@@ -37,6 +40,19 @@ class AuthorityUI:
         self.color_bg = (30, 30, 30)
         self.color_text = (255, 255, 255)
 
+        # Panels
+        center_x = screen_width // 2
+        self.tier_panel = Panel((10, 10, 200, 40), self._draw_tier_indicator, self.color_bg + (200,))
+        self.investigation_panel = Panel((center_x - 200, 10, 400, 100), self._draw_fbi_investigation,
+                                         self.color_bg + (220,))
+        self.raid_panel = Panel((center_x - 250, screen_height // 3 - 100, 500, 200), self._draw_raid_countdown,
+                                self.color_bg + (240,))
+        self.ending_panel = Panel((center_x - 300, screen_height // 2 - 200, 600, 400), self._draw_game_ending,
+                                  self.color_bg)
+        self.hud_indicator_panel = Panel((screen_width - 220, 60, 210, 40), self._draw_hud_indicator,
+                                         (40, 40, 40, 200))
+        self.ending_overlay = None
+
     def render(self, screen, authority_manager):
         """
         Render authority UI.
@@ -63,80 +79,77 @@ class AuthorityUI:
     def _render_tier_indicator(self, screen, authority_manager):
         """Render authority tier indicator."""
         tier = authority_manager.current_tier
+        self.tier_panel.render(screen, tier)
+
+        # Tier change animation (flash)
+        if authority_manager.tier_changed:
+            # Draw flashing border
+            x, y, box_width, box_height = self.tier_panel.rect
+            color = self._get_tier_style(tier)[0]
+            for offset in range(3):
+                pygame.draw.rect(screen, color,
+                               (x - offset * 2, y - offset * 2,
+                                box_width + offset * 4, box_height + offset * 4), 2)
+
+    def _get_tier_style(self, tier):
+        """
+        Get the indicator colour and label for an authority tier.
 
-        # Choose color based on tier
+        Args:
+            tier: AuthorityTier
+
+        Returns:
+            tuple: (color, text)
+        """
         if tier == AuthorityTier.LOCAL:
-            color = self.color_local
-            text = "👮 LOCAL POLICE"
+            return self.color_local, "👮 LOCAL POLICE"
         elif tier == AuthorityTier.STATE:
-            color = self.color_state
-            text = "🚔 STATE POLICE"
+            return self.color_state, "🚔 STATE POLICE"
         else:  # FEDERAL
-            color = self.color_federal
-            text = "🚨 FBI"
-
-        # Position in top-left corner
-        x = 10
-        y = 10
-        box_width = 200
-        box_height = 40
+            return self.color_federal, "🚨 FBI"
 
-        # Semi-transparent background
-        box_surface = pygame.Surface((box_width, box_height))
-        box_surface.set_alpha(200)
-        box_surface.fill(self.color_bg)
-        screen.blit(box_surface, (x, y))
+    def _draw_tier_indicator(self, surface, tier):
+        """Draw the tier indicator contents."""
+        color, text = self._get_tier_style(tier)
+        box_rect = surface.get_rect()
 
         # Border
-        pygame.draw.rect(screen, color, (x, y, box_width, box_height), 3)
+        pygame.draw.rect(surface, color, box_rect, 3)
 
         # Text
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         tier_text = font.render(text, True, color)
-        tier_rect = tier_text.get_rect(center=(x + box_width // 2, y + box_height // 2))
-        screen.blit(tier_text, tier_rect)
-
-        # Tier change animation (flash)
-        if authority_manager.tier_changed:
-            # Draw flashing border
-            for offset in range(3):
-                pygame.draw.rect(screen, color,
-                               (x - offset * 2, y - offset * 2,
-                                box_width + offset * 4, box_height + offset * 4), 2)
+        tier_rect = tier_text.get_rect(center=box_rect.center)
+        surface.blit(tier_text, tier_rect)
 
     def _render_fbi_investigation(self, screen, authority_manager):
         """Render FBI investigation progress."""
-        progress = authority_manager.investigation_progress
-
-        # Position at top-center
-        center_x = self.screen_width // 2
-        y = 10
-
-        box_width = 400
-        box_height = 100
-        box_x = center_x - box_width // 2
-
-        # Semi-transparent background
-        box_surface = pygame.Surface((box_width, box_height))
-        box_surface.set_alpha(220)
-        box_surface.fill(self.color_bg)
-        screen.blit(box_surface, (box_x, y))
+        self.investigation_panel.render(
+            screen,
+            authority_manager.investigation_type.name.replace('_', ' '),
+            round(authority_manager.investigation_progress, 1),
+        )
+
+    def _draw_fbi_investigation(self, surface, inv_type, progress):
+        """Draw the FBI investigation panel contents."""
+        box_width, box_height = surface.get_size()
+        center_x = box_width // 2
+        y = 0
 
         # Border (danger color)
-        pygame.draw.rect(screen, self.color_federal, (box_x, y, box_width, box_height), 3)
+        pygame.draw.rect(surface, self.color_federal, (0, 0, box_width, box_height), 3)
 
         # Title
-        font_large = pygame.font.Font(None, 28)
+        font_large = get_font(28)
         title = font_large.render("🔍 FBI INVESTIGATION", True, self.color_federal)
         title_rect = title.get_rect(center=(center_x, y + 20))
-        screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
 
         # Investigation type
-        font_small = pygame.font.Font(None, 20)
-        inv_type = authority_manager.investigation_type.name.replace('_', ' ')
+        font_small = get_font(20)
         type_text = font_small.render(f"Type: {inv_type}", True, self.color_text)
         type_rect = type_text.get_rect(center=(center_x, y + 42))
-        screen.blit(type_text, type_rect)
+        surface.blit(type_text, type_rect)
 
         # Progress bar
         bar_width = 350
@@ -145,7 +158,7 @@ class AuthorityUI:
         bar_y = y + 60
 
         # Background
-        pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(surface, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
 
         # Progress fill (color based on progress)
         fill_width = int(bar_width * (progress / 100.0))
@@ -155,61 +168,53 @@ class AuthorityUI:
             fill_color = (255, 150, 0)  # Orange
         else:
             fill_color = (255, 50, 50)  # Red
-        pygame.draw.rect(screen, fill_color, (bar_x, bar_y, fill_width, bar_height))
+        pygame.draw.rect(surface, fill_color, (bar_x, bar_y, fill_width, bar_height))
 
         # Outline
-        pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 2)
 
         # Percentage text
         percent_text = font_small.render(f"{progress:.1f}%", True, self.color_text)
         percent_rect = percent_text.get_rect(center=(center_x, y + 85))
-        screen.blit(percent_text, percent_rect)
+        surface.blit(percent_text, percent_rect)
 
     def _render_raid_countdown(self, screen, authority_manager):
         """Render FBI raid countdown warning."""
         countdown_hours = authority_manager.raid_countdown / 3600.0
+        flash = int(time.time() * 2) % 2  # Flash every 0.5 seconds
+        self.raid_panel.render(screen, round(countdown_hours, 1), flash)
 
-        # Position at center (high priority warning)
-        center_x = self.screen_width // 2
-        center_y = self.screen_height // 3
-
-        box_width = 500
-        box_height = 200
-        box_x = center_x - box_width // 2
-        box_y = center_y - box_height // 2
-
-        # Semi-transparent background
-        box_surface = pygame.Surface((box_width, box_height))
-        box_surface.set_alpha(240)
-        box_surface.fill(self.color_bg)
-        screen.blit(box_surface, (box_x, box_y))
+    def _draw_raid_countdown(self, surface, countdown_hours, flash):
+        """Draw the raid countdown warning contents."""
+        box_width, box_height = surface.get_size()
+        center_x = box_width // 2
+        box_x = 0
+        box_y = 0
 
         # Flashing border
-        import time
-        flash = int(time.time() * 2) % 2  # Flash every 0.5 seconds
         border_color = (255, 0, 0) if flash else (200, 0, 0)
-        pygame.draw.rect(screen, border_color, (box_x, box_y, box_width, box_height), 4)
+        pygame.draw.rect(surface, border_color, (box_x, box_y, box_width, box_height), 4)
 
         # Title
-        font_large = pygame.font.Font(None, 36)
+        font_large = get_font(36)
         title = font_large.render("💥 FBI RAID IMMINENT 💥", True, (255, 0, 0))
         title_rect = title.get_rect(center=(center_x, box_y + 30))
-        screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
 
         # Countdown
-        font_medium = pygame.font.Font(None, 32)
+        font_medium = get_font(32)
         countdown_text = f"Tactical team arrives in: {countdown_hours:.1f} hours"
         countdown = font_medium.render(countdown_text, True, self.color_warning)
         countdown_rect = countdown.get_rect(center=(center_x, box_y + 70))
-        screen.blit(countdown, countdown_rect)
+        surface.blit(countdown, countdown_rect)
 
         # Divider line
-        pygame.draw.line(screen, (200, 200, 200),
+        pygame.draw.line(surface, (200, 200, 200),
                         (box_x + 20, box_y + 95),
                         (box_x + box_width - 20, box_y + 95), 2)
 
         # Options
-        font_small = pygame.font.Font(None, 24)
+        font_small = get_font(24)
         options = [
             "Available Actions:",
             "  E - Attempt Escape",
@@ -221,34 +226,33 @@ class AuthorityUI:
         for option in options:
             option_text = font_small.render(option, True, self.color_text)
             option_rect = option_text.get_rect(center=(center_x, y_offset))
-            screen.blit(option_text, option_rect)
+            surface.blit(option_text, option_rect)
             y_offset += 25
 
     def _render_game_ending(self, screen, authority_manager):
         """Render game ending screen."""
-        ending = authority_manager.game_ending
-        reason = authority_manager.ending_reason
-
         # Full-screen overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        if self.ending_overlay is None:
+            self.ending_overlay = pygame.Surface((self.screen_width, self.screen_height))
+            self.ending_overlay.set_alpha(200)
+            self.ending_overlay.fill((0, 0, 0))
+        screen.blit(self.ending_overlay, (0, 0))
 
-        # Center box
-        center_x = self.screen_width // 2
-        center_y = self.screen_height // 2
+        # Statistics (if available)
+        stats = None
+        if hasattr(authority_manager, 'tier_escalations'):
+            stats = (authority_manager.tier_escalations,
+                     authority_manager.bribes_attempted,
+                     authority_manager.bribes_successful)
 
-        box_width = 600
-        box_height = 400
-        box_x = center_x - box_width // 2
-        box_y = center_y - box_height // 2
+        self.ending_panel.render(screen, authority_manager.game_ending, authority_manager.ending_reason, stats)
 
-        # Background
-        box_surface = pygame.Surface((box_width, box_height))
-        box_surface.set_alpha(255)
-        box_surface.fill(self.color_bg)
-        screen.blit(box_surface, (box_x, box_y))
+    def _draw_game_ending(self, surface, ending, reason, stats):
+        """Draw the game ending box contents."""
+        box_width, box_height = surface.get_size()
+        center_x = box_width // 2
+        box_x = 0
+        box_y = 0
 
         # Choose color and title based on ending
         if ending == GameEnding.LEGITIMATE_SUCCESS:
@@ -277,58 +281,59 @@ class AuthorityUI:
             subtitle = "Critical violations discovered"
 
         # Border
-        pygame.draw.rect(screen, border_color, (box_x, box_y, box_width, box_height), 5)
+        pygame.draw.rect(surface, border_color, (box_x, box_y, box_width, box_height), 5)
 
         # Title
-        font_huge = pygame.font.Font(None, 48)
+        font_huge = get_font(48)
         title = font_huge.render(title_text, True, border_color)
         title_rect = title.get_rect(center=(center_x, box_y + 60))
-        screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
 
         # Subtitle
-        font_large = pygame.font.Font(None, 32)
+        font_large = get_font(32)
         sub = font_large.render(subtitle, True, self.color_text)
         sub_rect = sub.get_rect(center=(center_x, box_y + 110))
-        screen.blit(sub, sub_rect)
+        surface.blit(sub, sub_rect)
 
         # Divider
-        pygame.draw.line(screen, border_color,
+        pygame.draw.line(surface, border_color,
                         (box_x + 40, box_y + 150),
                         (box_x + box_width - 40, box_y + 150), 3)
 
         # Reason details
-        font_medium = pygame.font.Font(None, 24)
+        font_medium = get_font(24)
         reason_lines = self._wrap_text(reason, box_width - 80)
 
         y_offset = box_y + 180
         for line in reason_lines:
             line_text = font_medium.render(line, True, self.color_text)
             line_rect = line_text.get_rect(center=(center_x, y_offset))
-            screen.blit(line_text, line_rect)
+            surface.blit(line_text, line_rect)
             y_offset += 30
 
         # Statistics (if available)
-        if hasattr(authority_manager, 'tier_escalations'):
+        if stats is not None:
             stats_y = box_y + box_height - 120
-            font_small = pygame.font.Font(None, 20)
+            font_small = get_font(20)
+            tier_escalations, bribes_attempted, bribes_successful = stats
 
-            stats = [
-                f"Authority Escalations: {authority_manager.tier_escalations}",
-                f"Bribes Attempted: {authority_manager.bribes_attempted}",
-                f"Bribes Successful: {authority_manager.bribes_successful}",
+            lines = [
+                f"Authority Escalations: {tier_escalations}",
+                f"Bribes Attempted: {bribes_attempted}",
+                f"Bribes Successful: {bribes_successful}",
             ]
 
-            for stat in stats:
+            for stat in lines:
                 stat_text = font_small.render(stat, True, (200, 200, 200))
                 stat_rect = stat_text.get_rect(center=(center_x, stats_y))
-                screen.blit(stat_text, stat_rect)
+                surface.blit(stat_text, stat_rect)
                 stats_y += 25
 
         # Exit instruction
-        font_small = pygame.font.Font(None, 24)
+        font_small = get_font(24)
         exit_text = font_small.render("Press ESC to exit", True, (150, 150, 150))
         exit_rect = exit_text.get_rect(center=(center_x, box_y + box_height - 30))
-        screen.blit(exit_text, exit_rect)
+        surface.blit(exit_text, exit_rect)
 
     def _wrap_text(self, text: str, max_width: int) -> list:
         """
@@ -347,11 +352,10 @@ class AuthorityUI:
         current_line = []
         current_width = 0
 
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
 
         for word in words:
-            word_surface = font.render(word + ' ', True, (255, 255, 255))
-            word_width = word_surface.get_width()
+            word_width = font.size(word + ' ')[0]
 
             if current_width + word_width <= max_width:
                 current_line.append(word)
@@ -377,24 +381,17 @@ class AuthorityUI:
         """
         # FBI investigation indicator (if active)
         if authority_manager.fbi_investigation_active:
-            x = self.screen_width - 220
-            y = 60  # Below inspection indicator
-
-            box_width = 210
-            box_height = 40
-
-            # Semi-transparent background
-            box_surface = pygame.Surface((box_width, box_height))
-            box_surface.set_alpha(200)
-            box_surface.fill((40, 40, 40))
-            screen.blit(box_surface, (x, y))
-
-            # Border
-            pygame.draw.rect(screen, self.color_federal, (x, y, box_width, box_height), 2)
-
-            # Text
-            font = pygame.font.Font(None, 18)
-            progress = authority_manager.investigation_progress
-            text = font.render(f"🔍 FBI: {progress:.0f}%", True, self.color_federal)
-            text_rect = text.get_rect(center=(x + box_width // 2, y + box_height // 2))
-            screen.blit(text, text_rect)
+            self.hud_indicator_panel.render(screen, round(authority_manager.investigation_progress))
+
+    def _draw_hud_indicator(self, surface, progress):
+        """Draw the FBI HUD indicator contents."""
+        box_rect = surface.get_rect()
+
+        # Border
+        pygame.draw.rect(surface, self.color_federal, box_rect, 2)
+
+        # Text
+        font = get_font(18)
+        text = font.render(f"🔍 FBI: {progress:.0f}%", True, self.color_federal)
+        text_rect = text.get_rect(center=box_rect.center)
+        surface.blit(text, text_rect)
@@ -6,6 +6,8 @@ Provides UI panels for competitive gameplay.
 
 import pygame
 from typing import List, Dict, Optional, Tuple
+from src.rendering.text_cache import get_font
+from src.ui.panel import Panel
 
 
 class CompetitorPanel:
@@ -27,9 +29,11 @@ class CompetitorPanel:
         self.player_color = (100, 255, 100)
 
         # Fonts
-        self.font_title = pygame.font.Font(None, 28)
-        self.font_normal = pygame.font.Font(None, 20)
-        self.font_small = pygame.font.Font(None, 16)
+        self.font_title = get_font(28)
+        self.font_normal = get_font(20)
+        self.font_small = get_font(16)
+
+        self.panel = Panel((x, y, width, height), self._draw)
 
     def render(self, surface: pygame.Surface, leaderboard: List[Dict]):
         """
@@ -42,8 +46,16 @@ class CompetitorPanel:
         if not self.visible:
             return
 
+        entries = tuple(
+            (entry['rank'], entry['name'], round(entry['score']), entry.get('is_player', False))
+            for entry in leaderboard[:8]  # Show top 8
+        )
+        self.panel.move_to(self.x, self.y)
+        self.panel.render(surface, entries)
+
+    def _draw(self, panel_surface: pygame.Surface, entries: Tuple):
+        """Draw the leaderboard contents."""
         # Background
-        panel_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         pygame.draw.rect(panel_surface, self.bg_color, (0, 0, self.width, self.height), border_radius=10)
         pygame.draw.rect(panel_surface, self.border_color, (0, 0, self.width, self.height), 2, border_radius=10)
 
@@ -67,12 +79,7 @@ class CompetitorPanel:
         y_offset += 10
 
         # Leaderboard entries
-        for i, entry in enumerate(leaderboard[:8]):  # Show top 8
-            rank = entry['rank']
-            name = entry['name']
-            score = entry['score']
-            is_player = entry.get('is_player', False)
-
+        for rank, name, score, is_player in entries:
             # Highlight player or top 3
             if is_player:
                 entry_color = self.player_color
@@ -103,8 +110,6 @@ class CompetitorPanel:
             if y_offset > self.height - 40:
                 break
 
-        surface.blit(panel_surface, (self.x, self.y))
-
 
 class MarketPanel:
     """UI panel showing market conditions."""
@@ -125,8 +130,10 @@ class MarketPanel:
         self.negative_color = (255, 100, 100)
 
         # Fonts
-        self.font_title = pygame.font.Font(None, 24)
-        self.font_normal = pygame.font.Font(None, 18)
+        self.font_title = get_font(24)
+        self.font_normal = get_font(18)
+
+        self.panel = Panel((x, y, width, height), self._draw)
 
     def render(self, surface: pygame.Surface, market_data: Dict):
         """
@@ -139,8 +146,19 @@ class MarketPanel:
         if not self.visible:
             return
 
+        self.panel.move_to(self.x, self.y)
+        self.panel.render(
+            surface,
+            round(market_data.get('market_demand', 1.0), 2),
+            round(market_data.get('price_multiplier', 1.0), 2),
+            int(market_data.get('police_activity', 0.3) * 100),
+            market_data.get('investigation_active', False),
+        )
+
+    def _draw(self, panel_surface: pygame.Surface, demand: float, price_mult: float,
+              police_percent: int, investigation: bool):
+        """Draw the market panel contents."""
         # Background
-        panel_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         pygame.draw.rect(panel_surface, self.bg_color, (0, 0, self.width, self.height), border_radius=10)
         pygame.draw.rect(panel_surface, self.border_color, (0, 0, self.width, self.height), 2, border_radius=10)
 
@@ -151,34 +169,28 @@ class MarketPanel:
         y_offset = 45
 
         # Demand
-        demand = market_data.get('market_demand', 1.0)
         demand_color = self.positive_color if demand > 1.0 else self.negative_color if demand < 0.9 else self.text_color
         demand_text = self.font_normal.render(f"Demand: {demand:.2f}x", True, demand_color)
         panel_surface.blit(demand_text, (20, y_offset))
         y_offset += 30
 
         # Price
-        price_mult = market_data.get('price_multiplier', 1.0)
         price_color = self.positive_color if price_mult > 1.1 else self.negative_color if price_mult < 0.9 else self.text_color
         price_text = self.font_normal.render(f"Price: {price_mult:.2f}x", True, price_color)
         panel_surface.blit(price_text, (20, y_offset))
         y_offset += 30
 
         # Police Activity
-        police = market_data.get('police_activity', 0.3)
-        police_color = self.negative_color if police > 0.7 else self.text_color
-        police_text = self.font_normal.render(f"Police: {int(police * 100)}%", True, police_color)
+        police_color = self.negative_color if police_percent > 70 else self.text_color
+        police_text = self.font_normal.render(f"Police: {police_percent}%", True, police_color)
         panel_surface.blit(police_text, (20, y_offset))
         y_offset += 30
 
         # Investigation
-        investigation = market_data.get('investigation_active', False)
         if investigation:
             inv_text = self.font_normal.render("! INVESTIGATION !", True, self.negative_color)
             panel_surface.blit(inv_text, (20, y_offset))
 
-        surface.blit(panel_surface, (self.x, self.y))
-
 
 class OpponentDetailPanel:
     """Detailed view of a specific opponent."""
@@ -198,9 +210,11 @@ class OpponentDetailPanel:
         self.label_color = (180, 180, 180)
 
         # Fonts
-        self.font_title = pygame.font.Font(None, 26)
-        self.font_normal = pygame.font.Font(None, 20)
-        self.font_small = pygame.font.Font(None, 16)
+        self.font_title = get_font(26)
+        self.font_normal = get_font(20)
+        self.font_small = get_font(16)
+
+        self.panel = Panel((x, y, width, height), self._draw)
 
     def render(self, surface: pygame.Surface, opponent_stats: Dict):
         """
@@ -213,37 +227,49 @@ class OpponentDetailPanel:
         if not self.visible or not opponent_stats:
             return
 
+        # Stats, formatted as displayed
+        stats = (
+            ("Money", f"${opponent_stats.get('money', 0):,.0f}"),
+            ("Net Worth", f"${opponent_stats.get('net_worth', 0):,.0f}"),
+            ("Profit", f"${opponent_stats.get('profit', 0):,.0f}"),
+            ("Robots", str(opponent_stats.get('robots', 0))),
+            ("Workstations", str(opponent_stats.get('workstations', 0))),
+            ("Tech Level", str(opponent_stats.get('technology_level', 1))),
+            ("Market Share", f"{opponent_stats.get('market_share', 0) * 100:.1f}%"),
+            ("Green Rep.", f"{opponent_stats.get('green_reputation', 100):.0f}%"),
+            ("Heat Level", f"{opponent_stats.get('heat_level', 0):.0f}"),
+        )
+
+        self.panel.move_to(self.x, self.y)
+        self.panel.render(
+            surface,
+            opponent_stats.get('name', 'Unknown'),
+            opponent_stats.get('personality', 'balanced'),
+            stats,
+            opponent_stats.get('recycling_illegal_materials', False),
+            opponent_stats.get('current_goal', 'unknown'),
+        )
+
+    def _draw(self, panel_surface: pygame.Surface, name: str, personality: str, stats: Tuple,
+              recycling_illegal: bool, goal: str):
+        """Draw the opponent details."""
         # Background
-        panel_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         pygame.draw.rect(panel_surface, self.bg_color, (0, 0, self.width, self.height), border_radius=10)
         pygame.draw.rect(panel_surface, self.border_color, (0, 0, self.width, self.height), 2, border_radius=10)
 
         # Title (Company name)
-        title = self.font_title.render(opponent_stats.get('name', 'Unknown'), True, self.text_color)
+        title = self.font_title.render(name, True, self.text_color)
         panel_surface.blit(title, (self.width // 2 - title.get_width() // 2, 10))
 
         # Personality
-        personality = opponent_stats.get('personality', 'balanced')
         pers_text = self.font_small.render(f"Strategy: {personality.title()}", True, self.label_color)
         panel_surface.blit(pers_text, (self.width // 2 - pers_text.get_width() // 2, 40))
 
         y_offset = 70
 
         # Stats
-        recycling_mode = "ILLEGAL" if opponent_stats.get('recycling_illegal_materials', False) else "Legal"
-        recycling_color = (255, 100, 100) if opponent_stats.get('recycling_illegal_materials', False) else (100, 255, 100)
-
-        stats = [
-            ("Money", f"${opponent_stats.get('money', 0):,}"),
-            ("Net Worth", f"${opponent_stats.get('net_worth', 0):,}"),
-            ("Profit", f"${opponent_stats.get('profit', 0):,}"),
-            ("Robots", str(opponent_stats.get('robots', 0))),
-            ("Workstations", str(opponent_stats.get('workstations', 0))),
-            ("Tech Level", str(opponent_stats.get('technology_level', 1))),
-            ("Market Share", f"{opponent_stats.get('market_share', 0) * 100:.1f}%"),
-            ("Green Rep.", f"{opponent_stats.get('green_reputation', 100):.0f}%"),
-            ("Heat Level", f"{opponent_stats.get('heat_level', 0):.0f}"),
-        ]
+        recycling_mode = "ILLEGAL" if recycling_illegal else "Legal"
+        recycling_color = (255, 100, 100) if recycling_illegal else (100, 255, 100)
 
         for label, value in stats:
             label_text = self.font_small.render(label + ":", True, self.label_color)
@@ -259,12 +285,9 @@ class OpponentDetailPanel:
         panel_surface.blit(mode_text, (20, y_offset + 10))
 
         # Current goal
-        goal = opponent_stats.get('current_goal', 'unknown')
         goal_text = self.font_small.render(f"Goal: {goal.replace('_', ' ').title()}", True, (100, 200, 255))
         panel_surface.blit(goal_text, (20, y_offset + 35))
 
-        surface.blit(panel_surface, (self.x, self.y))
-
     def toggle(self):
         """Toggle panel visibility."""
         self.visible = not self.visible
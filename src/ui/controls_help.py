@@ -118,8 +118,8 @@ class ControlsHelp:
             ]),
 
             ("Debug (if enabled)", [
-                ("F3", "Toggle debug info"),
-                ("F4", "Spawn test entities"),
+                ("F3", "Toggle performance overlay"),
+                ("F4", "Save performance profile (JSON/CSV)"),
                 ("F11", "Toggle fullscreen"),
                 ("F12", "Take screenshot"),
             ]),
@@ -1,8 +1,13 @@
 """
 HUD (Heads-Up Display) - displays game information to the player.
+
+Every HUD panel is a retained Panel: it keeps its drawn surface and is only
+repainted when the values it shows change.
 """
 
 import pygame
+from src.rendering.text_cache import get_font
+from src.ui.panel import Panel
 
 
 class HUD:
@@ -24,9 +29,9 @@ class HUD:
         self.screen_height = screen_height
 
         # Fonts
-        self.font_small = pygame.font.Font(None, 20)
-        self.font_medium = pygame.font.Font(None, 24)
-        self.font_large = pygame.font.Font(None, 32)
+        self.font_small = get_font(20)
+        self.font_medium = get_font(24)
+        self.font_large = get_font(32)
 
         # Colors
         self.color_text = (255, 255, 255)
@@ -36,6 +41,30 @@ class HUD:
         self.color_bad = (255, 100, 100)
         self.color_bg = (0, 0, 0)
 
+        # Panels
+        panel_bg = self.color_bg + (180,)
+        self.resources_panel = Panel((10, 10, 250, 120), self._draw_resources_panel, panel_bg)
+        self.time_panel = Panel((10, 140, 250, 50), self._draw_time_panel, panel_bg)
+        self.robot_panel = Panel((screen_width - 230, 10, 220, 165), self._draw_robot_panel, panel_bg)
+        self.power_panel = Panel((screen_width - 250, 10, 240, 200), self._draw_power_panel, panel_bg)
+        self.controls_panel = Panel((10, screen_height - 130, 280, 120), self._draw_controls_help,
+                                    self.color_bg + (150,))
+        self.fps_panel = Panel((screen_width // 2 - 60, 5, 120, 30), self._draw_fps)
+        self.research_panel = Panel(((screen_width - 300) // 2, 50, 300, 80),
+                                    self._draw_research_progress, panel_bg)
+        self.suspicion_panel = Panel(((screen_width - 300) // 2, screen_height - 100, 300, 40),
+                                     self._draw_suspicion_meter, self.color_bg + (200,))
+
+    def get_panels(self):
+        """
+        Get all HUD panels.
+
+        Returns:
+            list: Panel instances
+        """
+        return [self.resources_panel, self.time_panel, self.robot_panel, self.power_panel,
+                self.controls_panel, self.fps_panel, self.research_panel, self.suspicion_panel]
+
     def render(self, screen, resource_manager, entity_manager, clock=None, power_manager=None, building_manager=None, research_manager=None, suspicion_manager=None, day=None, hour=None, minute=None):
         """
         Render the HUD.
@@ -55,7 +84,7 @@ class HUD:
 
         # Top-left (below resources): Time display
         if day is not None and hour is not None and minute is not None:
-            self._render_time_panel(screen, day, hour, minute)
+            self.time_panel.render(screen, day, hour, minute)
 
         # Top-right panel: Robot info or Power info
         if entity_manager.selected_robot:
@@ -64,11 +93,11 @@ class HUD:
             self._render_power_panel(screen, power_manager, building_manager)
 
         # Bottom-left: Controls help
-        self._render_controls_help(screen)
+        self.controls_panel.render(screen)
 
         # Top-center: FPS (if clock provided)
         if clock:
-            self._render_fps(screen, clock)
+            self.fps_panel.render(screen, int(clock.get_fps()))
 
         # Top-center: Research progress (if active)
         if research_manager and research_manager.current_research:
@@ -80,82 +109,74 @@ class HUD:
 
     def _render_resources_panel(self, screen, resource_manager, entity_manager):
         """Render the resources panel at top-left."""
-        panel_x = 10
-        panel_y = 10
-        line_height = 22
-
-        # Background panel
-        panel_width = 250
-        panel_height = 120
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(180)
-        panel_surface.fill(self.color_bg)
-        screen.blit(panel_surface, (panel_x, panel_y))
+        entity_stats = entity_manager.get_stats()
+        self.resources_panel.render(
+            screen,
+            round(resource_manager.money, 2),
+            round(resource_manager.get_total_stored_weight(), 1),
+            round(resource_manager.get_total_stored_value(), 2),
+            entity_stats['robots'],
+            entity_stats['collectibles'],
+        )
 
+    def _draw_resources_panel(self, surface, money, total_weight, total_value, robots, collectibles):
+        """Draw the resources panel contents."""
         # Money
-        money_text = self.font_medium.render(
-            f"Money: ${resource_manager.money:.2f}",
-            True, self.color_money
-        )
-        screen.blit(money_text, (panel_x + 10, panel_y + 10))
+        money_text = self.font_medium.render(f"Money: ${money:.2f}", True, self.color_money)
+        surface.blit(money_text, (10, 10))
 
         # Total stored materials
-        total_weight = resource_manager.get_total_stored_weight()
-        stored_text = self.font_small.render(
-            f"Stored: {total_weight:.1f}kg",
-            True, self.color_text
-        )
-        screen.blit(stored_text, (panel_x + 10, panel_y + 35))
+        stored_text = self.font_small.render(f"Stored: {total_weight:.1f}kg", True, self.color_text)
+        surface.blit(stored_text, (10, 35))
 
         # Stored value
-        total_value = resource_manager.get_total_stored_value()
-        value_text = self.font_small.render(
-            f"Value: ${total_value:.2f}",
-            True, self.color_good
-        )
-        screen.blit(value_text, (panel_x + 10, panel_y + 55))
+        value_text = self.font_small.render(f"Value: ${total_value:.2f}", True, self.color_good)
+        surface.blit(value_text, (10, 55))
 
         # Entity counts
-        entity_stats = entity_manager.get_stats()
         entities_text = self.font_small.render(
-            f"Robots: {entity_stats['robots']}  Collectibles: {entity_stats['collectibles']}",
+            f"Robots: {robots}  Collectibles: {collectibles}",
             True, self.color_text
         )
-        screen.blit(entities_text, (panel_x + 10, panel_y + 80))
+        surface.blit(entities_text, (10, 80))
 
     def _render_robot_panel(self, screen, robot):
         """Render selected robot info panel at top-right."""
-        panel_width = 220
-        panel_height = 165
-        panel_x = self.screen_width - panel_width - 10
-        panel_y = 10
-        line_height = 20
+        state_name = robot.state.name if hasattr(robot.state, 'name') else str(robot.state)
+
+        # Sort by quantity (descending) and show top 3
+        sorted_inv = sorted(robot.inventory.items(), key=lambda x: x[1], reverse=True)
+        top_inventory = tuple((material_type, round(quantity, 1)) for material_type, quantity in sorted_inv[:3])
+
+        self.robot_panel.render(
+            screen,
+            robot.id,
+            robot.autonomous,
+            state_name,
+            round(robot.current_load, 1),
+            robot.max_capacity,
+            round(robot.current_power),
+            robot.power_capacity,
+            top_inventory,
+        )
 
-        # Background panel
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(180)
-        panel_surface.fill(self.color_bg)
-        screen.blit(panel_surface, (panel_x, panel_y))
+    def _draw_robot_panel(self, surface, robot_id, autonomous, state_name, current_load,
+                          max_capacity, current_power, power_capacity, top_inventory):
+        """Draw the selected robot panel contents."""
+        line_height = 20
 
         # Title
-        mode = "AUTO" if robot.autonomous else "MANUAL"
-        title_text = self.font_medium.render(
-            f"Robot #{robot.id} [{mode}]",
-            True, self.color_good
-        )
-        screen.blit(title_text, (panel_x + 10, panel_y + 10))
+        mode = "AUTO" if autonomous else "MANUAL"
+        title_text = self.font_medium.render(f"Robot #{robot_id} [{mode}]", True, self.color_good)
+        surface.blit(title_text, (10, 10))
 
         # State (for autonomous robots)
-        if robot.autonomous:
-            state_name = robot.state.name if hasattr(robot.state, 'name') else str(robot.state)
-            state_text = self.font_small.render(
-                f"State: {state_name}",
-                True, self.color_text
-            )
-            screen.blit(state_text, (panel_x + 10, panel_y + 35))
+        if autonomous:
+            state_text = self.font_small.render(f"State: {state_name}", True, self.color_text)
+            surface.blit(state_text, (10, 35))
 
         # Inventory load
-        load_ratio = robot.current_load / robot.max_capacity if robot.max_capacity > 0 else 0
+        load_ratio = current_load / max_capacity if max_capacity > 0 else 0
         if load_ratio >= 0.9:
             load_color = self.color_bad
         elif load_ratio >= 0.7:
@@ -163,15 +184,12 @@ class HUD:
         else:
             load_color = self.color_good
 
-        y_offset = 55 if robot.autonomous else 35
-        load_text = self.font_small.render(
-            f"Load: {robot.current_load:.1f}/{robot.max_capacity}kg",
-            True, load_color
-        )
-        screen.blit(load_text, (panel_x + 10, panel_y + y_offset))
+        y_offset = 55 if autonomous else 35
+        load_text = self.font_small.render(f"Load: {current_load:.1f}/{max_capacity}kg", True, load_color)
+        surface.blit(load_text, (10, y_offset))
 
         # Power
-        power_ratio = robot.current_power / robot.power_capacity if robot.power_capacity > 0 else 0
+        power_ratio = current_power / power_capacity if power_capacity > 0 else 0
         if power_ratio < 0.2:
             power_color = self.color_bad
         elif power_ratio < 0.5:
@@ -180,69 +198,59 @@ class HUD:
             power_color = self.color_good
 
         y_offset += 20
-        power_text = self.font_small.render(
-            f"Power: {robot.current_power:.0f}/{robot.power_capacity}",
-            True, power_color
-        )
-        screen.blit(power_text, (panel_x + 10, panel_y + y_offset))
+        power_text = self.font_small.render(f"Power: {current_power:.0f}/{power_capacity}", True, power_color)
+        surface.blit(power_text, (10, y_offset))
 
         # Inventory contents (top 3 materials)
         y_offset += 25
-        if robot.inventory:
+        if top_inventory:
             inv_title = self.font_small.render("Inventory:", True, self.color_text)
-            screen.blit(inv_title, (panel_x + 10, panel_y + y_offset))
+            surface.blit(inv_title, (10, y_offset))
             y_offset += line_height
 
-            # Sort by quantity (descending) and show top 3
-            sorted_inv = sorted(robot.inventory.items(), key=lambda x: x[1], reverse=True)
-            for material_type, quantity in sorted_inv[:3]:
-                inv_text = self.font_small.render(
-                    f"  {material_type}: {quantity:.1f}kg",
-                    True, self.color_text
-                )
-                screen.blit(inv_text, (panel_x + 10, panel_y + y_offset))
+            for material_type, quantity in top_inventory:
+                inv_text = self.font_small.render(f"  {material_type}: {quantity:.1f}kg", True, self.color_text)
+                surface.blit(inv_text, (10, y_offset))
                 y_offset += line_height
         else:
             empty_text = self.font_small.render("Inventory: Empty", True, self.color_text)
-            screen.blit(empty_text, (panel_x + 10, panel_y + y_offset))
+            surface.blit(empty_text, (10, y_offset))
 
     def _render_power_panel(self, screen, power_manager, building_manager):
         """Render power system info panel at top-right."""
-        panel_width = 240
-        panel_height = 200
-        panel_x = self.screen_width - panel_width - 10
-        panel_y = 10
-        line_height = 20
+        building_stats = building_manager.get_building_counts()
+        self.power_panel.render(
+            screen,
+            round(power_manager.total_generation, 1),
+            round(power_manager.total_consumption, 1),
+            round(power_manager.current_power),
+            round(power_manager.max_storage),
+            power_manager.blackout,
+            power_manager.brownout,
+            sum(building_stats.values()),
+        )
 
-        # Background panel
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(180)
-        panel_surface.fill(self.color_bg)
-        screen.blit(panel_surface, (panel_x, panel_y))
+    def _draw_power_panel(self, surface, generation, consumption, stored, max_storage,
+                          blackout, brownout, total_buildings):
+        """Draw the power system panel contents."""
+        panel_width = surface.get_width()
+        line_height = 20
 
         # Title
         title_text = self.font_medium.render("Power System", True, self.color_good)
-        screen.blit(title_text, (panel_x + 10, panel_y + 10))
+        surface.blit(title_text, (10, 10))
 
         y_offset = 35
 
         # Power generation
-        generation = power_manager.total_generation
-        gen_text = self.font_small.render(
-            f"Generation: {generation:.1f}W",
-            True, self.color_good
-        )
-        screen.blit(gen_text, (panel_x + 10, panel_y + y_offset))
+        gen_text = self.font_small.render(f"Generation: {generation:.1f}W", True, self.color_good)
+        surface.blit(gen_text, (10, y_offset))
         y_offset += line_height
 
         # Power consumption
-        consumption = power_manager.total_consumption
         cons_color = self.color_warning if consumption > generation else self.color_text
-        cons_text = self.font_small.render(
-            f"Consumption: {consumption:.1f}W",
-            True, cons_color
-        )
-        screen.blit(cons_text, (panel_x + 10, panel_y + y_offset))
+        cons_text = self.font_small.render(f"Consumption: {consumption:.1f}W", True, cons_color)
+        surface.blit(cons_text, (10, y_offset))
         y_offset += line_height
 
         # Net power
@@ -257,16 +265,11 @@ class HUD:
             net_color = self.color_text
             net_label = "Net:"
 
-        net_text = self.font_small.render(
-            f"{net_label} {abs(net_power):.1f}W",
-            True, net_color
-        )
-        screen.blit(net_text, (panel_x + 10, panel_y + y_offset))
+        net_text = self.font_small.render(f"{net_label} {abs(net_power):.1f}W", True, net_color)
+        surface.blit(net_text, (10, y_offset))
         y_offset += line_height + 5
 
         # Stored power
-        stored = power_manager.current_power
-        max_storage = power_manager.max_storage
         storage_ratio = stored / max_storage if max_storage > 0 else 0
 
         if storage_ratio < 0.2:
@@ -276,37 +279,34 @@ class HUD:
         else:
             storage_color = self.color_good
 
-        storage_text = self.font_small.render(
-            f"Storage: {stored:.0f}/{max_storage:.0f}",
-            True, storage_color
-        )
-        screen.blit(storage_text, (panel_x + 10, panel_y + y_offset))
+        storage_text = self.font_small.render(f"Storage: {stored:.0f}/{max_storage:.0f}", True, storage_color)
+        surface.blit(storage_text, (10, y_offset))
         y_offset += line_height
 
         # Storage bar
-        bar_x = panel_x + 10
-        bar_y = panel_y + y_offset
+        bar_x = 10
+        bar_y = y_offset
         bar_width = panel_width - 20
         bar_height = 15
 
         # Background bar
-        pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(surface, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
 
         # Fill bar
         if storage_ratio > 0:
             fill_width = int(bar_width * storage_ratio)
-            pygame.draw.rect(screen, storage_color, (bar_x, bar_y, fill_width, bar_height))
+            pygame.draw.rect(surface, storage_color, (bar_x, bar_y, fill_width, bar_height))
 
         # Border
-        pygame.draw.rect(screen, (150, 150, 150), (bar_x, bar_y, bar_width, bar_height), 1)
+        pygame.draw.rect(surface, (150, 150, 150), (bar_x, bar_y, bar_width, bar_height), 1)
 
         y_offset += line_height + 5
 
         # System status
-        if power_manager.blackout:
+        if blackout:
             status = "STATUS: BLACKOUT"
             status_color = self.color_bad
-        elif power_manager.brownout:
+        elif brownout:
             status = "STATUS: BROWNOUT"
             status_color = self.color_warning
         elif net_power > 0:
@@ -317,33 +317,17 @@ class HUD:
             status_color = self.color_text
 
         status_text = self.font_small.render(status, True, status_color)
-        screen.blit(status_text, (panel_x + 10, panel_y + y_offset))
+        surface.blit(status_text, (10, y_offset))
         y_offset += line_height + 5
 
         # Building counts
-        building_stats = building_manager.get_building_counts()
-        total_buildings = sum(building_stats.values())
-
-        buildings_text = self.font_small.render(
-            f"Buildings: {total_buildings}",
-            True, self.color_text
-        )
-        screen.blit(buildings_text, (panel_x + 10, panel_y + y_offset))
+        buildings_text = self.font_small.render(f"Buildings: {total_buildings}", True, self.color_text)
+        surface.blit(buildings_text, (10, y_offset))
 
-    def _render_controls_help(self, screen):
-        """Render controls help at bottom-left."""
-        panel_x = 10
-        panel_y = self.screen_height - 130
+    def _draw_controls_help(self, surface):
+        """Draw the controls help panel contents."""
         line_height = 22
 
-        # Background panel
-        panel_width = 280
-        panel_height = 120
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(150)
-        panel_surface.fill(self.color_bg)
-        screen.blit(panel_surface, (panel_x, panel_y))
-
         # Controls
         controls = [
             "Arrow Keys: Move robot",
@@ -355,12 +339,10 @@ class HUD:
 
         for i, control in enumerate(controls):
             text = self.font_small.render(control, True, (200, 200, 200))
-            screen.blit(text, (panel_x + 10, panel_y + 10 + i * line_height))
-
-    def _render_fps(self, screen, clock):
-        """Render FPS counter at top-center."""
-        fps = int(clock.get_fps())
+            surface.blit(text, (10, 10 + i * line_height))
 
+    def _draw_fps(self, surface, fps):
+        """Draw the FPS counter, centred in its panel."""
         # Color based on FPS
         if fps >= 55:
             fps_color = self.color_good
@@ -370,16 +352,13 @@ class HUD:
             fps_color = self.color_bad
 
         fps_text = self.font_medium.render(f"FPS: {fps}", True, fps_color)
-        text_rect = fps_text.get_rect(center=(self.screen_width // 2, 20))
+        text_rect = fps_text.get_rect(center=surface.get_rect().center)
 
-        # Background
+        # Background (only behind the text, the rest of the panel is transparent)
         bg_rect = pygame.Rect(text_rect.x - 5, text_rect.y - 2, text_rect.width + 10, text_rect.height + 4)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-        bg_surface.set_alpha(180)
-        bg_surface.fill(self.color_bg)
-        screen.blit(bg_surface, bg_rect)
+        surface.fill(self.color_bg + (180,), bg_rect)
 
-        screen.blit(fps_text, text_rect)
+        surface.blit(fps_text, text_rect)
 
     def render_message(self, screen, message, duration=2.0):
         """
@@ -412,137 +391,113 @@ class HUD:
             screen: Pygame surface
             research_manager: ResearchManager instance
         """
-        if not research_manager.current_research:
+        info = research_manager.get_progress_info()
+        if not info:
             return
 
-        research = research_manager.get_research(research_manager.current_research)
-        if not research:
-            return
+        # Bar fill is quantized to whole pixels so the panel repaints only when it visibly moves
+        bar_width = self.research_panel.rect.width - 20
+        progress = min(1.0, max(0.0, info['percent'] / 100.0))
 
-        # Panel dimensions
-        panel_width = 300
-        panel_height = 80
-        panel_x = (self.screen_width - panel_width) // 2
-        panel_y = 50  # Below FPS display
+        self.research_panel.render(
+            screen,
+            info['name'],
+            int(bar_width * progress),
+            int(info['percent']),
+            round(max(0.0, info['remaining']), 1),
+        )
 
-        # Background
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(180)
-        panel_surface.fill(self.color_bg)
-        screen.blit(panel_surface, (panel_x, panel_y))
+    def _draw_research_progress(self, surface, name, fill_width, progress_pct, time_remaining):
+        """Draw the research progress panel contents."""
+        panel_width = surface.get_width()
 
         # Research name
-        name = research.get('name', 'Unknown')
         if len(name) > 30:
             name = name[:27] + "..."
         name_text = self.font_medium.render(name, True, self.color_text)
-        name_rect = name_text.get_rect(centerx=panel_x + panel_width // 2, top=panel_y + 5)
-        screen.blit(name_text, name_rect)
+        name_rect = name_text.get_rect(centerx=panel_width // 2, top=5)
+        surface.blit(name_text, name_rect)
 
         # Progress bar
-        progress = research_manager.get_research_progress()
         bar_width = panel_width - 20
         bar_height = 20
-        bar_x = panel_x + 10
-        bar_y = panel_y + 35
+        bar_x = 10
+        bar_y = 35
 
         # Background
-        pygame.draw.rect(screen, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(surface, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height))
 
         # Fill (yellow/orange for in-progress)
-        fill_width = int(bar_width * progress)
         fill_color = (255, 200, 50)
-        pygame.draw.rect(screen, fill_color, (bar_x, bar_y, fill_width, bar_height))
+        pygame.draw.rect(surface, fill_color, (bar_x, bar_y, fill_width, bar_height))
 
         # Border
-        pygame.draw.rect(screen, (150, 150, 150), (bar_x, bar_y, bar_width, bar_height), 2)
-
-        # Percentage and time remaining
-        progress_pct = progress * 100
-        time_elapsed = research_manager.research_progress
-        time_total = research_manager.research_time_required
-        time_remaining = max(0, time_total - time_elapsed)
+        pygame.draw.rect(surface, (150, 150, 150), (bar_x, bar_y, bar_width, bar_height), 2)
 
+        # Percentage and time remaining (game hours)
         info_text = self.font_small.render(
-            f"{progress_pct:.0f}%  •  {time_remaining:.0f}s remaining",
+            f"{progress_pct}%  •  {time_remaining:.1f}h remaining",
             True, self.color_text
         )
-        info_rect = info_text.get_rect(centerx=panel_x + panel_width // 2, top=bar_y + bar_height + 5)
-        screen.blit(info_text, info_rect)
+        info_rect = info_text.get_rect(centerx=panel_width // 2, top=bar_y + bar_height + 5)
+        surface.blit(info_text, info_rect)
+
     def _render_suspicion_meter(self, screen, suspicion_manager):
         """Render the suspicion meter at bottom-center."""
-        meter_width = 300
-        meter_height = 40
-        meter_x = (self.screen_width - meter_width) // 2
-        meter_y = self.screen_height - meter_height - 60
-
-        # Background panel
-        panel_surface = pygame.Surface((meter_width, meter_height))
-        panel_surface.set_alpha(200)
-        panel_surface.fill(self.color_bg)
-        screen.blit(panel_surface, (meter_x, meter_y))
-
-        # Tier and level
-        tier_name = suspicion_manager.tier_names[suspicion_manager.current_tier]
-        level = suspicion_manager.suspicion_level
+        tier = suspicion_manager.current_tier
+        self.suspicion_panel.render(
+            screen,
+            round(suspicion_manager.suspicion_level, 1),
+            suspicion_manager.tier_names[tier],
+            suspicion_manager.tier_colors[tier],
+        )
 
-        # Tier color
-        tier_color = suspicion_manager.tier_colors[suspicion_manager.current_tier]
+    def _draw_suspicion_meter(self, surface, level, tier_name, tier_color):
+        """Draw the suspicion meter contents."""
+        meter_width = surface.get_width()
 
         # Title
         title_text = self.font_small.render("SUSPICION", True, self.color_text)
-        screen.blit(title_text, (meter_x + 10, meter_y + 5))
+        surface.blit(title_text, (10, 5))
 
         # Progress bar
         bar_width = meter_width - 20
         bar_height = 12
-        bar_x = meter_x + 10
-        bar_y = meter_y + 23
+        bar_x = 10
+        bar_y = 23
 
         # Background
-        pygame.draw.rect(screen, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(surface, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height))
 
         # Fill based on suspicion level
         fill_width = int(bar_width * (level / 100.0))
-        pygame.draw.rect(screen, tier_color, (bar_x, bar_y, fill_width, bar_height))
+        pygame.draw.rect(surface, tier_color, (bar_x, bar_y, fill_width, bar_height))
 
         # Tier markers (20, 40, 60, 80)
         for threshold in [20, 40, 60, 80]:
             marker_x = bar_x + int(bar_width * (threshold / 100.0))
-            pygame.draw.line(screen, (150, 150, 150), (marker_x, bar_y), (marker_x, bar_y + bar_height), 2)
+            pygame.draw.line(surface, (150, 150, 150), (marker_x, bar_y), (marker_x, bar_y + bar_height), 2)
 
         # Border
-        pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 2)
 
         # Level and tier text
-        info_text = self.font_small.render(
-            f"{level:.1f}  •  {tier_name}",
-            True, tier_color
-        )
-        info_rect = info_text.get_rect(right=meter_x + meter_width - 10, centery=meter_y + 12)
-        screen.blit(info_text, info_rect)
-
-    def _render_time_panel(self, screen, day, hour, minute):
-        """Render the game time panel below resources panel."""
-        panel_x = 10
-        panel_y = 140  # Below resources panel
-        panel_width = 250
-        panel_height = 50
-
-        # Background panel
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(180)
-        panel_surface.fill(self.color_bg)
-        screen.blit(panel_surface, (panel_x, panel_y))
+        info_text = self.font_small.render(f"{level:.1f}  •  {tier_name}", True, tier_color)
+        info_rect = info_text.get_rect(right=meter_width - 10, centery=12)
+        surface.blit(info_text, info_rect)
+
+    def _draw_time_panel(self, surface, day, hour, minute):
+        """Draw the game time panel contents."""
+        panel_width = surface.get_width()
 
         # Day
         day_text = self.font_medium.render(f"Day {day}", True, self.color_text)
-        screen.blit(day_text, (panel_x + 10, panel_y + 5))
+        surface.blit(day_text, (10, 5))
 
         # Time (HH:MM format)
         time_str = f"{hour:02d}:{minute:02d}"
         time_text = self.font_medium.render(time_str, True, self.color_good)
-        screen.blit(time_text, (panel_x + 10, panel_y + 26))
+        surface.blit(time_text, (10, 26))
 
         # Time of day indicator
         if 6 <= hour < 12:
@@ -559,5 +514,5 @@ class HUD:
             period_color = (100, 100, 200)
 
         period_text = self.font_small.render(period, True, period_color)
-        period_rect = period_text.get_rect(right=panel_x + panel_width - 10, centery=panel_y + 15)
-        screen.blit(period_text, period_rect)
+        period_rect = period_text.get_rect(right=panel_width - 10, centery=15)
+        surface.blit(period_text, period_rect)
@@ -9,6 +9,7 @@ Handles:
 
 import pygame
 from src.systems.inspection_manager import InspectionStatus, InspectionResult
+from src.rendering.text_cache import get_font
 
 
 class InspectionUI:
@@ -80,13 +81,13 @@ class InspectionUI:
         pygame.draw.rect(screen, self.color_warning, (box_x, y, box_width, box_height), 3)
 
         # Title
-        font_large = pygame.font.Font(None, 32)
+        font_large = get_font(32)
         title = font_large.render("⚠️ INSPECTION SCHEDULED", True, self.color_warning)
         title_rect = title.get_rect(center=(center_x, y + 20))
         screen.blit(title, title_rect)
 
         # Countdown
-        font_medium = pygame.font.Font(None, 28)
+        font_medium = get_font(28)
         countdown_text = f"Inspector arrives in: {countdown_hours:.1f} game hours"
         countdown = font_medium.render(countdown_text, True, self.color_text)
         countdown_rect = countdown.get_rect(center=(center_x, y + 50))
@@ -115,7 +116,7 @@ class InspectionUI:
         pygame.draw.rect(screen, self.color_danger, (box_x, y, box_width, box_height), 3)
 
         # Title
-        font_large = pygame.font.Font(None, 32)
+        font_large = get_font(32)
         title = font_large.render("🕵️ INSPECTION IN PROGRESS", True, self.color_danger)
         title_rect = title.get_rect(center=(center_x, y + 20))
         screen.blit(title, title_rect)
@@ -137,7 +138,7 @@ class InspectionUI:
         pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 2)
 
         # Percentage text
-        font_small = pygame.font.Font(None, 24)
+        font_small = get_font(24)
         percent_text = font_small.render(f"{progress_percent:.0f}%", True, self.color_text)
         percent_rect = percent_text.get_rect(center=(center_x, y + 80))
         screen.blit(percent_text, percent_rect)
@@ -219,7 +220,7 @@ class InspectionUI:
         pygame.draw.rect(screen, border_color, (box_x, box_y, box_width, box_height), 4)
 
         # Title
-        font_large = pygame.font.Font(None, 36)
+        font_large = get_font(36)
         title = font_large.render(title_text, True, border_color)
         title_rect = title.get_rect(center=(center_x, box_y + 30))
         screen.blit(title, title_rect)
@@ -228,7 +229,7 @@ class InspectionUI:
         pygame.draw.line(screen, border_color, (box_x + 20, box_y + 60), (box_x + box_width - 20, box_y + 60), 2)
 
         # Details
-        font_medium = pygame.font.Font(None, 24)
+        font_medium = get_font(24)
         detail_y = box_y + 80
         for detail in details:
             detail_text = font_medium.render(detail, True, self.color_text)
@@ -238,7 +239,7 @@ class InspectionUI:
 
         # Press key to continue (if critical)
         if result == InspectionResult.FAIL_CRITICAL:
-            font_small = pygame.font.Font(None, 20)
+            font_small = get_font(20)
             continue_text = font_small.render("Press ESC to exit", True, (200, 200, 200))
             continue_rect = continue_text.get_rect(center=(center_x, box_y + box_height - 20))
             screen.blit(continue_text, continue_rect)
@@ -272,7 +273,7 @@ class InspectionUI:
         pygame.draw.rect(screen, self.color_warning, (x, y, box_width, box_height), 2)
 
         # Text
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         countdown_hours = inspection_manager.get_countdown_hours()
         text = font.render(f"⚠️ Inspection: {countdown_hours:.1f}h", True, self.color_warning)
         text_rect = text.get_rect(center=(x + box_width // 2, y + box_height // 2))
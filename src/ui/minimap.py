@@ -213,8 +213,8 @@ class Minimap:
         # Sample tiles for performance (don't render every single tile)
         sample_rate = 4  # Sample every 4th tile
 
-        for y in range(0, grid.height, sample_rate):
-            for x in range(0, grid.width, sample_rate):
+        for y in range(0, grid.height_tiles, sample_rate):
+            for x in range(0, grid.width_tiles, sample_rate):
                 tile = grid.get_tile(x, y)
                 if tile:
                     # Determine color based on tile type
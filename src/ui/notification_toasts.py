@@ -0,0 +1,68 @@
+"""
+Notification Toasts - draws active notifications in the top-right corner.
+
+Reads a NotificationSystem; stacking, priority and auto-dismissal are
+handled there.
+"""
+
+import pygame
+
+from src.ui.notification_system import NotificationType
+
+
+class NotificationToasts:
+    """Stack of toast messages for the active notifications."""
+
+    def __init__(self, screen_width: int, screen_height: int):
+        """
+        Initialize the toast renderer.
+
+        Args:
+            screen_width: Width of the game screen
+            screen_height: Height of the game screen
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+
+        # Layout
+        self.toast_width = 300
+        self.toast_height = 30
+        self.margin = 10
+        self.top = 200
+
+        # Fonts
+        self.font = pygame.font.Font(None, 22)
+
+        # Colors
+        self.color_bg = (20, 20, 30)
+        self.color_text = (230, 230, 230)
+        self.type_colors = {
+            NotificationType.INFO: (100, 180, 255),
+            NotificationType.SUCCESS: (80, 220, 120),
+            NotificationType.WARNING: (255, 200, 60),
+            NotificationType.ERROR: (255, 90, 90),
+        }
+
+    def render(self, screen, notification_system):
+        """
+        Render the active notifications, newest priority first.
+
+        Args:
+            screen: Pygame surface to draw on
+            notification_system: NotificationSystem to read
+        """
+        x = self.screen_width - self.toast_width - self.margin
+        y = self.top
+        for notification in notification_system.get_active_notifications():
+            background = pygame.Surface((self.toast_width, self.toast_height))
+            background.set_alpha(210)
+            background.fill(self.color_bg)
+            screen.blit(background, (x, y))
+
+            accent = self.type_colors.get(notification.notification_type, self.color_text)
+            pygame.draw.rect(screen, accent, (x, y, 4, self.toast_height))
+
+            text = self.font.render(notification.message, True, self.color_text)
+            screen.blit(text, (x + 12, y + (self.toast_height - text.get_height()) // 2))
+
+            y += self.toast_height + 4
@@ -0,0 +1,92 @@
+"""
+Panel - retained-mode UI panel.
+
+UI code used to rebuild every panel from scratch each frame: background,
+text, bars. A Panel keeps what it drew in its own surface and only repaints
+it when the values it shows change, so an unchanged HUD costs one blit per
+panel.
+
+The owner passes the panel's inputs on every render call: the values it
+displays, rounded to the precision they are shown at (money to cents, time
+to the minute, ...), so that changes too small to see do not cause a
+repaint. Everything the draw function uses must be among the inputs or
+fixed for the panel's lifetime.
+"""
+
+from typing import Callable, Optional, Tuple
+import pygame
+
+
+# Inputs value that never equals a real inputs tuple
+_NO_INPUTS = object()
+
+
+class Panel:
+    """
+    A UI element drawn into a cached surface, redrawn only when its inputs change.
+    """
+
+    def __init__(self, rect, draw: Callable, background: Optional[Tuple[int, ...]] = None):
+        """
+        Initialize the panel.
+
+        Args:
+            rect: Screen area (pygame.Rect or (x, y, width, height))
+            draw: Function called as draw(surface, *inputs) to paint the panel;
+                coordinates are relative to the panel's top-left corner
+            background: RGB or RGBA fill applied before each redraw
+                (None for a transparent surface)
+        """
+        self.rect = pygame.Rect(rect)
+        self.draw = draw
+        self.background = background
+
+        self.surface = None
+        self.inputs = _NO_INPUTS
+
+        # Statistics
+        self.redraws = 0
+
+    def render(self, screen: pygame.Surface, *inputs) -> bool:
+        """
+        Draw the panel, repainting it first if its inputs changed.
+
+        Args:
+            screen: Surface to draw on
+            *inputs: Values the panel displays
+
+        Returns:
+            bool: True if the panel was repainted
+        """
+        redrawn = inputs != self.inputs
+        if redrawn:
+            self._repaint(inputs)
+        screen.blit(self.surface, self.rect)
+        return redrawn
+
+    def _repaint(self, inputs: tuple):
+        """Paint the panel surface for a set of inputs."""
+        if self.surface is None or self.surface.get_size() != self.rect.size:
+            self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.surface.fill(self.background if self.background is not None else (0, 0, 0, 0))
+        self.draw(self.surface, *inputs)
+        self.inputs = inputs
+        self.redraws += 1
+
+    def invalidate(self):
+        """Force a repaint on the next render (e.g. after changing colours)."""
+        self.inputs = _NO_INPUTS
+
+    def move_to(self, x: int, y: int):
+        """
+        Move the panel on screen without repainting it.
+
+        Args:
+            x (int): New left edge
+            y (int): New top edge
+        """
+        self.rect.topleft = (x, y)
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"Panel(rect={tuple(self.rect)}, redraws={self.redraws})"
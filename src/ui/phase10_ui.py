@@ -13,6 +13,8 @@ Displays:
 
 import pygame
 from typing import Dict, List, Tuple, Optional
+from src.rendering.text_cache import get_font
+from src.ui.panel import Panel
 
 
 class Phase10UI:
@@ -55,6 +57,14 @@ class Phase10UI:
         self.weather_panel_rect = pygame.Rect(10, 10, 250, 120)
         self.score_panel_rect = pygame.Rect(1610, 270, 300, 200)
 
+        # Retained panels (redrawn only when the values they show change)
+        self.drone_panel = Panel(self.drone_panel_rect, self._draw_drone_panel, self.color_bg)
+        self.market_panel = Panel(self.market_panel_rect, self._draw_market_panel, self.color_bg)
+        self.weather_panel = Panel(self.weather_panel_rect, self._draw_weather_panel, self.color_bg)
+        self.score_panel = Panel(self.score_panel_rect, self._draw_score_panel, self.color_bg)
+        self.job_panels = [Panel((320, 500 + i * 70, 280, 60), self._draw_deconstruction_job, self.color_bg)
+                           for i in range(3)]
+
         # Fonts (will be set in render if not available)
         self.font_small = None
         self.font_medium = None
@@ -63,9 +73,9 @@ class Phase10UI:
     def _init_fonts(self):
         """Initialize fonts if not already done."""
         if self.font_small is None:
-            self.font_small = pygame.font.Font(None, 18)
-            self.font_medium = pygame.font.Font(None, 24)
-            self.font_large = pygame.font.Font(None, 32)
+            self.font_small = get_font(18)
+            self.font_medium = get_font(24)
+            self.font_large = get_font(32)
 
     def render(self, screen, drone_manager=None, transmitter_manager=None,
                market_manager=None, weather_manager=None,
@@ -108,231 +118,245 @@ class Phase10UI:
 
     def _render_drone_panel(self, screen, drone_manager):
         """Render drone status panel."""
-        # Background
-        pygame.draw.rect(screen, self.color_bg, self.drone_panel_rect)
-        pygame.draw.rect(screen, self.color_border, self.drone_panel_rect, 2)
+        counts = drone_manager.get_drone_count()
+        self.drone_panel.render(
+            screen,
+            counts['total'],
+            drone_manager.max_drones,
+            counts['flying'],
+            counts['returning'],
+            counts['charging'],
+            counts['crashed'],
+            round(drone_manager.get_exploration_percentage(), 1),
+        )
+
+    def _draw_drone_panel(self, surface, total, max_drones, flying, returning, charging, crashed, exploration):
+        """Draw the drone panel contents."""
+        # Border
+        pygame.draw.rect(surface, self.color_border, surface.get_rect(), 2)
 
         # Title
         title = self.font_medium.render("🚁 Drones", True, self.color_text)
-        screen.blit(title, (self.drone_panel_rect.x + 10, self.drone_panel_rect.y + 10))
+        surface.blit(title, (10, 10))
 
-        # Drone counts
-        counts = drone_manager.get_drone_count()
-        y = self.drone_panel_rect.y + 45
+        y = 45
 
         # Total drones
-        text = self.font_small.render(f"Total: {counts['total']}/{drone_manager.max_drones}",
-                                      True, self.color_text)
-        screen.blit(text, (self.drone_panel_rect.x + 15, y))
+        text = self.font_small.render(f"Total: {total}/{max_drones}", True, self.color_text)
+        surface.blit(text, (15, y))
         y += 25
 
         # Flying
-        color = self.color_drone_flying if counts['flying'] > 0 else self.color_neutral
-        text = self.font_small.render(f"Flying: {counts['flying']}", True, color)
-        screen.blit(text, (self.drone_panel_rect.x + 15, y))
+        color = self.color_drone_flying if flying > 0 else self.color_neutral
+        text = self.font_small.render(f"Flying: {flying}", True, color)
+        surface.blit(text, (15, y))
         y += 22
 
         # Returning
-        if counts['returning'] > 0:
-            text = self.font_small.render(f"Returning: {counts['returning']}",
-                                          True, self.color_drone_returning)
-            screen.blit(text, (self.drone_panel_rect.x + 15, y))
+        if returning > 0:
+            text = self.font_small.render(f"Returning: {returning}", True, self.color_drone_returning)
+            surface.blit(text, (15, y))
             y += 22
 
         # Charging
-        if counts['charging'] > 0:
-            text = self.font_small.render(f"Charging: {counts['charging']}",
-                                          True, self.color_warning)
-            screen.blit(text, (self.drone_panel_rect.x + 15, y))
+        if charging > 0:
+            text = self.font_small.render(f"Charging: {charging}", True, self.color_warning)
+            surface.blit(text, (15, y))
             y += 22
 
         # Crashed
-        if counts['crashed'] > 0:
-            text = self.font_small.render(f"Crashed: {counts['crashed']}",
-                                          True, self.color_drone_crashed)
-            screen.blit(text, (self.drone_panel_rect.x + 15, y))
+        if crashed > 0:
+            text = self.font_small.render(f"Crashed: {crashed}", True, self.color_drone_crashed)
+            surface.blit(text, (15, y))
             y += 22
 
         # Exploration percentage
         y += 10
-        exploration = drone_manager.get_exploration_percentage()
-        text = self.font_small.render(f"Map Explored: {exploration:.1f}%",
-                                      True, self.color_text)
-        screen.blit(text, (self.drone_panel_rect.x + 15, y))
+        text = self.font_small.render(f"Map Explored: {exploration:.1f}%", True, self.color_text)
+        surface.blit(text, (15, y))
 
         # Exploration bar
-        bar_rect = pygame.Rect(self.drone_panel_rect.x + 15, y + 22, 270, 15)
-        pygame.draw.rect(screen, self.color_border, bar_rect, 1)
+        bar_rect = pygame.Rect(15, y + 22, 270, 15)
+        pygame.draw.rect(surface, self.color_border, bar_rect, 1)
 
         fill_width = int((exploration / 100.0) * 268)
         if fill_width > 0:
             fill_rect = pygame.Rect(bar_rect.x + 1, bar_rect.y + 1, fill_width, 13)
-            pygame.draw.rect(screen, self.color_good, fill_rect)
+            pygame.draw.rect(surface, self.color_good, fill_rect)
 
     def _render_market_panel(self, screen, market_manager):
         """Render market prices and trends panel."""
-        # Background
-        pygame.draw.rect(screen, self.color_bg, self.market_panel_rect)
-        pygame.draw.rect(screen, self.color_border, self.market_panel_rect, 2)
+        # Selected materials to show
+        materials_to_show = ['plastic', 'metal', 'electronics', 'copper']
+
+        prices = tuple(
+            (material,
+             round(market_manager.get_buy_price(material), 1),
+             market_manager.get_price_trend(material),
+             round(market_manager.get_price_change_percentage(material)))
+            for material in materials_to_show
+        )
+        self.market_panel.render(screen, market_manager.current_trend.name, prices,
+                                 len(market_manager.active_events))
+
+    def _draw_market_panel(self, surface, trend_name, prices, event_count):
+        """Draw the market panel contents."""
+        # Border
+        pygame.draw.rect(surface, self.color_border, surface.get_rect(), 2)
 
         # Title
         title = self.font_medium.render("📈 Market", True, self.color_text)
-        screen.blit(title, (self.market_panel_rect.x + 10, self.market_panel_rect.y + 10))
+        surface.blit(title, (10, 10))
 
         # Current trend
-        trend_text = f"Trend: {market_manager.current_trend.name}"
-        trend = self.font_small.render(trend_text, True, self.color_text)
-        screen.blit(trend, (self.market_panel_rect.x + 15, self.market_panel_rect.y + 45))
+        trend = self.font_small.render(f"Trend: {trend_name}", True, self.color_text)
+        surface.blit(trend, (15, 45))
 
-        # Selected materials to show
-        materials_to_show = ['plastic', 'metal', 'electronics', 'copper']
-
-        y = self.market_panel_rect.y + 75
-        for material in materials_to_show:
+        y = 75
+        for material, price, trend_symbol, change in prices:
             # Material name
             name_text = material.title()[:8]  # Truncate if too long
             name = self.font_small.render(name_text, True, self.color_text)
-            screen.blit(name, (self.market_panel_rect.x + 15, y))
+            surface.blit(name, (15, y))
 
             # Price
-            price = market_manager.get_buy_price(material)
-            price_text = f"${price:.1f}"
-            price_surf = self.font_small.render(price_text, True, self.color_text)
-            screen.blit(price_surf, (self.market_panel_rect.x + 100, y))
+            price_surf = self.font_small.render(f"${price:.1f}", True, self.color_text)
+            surface.blit(price_surf, (100, y))
 
             # Trend indicator
-            trend_symbol = market_manager.get_price_trend(material)
             trend_color = self.color_good if trend_symbol == "↑" else \
                          self.color_danger if trend_symbol == "↓" else \
                          self.color_neutral
             trend_surf = self.font_medium.render(trend_symbol, True, trend_color)
-            screen.blit(trend_surf, (self.market_panel_rect.x + 170, y - 2))
+            surface.blit(trend_surf, (170, y - 2))
 
             # Change percentage
-            change = market_manager.get_price_change_percentage(material)
-            change_text = f"{change:+.0f}%"
             change_color = self.color_good if change > 0 else \
                           self.color_danger if change < 0 else \
                           self.color_neutral
-            change_surf = self.font_small.render(change_text, True, change_color)
-            screen.blit(change_surf, (self.market_panel_rect.x + 210, y))
+            change_surf = self.font_small.render(f"{change:+.0f}%", True, change_color)
+            surface.blit(change_surf, (210, y))
 
             y += 28
 
         # Active events
-        if len(market_manager.active_events) > 0:
+        if event_count > 0:
             y += 5
-            events_text = f"Events: {len(market_manager.active_events)}"
-            events = self.font_small.render(events_text, True, self.color_warning)
-            screen.blit(events, (self.market_panel_rect.x + 15, y))
+            events = self.font_small.render(f"Events: {event_count}", True, self.color_warning)
+            surface.blit(events, (15, y))
 
     def _render_weather_panel(self, screen, weather_manager):
         """Render weather status panel."""
-        # Background
-        pygame.draw.rect(screen, self.color_bg, self.weather_panel_rect)
-        pygame.draw.rect(screen, self.color_border, self.weather_panel_rect, 2)
+        effects = weather_manager.get_current_effects()
+        self.weather_panel.render(
+            screen,
+            weather_manager.get_weather_description(),
+            weather_manager.current_season,
+            round((effects.production_modifier - 1.0) * 100),
+            round((effects.suspicion_modifier - 1.0) * 100),
+        )
+
+    def _draw_weather_panel(self, surface, description, season, prod_change, sus_change):
+        """Draw the weather panel contents."""
+        # Border
+        pygame.draw.rect(surface, self.color_border, surface.get_rect(), 2)
 
         # Weather description
-        description = weather_manager.get_weather_description()
         weather_text = self.font_large.render(description, True, self.color_text)
-        screen.blit(weather_text, (self.weather_panel_rect.x + 10, self.weather_panel_rect.y + 10))
+        surface.blit(weather_text, (10, 10))
 
         # Season
-        season_text = f"Season: {weather_manager.current_season.title()}"
-        season = self.font_small.render(season_text, True, self.color_text)
-        screen.blit(season, (self.weather_panel_rect.x + 15, self.weather_panel_rect.y + 50))
-
-        # Effects summary
-        effects = weather_manager.get_current_effects()
+        season_surf = self.font_small.render(f"Season: {season.title()}", True, self.color_text)
+        surface.blit(season_surf, (15, 50))
 
-        y = self.weather_panel_rect.y + 75
+        y = 75
 
         # Production modifier
-        if effects.production_modifier != 1.0:
-            prod_change = (effects.production_modifier - 1.0) * 100
-            prod_text = f"Production: {prod_change:+.0f}%"
+        if prod_change != 0:
             color = self.color_good if prod_change > 0 else self.color_danger
-            prod = self.font_small.render(prod_text, True, color)
-            screen.blit(prod, (self.weather_panel_rect.x + 15, y))
+            prod = self.font_small.render(f"Production: {prod_change:+.0f}%", True, color)
+            surface.blit(prod, (15, y))
             y += 22
 
         # Suspicion modifier
-        if effects.suspicion_modifier != 1.0:
-            sus_change = (effects.suspicion_modifier - 1.0) * 100
-            sus_text = f"Suspicion: {sus_change:+.0f}%"
+        if sus_change != 0:
             # Lower suspicion is good
             color = self.color_good if sus_change < 0 else self.color_danger
-            sus = self.font_small.render(sus_text, True, color)
-            screen.blit(sus, (self.weather_panel_rect.x + 15, y))
+            sus = self.font_small.render(f"Suspicion: {sus_change:+.0f}%", True, color)
+            surface.blit(sus, (15, y))
 
     def _render_score_panel(self, screen, scoring_manager):
         """Render score and achievements panel."""
-        # Background
-        pygame.draw.rect(screen, self.color_bg, self.score_panel_rect)
-        pygame.draw.rect(screen, self.color_border, self.score_panel_rect, 2)
+        if scoring_manager.game_completed:
+            summary = (scoring_manager.total_score, scoring_manager.rank)
+        else:
+            # Live statistics
+            summary = (
+                ('Money Earned', f"${scoring_manager.stats['total_money_earned']:,.0f}"),
+                ('Materials', f"{scoring_manager.stats['materials_processed']:.0f}"),
+                ('Buildings', str(scoring_manager.stats['buildings_built'])),
+            )
+
+        unlocked, total = scoring_manager.get_achievement_progress()
+        recent = tuple((achievement.icon, achievement.name)
+                       for achievement in scoring_manager.get_unlocked_achievements()[-3:])
+
+        self.score_panel.render(screen, scoring_manager.game_completed, summary, unlocked, total, recent)
+
+    def _draw_score_panel(self, surface, game_completed, summary, unlocked, total, recent):
+        """Draw the score panel contents."""
+        # Border
+        pygame.draw.rect(surface, self.color_border, surface.get_rect(), 2)
 
         # Title
         title = self.font_medium.render("🏆 Score", True, self.color_text)
-        screen.blit(title, (self.score_panel_rect.x + 10, self.score_panel_rect.y + 10))
+        surface.blit(title, (10, 10))
 
         # Current score (if game completed)
-        y = self.score_panel_rect.y + 45
-        if scoring_manager.game_completed:
-            score_text = f"Total: {scoring_manager.total_score:,}"
-            score = self.font_medium.render(score_text, True, self.color_good)
-            screen.blit(score, (self.score_panel_rect.x + 15, y))
+        y = 45
+        if game_completed:
+            total_score, rank_name = summary
+            score = self.font_medium.render(f"Total: {total_score:,}", True, self.color_good)
+            surface.blit(score, (15, y))
             y += 35
 
             # Rank
-            rank_text = f"Rank: {scoring_manager.rank}"
-            rank = self.font_small.render(rank_text, True, self.color_warning)
-            screen.blit(rank, (self.score_panel_rect.x + 15, y))
+            rank = self.font_small.render(f"Rank: {rank_name}", True, self.color_warning)
+            surface.blit(rank, (15, y))
             y += 25
         else:
             # Show live statistics
-            stats_to_show = [
-                ('Money Earned', f"${scoring_manager.stats['total_money_earned']:,.0f}"),
-                ('Materials', f"{scoring_manager.stats['materials_processed']:.0f}"),
-                ('Buildings', str(scoring_manager.stats['buildings_built'])),
-            ]
-
-            for stat_name, stat_value in stats_to_show:
-                stat_text = f"{stat_name}: {stat_value}"
-                stat = self.font_small.render(stat_text, True, self.color_text)
-                screen.blit(stat, (self.score_panel_rect.x + 15, y))
+            for stat_name, stat_value in summary:
+                stat = self.font_small.render(f"{stat_name}: {stat_value}", True, self.color_text)
+                surface.blit(stat, (15, y))
                 y += 22
 
             y += 10
 
         # Achievements
-        unlocked, total = scoring_manager.get_achievement_progress()
-        achievements_text = f"Achievements: {unlocked}/{total}"
-        achievements = self.font_small.render(achievements_text, True, self.color_text)
-        screen.blit(achievements, (self.score_panel_rect.x + 15, y))
+        achievements = self.font_small.render(f"Achievements: {unlocked}/{total}", True, self.color_text)
+        surface.blit(achievements, (15, y))
 
         # Achievement bar
-        bar_rect = pygame.Rect(self.score_panel_rect.x + 15, y + 22, 270, 12)
-        pygame.draw.rect(screen, self.color_border, bar_rect, 1)
+        bar_rect = pygame.Rect(15, y + 22, 270, 12)
+        pygame.draw.rect(surface, self.color_border, bar_rect, 1)
 
         if total > 0:
             fill_width = int((unlocked / total) * 268)
             if fill_width > 0:
                 fill_rect = pygame.Rect(bar_rect.x + 1, bar_rect.y + 1, fill_width, 10)
-                pygame.draw.rect(screen, self.color_warning, fill_rect)
+                pygame.draw.rect(surface, self.color_warning, fill_rect)
 
         # Recent achievements (last 3)
-        recent = scoring_manager.get_unlocked_achievements()[-3:]
         if recent:
             y += 45
-            recent_text = "Recent:"
-            recent_label = self.font_small.render(recent_text, True, self.color_neutral)
-            screen.blit(recent_label, (self.score_panel_rect.x + 15, y))
+            recent_label = self.font_small.render("Recent:", True, self.color_neutral)
+            surface.blit(recent_label, (15, y))
             y += 20
 
-            for achievement in recent:
-                ach_text = f"{achievement.icon} {achievement.name[:18]}"
-                ach = self.font_small.render(ach_text, True, self.color_good)
-                screen.blit(ach, (self.score_panel_rect.x + 20, y))
+            for icon, name in recent:
+                ach = self.font_small.render(f"{icon} {name[:18]}", True, self.color_good)
+                surface.blit(ach, (20, y))
                 y += 18
 
     def _render_deconstruction_jobs(self, screen, deconstruction_manager):
@@ -343,43 +367,45 @@ class Phase10UI:
             return
 
         # Render job progress bars
-        x = 320
-        y = 500
+        job_panels = iter(self.job_panels)
 
         for job_id in active_jobs[:3]:  # Show max 3 jobs
             status = deconstruction_manager.get_job_status(job_id)
 
             if status:
-                # Background
-                job_rect = pygame.Rect(x, y, 280, 60)
-                pygame.draw.rect(screen, self.color_bg, job_rect)
-                pygame.draw.rect(screen, self.color_border, job_rect, 1)
-
-                # Job info
-                job_text = f"🔨 {status['target_type'].title()} #{status['target_id']}"
-                job_label = self.font_small.render(job_text, True, self.color_text)
-                screen.blit(job_label, (x + 10, y + 8))
-
-                # Progress
-                progress_text = f"{status['progress']:.0f}%"
-                progress_label = self.font_small.render(progress_text, True, self.color_text)
-                screen.blit(progress_label, (x + 10, y + 28))
-
-                # Progress bar
-                bar_rect = pygame.Rect(x + 80, y + 30, 190, 10)
-                pygame.draw.rect(screen, self.color_border, bar_rect, 1)
-
-                fill_width = int((status['progress'] / 100.0) * 188)
-                if fill_width > 0:
-                    fill_rect = pygame.Rect(bar_rect.x + 1, bar_rect.y + 1, fill_width, 8)
-                    pygame.draw.rect(screen, self.color_warning, fill_rect)
-
-                # Time remaining
-                time_text = f"{status['time_remaining']:.0f}s"
-                time_label = self.font_small.render(time_text, True, self.color_neutral)
-                screen.blit(time_label, (x + 220, y + 8))
-
-                y += 70
+                next(job_panels).render(
+                    screen,
+                    status['target_type'],
+                    status['target_id'],
+                    round(status['progress']),
+                    round(status['time_remaining']),
+                )
+
+    def _draw_deconstruction_job(self, surface, target_type, target_id, progress, time_remaining):
+        """Draw one deconstruction job card."""
+        # Border
+        pygame.draw.rect(surface, self.color_border, surface.get_rect(), 1)
+
+        # Job info
+        job_label = self.font_small.render(f"🔨 {target_type.title()} #{target_id}", True, self.color_text)
+        surface.blit(job_label, (10, 8))
+
+        # Progress
+        progress_label = self.font_small.render(f"{progress:.0f}%", True, self.color_text)
+        surface.blit(progress_label, (10, 28))
+
+        # Progress bar
+        bar_rect = pygame.Rect(80, 30, 190, 10)
+        pygame.draw.rect(surface, self.color_border, bar_rect, 1)
+
+        fill_width = int((progress / 100.0) * 188)
+        if fill_width > 0:
+            fill_rect = pygame.Rect(bar_rect.x + 1, bar_rect.y + 1, fill_width, 8)
+            pygame.draw.rect(surface, self.color_warning, fill_rect)
+
+        # Time remaining
+        time_label = self.font_small.render(f"{time_remaining:.0f}s", True, self.color_neutral)
+        surface.blit(time_label, (220, 8))
 
     def render_fog_of_war(self, screen, drone_manager, tile_size: int, camera_offset: Tuple[int, int]):
         """
@@ -0,0 +1,97 @@
+"""
+Profiler Overlay - on-screen table of per-system frame timings.
+
+Shows the slowest profiled sections with their rolling average, 95th
+percentile and maximum times.
+"""
+
+import pygame
+
+
+class ProfilerOverlay:
+    """
+    Timing table drawn over the game view.
+
+    Reads a FrameProfiler's statistics; it has no state of its own besides
+    visibility.
+    """
+
+    def __init__(self, screen_width: int, screen_height: int, max_rows: int = 18):
+        """
+        Initialize the profiler overlay.
+
+        Args:
+            screen_width: Width of the game screen
+            screen_height: Height of the game screen
+            max_rows: Number of sections listed
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.max_rows = max_rows
+
+        # Visibility
+        self.visible = False
+
+        # Layout
+        self.panel_x = 10
+        self.panel_y = 140
+        self.panel_width = 380
+        self.line_height = 18
+
+        # Fonts
+        self.font = pygame.font.Font(None, 20)
+
+        # Colors
+        self.color_bg = (20, 20, 30)
+        self.color_title = (100, 200, 255)
+        self.color_text = (220, 220, 220)
+        self.color_slow = (255, 180, 80)
+        self.color_very_slow = (255, 90, 90)
+
+    def toggle(self):
+        """Toggle overlay visibility."""
+        self.visible = not self.visible
+
+    def render(self, screen, profiler):
+        """
+        Render the timing table.
+
+        Args:
+            screen: Pygame surface to draw on
+            profiler: FrameProfiler to read
+        """
+        if not self.visible:
+            return
+
+        rows = list(profiler.get_stats().items())[:self.max_rows]
+        height = (len(rows) + 2) * self.line_height + 10
+
+        background = pygame.Surface((self.panel_width, height))
+        background.set_alpha(200)
+        background.fill(self.color_bg)
+        screen.blit(background, (self.panel_x, self.panel_y))
+
+        x = self.panel_x + 8
+        y = self.panel_y + 5
+        title = "Frame profile (ms)" if profiler.enabled else "Frame profile (paused)"
+        self._draw_row(screen, x, y, title, "avg", "p95", "max", self.color_title)
+        y += self.line_height * 2
+
+        for label, summary in rows:
+            if summary['p95_ms'] >= 8.0:
+                color = self.color_very_slow
+            elif summary['p95_ms'] >= 2.0:
+                color = self.color_slow
+            else:
+                color = self.color_text
+            self._draw_row(screen, x, y, label,
+                           f"{summary['avg_ms']:.2f}", f"{summary['p95_ms']:.2f}",
+                           f"{summary['max_ms']:.2f}", color)
+            y += self.line_height
+
+    def _draw_row(self, screen, x, y, label, avg, p95, peak, color):
+        """Draw one table row with right-aligned number columns."""
+        screen.blit(self.font.render(label, True, color), (x, y))
+        for column_x, value in ((230, avg), (295, p95), (360, peak)):
+            text = self.font.render(value, True, color)
+            screen.blit(text, (x + column_x - text.get_width(), y))
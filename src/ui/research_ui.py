@@ -6,6 +6,7 @@ Provides a menu for browsing technologies, viewing details, and starting researc
 
 import pygame
 from typing import Optional, Dict, List
+from src.ui.panel import Panel
 
 
 class ResearchUI:
@@ -72,6 +73,11 @@ class ResearchUI:
         self.cancel_button_rect = None
         self.close_button_rect = None
 
+        # Retained panel and screen dimming overlay
+        self.panel = Panel((self.panel_x, self.panel_y, self.panel_width, self.panel_height),
+                           self._draw_panel, self.bg_color)
+        self.overlay = None
+
     def _setup_category_buttons(self):
         """Setup category button rectangles."""
         button_width = 120
@@ -175,10 +181,11 @@ class ResearchUI:
 
     def _get_filtered_research(self, research_manager) -> List[Dict]:
         """Get research list filtered by selected category."""
-        if self.selected_category == "all":
-            return list(research_manager.research_tree.values())
-        else:
-            return research_manager.get_research_by_category(self.selected_category)
+        return [
+            {'id': tech_id, **tech}
+            for tech_id, tech in research_manager.research_definitions.items()
+            if self.selected_category == "all" or tech.get('category') == self.selected_category
+        ]
 
     def render(self, screen, research_manager, money: float):
         """
@@ -193,13 +200,36 @@ class ResearchUI:
             return
 
         # Semi-transparent background overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        screen.blit(overlay, (0, 0))
+        if self.overlay is None:
+            self.overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            self.overlay.fill((0, 0, 0, 128))
+        screen.blit(self.overlay, (0, 0))
+
+        # Main panel (repainted only when the menu state or research state changes)
+        progress_info = research_manager.get_progress_info()
+        progress_pct = int(progress_info['percent']) if progress_info else 0
+        affordable = frozenset(
+            tech_id for tech_id, tech in research_manager.research_definitions.items()
+            if money >= tech.get('cost', 0)
+        )
+
+        self.panel.render(
+            screen,
+            research_manager,
+            self.selected_category,
+            self.selected_research,
+            self.scroll_offset,
+            research_manager.current_research,
+            frozenset(research_manager.completed_research),
+            affordable,
+            progress_pct,
+        )
 
-        # Main panel
-        panel_surface = pygame.Surface((self.panel_width, self.panel_height), pygame.SRCALPHA)
-        panel_surface.fill(self.bg_color)
+    def _draw_panel(self, panel_surface, research_manager, selected_category, selected_research,
+                    scroll_offset, current_research, completed, affordable, progress_pct):
+        """Draw the research menu contents."""
+        self.start_button_rect = None
+        self.cancel_button_rect = None
 
         # Title
         title_text = self.font_title.render("Research", True, self.text_color)
@@ -222,7 +252,7 @@ class ResearchUI:
                 rect.width, rect.height
             )
 
-            if category == self.selected_category:
+            if category == selected_category:
                 color = self.button_hover_color
             else:
                 color = self.button_color
@@ -237,28 +267,26 @@ class ResearchUI:
 
         # Research list area
         list_y_start = 120
-        self._render_research_list(panel_surface, research_manager, money, list_y_start)
+        self._render_research_list(panel_surface, research_manager, affordable, list_y_start)
 
         # Research details panel
-        if self.selected_research:
+        if selected_research:
             details_x = self.list_width + 20
             self._render_research_details(
-                panel_surface, research_manager, money,
+                panel_surface, research_manager, affordable, progress_pct,
                 details_x, list_y_start
             )
 
         # Statistics
-        stats = research_manager.get_stats()
+        total = len(research_manager.research_definitions)
+        percentage = len(completed) / total * 100 if total > 0 else 0
         stats_text = self.font_small.render(
-            f"Completed: {stats['completed']}/{stats['total_research']} ({stats['completion_percentage']:.1f}%)",
+            f"Completed: {len(completed)}/{total} ({percentage:.1f}%)",
             True, self.text_color
         )
         panel_surface.blit(stats_text, (10, self.panel_height - 30))
 
-        # Blit panel to screen
-        screen.blit(panel_surface, (self.panel_x, self.panel_y))
-
-    def _render_research_list(self, surface, research_manager, money: float, start_y: int):
+    def _render_research_list(self, surface, research_manager, affordable, start_y: int):
         """Render the list of research items."""
         research_list = self._get_filtered_research(research_manager)
 
@@ -286,7 +314,7 @@ class ResearchUI:
                 status_color = self.in_progress_color
                 status = "⏳"
             elif research_manager.is_available(tech_id):
-                if research_manager.can_afford(tech_id, money):
+                if tech_id in affordable:
                     status_color = self.available_color
                     status = "●"
                 else:
@@ -324,18 +352,19 @@ class ResearchUI:
             cost = research.get('cost', 0)
             time = research.get('time', 0)
             info_text = self.font_small.render(
-                f"${cost}  •  {time}s",
+                f"${cost}  •  {time}h",
                 True, (200, 200, 200)
             )
             surface.blit(info_text, (list_x + 30, item_y + 32))
 
-    def _render_research_details(self, surface, research_manager, money: float, start_x: int, start_y: int):
+    def _render_research_details(self, surface, research_manager, affordable, progress_pct: int,
+                                 start_x: int, start_y: int):
         """Render detailed view of selected research."""
-        research = research_manager.get_research(self.selected_research)
+        tech_id = self.selected_research
+        research = research_manager.get_research_definition(tech_id)
         if not research:
             return
 
-        tech_id = research['id']
         y = start_y
 
         # Panel background
@@ -374,14 +403,14 @@ class ResearchUI:
 
         # Cost
         cost = research.get('cost', 0)
-        cost_color = self.available_color if money >= cost else (200, 50, 50)
+        cost_color = self.available_color if tech_id in affordable else (200, 50, 50)
         cost_text = self.font_normal.render(f"Cost: ${cost}", True, cost_color)
         surface.blit(cost_text, (start_x + 10, y))
         y += 30
 
         # Time
         time = research.get('time', 0)
-        time_text = self.font_normal.render(f"Time: {time} seconds", True, self.text_color)
+        time_text = self.font_normal.render(f"Time: {time} hours", True, self.text_color)
         surface.blit(time_text, (start_x + 10, y))
         y += 30
 
@@ -397,7 +426,7 @@ class ResearchUI:
             y += 25
         else:
             for prereq_id in prereqs:
-                prereq_research = research_manager.get_research(prereq_id)
+                prereq_research = research_manager.get_research_definition(prereq_id)
                 prereq_name = prereq_research.get('name', prereq_id) if prereq_research else prereq_id
 
                 if research_manager.is_completed(prereq_id):
@@ -437,7 +466,7 @@ class ResearchUI:
         # Start button (if available)
         if research_manager.current_research is None:
             if research_manager.is_available(tech_id) and not research_manager.is_completed(tech_id):
-                can_afford = research_manager.can_afford(tech_id, money)
+                can_afford = tech_id in affordable
                 button_color = self.button_color if can_afford else self.locked_color
 
                 self.start_button_rect = pygame.Rect(
@@ -473,7 +502,6 @@ class ResearchUI:
             surface.blit(button_text, (text_x, text_y))
 
             # Show progress
-            progress = research_manager.get_research_progress()
             progress_y = button_y - 30
             progress_width = 150
             progress_height = 20
@@ -483,7 +511,7 @@ class ResearchUI:
             pygame.draw.rect(surface, (60, 60, 60), progress_rect)
 
             # Fill
-            fill_width = int(progress_width * progress)
+            fill_width = int(progress_width * progress_pct / 100)
             fill_rect = pygame.Rect(start_x + 10, progress_y, fill_width, progress_height)
             pygame.draw.rect(surface, self.in_progress_color, fill_rect)
 
@@ -491,5 +519,5 @@ class ResearchUI:
             pygame.draw.rect(surface, self.text_color, progress_rect, 1)
 
             # Percentage text
-            progress_text = self.font_small.render(f"{progress * 100:.0f}%", True, self.text_color)
+            progress_text = self.font_small.render(f"{progress_pct}%", True, self.text_color)
             surface.blit(progress_text, (start_x + 170, progress_y + 2))
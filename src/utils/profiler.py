@@ -0,0 +1,230 @@
+"""
+FrameProfiler - per-system timing of update and render calls.
+
+Systems are registered once with watch(obj, method). While the profiler is
+enabled, each watched method is replaced on its instance by a thin timing
+wrapper; disabling removes the wrappers again, so a disabled profiler costs
+nothing at all.
+"""
+
+import csv
+import json
+import time
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+class SectionStats:
+    """
+    Rolling timing samples for one profiled section.
+
+    Attributes:
+        name (str): Section label
+        samples (deque): Most recent durations in milliseconds
+        calls (int): Total calls since the last reset
+        total_ms (float): Total time since the last reset
+        max_ms (float): Longest call since the last reset
+    """
+
+    def __init__(self, name: str, window: int):
+        self.name = name
+        self.samples = deque(maxlen=window)
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, duration_ms: float):
+        """Record one call."""
+        self.samples.append(duration_ms)
+        self.calls += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def summary(self) -> Dict:
+        """
+        Summarize the rolling window.
+
+        Returns:
+            dict: avg/p95/max over the window plus lifetime totals
+        """
+        samples = sorted(self.samples)
+        count = len(samples)
+        if count:
+            avg = sum(samples) / count
+            p95 = samples[min(count - 1, int(count * 0.95))]
+            window_max = samples[-1]
+        else:
+            avg = p95 = window_max = 0.0
+
+        return {
+            'avg_ms': avg,
+            'p95_ms': p95,
+            'max_ms': window_max,
+            'last_ms': self.samples[-1] if count else 0.0,
+            'calls': self.calls,
+            'total_ms': self.total_ms,
+            'lifetime_max_ms': self.max_ms,
+        }
+
+
+class FrameProfiler:
+    """
+    Times registered system methods with rolling statistics.
+
+    Usage:
+        profiler.watch(game.npcs, 'update', 'update.npcs')
+        profiler.enable()
+        ...
+        profiler.get_stats()['update.npcs']['p95_ms']
+    """
+
+    def __init__(self, window: int = 120):
+        """
+        Initialize the profiler.
+
+        Args:
+            window (int): Number of recent calls kept per section for
+                averages and percentiles
+        """
+        self.window = window
+        self.enabled = False
+
+        self.sections: Dict[str, SectionStats] = {}
+        self._watched: List[Tuple[object, str, str]] = []  # (obj, method, label)
+        self._saved: Dict[Tuple[int, str], object] = {}    # instance attributes we shadowed
+
+    def watch(self, obj, method: str, label: str = None):
+        """
+        Register a method to be timed while the profiler is enabled.
+
+        Args:
+            obj: Object owning the method (None is ignored)
+            method (str): Method name
+            label (str, optional): Section name (default "<method>.<class>")
+        """
+        if obj is None or not callable(getattr(obj, method, None)):
+            return
+        label = label or f"{method}.{type(obj).__name__}"
+        self._watched.append((obj, method, label))
+        if self.enabled:
+            self._wrap(obj, method, label)
+
+    def enable(self):
+        """Start timing the watched methods."""
+        if self.enabled:
+            return
+        self.enabled = True
+        for obj, method, label in self._watched:
+            self._wrap(obj, method, label)
+
+    def disable(self):
+        """Stop timing and restore the original methods."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        for obj, method, _ in self._watched:
+            key = (id(obj), method)
+            if key in self._saved:
+                setattr(obj, method, self._saved.pop(key))
+            else:
+                try:
+                    delattr(obj, method)
+                except AttributeError:
+                    pass
+
+    def toggle(self) -> bool:
+        """
+        Toggle profiling.
+
+        Returns:
+            bool: Whether the profiler is now enabled
+        """
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def _wrap(self, obj, method, label):
+        """Shadow a method on its instance with a timing wrapper."""
+        if method in vars(obj):
+            self._saved[(id(obj), method)] = vars(obj)[method]
+        original = getattr(obj, method)
+        stats = self.sections.get(label)
+        if stats is None:
+            stats = self.sections[label] = SectionStats(label, self.window)
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                stats.add((perf_counter() - start) * 1000.0)
+
+        setattr(obj, method, timed)
+
+    def record(self, label: str, duration_ms: float):
+        """
+        Add a sample for code that is not a watched method.
+
+        Args:
+            label (str): Section name
+            duration_ms (float): Duration in milliseconds
+        """
+        if not self.enabled:
+            return
+        stats = self.sections.get(label)
+        if stats is None:
+            stats = self.sections[label] = SectionStats(label, self.window)
+        stats.add(duration_ms)
+
+    def reset(self):
+        """Drop all collected samples."""
+        for label in list(self.sections):
+            self.sections[label] = SectionStats(label, self.window)
+        if self.enabled:
+            # Wrappers hold the old stats objects; rewrap onto the new ones
+            self.disable()
+            self.enable()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Get per-section statistics, slowest (by rolling average) first.
+
+        Returns:
+            dict: label -> summary dict (avg_ms, p95_ms, max_ms, last_ms,
+                calls, total_ms, lifetime_max_ms)
+        """
+        summaries = {label: stats.summary() for label, stats in self.sections.items()}
+        return dict(sorted(summaries.items(), key=lambda item: item[1]['avg_ms'], reverse=True))
+
+    def dump_json(self, path: str):
+        """
+        Write the statistics to a JSON file.
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, 'w') as f:
+            json.dump({'window': self.window, 'sections': self.get_stats()}, f, indent=2)
+
+    def dump_csv(self, path: str):
+        """
+        Write the statistics to a CSV file, one row per section.
+
+        Args:
+            path (str): Output file path
+        """
+        columns = ['avg_ms', 'p95_ms', 'max_ms', 'last_ms', 'calls', 'total_ms', 'lifetime_max_ms']
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['section'] + columns)
+            for label, summary in self.get_stats().items():
+                writer.writerow([label] + [summary[column] for column in columns])
+
+    def __repr__(self):
+        """String representation for debugging."""
+        state = 'on' if self.enabled else 'off'
+        return f"FrameProfiler({state}, watched={len(self._watched)}, sections={len(self.sections)})"
@@ -0,0 +1,324 @@
+"""
+Serialization helpers for saving game objects.
+
+Entities keep only plain data in their attributes (numbers, strings,
+tuples, enums and containers of those), so collections of them are saved
+column by column: one column per attribute, numeric columns as typed
+NumPy arrays. Loading creates the objects with ``cls.__new__`` and fills in
+their attributes directly, so constructors (which roll random visuals) and
+world generation never run.
+
+Values that JSON cannot represent exactly are tagged:
+    tuple -> {"__tuple__": [...]}
+    set -> {"__set__": [...]}
+    Enum -> {"__enum__": ["module:Class", "NAME"]}
+    dict with non-string keys -> {"__items__": [[key, value], ...]}
+"""
+
+import importlib
+from enum import Enum
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+TAG_TUPLE = '__tuple__'
+TAG_SET = '__set__'
+TAG_ENUM = '__enum__'
+TAG_ITEMS = '__items__'
+TAG_MISSING = '__missing__'
+_TAGS = (TAG_TUPLE, TAG_SET, TAG_ENUM, TAG_ITEMS, TAG_MISSING)
+
+# Top-level packages classes may be loaded from (src/ is also on sys.path)
+_LOADABLE_ROOTS = ('src', 'core', 'entities', 'rendering', 'systems', 'ui', 'utils', 'world')
+
+_PLAIN_TYPES = (int, float, str, bool, type(None))
+
+_MISSING = object()
+_class_cache: Dict[str, type] = {}
+
+
+class SerializationError(Exception):
+    """Raised when a value cannot be saved or a saved class cannot be loaded."""
+
+
+def class_path(cls: type) -> str:
+    """Get the "module:QualifiedName" string a class is saved under."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def resolve_class(path: str) -> type:
+    """
+    Find a class from its saved path.
+
+    Only classes from the game's own packages can be loaded, so a save file
+    cannot make the game import arbitrary modules.
+
+    Args:
+        path: "module:QualifiedName" (see class_path)
+
+    Returns:
+        The class
+
+    Raises:
+        SerializationError: If the path is outside the game or unknown
+    """
+    cls = _class_cache.get(path)
+    if cls is not None:
+        return cls
+
+    module_name, _, qualname = path.partition(':')
+    if module_name.split('.')[0] not in _LOADABLE_ROOTS:
+        raise SerializationError(f"Refusing to load class from {module_name}")
+    try:
+        cls = importlib.import_module(module_name)
+        for part in qualname.split('.'):
+            cls = getattr(cls, part)
+    except (ImportError, AttributeError) as e:
+        raise SerializationError(f"Unknown class {path}") from e
+    if not isinstance(cls, type):
+        raise SerializationError(f"{path} is not a class")
+
+    _class_cache[path] = cls
+    return cls
+
+
+def encode_value(value) -> Any:
+    """
+    Convert a value to JSON-compatible data (ndarrays pass through).
+
+    Args:
+        value: Plain value, container or enum
+
+    Returns:
+        Encoded value
+
+    Raises:
+        SerializationError: For objects that are not plain data
+    """
+    value_type = type(value)
+    if value_type in _PLAIN_TYPES:
+        return value
+    if value_type is list:
+        return [encode_value(item) for item in value]
+    if value_type is tuple:
+        return {TAG_TUPLE: [encode_value(item) for item in value]}
+    if value_type is dict:
+        if all(type(key) is str for key in value) and not (len(value) == 1 and next(iter(value)) in _TAGS):
+            return {key: encode_value(item) for key, item in value.items()}
+        return {TAG_ITEMS: [[encode_value(key), encode_value(item)] for key, item in value.items()]}
+    if value_type in (set, frozenset):
+        return {TAG_SET: [encode_value(item) for item in value]}
+    if isinstance(value, Enum):
+        return {TAG_ENUM: [class_path(value_type), value.name]}
+    if isinstance(value, np.ndarray):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (int, float, str)):
+        return value
+    raise SerializationError(f"Cannot save a {value_type.__name__} value")
+
+
+def decode_value(data) -> Any:
+    """
+    Rebuild a value encoded by encode_value.
+
+    Args:
+        data: Encoded value
+
+    Returns:
+        Decoded value
+    """
+    if type(data) is list:
+        return [decode_value(item) for item in data]
+    if type(data) is dict:
+        if len(data) == 1:
+            tag, payload = next(iter(data.items()))
+            if tag == TAG_TUPLE:
+                return tuple(decode_value(item) for item in payload)
+            if tag == TAG_SET:
+                return {decode_value(item) for item in payload}
+            if tag == TAG_ENUM:
+                return resolve_class(payload[0])[payload[1]]
+            if tag == TAG_ITEMS:
+                return {decode_value(key): decode_value(item) for key, item in payload}
+            if tag == TAG_MISSING:
+                return _MISSING
+        return {key: decode_value(item) for key, item in data.items()}
+    return data
+
+
+def _pack_column(values: List) -> Any:
+    """Store one attribute column as a typed array, a plain list or encoded values."""
+    types = set(map(type, values))
+    if types == {float}:
+        return np.array(values, dtype=np.float64)
+    if types == {bool}:
+        return np.array(values, dtype=bool)
+    if types == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    if types <= {str, type(None)}:
+        return values
+    if types == {tuple} and len(set(map(len, values))) == 1:
+        # Positions and colors: store as a 2D array
+        item_types = {type(item) for value in values for item in value}
+        if item_types == {int} or item_types == {float}:
+            try:
+                return {'tuples': np.array(values, dtype=np.int64 if item_types == {int} else np.float64)}
+            except OverflowError:
+                pass
+    return {'encoded': [{TAG_MISSING: 0} if value is _MISSING else encode_value(value)
+                        for value in values]}
+
+
+def _unpack_column(column) -> List:
+    """Inverse of _pack_column."""
+    if isinstance(column, np.ndarray):
+        return column.tolist()
+    if isinstance(column, dict):
+        if 'tuples' in column:
+            return [tuple(row) for row in column['tuples'].tolist()]
+        return [decode_value(value) for value in column['encoded']]
+    return column
+
+
+def pack_objects(objects, exclude=()) -> Dict[str, Any]:
+    """
+    Save a list of objects column by column.
+
+    Args:
+        objects: Objects whose attributes are all plain data
+        exclude: Attribute names to leave out (e.g. references to other
+            objects, which the caller saves in its own form)
+
+    Returns:
+        dict: classes, per-object class index and per-class columns
+
+    Raises:
+        SerializationError: If an attribute holds something other than plain data
+    """
+    classes = []
+    class_index = {}
+    members: List[List] = []
+    order = []
+    for obj in objects:
+        cls = type(obj)
+        index = class_index.get(cls)
+        if index is None:
+            index = class_index[cls] = len(classes)
+            classes.append(cls)
+            members.append([])
+        members[index].append(vars(obj))
+        order.append(index)
+
+    groups = []
+    for states in members:
+        names = {}
+        for state in states:
+            for name in state:
+                names[name] = None
+        for name in exclude:
+            names.pop(name, None)
+
+        columns = {}
+        for name in names:
+            try:
+                columns[name] = _pack_column([state.get(name, _MISSING) for state in states])
+            except SerializationError as e:
+                raise SerializationError(f"{name}: {e}") from None
+        groups.append(columns)
+
+    return {
+        'classes': [class_path(cls) for cls in classes],
+        'order': np.array(order, dtype=np.uint16),
+        'groups': groups,
+    }
+
+
+def unpack_objects(data: Dict[str, Any]) -> List:
+    """
+    Recreate objects saved by pack_objects, without calling their constructors.
+
+    Args:
+        data: Output of pack_objects
+
+    Returns:
+        list: Objects in their original order
+    """
+    order = data['order']
+    if isinstance(order, np.ndarray):
+        order = order.tolist()
+
+    groups = []
+    for index, (path, columns) in enumerate(zip(data['classes'], data['groups'])):
+        cls = resolve_class(path)
+        names = list(columns)
+        values = [_unpack_column(columns[name]) for name in names]
+        sparse = any('encoded' in columns[name] for name in names if isinstance(columns[name], dict))
+        rows = zip(*values) if names else [()] * order.count(index)
+
+        objects = []
+        for row in rows:
+            obj = cls.__new__(cls)
+            state = dict(zip(names, row))
+            if sparse:
+                state = {name: value for name, value in state.items() if value is not _MISSING}
+            obj.__dict__.update(state)
+            objects.append(obj)
+        groups.append(iter(objects))
+
+    return [next(groups[index]) for index in order]
+
+
+def reassign_identity_ids(objects) -> Dict[int, int]:
+    """
+    Give loaded objects fresh ids, for classes that use id(self) as their id.
+
+    Saved ids are memory addresses from the process that saved them and
+    could clash with objects created later.
+
+    Args:
+        objects: Loaded objects with an ``id`` attribute
+
+    Returns:
+        dict: old id -> new id, for fixing up references by id
+    """
+    remap = {}
+    for obj in objects:
+        new_id = id(obj)
+        remap[obj.id] = new_id
+        obj.id = new_id
+    return remap
+
+
+def pack_attributes(obj, names) -> Dict[str, Any]:
+    """
+    Save selected attributes of a manager.
+
+    Args:
+        obj: Object to read
+        names: Attribute names
+
+    Returns:
+        dict: name -> encoded value
+    """
+    return {name: encode_value(getattr(obj, name)) for name in names}
+
+
+def unpack_attributes(obj, data: Dict[str, Any], names):
+    """
+    Restore attributes saved by pack_attributes.
+
+    Args:
+        obj: Object to update
+        data: Saved attributes
+        names: Attribute names to restore (others in data are ignored;
+            names missing from data keep their current value)
+    """
+    for name in names:
+        if name in data:
+            setattr(obj, name, decode_value(data[name]))
@@ -0,0 +1,79 @@
+"""
+SpatialHash - uniform grid of buckets for fast neighbourhood queries.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+
+class SpatialHash:
+    """
+    Buckets items by position in square cells.
+
+    Meant to be rebuilt each frame from moving entities: insert everything,
+    then ask for items near a point. A query returns every item in the
+    cells overlapping the search square, so callers still do their own
+    exact distance test.
+    """
+
+    def __init__(self, cell_size: float):
+        """
+        Initialize the spatial hash.
+
+        Args:
+            cell_size (float): Cell width/height in world pixels; about the
+                typical query radius works best
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List] = {}
+
+    def clear(self):
+        """Remove all items."""
+        self.cells.clear()
+
+    def insert(self, item, x: float, y: float):
+        """
+        Add an item at a world position.
+
+        Args:
+            item: Object to store
+            x (float): World X
+            y (float): World Y
+        """
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [item]
+        else:
+            bucket.append(item)
+
+    def query(self, x: float, y: float, radius: float) -> Iterator:
+        """
+        Iterate over items in cells within radius of a point.
+
+        Args:
+            x (float): World X
+            y (float): World Y
+            radius (float): Search radius in world pixels
+
+        Yields:
+            Items whose cell overlaps the square around the point
+        """
+        size = self.cell_size
+        cells = self.cells
+        min_cx = int((x - radius) // size)
+        max_cx = int((x + radius) // size)
+        min_cy = int((y - radius) // size)
+        max_cy = int((y + radius) // size)
+
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.cells.values())
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"SpatialHash(cell_size={self.cell_size}, cells={len(self.cells)})"
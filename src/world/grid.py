@@ -5,6 +5,10 @@ Grid class - manages the tile-based game world.
 import pygame
 import random
 from src.world.tile import Tile, TileType, TerrainType
+from src.world.tile_store import TileStore
+from src.world.visibility import VisibilityMap
+from src.rendering.terrain_cache import TerrainCache
+from src.utils.serialization import pack_objects, unpack_objects
 from src.world.city_generator import CityGenerator
 from src.world.river_generator import RiverGenerator
 from src.entities.city_building import (
@@ -36,14 +40,14 @@ class Grid:
         self.world_width = width_tiles * tile_size
         self.world_height = height_tiles * tile_size
 
-        # Create 2D array of tiles
-        self.tiles = []
-        for y in range(height_tiles):
-            row = []
-            for x in range(width_tiles):
-                tile = Tile(x, y, TileType.GRASS)
-                row.append(tile)
-            self.tiles.append(row)
+        # Tile data lives in per-attribute layers; get_tile() returns views
+        self.store = TileStore(width_tiles, height_tiles, TileType.GRASS)
+
+        # Pre-rendered terrain chunks (created on first render)
+        self.terrain_cache = None
+
+        # Shared sight-blocking bitmap (created on first use)
+        self.visibility = None
 
         # City generation
         self.city_generator = None
@@ -68,7 +72,7 @@ class Grid:
             Tile or None if out of bounds
         """
         if 0 <= grid_x < self.width_tiles and 0 <= grid_y < self.height_tiles:
-            return self.tiles[grid_y][grid_x]
+            return Tile.view(self.store, grid_x, grid_y)
         return None
 
     def get_tile_at_world_pos(self, world_x, world_y):
@@ -125,9 +129,58 @@ class Grid:
             grid_y (int): Y position in grid
             tile_type (int): New tile type
         """
-        tile = self.get_tile(grid_x, grid_y)
-        if tile:
-            tile.set_type(tile_type)
+        if 0 <= grid_x < self.width_tiles and 0 <= grid_y < self.height_tiles:
+            self.store.set_tile_type(grid_x, grid_y, tile_type)
+
+    def set_terrain_type(self, grid_x, grid_y, terrain_type):
+        """
+        Change the terrain type of a tile.
+
+        Args:
+            grid_x (int): X position in grid
+            grid_y (int): Y position in grid
+            terrain_type (int): New terrain type
+        """
+        if 0 <= grid_x < self.width_tiles and 0 <= grid_y < self.height_tiles:
+            self.store.set_terrain_type(grid_x, grid_y, terrain_type)
+
+    def is_passable(self, grid_x, grid_y):
+        """
+        Check whether entities can move through a tile.
+
+        Args:
+            grid_x (int): X position in grid
+            grid_y (int): Y position in grid
+
+        Returns:
+            bool: True if in bounds, walkable and not occupied
+        """
+        if 0 <= grid_x < self.width_tiles and 0 <= grid_y < self.height_tiles:
+            return self.store.is_passable(grid_x, grid_y)
+        return False
+
+    def get_visibility(self):
+        """
+        Get the shared line-of-sight map for this grid.
+
+        Returns:
+            VisibilityMap: Sight-blocking bitmap kept in sync with the tiles
+        """
+        if self.visibility is None:
+            self.visibility = VisibilityMap(self.store)
+        return self.visibility
+
+    def find_tiles(self, tile_type):
+        """
+        Find all tiles of a given type.
+
+        Args:
+            tile_type (int): TileType to search for
+
+        Returns:
+            List of (grid_x, grid_y) tuples
+        """
+        return self.store.find_tiles(tile_type)
 
     def create_test_world(self):
         """
@@ -142,19 +195,19 @@ class Grid:
         for y in range(center_y - 5, center_y + 5):
             for x in range(center_x - 5, center_x + 5):
                 if 0 <= x < self.width_tiles and 0 <= y < self.height_tiles:
-                    self.tiles[y][x].set_type(TileType.GRASS)
+                    self.set_tile_type(x, y, TileType.GRASS)
 
         # Add a simple factory building (5x5)
         for y in range(center_y - 2, center_y + 3):
             for x in range(center_x - 2, center_x + 3):
                 if 0 <= x < self.width_tiles and 0 <= y < self.height_tiles:
-                    self.tiles[y][x].set_type(TileType.FACTORY)
+                    self.set_tile_type(x, y, TileType.FACTORY)
 
         # Create a road leading from factory to the left (dirt road)
         road_y = center_y
         for x in range(center_x - 10, center_x - 2):
             if 0 <= x < self.width_tiles:
-                self.tiles[road_y][x].set_type(TileType.ROAD_DIRT)
+                self.set_tile_type(x, road_y, TileType.ROAD_DIRT)
 
         # Create landfill area to the left
         for y in range(10, 30):
@@ -162,9 +215,9 @@ class Grid:
                 if 0 <= x < self.width_tiles and 0 <= y < self.height_tiles:
                     # Randomize landfill appearance slightly
                     if random.random() < 0.8:
-                        self.tiles[y][x].set_type(TileType.LANDFILL)
+                        self.set_tile_type(x, y, TileType.LANDFILL)
                     else:
-                        self.tiles[y][x].set_type(TileType.DIRT)
+                        self.set_tile_type(x, y, TileType.DIRT)
 
         # Create a city area to the right
         for y in range(10, 40):
@@ -173,13 +226,13 @@ class Grid:
                     # Create a grid pattern for city
                     if x % 8 in [0, 7] or y % 8 in [0, 7]:
                         # Roads
-                        self.tiles[y][x].set_type(TileType.ROAD_TAR)
+                        self.set_tile_type(x, y, TileType.ROAD_TAR)
                     elif random.random() < 0.6:
                         # Buildings
-                        self.tiles[y][x].set_type(TileType.BUILDING)
+                        self.set_tile_type(x, y, TileType.BUILDING)
                     else:
                         # Grass
-                        self.tiles[y][x].set_type(TileType.GRASS)
+                        self.set_tile_type(x, y, TileType.GRASS)
 
         print("Test world created with factory, landfill, and city areas")
 
@@ -213,9 +266,7 @@ class Grid:
 
         # Apply river tiles to grid
         for (river_x, river_y) in river_data['river_tiles']:
-            tile = self.get_tile(river_x, river_y)
-            if tile:
-                tile.set_terrain_type(TerrainType.WATER)
+            self.set_terrain_type(river_x, river_y, TerrainType.WATER)
 
         # Generate ocean edges if specified
         ocean_tiles = set()
@@ -226,9 +277,7 @@ class Grid:
 
             # Apply ocean tiles to grid
             for (ocean_x, ocean_y) in ocean_tiles:
-                tile = self.get_tile(ocean_x, ocean_y)
-                if tile:
-                    tile.set_terrain_type(TerrainType.OCEAN)
+                self.set_terrain_type(ocean_x, ocean_y, TerrainType.OCEAN)
 
         self.has_geographic_features = True
 
@@ -263,9 +312,7 @@ class Grid:
 
             # Apply bridge tiles to grid
             for (bridge_x, bridge_y) in self.river_generator.bridge_tiles:
-                tile = self.get_tile(bridge_x, bridge_y)
-                if tile:
-                    tile.set_terrain_type(TerrainType.BRIDGE)
+                self.set_terrain_type(bridge_x, bridge_y, TerrainType.BRIDGE)
 
             stats = self.river_generator.get_statistics()
             print(f"Bridges placed: {stats['num_bridges']} ({stats['bridge_tiles']} tiles)")
@@ -359,19 +406,14 @@ class Grid:
         end_x = min(self.width_tiles, int((camera.x + camera.width) // self.tile_size) + 2)
         end_y = min(self.height_tiles, int((camera.y + camera.height) // self.tile_size) + 2)
 
-        # Render visible tiles
-        for grid_y in range(start_y, end_y):
-            for grid_x in range(start_x, end_x):
-                tile = self.tiles[grid_y][grid_x]
-
-                # Calculate screen position
-                world_x = grid_x * self.tile_size
-                world_y = grid_y * self.tile_size
-                screen_x = world_x - camera.x
-                screen_y = world_y - camera.y
+        # Render terrain as pre-rendered chunks
+        if self.terrain_cache is None:
+            self.terrain_cache = TerrainCache(self)
+        self.terrain_cache.render(screen, camera)
 
-                # Render the tile
-                tile.render(screen, screen_x, screen_y, self.tile_size, show_grid)
+        # Grid lines come from a separate cached overlay
+        if show_grid:
+            self.terrain_cache.render_grid_lines(screen, camera)
 
         # Render city buildings (on top of tiles)
         if self.city_generated:
@@ -388,13 +430,45 @@ class Grid:
         Args:
             dt (float): Delta time in seconds
         """
-        # Update water tile animations
-        for y in range(self.height_tiles):
-            for x in range(self.width_tiles):
-                tile = self.tiles[y][x]
-                if tile:
-                    # Update water/ocean animation frames
-                    tile.update_animation(dt)
+        # Water shares one animation clock, so this is O(1) regardless of
+        # map size; tiles read their palette step from it when rendering
+        if self.store.animated_tiles:
+            self.store.advance_water_phase(dt)
+
+    def to_dict(self):
+        """
+        Serialize the world for saving.
+
+        Returns:
+            dict: Tile layers, city buildings and generation flags
+        """
+        return {
+            'tile_size': self.tile_size,
+            'store': self.store.to_dict(),
+            'city_buildings': pack_objects(self.city_buildings),
+            'city_generated': self.city_generated,
+            'has_geographic_features': self.has_geographic_features,
+        }
+
+    def from_dict(self, data):
+        """
+        Load a world saved by to_dict, in place of generating one.
+
+        Args:
+            data (dict): Saved world
+
+        Raises:
+            ValueError: If the saved world has a different size
+        """
+        self.store.from_dict(data['store'])
+        self.city_buildings = unpack_objects(data['city_buildings'])
+        self.city_generated = data['city_generated']
+        self.has_geographic_features = data['has_geographic_features']
+        self.city_generator = None
+        self.river_generator = None
+
+        if self.terrain_cache is not None:
+            self.terrain_cache.invalidate_all()
 
     def __repr__(self):
         """String representation for debugging."""
@@ -2,6 +2,8 @@
 Tile class - represents a single tile in the game world.
 """
 
+import math
+from collections.abc import MutableMapping
 import pygame
 from src.core.constants import Colors
 
@@ -28,10 +30,97 @@ class TerrainType:
     OCEAN = 4
 
 
+# Display colors per tile type
+TILE_COLORS = {
+    TileType.EMPTY: (20, 20, 20),           # Dark gray
+    TileType.LANDFILL: (100, 80, 60),       # Brown
+    TileType.GRASS: (50, 120, 50),          # Green
+    TileType.DIRT: (139, 115, 85),          # Light brown
+    TileType.ROAD_DIRT: (160, 130, 95),     # Lighter brown
+    TileType.ROAD_TAR: (60, 60, 60),        # Dark gray
+    TileType.ROAD_ASPHALT: (40, 40, 40),    # Very dark gray
+    TileType.FACTORY: (80, 80, 120),        # Blue-gray
+    TileType.BUILDING: (120, 100, 80),      # Tan
+}
+
+
+# Terrain types that animate (water shimmer)
+ANIMATED_TERRAIN = (TerrainType.WATER, TerrainType.OCEAN)
+
+# Water animation: frames advance this many units per second and wrap at
+# WATER_CYCLE_FRAMES; the shimmer itself is a precomputed palette cycle
+WATER_ANIM_SPEED = 10
+WATER_CYCLE_FRAMES = 360
+WATER_PALETTE_STEPS = 32
+
+
+def _build_water_palette(base_color):
+    """
+    Precompute one full shimmer cycle for a water base color.
+
+    Returns:
+        list: WATER_PALETTE_STEPS entries of (water_color, ripple_color, wave_offset)
+    """
+    palette = []
+    for step in range(WATER_PALETTE_STEPS):
+        anim_value = math.sin(step * 2 * math.pi / WATER_PALETTE_STEPS) * 10
+        water_color = tuple(min(255, max(0, int(c + anim_value))) for c in base_color)
+        ripple_color = tuple(min(255, c + 20) for c in water_color)
+        palette.append((water_color, ripple_color, int(anim_value * 0.3)))
+    return palette
+
+
+WATER_PALETTES = {
+    TerrainType.WATER: _build_water_palette((30, 100, 180)),   # Lighter blue for rivers
+    TerrainType.OCEAN: _build_water_palette((10, 50, 100)),    # Dark blue for ocean
+}
+
+
+# Palette steps per unit of water phase (the wave is sin(phase * 0.1))
+WATER_STEPS_PER_FRAME = 0.1 * WATER_PALETTE_STEPS / (2 * math.pi)
+
+
+def water_phase_step(water_phase):
+    """
+    Quantize the shared water clock to a palette step.
+
+    Every water tile changes color at the same moment, when this value
+    changes, so cached water only needs redrawing then.
+
+    Args:
+        water_phase (float): Shared water animation frame
+
+    Returns:
+        int: Global palette step
+    """
+    return int(water_phase * WATER_STEPS_PER_FRAME)
+
+
+def water_palette_index(water_phase, grid_x, grid_y):
+    """
+    Get the palette step for a water tile at the given animation phase.
+
+    Args:
+        water_phase (float): Shared water animation frame
+        grid_x (int): X position in grid
+        grid_y (int): Y position in grid
+
+    Returns:
+        int: Index into a WATER_PALETTES cycle
+    """
+    # Tiles are offset along the diagonal so the shimmer travels as a wave
+    offset = int((grid_x + grid_y) * WATER_STEPS_PER_FRAME)
+    return (water_phase_step(water_phase) + offset) % WATER_PALETTE_STEPS
+
+
 class Tile:
     """
     Represents a single tile in the game world.
 
+    Tiles are lightweight views onto a TileStore: reading or writing an
+    attribute goes straight to the store's per-attribute layers. A Tile
+    created directly (outside of a Grid) gets its own single-tile store.
+
     Attributes:
         grid_x (int): X position in grid
         grid_y (int): Y position in grid
@@ -41,9 +130,11 @@ class Tile:
         terrain_data (dict): Additional terrain-specific data
     """
 
+    __slots__ = ('grid_x', 'grid_y', '_store', '_sx', '_sy')
+
     def __init__(self, grid_x, grid_y, tile_type=TileType.GRASS, terrain_type=None):
         """
-        Initialize a tile.
+        Initialize a standalone tile.
 
         Args:
             grid_x (int): X position in grid
@@ -51,42 +142,123 @@ class Tile:
             tile_type (int): Type of tile
             terrain_type (int): Terrain type (water, land, bridge, etc.)
         """
+        from src.world.tile_store import TileStore
+
         self.grid_x = grid_x
         self.grid_y = grid_y
-        self.tile_type = tile_type
-        self.terrain_type = terrain_type if terrain_type is not None else TerrainType.LAND
-        self.walkable = True
-        self.occupied = False
+        self._store = TileStore(
+            1, 1, tile_type,
+            terrain_type if terrain_type is not None else TerrainType.LAND
+        )
+        self._sx = 0
+        self._sy = 0
 
-        # Additional data for this tile
-        self.terrain_data = {}
+    @classmethod
+    def view(cls, store, grid_x, grid_y):
+        """
+        Create a view onto an existing tile in a TileStore.
+
+        Args:
+            store (TileStore): Store holding the tile data
+            grid_x (int): X position in grid
+            grid_y (int): Y position in grid
 
-        # Landfill depletion tracking (0.0 = full, 1.0 = completely depleted)
-        self.depletion_level = 0.0
+        Returns:
+            Tile: View onto the stored tile
+        """
+        tile = cls.__new__(cls)
+        tile.grid_x = grid_x
+        tile.grid_y = grid_y
+        tile._store = store
+        tile._sx = grid_x
+        tile._sy = grid_y
+        return tile
+
+    @property
+    def tile_type(self):
+        return int(self._store.tile_type[self._sy, self._sx])
+
+    @tile_type.setter
+    def tile_type(self, value):
+        self._store.tile_type[self._sy, self._sx] = value
+        self._store.notify(self._sx, self._sy)
+
+    @property
+    def terrain_type(self):
+        return int(self._store.terrain_type[self._sy, self._sx])
+
+    @terrain_type.setter
+    def terrain_type(self, value):
+        self._store.terrain_type[self._sy, self._sx] = value
+        self._store.index_animation(self._sx, self._sy)
+        self._store.notify(self._sx, self._sy)
+
+    @property
+    def walkable(self):
+        return bool(self._store.walkable[self._sy, self._sx])
+
+    @walkable.setter
+    def walkable(self, value):
+        self._store.set_walkable(self._sx, self._sy, value)
+
+    @property
+    def occupied(self):
+        return bool(self._store.occupied[self._sy, self._sx])
+
+    @occupied.setter
+    def occupied(self, value):
+        self._store.set_occupied(self._sx, self._sy, value)
+
+    @property
+    def depletion_level(self):
+        return float(self._store.depletion_level[self._sy, self._sx])
+
+    @depletion_level.setter
+    def depletion_level(self, value):
+        self._store.set_depletion(self._sx, self._sy, value)
+
+    @property
+    def water_anim_frame(self):
+        """Water animation frame (shared by every tile in the store)."""
+        return self._store.water_phase
+
+    @water_anim_frame.setter
+    def water_anim_frame(self, value):
+        self._store.water_phase = value
+
+    @property
+    def terrain_data(self):
+        """Extra terrain data; the store only keeps an entry once something is written."""
+        data = self._store.terrain_data.get((self._sx, self._sy))
+        if data is None:
+            return _NewTerrainData(self._store, (self._sx, self._sy))
+        return data
+
+    @terrain_data.setter
+    def terrain_data(self, value):
+        if value:
+            self._store.terrain_data[(self._sx, self._sy)] = dict(value)
+        else:
+            self._store.terrain_data.pop((self._sx, self._sy), None)
 
-        # Water animation frame for animated water
-        self.water_anim_frame = 0
+    @property
+    def color(self):
+        """Display color, derived from tile type and landfill depletion."""
+        if self.tile_type == TileType.LANDFILL:
+            return self._get_landfill_color_for_depletion()
+        return self._get_color_for_type(self.tile_type)
 
-        # Visual properties
-        self.color = self._get_color_for_type(tile_type)
+    def __eq__(self, other):
+        if not isinstance(other, Tile):
+            return NotImplemented
+        return self._store is other._store and self._sx == other._sx and self._sy == other._sy
 
-        # Update walkability based on terrain
-        self._update_walkability()
+    def __hash__(self):
+        return hash((id(self._store), self._sx, self._sy))
 
     def _get_color_for_type(self, tile_type):
         """Get the display color for this tile type."""
-        color_map = {
-            TileType.EMPTY: (20, 20, 20),           # Dark gray
-            TileType.LANDFILL: (100, 80, 60),       # Brown
-            TileType.GRASS: (50, 120, 50),          # Green
-            TileType.DIRT: (139, 115, 85),          # Light brown
-            TileType.ROAD_DIRT: (160, 130, 95),     # Lighter brown
-            TileType.ROAD_TAR: (60, 60, 60),        # Dark gray
-            TileType.ROAD_ASPHALT: (40, 40, 40),    # Very dark gray
-            TileType.FACTORY: (80, 80, 120),        # Blue-gray
-            TileType.BUILDING: (120, 100, 80),      # Tan
-        }
-        return color_map.get(tile_type, Colors.GRAY)
+        return TILE_COLORS.get(tile_type, Colors.GRAY)
 
     def _get_landfill_color_for_depletion(self):
         """Get color for landfill tile based on depletion level."""
@@ -103,16 +275,7 @@ class Tile:
 
     def _update_walkability(self):
         """Update walkability based on tile type and terrain type."""
-        # Water blocks movement (unless bridge)
-        if self.terrain_type == TerrainType.WATER or self.terrain_type == TerrainType.OCEAN:
-            self.walkable = False
-        elif self.terrain_type == TerrainType.BRIDGE:
-            self.walkable = True
-        # Buildings block movement
-        elif self.tile_type in [TileType.FACTORY, TileType.BUILDING]:
-            self.walkable = False
-        else:
-            self.walkable = True
+        self._store.update_walkability(self._sx, self._sy)
 
     def set_type(self, tile_type):
         """
@@ -121,9 +284,7 @@ class Tile:
         Args:
             tile_type (int): New tile type
         """
-        self.tile_type = tile_type
-        self.color = self._get_color_for_type(tile_type)
-        self._update_walkability()
+        self._store.set_tile_type(self._sx, self._sy, tile_type)
 
     def set_terrain_type(self, terrain_type):
         """
@@ -132,8 +293,7 @@ class Tile:
         Args:
             terrain_type (int): New terrain type
         """
-        self.terrain_type = terrain_type
-        self._update_walkability()
+        self._store.set_terrain_type(self._sx, self._sy, terrain_type)
 
     def add_depletion(self, amount: float, pollution_manager=None):
         """
@@ -145,10 +305,8 @@ class Tile:
         """
         self.depletion_level = min(1.0, self.depletion_level + amount)
 
-        # Update color for landfill tiles
+        # Landfill color follows depletion automatically (see color)
         if self.tile_type == TileType.LANDFILL:
-            self.color = self._get_landfill_color_for_depletion()
-
             # Update pollution generation (more trash = more pollution)
             if pollution_manager:
                 fullness = 1.0 - self.depletion_level
@@ -232,38 +390,17 @@ class Tile:
 
     def _render_water(self, screen, x, y, tile_size):
         """Render water tile with animated effect."""
-        # Base water color
-        if self.terrain_type == TerrainType.OCEAN:
-            base_color = (10, 50, 100)  # Dark blue for ocean
-        else:
-            base_color = (30, 100, 180)  # Lighter blue for rivers
-
-        # Animate water by varying color slightly
-        import math
-        time_offset = (self.grid_x + self.grid_y) * 0.1  # Offset based on position
-        anim_value = math.sin(self.water_anim_frame * 0.1 + time_offset) * 10
-
-        water_color = (
-            min(255, max(0, int(base_color[0] + anim_value))),
-            min(255, max(0, int(base_color[1] + anim_value))),
-            min(255, max(0, int(base_color[2] + anim_value)))
-        )
+        palette = WATER_PALETTES.get(self.terrain_type, WATER_PALETTES[TerrainType.WATER])
+        step = water_palette_index(self._store.water_phase, self.grid_x, self.grid_y)
+        water_color, ripple_color, wave_offset = palette[step]
 
         rect = pygame.Rect(x, y, tile_size, tile_size)
         pygame.draw.rect(screen, water_color, rect)
 
-        # Draw water ripple effect
+        # Draw subtle waves
         if tile_size >= 16:
-            ripple_alpha = int(50 + anim_value * 2)
-            ripple_color = (
-                min(255, water_color[0] + 20),
-                min(255, water_color[1] + 20),
-                min(255, water_color[2] + 20)
-            )
-
-            # Draw subtle waves
             for i in range(2):
-                wave_y = y + tile_size // 3 + i * tile_size // 3 + int(anim_value * 0.3)
+                wave_y = y + tile_size // 3 + i * tile_size // 3 + wave_offset
                 pygame.draw.line(screen, ripple_color, (x, wave_y), (x + tile_size, wave_y), 1)
 
     def _render_bridge(self, screen, x, y, tile_size):
@@ -324,15 +461,54 @@ class Tile:
         """
         Update tile animation (for water, etc.).
 
+        Water shares one animation clock per store, so this only needs to
+        be called for standalone tiles; Grid.update advances the grid's clock.
+
         Args:
             dt (float): Delta time in seconds
         """
-        # Update water animation frame
-        if self.terrain_type in [TerrainType.WATER, TerrainType.OCEAN]:
-            self.water_anim_frame += dt * 10  # Animation speed
-            if self.water_anim_frame > 360:
-                self.water_anim_frame -= 360
+        if self.terrain_type in ANIMATED_TERRAIN:
+            self._store.advance_water_phase(dt)
 
     def __repr__(self):
         """String representation for debugging."""
         return f"Tile({self.grid_x}, {self.grid_y}, type={self.tile_type}, terrain={self.terrain_type})"
+
+
+class _NewTerrainData(MutableMapping):
+    """
+    terrain_data of a tile that has none yet.
+
+    Reads see an empty mapping; the first write creates the tile's entry in
+    the store's sparse terrain_data, so reading never adds empty entries.
+    """
+
+    __slots__ = ('_store', '_key')
+
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+    def _data(self):
+        return self._store.terrain_data.get(self._key, {})
+
+    def __getitem__(self, name):
+        return self._data()[name]
+
+    def __setitem__(self, name, value):
+        self._store.terrain_data.setdefault(self._key, {})[name] = value
+
+    def __delitem__(self, name):
+        data = self._data()
+        del data[name]
+        if not data:
+            self._store.terrain_data.pop(self._key, None)
+
+    def __iter__(self):
+        return iter(self._data())
+
+    def __len__(self):
+        return len(self._data())
+
+    def __repr__(self):
+        return repr(self._data())
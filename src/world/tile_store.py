@@ -0,0 +1,334 @@
+"""
+TileStore - structure-of-arrays storage for grid tiles.
+
+Instead of one Python object per tile, every tile attribute lives in its own
+NumPy layer indexed as ``layer[grid_y, grid_x]``. ``Tile`` objects handed out
+by ``Grid.get_tile`` are lightweight views onto these layers, while systems
+that need bulk access (pathfinding, detection, pollution) can read the layers
+directly.
+"""
+
+import numpy as np
+from src.utils.serialization import encode_value, decode_value
+from src.world.tile import (
+    TileType, TerrainType, ANIMATED_TERRAIN, WATER_ANIM_SPEED, WATER_CYCLE_FRAMES
+)
+
+
+# Terrain that blocks movement unless bridged
+BLOCKING_TERRAIN = (TerrainType.WATER, TerrainType.OCEAN)
+
+# Tile types that block movement
+BLOCKING_TILE_TYPES = (TileType.FACTORY, TileType.BUILDING)
+
+
+class TileStore:
+    """
+    Per-attribute tile layers for a rectangular grid.
+
+    Attributes:
+        width (int): Width in tiles
+        height (int): Height in tiles
+        tile_type (np.ndarray): uint8 layer of TileType values
+        terrain_type (np.ndarray): uint8 layer of TerrainType values
+        walkable (np.ndarray): bool layer, derived from tile/terrain type
+        occupied (np.ndarray): bool layer, set by buildings and construction
+        depletion_level (np.ndarray): float64 layer (0.0 = full, 1.0 = empty)
+        terrain_data (dict): Sparse (grid_x, grid_y) -> dict of extra data
+        water_phase (float): Shared water animation frame for all tiles
+        animated_tiles (set): (grid_x, grid_y) of tiles that animate
+        listeners (list): Callbacks called as listener(grid_x, grid_y)
+            whenever a tile's type, terrain, occupancy or depletion changes
+        passability_listeners (list): Callbacks called as
+            listener(grid_x, grid_y, passable) when a tile becomes passable
+            or blocked
+        version (int): Bumped on every tile change
+        passable_version (int): Bumped whenever passability changes
+    """
+
+    def __init__(self, width, height, tile_type=TileType.GRASS, terrain_type=TerrainType.LAND):
+        """
+        Initialize the store with every tile set to the same type.
+
+        Args:
+            width (int): Width in tiles
+            height (int): Height in tiles
+            tile_type (int): Initial tile type for all tiles
+            terrain_type (int): Initial terrain type for all tiles
+        """
+        self.width = width
+        self.height = height
+
+        shape = (height, width)
+        self.tile_type = np.full(shape, tile_type, dtype=np.uint8)
+        self.terrain_type = np.full(shape, terrain_type, dtype=np.uint8)
+        self.walkable = np.ones(shape, dtype=bool)
+        self.occupied = np.zeros(shape, dtype=bool)
+        self.depletion_level = np.zeros(shape, dtype=np.float64)
+
+        # Rarely used, so kept sparse instead of as a layer
+        self.terrain_data = {}
+
+        # Water animates from a single clock; only the index of animated
+        # tiles is tracked per tile
+        self.water_phase = 0.0
+        self.animated_tiles = set()
+
+        # Caches built on top of the layers (terrain chunks, paths, ...)
+        self.listeners = []
+        self.passability_listeners = []
+
+        # Bumped on change so derived data can tell when it is stale
+        self.version = 0
+        self.passable_version = 0
+        self._passable_bitmap = None
+        self._passable_bitmap_version = -1
+
+        self.refresh_walkability()
+        self.refresh_animation_index()
+
+    def add_listener(self, listener):
+        """
+        Register a callback for tile changes.
+
+        Args:
+            listener: Callable taking (grid_x, grid_y)
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Unregister a tile change callback."""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def add_passability_listener(self, listener):
+        """
+        Register a callback for tiles becoming passable or blocked.
+
+        Args:
+            listener: Callable taking (grid_x, grid_y, passable)
+        """
+        self.passability_listeners.append(listener)
+
+    def remove_passability_listener(self, listener):
+        """Unregister a passability callback."""
+        if listener in self.passability_listeners:
+            self.passability_listeners.remove(listener)
+
+    def notify(self, grid_x, grid_y, was_passable=None):
+        """
+        Tell listeners that a tile changed.
+
+        Args:
+            grid_x (int): X position in grid
+            grid_y (int): Y position in grid
+            was_passable (bool): Passability before the change, if the
+                change could have affected it
+        """
+        self.version += 1
+
+        if was_passable is not None:
+            passable = self.is_passable(grid_x, grid_y)
+            if passable != was_passable:
+                self.passable_version += 1
+                for listener in self.passability_listeners:
+                    listener(grid_x, grid_y, passable)
+
+        for listener in self.listeners:
+            listener(grid_x, grid_y)
+
+    def is_passable(self, grid_x, grid_y):
+        """Check whether a tile is walkable and not occupied."""
+        return bool(self.walkable[grid_y, grid_x]) and not self.occupied[grid_y, grid_x]
+
+    def in_bounds(self, grid_x, grid_y):
+        """Check whether grid coordinates fall inside the store."""
+        return 0 <= grid_x < self.width and 0 <= grid_y < self.height
+
+    def update_walkability(self, grid_x, grid_y):
+        """
+        Recompute walkability for a single tile.
+
+        Args:
+            grid_x (int): X position in grid
+            grid_y (int): Y position in grid
+        """
+        terrain = self.terrain_type[grid_y, grid_x]
+        if terrain in BLOCKING_TERRAIN:
+            walkable = False
+        elif terrain == TerrainType.BRIDGE:
+            walkable = True
+        else:
+            walkable = self.tile_type[grid_y, grid_x] not in BLOCKING_TILE_TYPES
+        self.walkable[grid_y, grid_x] = walkable
+
+    def refresh_walkability(self, x0=0, y0=0, x1=None, y1=None):
+        """
+        Recompute walkability for a rectangular region in one vectorized pass.
+
+        Args:
+            x0, y0 (int): Top-left corner (inclusive)
+            x1, y1 (int): Bottom-right corner (exclusive), defaults to store size
+        """
+        x1 = self.width if x1 is None else x1
+        y1 = self.height if y1 is None else y1
+
+        terrain = self.terrain_type[y0:y1, x0:x1]
+        tile_type = self.tile_type[y0:y1, x0:x1]
+
+        blocked_by_water = np.isin(terrain, BLOCKING_TERRAIN)
+        blocked_by_type = np.isin(tile_type, BLOCKING_TILE_TYPES) & (terrain != TerrainType.BRIDGE)
+        self.walkable[y0:y1, x0:x1] = ~(blocked_by_water | blocked_by_type)
+
+        # Bulk changes are not reported per tile; bump the versions so
+        # caches comparing against them know to rebuild
+        self.version += 1
+        self.passable_version += 1
+
+    def set_tile_type(self, grid_x, grid_y, tile_type):
+        """Set a tile's type and update its walkability."""
+        was_passable = self.is_passable(grid_x, grid_y)
+        self.tile_type[grid_y, grid_x] = tile_type
+        self.update_walkability(grid_x, grid_y)
+        self.notify(grid_x, grid_y, was_passable)
+
+    def set_terrain_type(self, grid_x, grid_y, terrain_type):
+        """Set a tile's terrain type and update its walkability."""
+        was_passable = self.is_passable(grid_x, grid_y)
+        self.terrain_type[grid_y, grid_x] = terrain_type
+        self.update_walkability(grid_x, grid_y)
+        self.index_animation(grid_x, grid_y)
+        self.notify(grid_x, grid_y, was_passable)
+
+    def set_walkable(self, grid_x, grid_y, walkable):
+        """Override a tile's walkability."""
+        was_passable = self.is_passable(grid_x, grid_y)
+        self.walkable[grid_y, grid_x] = walkable
+        self.notify(grid_x, grid_y, was_passable)
+
+    def set_occupied(self, grid_x, grid_y, occupied):
+        """Set whether something occupies a tile."""
+        was_passable = self.is_passable(grid_x, grid_y)
+        self.occupied[grid_y, grid_x] = occupied
+        self.notify(grid_x, grid_y, was_passable)
+
+    def set_depletion(self, grid_x, grid_y, depletion_level):
+        """Set a tile's landfill depletion level."""
+        self.depletion_level[grid_y, grid_x] = depletion_level
+        self.notify(grid_x, grid_y)
+
+    def index_animation(self, grid_x, grid_y):
+        """Add or remove a tile from the animated tile index."""
+        if self.terrain_type[grid_y, grid_x] in ANIMATED_TERRAIN:
+            self.animated_tiles.add((grid_x, grid_y))
+        else:
+            self.animated_tiles.discard((grid_x, grid_y))
+
+    def refresh_animation_index(self):
+        """Rebuild the animated tile index from the terrain layer."""
+        ys, xs = np.nonzero(np.isin(self.terrain_type, ANIMATED_TERRAIN))
+        self.animated_tiles = set(zip(xs.tolist(), ys.tolist()))
+
+    def advance_water_phase(self, dt):
+        """
+        Advance the shared water animation clock.
+
+        Args:
+            dt (float): Delta time in seconds
+        """
+        self.water_phase += dt * WATER_ANIM_SPEED
+        if self.water_phase > WATER_CYCLE_FRAMES:
+            self.water_phase -= WATER_CYCLE_FRAMES
+
+    def passable_mask(self):
+        """
+        Get tiles that entities can move through right now.
+
+        Returns:
+            np.ndarray: bool layer, True where walkable and not occupied
+        """
+        return self.walkable & ~self.occupied
+
+    def passable_bitmap(self):
+        """
+        Get passable tiles as a flat byte string with a blocked border.
+
+        The layer is padded by one tile on every side, so the tile at
+        (grid_x, grid_y) is byte ``(grid_y + 1) * (width + 2) + grid_x + 1``
+        and neighbour lookups never need bounds checks. The result is cached
+        until passability next changes.
+
+        Returns:
+            bytes: 1 where passable, 0 where blocked or outside the grid
+        """
+        if self._passable_bitmap_version != self.passable_version:
+            padded = np.pad(self.passable_mask(), 1, constant_values=False)
+            self._passable_bitmap = padded.astype(np.uint8).tobytes()
+            self._passable_bitmap_version = self.passable_version
+        return self._passable_bitmap
+
+    def find_tiles(self, tile_type):
+        """
+        Find all tiles of a given type.
+
+        Args:
+            tile_type (int): TileType to search for
+
+        Returns:
+            List of (grid_x, grid_y) tuples in row-major order
+        """
+        ys, xs = np.nonzero(self.tile_type == tile_type)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def to_dict(self):
+        """
+        Serialize the tile layers for saving.
+
+        Returns:
+            dict: Layers as arrays plus the sparse terrain data
+        """
+        return {
+            'width': self.width,
+            'height': self.height,
+            'tile_type': self.tile_type,
+            'terrain_type': self.terrain_type,
+            'walkable': self.walkable,
+            'occupied': self.occupied,
+            'depletion_level': self.depletion_level,
+            'terrain_data': encode_value(self.terrain_data),
+            'water_phase': self.water_phase,
+        }
+
+    def from_dict(self, data):
+        """
+        Load tile layers saved by to_dict.
+
+        Layers are copied into the existing arrays, so views and listeners
+        stay attached. Nothing is reported per tile; the bumped versions
+        tell caches to rebuild.
+
+        Args:
+            data (dict): Saved layers
+
+        Raises:
+            ValueError: If the saved grid has a different size
+        """
+        if (data['width'], data['height']) != (self.width, self.height):
+            raise ValueError(f"Saved grid is {data['width']}x{data['height']}, "
+                             f"this grid is {self.width}x{self.height}")
+
+        self.tile_type[...] = data['tile_type']
+        self.terrain_type[...] = data['terrain_type']
+        self.walkable[...] = data['walkable']
+        self.occupied[...] = data['occupied']
+        self.depletion_level[...] = data['depletion_level']
+        self.terrain_data = decode_value(data['terrain_data'])
+        self.water_phase = data['water_phase']
+
+        self.refresh_animation_index()
+        self.version += 1
+        self.passable_version += 1
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"TileStore({self.width}x{self.height})"
@@ -0,0 +1,298 @@
+"""
+Visibility - shared line-of-sight tests over the tile grid.
+
+Rays are traced with the Amanatides-Woo grid traversal (DDA), which visits
+exactly the tiles a segment passes through, in order, with one comparison
+per tile. Coordinates are in tile units (pixel / tile_size), so a tile
+centre is ``grid_x + 0.5``.
+
+The tests run over flat "clear" bitmaps padded by one tile on each side,
+the same layout as ``TileStore.passable_bitmap``: tile (grid_x, grid_y) is
+byte ``(grid_y + 1) * (width + 2) + grid_x + 1``. ``VisibilityMap`` keeps
+such a bitmap for tiles that block sight; path smoothing traces against
+the passability bitmap instead.
+"""
+
+import math
+import numpy as np
+from src.world.tile import TileType
+
+
+# Tile types that block line-of-sight
+SIGHT_BLOCKING_TILES = (TileType.BUILDING, TileType.FACTORY)
+
+INFINITY = float('inf')
+
+
+def trace_clear(clear, width, height, x0, y0, x1, y1, outside_clear=False):
+    """
+    Check whether a segment crosses only clear tiles.
+
+    The tiles holding the two end points are not tested, so a viewer
+    standing in a doorway can still see out. When the segment passes exactly
+    through a tile corner, both tiles beside the corner must be clear.
+
+    Args:
+        clear: Padded bitmap (bytes/bytearray), non-zero where clear
+        width (int): Grid width in tiles
+        height (int): Grid height in tiles
+        x0, y0 (float): Start point in tile units
+        x1, y1 (float): End point in tile units
+        outside_clear (bool): Whether tiles outside the grid count as clear
+
+    Returns:
+        bool: True if nothing blocks the segment
+    """
+    tx = math.floor(x0)
+    ty = math.floor(y0)
+    end_x = math.floor(x1)
+    end_y = math.floor(y1)
+    steps = abs(end_x - tx) + abs(end_y - ty)
+    if steps <= 1:
+        return True
+
+    stride = width + 2
+    dx = x1 - x0
+    dy = y1 - y0
+
+    if dx > 0:
+        step_x = 1
+        delta_x = 1.0 / dx
+        max_x = (tx + 1 - x0) * delta_x
+    elif dx < 0:
+        step_x = -1
+        delta_x = -1.0 / dx
+        max_x = (x0 - tx) * delta_x
+    else:
+        step_x = 0
+        delta_x = max_x = INFINITY
+
+    if dy > 0:
+        step_y = 1
+        delta_y = 1.0 / dy
+        max_y = (ty + 1 - y0) * delta_y
+    elif dy < 0:
+        step_y = -1
+        delta_y = -1.0 / dy
+        max_y = (y0 - ty) * delta_y
+    else:
+        step_y = 0
+        delta_y = max_y = INFINITY
+
+    while steps > 1:
+        if max_x < max_y:
+            tx += step_x
+            max_x += delta_x
+            steps -= 1
+        elif max_y < max_x:
+            ty += step_y
+            max_y += delta_y
+            steps -= 1
+        else:
+            # Through a corner: both side tiles are touched
+            if not _is_clear(clear, stride, width, height, tx + step_x, ty, outside_clear):
+                return False
+            if not _is_clear(clear, stride, width, height, tx, ty + step_y, outside_clear):
+                return False
+            tx += step_x
+            ty += step_y
+            max_x += delta_x
+            max_y += delta_y
+            steps -= 2
+            if steps <= 0:
+                break
+
+        if not _is_clear(clear, stride, width, height, tx, ty, outside_clear):
+            return False
+
+    return True
+
+
+def _is_clear(clear, stride, width, height, tx, ty, outside_clear):
+    if 0 <= tx < width and 0 <= ty < height:
+        return bool(clear[(ty + 1) * stride + tx + 1])
+    return outside_clear
+
+
+def trace_clear_many(clear, width, height, x0, y0, x1, y1, outside_clear=False):
+    """
+    Batched trace_clear: test many segments at once.
+
+    All rays advance one tile per iteration in lockstep, so the cost is the
+    longest ray's length in NumPy steps instead of the total length in
+    Python steps. Results match trace_clear exactly.
+
+    Args:
+        clear: Padded bitmap (bytes/bytearray/uint8 array), non-zero where clear
+        width (int): Grid width in tiles
+        height (int): Grid height in tiles
+        x0, y0, x1, y1: Sequences of segment end points in tile units
+        outside_clear (bool): Whether tiles outside the grid count as clear
+
+    Returns:
+        np.ndarray: bool per segment, True if nothing blocks it
+    """
+    x0 = np.asarray(x0, dtype=np.float64)
+    y0 = np.asarray(y0, dtype=np.float64)
+    x1 = np.asarray(x1, dtype=np.float64)
+    y1 = np.asarray(y1, dtype=np.float64)
+    cells = np.frombuffer(clear, dtype=np.uint8) if not isinstance(clear, np.ndarray) else clear
+    stride = width + 2
+
+    tx = np.floor(x0).astype(np.int64)
+    ty = np.floor(y0).astype(np.int64)
+    steps = np.abs(np.floor(x1).astype(np.int64) - tx) + np.abs(np.floor(y1).astype(np.int64) - ty)
+    result = np.ones(len(x0), dtype=bool)
+    if not len(x0) or steps.max() <= 1:
+        return result
+
+    dx = x1 - x0
+    dy = y1 - y0
+    step_x = np.sign(dx).astype(np.int64)
+    step_y = np.sign(dy).astype(np.int64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta_x = np.where(dx != 0, 1.0 / np.abs(dx), INFINITY)
+        delta_y = np.where(dy != 0, 1.0 / np.abs(dy), INFINITY)
+        max_x = np.where(dx > 0, (tx + 1 - x0) * delta_x,
+                         np.where(dx < 0, (x0 - tx) * delta_x, INFINITY))
+        max_y = np.where(dy > 0, (ty + 1 - y0) * delta_y,
+                         np.where(dy < 0, (y0 - ty) * delta_y, INFINITY))
+
+    def lookup(xs, ys):
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        index = (np.clip(ys, -1, height) + 1) * stride + np.clip(xs, -1, width) + 1
+        return np.where(inside, cells[index] != 0, outside_clear)
+
+    active = np.nonzero(steps > 1)[0]
+    while len(active):
+        ax = max_x[active]
+        ay = max_y[active]
+        go_x = ax < ay
+        go_y = ay < ax
+        corner = ~(go_x | go_y)
+
+        if corner.any():
+            rays = active[corner]
+            side_ok = (lookup(tx[rays] + step_x[rays], ty[rays]) &
+                       lookup(tx[rays], ty[rays] + step_y[rays]))
+            result[rays[~side_ok]] = False
+
+        move_x = active[go_x | corner]
+        move_y = active[go_y | corner]
+        tx[move_x] += step_x[move_x]
+        max_x[move_x] += delta_x[move_x]
+        ty[move_y] += step_y[move_y]
+        max_y[move_y] += delta_y[move_y]
+        steps[active] -= np.where(corner, 2, 1)
+
+        # Rays that reached the end tile are done; the rest test the new tile
+        arrived = steps[active] <= 0
+        live = active[~arrived & result[active]]
+        blocked = ~lookup(tx[live], ty[live])
+        result[live[blocked]] = False
+        active = live[~blocked & (steps[live] > 1)]
+
+    return result
+
+
+class VisibilityMap:
+    """
+    Packed "blocks sight" bitmap for a TileStore.
+
+    The bitmap is patched one byte at a time from tile change events and
+    rebuilt from the tile layer when the store changes in bulk (which bumps
+    its version without per-tile events). Tiles outside the grid never block
+    sight.
+    """
+
+    def __init__(self, store, blocking_tiles=SIGHT_BLOCKING_TILES):
+        """
+        Initialize the visibility map.
+
+        Args:
+            store: TileStore to track
+            blocking_tiles: Tile types that block line-of-sight
+        """
+        self.store = store
+        self.width = store.width
+        self.height = store.height
+        self.stride = store.width + 2
+        self.blocking_tiles = tuple(blocking_tiles)
+
+        # 1 where sight passes through, padded like passable_bitmap
+        self.clear = bytearray()
+        self._cells = None
+        self._version = -1
+        self._events = 0
+
+        # Statistics
+        self.rebuilds = 0
+
+        store.add_listener(self._on_tile_changed)
+
+    def _on_tile_changed(self, grid_x, grid_y):
+        """Patch one tile of the bitmap."""
+        if self._version < 0:
+            return
+        blocks = self.store.tile_type[grid_y, grid_x] in self.blocking_tiles
+        self.clear[(grid_y + 1) * self.stride + grid_x + 1] = 0 if blocks else 1
+        self._events += 1
+
+    def sync(self):
+        """Bring the bitmap up to date with the store."""
+        version = self.store.version
+        if version == self._version:
+            return
+        if self._version < 0 or version - self._version != self._events:
+            self.rebuild()
+        else:
+            self._version = version
+            self._events = 0
+
+    def rebuild(self):
+        """Recompute the whole bitmap from the tile type layer."""
+        blocked = np.isin(self.store.tile_type, self.blocking_tiles)
+        padded = np.pad(~blocked, 1, constant_values=True)
+        self.clear = bytearray(padded.astype(np.uint8).tobytes())
+        self._cells = np.frombuffer(self.clear, dtype=np.uint8)
+        self._version = self.store.version
+        self._events = 0
+        self.rebuilds += 1
+
+    def blocks_sight(self, grid_x: int, grid_y: int) -> bool:
+        """Check whether a tile blocks line-of-sight."""
+        self.sync()
+        if not self.store.in_bounds(grid_x, grid_y):
+            return False
+        return not self.clear[(grid_y + 1) * self.stride + grid_x + 1]
+
+    def has_line_of_sight(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        """
+        Check whether sight passes between two points.
+
+        Args:
+            x0, y0 (float): Viewer position in tile units
+            x1, y1 (float): Target position in tile units
+
+        Returns:
+            bool: True if no sight-blocking tile lies between them
+        """
+        self.sync()
+        return trace_clear(self.clear, self.width, self.height, x0, y0, x1, y1, outside_clear=True)
+
+    def has_line_of_sight_many(self, x0, y0, x1, y1) -> np.ndarray:
+        """
+        Batched has_line_of_sight.
+
+        Args:
+            x0, y0, x1, y1: Sequences of end points in tile units
+
+        Returns:
+            np.ndarray: bool per ray
+        """
+        self.sync()
+        return trace_clear_many(self._cells, self.width, self.height, x0, y0, x1, y1, outside_clear=True)
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"VisibilityMap({self.width}x{self.height})"
@@ -22,7 +22,7 @@ def test_ai_basic_gameplay():
     print()
 
     # Create game instance (headless mode)
-    game = Game()
+    game = Game(headless=True)
     game.paused = False
 
     # Give AI some starting funds for testing
@@ -44,23 +44,20 @@ def test_ai_basic_gameplay():
     print(f"Running AI for {total_time:.0f} seconds ({updates} updates)...")
     print()
 
-    for i in range(updates):
-        # Update game systems
-        game.entities.update(dt)
-        game.buildings.update(dt)
-        game.power.update(dt, game.buildings)
-
-        # Update AI
+    def step(game, dt):
+        # Update AI after the full game update
         ai.update(dt)
 
         # Print status every 10 seconds
-        if (i + 1) % 10 == 0:
-            elapsed = (i + 1) * dt
+        if game.tick_count % 10 == 0:
             state = ai._evaluate_game_state()
-            print(f"[{elapsed:.0f}s] Money: ${state['money']:.2f}, "
+            print(f"[{game.simulation_time:.0f}s] Money: ${state['money']:.2f}, "
                   f"Buildings: {state['building_count']}, "
                   f"Power: {state['power_generation']:.1f}W gen / {state['power_consumption']:.1f}W cons")
 
+    run_stats = game.run_ticks(updates, dt=dt, on_tick=step)
+    assert run_stats['ticks'] == updates
+
     print()
     print("Final AI Statistics:")
     print("-" * 80)
@@ -103,17 +100,13 @@ def test_ai_difficulty_levels():
         print(f"Testing {difficulty.upper()} difficulty...")
 
         # Create game and AI
-        game = Game()
+        game = Game(headless=True)
         game.paused = False
         game.resources.money = 10000.0  # Give starting funds
         ai = GameAI(game, difficulty=difficulty)
 
         # Run for 30 seconds
-        for _ in range(30):
-            game.entities.update(1.0)
-            game.buildings.update(1.0)
-            game.power.update(1.0, game.buildings)
-            ai.update(1.0)
+        game.run_ticks(30, dt=1.0, on_tick=lambda game, dt: ai.update(dt))
 
         stats = ai.get_stats()
         results[difficulty] = stats
@@ -147,7 +140,7 @@ def test_ai_building_priorities():
     print("=" * 80)
     print()
 
-    game = Game()
+    game = Game(headless=True)
     game.paused = False
     ai = GameAI(game, difficulty="medium")
 
@@ -159,11 +152,7 @@ def test_ai_building_priorities():
     print()
 
     # Run AI
-    for i in range(60):
-        game.entities.update(1.0)
-        game.buildings.update(1.0)
-        game.power.update(1.0, game.buildings)
-        ai.update(1.0)
+    game.run_ticks(60, dt=1.0, on_tick=lambda game, dt: ai.update(dt))
 
     # Analyze what was built
     building_stats = game.buildings.get_building_counts()
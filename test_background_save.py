@@ -0,0 +1,192 @@
+"""
+Tests for background saving.
+
+Tests that background saves work on a snapshot of the state, that only one
+runs at a time, that files are replaced atomically, and that a game reports
+finished saves through its notification system.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import numpy as np
+from src.systems.save_manager import SaveManager
+from src.ui.notification_system import NotificationType
+from src.core.game import Game
+
+
+class GatedSaveManager(SaveManager):
+    """SaveManager whose writes wait until the test opens a gate."""
+
+    def __init__(self, save_directory):
+        super().__init__(save_directory=save_directory)
+        self.gate = threading.Event()
+
+    def _write_save(self, game_state, save_name, delta):
+        self.gate.wait(5.0)
+        return super()._write_save(game_state, save_name, delta)
+
+
+def _state(day=1):
+    return {
+        "time": {"day": day, "hour": 0, "minute": 0},
+        "resources": {"money": 1000},
+        "grid": {"tiles": np.zeros((64, 64), dtype=np.uint8)},
+    }
+
+
+def test_snapshot_and_single_worker():
+    """Test that the save sees the state as it was when it started."""
+    print("Testing snapshot isolation...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = GatedSaveManager(directory)
+        state = _state()
+
+        assert manager.save_game_async(state, "world")
+        assert manager.is_saving()
+        assert manager.poll_background_save() is None
+
+        # The game keeps changing its state while the worker waits
+        state["time"]["day"] = 99
+        state["grid"]["tiles"][:] = 7
+        assert not manager.save_game_async(state, "world")
+
+        manager.gate.set()
+        result = manager.wait_for_background_save(5.0)
+        assert result["success"] and result["save_name"] == "world"
+        assert not manager.is_saving()
+        assert manager.poll_background_save() is None
+
+        loaded = manager.load_game("world")
+        assert loaded["time"]["day"] == 1
+        assert not loaded["grid"]["tiles"].any()
+
+    print("  ✓ Snapshot taken on the calling thread")
+    print()
+
+
+def test_atomic_write():
+    """Test that a failed save leaves the previous file intact."""
+    print("Testing atomic writes...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_directory=directory)
+        assert manager.save_game(_state(day=3), "world")
+
+        broken = _state(day=4)
+        broken["resources"]["unsaveable"] = object()
+        manager.save_game_async(broken, "world")
+        result = manager.wait_for_background_save(5.0)
+        assert not result["success"]
+        assert "TypeError" in result["error"]
+
+        assert manager.load_game("world")["time"]["day"] == 3
+        assert sorted(os.listdir(directory)) == ["world.sav"]
+
+    print("  ✓ Old save kept, no temporary files left")
+    print()
+
+
+def test_auto_save_in_background():
+    """Test background auto-saves and the due check."""
+    print("Testing background auto-save...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_directory=directory)
+        assert not manager.is_auto_save_due(4)
+        assert manager.is_auto_save_due(5)
+
+        assert manager.auto_save(_state(day=5), 5, background=True)
+        assert manager.wait_for_background_save(5.0)["success"]
+        assert manager.last_auto_save_day == 5
+        assert not manager.is_auto_save_due(6)
+
+        # The next auto-save is a delta of the first
+        state = _state(day=10)
+        state["grid"]["tiles"] = np.zeros((4096, 64), dtype=np.uint8)
+        manager.save_game(state, manager.AUTO_SAVE_NAME)
+        state["time"]["day"] = 15
+        assert manager.auto_save(state, 15, background=True)
+        assert manager.wait_for_background_save(5.0)["success"]
+        assert manager.last_save_stats["delta"]
+        assert manager.load_game(manager.AUTO_SAVE_NAME)["time"]["day"] == 15
+
+    print("  ✓ Auto-saves written by the worker")
+    print()
+
+
+def test_game_reports_saves():
+    """Test that a game turns finished saves into notifications."""
+    print("Testing save notifications...")
+
+    game = Game(headless=True)
+    with tempfile.TemporaryDirectory() as directory:
+        game.save_manager = SaveManager(save_directory=directory)
+
+        game.save_manager.save_game_async(_state(), "autosave")
+        game.save_manager._save_thread.join(5.0)
+        game.tick()
+
+        notifications = game.notifications.get_active_notifications()
+        assert len(notifications) == 1
+        assert notifications[0].notification_type == NotificationType.SUCCESS
+
+        game.save_manager.save_game_async({"bad": object()}, "autosave")
+        game.save_manager._save_thread.join(5.0)
+        game.tick()
+        types = [n.notification_type for n in game.notifications.get_active_notifications()]
+        assert NotificationType.ERROR in types
+
+    print("  ✓ Success and failure notifications posted")
+    print()
+
+
+def test_game_reports_serialization_errors():
+    """Test that a state that cannot be serialized is reported, not raised."""
+    print("Testing serialization failure notifications...")
+
+    def failing_serialize(game):
+        raise ValueError("cannot serialize")
+
+    game = Game(headless=True)
+    serialize = SaveManager.serialize_game_state
+    with tempfile.TemporaryDirectory() as directory:
+        game.save_manager = SaveManager(save_directory=directory)
+        SaveManager.serialize_game_state = staticmethod(failing_serialize)
+        try:
+            # Roll over into day 5, when the first auto-save is due
+            game.day, game.hour, game.minute = 4, 23, 59
+            game.time_elapsed = 0.999
+            game.tick()
+            assert game.day == 5
+            game._quick_save()
+        finally:
+            SaveManager.serialize_game_state = serialize
+
+    assert game.notifications.notifications_by_type[NotificationType.ERROR] == 2
+
+    print("  ✓ Auto-save and quick save failures posted as errors")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("BACKGROUND SAVE TESTS")
+    print("=" * 60)
+    print()
+
+    test_snapshot_and_single_worker()
+    test_atomic_write()
+    test_auto_save_in_background()
+    test_game_reports_saves()
+    test_game_reports_serialization_errors()
+
+    print("=" * 60)
+    print("ALL BACKGROUND SAVE TESTS PASSED!")
+    print("=" * 60)
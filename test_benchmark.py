@@ -0,0 +1,80 @@
+"""
+Tests for the benchmark suite.
+
+Runs one small world through every measurement and checks the result
+layout, that the config is restored, and run comparison.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import config
+import benchmark
+
+
+def test_benchmark_scale():
+    """Test measuring a small world."""
+    print("Testing one benchmark scale...")
+
+    world_width = config.WORLD_WIDTH
+    scale = {'width': 60, 'height': 45, 'npcs': 40, 'robots': 3, 'traffic': 5, 'props': 20}
+    result = benchmark.benchmark_scale('tiny', scale, ticks=5, frames=2, warmup=1)
+
+    # The config module is back to normal afterwards
+    assert config.WORLD_WIDTH == world_width
+    assert config.NPC_LIMIT is None
+
+    assert result['world']['npcs'] == 40
+    assert result['world']['robots'] == 4  # plus the manual robot
+    assert result['generation_seconds'] > 0
+    assert result['update']['ticks'] == 5 and result['update']['ticks_per_second'] > 0
+    assert result['update']['systems']['frame.update']['avg_ms'] > 0
+    assert result['render']['frames'] == 2 and result['render']['avg_ms'] > 0
+    assert 'error' not in result['save_load']
+    assert result['save_load']['load_seconds'] > 0
+
+    print("  ✓ Every measurement recorded")
+    print()
+
+
+def test_compare_runs():
+    """Test comparing two runs."""
+    print("Testing run comparison...")
+
+    result = {
+        'generation_seconds': 2.0,
+        'update': {'ticks_per_second': 100.0, 'p95_ms': 12.0},
+        'render': {'avg_ms': 20.0},
+        'save_load': {'save_seconds': 0.5, 'load_seconds': 0.25},
+    }
+    faster = {
+        'generation_seconds': 1.0,
+        'update': {'ticks_per_second': 200.0, 'p95_ms': 6.0},
+        'render': {'avg_ms': 10.0},
+        'save_load': {'error': 'not supported'},
+    }
+    ratios = benchmark.compare({'commit': 'a', 'results': {'small': result}},
+                               {'commit': 'b', 'results': {'small': faster}})
+    assert ratios['small']['update.ticks_per_second'] == 2.0
+    assert ratios['small']['render.avg_ms'] == 0.5
+    assert 'save_seconds' not in ratios['small']
+
+    print("  ✓ Ratios between runs")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("BENCHMARK SUITE TESTS")
+    print("=" * 60)
+    print()
+
+    test_benchmark_scale()
+    test_compare_runs()
+
+    print("=" * 60)
+    print("ALL BENCHMARK SUITE TESTS PASSED!")
+    print("=" * 60)
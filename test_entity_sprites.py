@@ -0,0 +1,148 @@
+"""
+Tests for sprite-based NPC, police and robot rendering.
+
+Tests that entities draw the cached SpriteGenerator sprite for their
+direction, frame and zoom, that repeated frames reuse the cache, and that
+the shape-drawing fallback still works.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.graphics.sprite_generator import SpriteType, Direction, direction_from_angle, get_sprite_generator
+from src.entities.npc import NPC
+from src.entities.police_officer import PoliceOfficer
+from src.entities.robot import Robot
+from src.rendering.camera import Camera
+
+
+def _camera(zoom=0.5):
+    camera = Camera(400, 300)
+    camera.zoom = zoom  # Below 0.8 so no labels are drawn
+    return camera
+
+
+def _drawn(entity, camera):
+    screen = pygame.Surface((400, 300), pygame.SRCALPHA)
+    entity.render(screen, camera)
+    return screen
+
+
+def test_direction_from_angle():
+    """Test snapping facing angles to sprite directions."""
+    print("Testing direction snapping...")
+
+    assert direction_from_angle(0) == Direction.EAST
+    assert direction_from_angle(90) == Direction.SOUTH
+    assert direction_from_angle(-90) == Direction.NORTH
+    assert direction_from_angle(200) == Direction.WEST
+    assert direction_from_angle(337.6) == Direction.EAST
+
+    print("  ✓ Angles snap to the nearest of 8 directions")
+    print()
+
+
+def test_npc_draws_cached_sprite():
+    """Test that an NPC is one blit of its cached sprite."""
+    print("Testing NPC sprite rendering...")
+
+    pygame.init()
+    camera = _camera()
+    npc = NPC(100.0, 80.0, 0, 0)
+    npc.moving = True
+    npc.animation_frame = 1
+    npc.facing_angle = 180.0
+
+    screen = _drawn(npc, camera)
+    sprite = get_sprite_generator().get_scaled_sprite(
+        SpriteType.NPC, Direction.WEST, 2, 0, camera.zoom, **npc.get_sprite_options())
+    expected = pygame.Surface((400, 300), pygame.SRCALPHA)
+    screen_pos = camera.world_to_screen(npc.world_x, npc.world_y)
+    expected.blit(sprite, sprite.get_rect(center=screen_pos))
+    assert pygame.image.tobytes(screen, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+
+    generator = get_sprite_generator()
+    misses = generator.misses
+    _drawn(npc, camera)
+    assert generator.misses == misses
+
+    print("  ✓ Same pixels as the cached sprite, no regeneration")
+    print()
+
+
+def test_police_uniform():
+    """Test that officers get their own uniform sprite."""
+    print("Testing police sprites...")
+
+    camera = _camera()
+    officer = PoliceOfficer(100.0, 80.0)
+    civilian = NPC(100.0, 80.0, 0, 0)
+    civilian.clothing_color = officer.clothing_color
+    civilian.facing_angle = officer.facing_angle
+
+    officer_pixels = pygame.image.tobytes(_drawn(officer, camera), 'RGBA')
+    civilian_pixels = pygame.image.tobytes(_drawn(civilian, camera), 'RGBA')
+    assert officer_pixels != civilian_pixels
+
+    print("  ✓ Badge and hat drawn into the officer sprite")
+    print()
+
+
+def test_robot_levels():
+    """Test that robot sprites grow with upgrade level."""
+    print("Testing robot sprites...")
+
+    camera = _camera(1.0)
+    sizes = []
+    for level in (1, 3, 5):
+        robot = Robot(100, 80)
+        robot.upgrade_level = level
+        robot.max_capacity = 0
+        rect = _drawn(robot, camera).get_bounding_rect()
+        sizes.append(rect.width)
+    assert sizes[0] < sizes[1] < sizes[2]
+
+    print(f"  ✓ Sprite widths by level: {sizes}")
+    print()
+
+
+def test_shape_fallback():
+    """Test that the shape-drawing path still renders."""
+    print("Testing shape fallback...")
+
+    camera = _camera()
+    try:
+        NPC.use_sprites = False
+        Robot.use_sprites = False
+        assert _drawn(NPC(100.0, 80.0, 0, 0), camera).get_bounding_rect().width > 0
+        assert _drawn(PoliceOfficer(100.0, 80.0), camera).get_bounding_rect().width > 0
+        assert _drawn(Robot(100, 80), camera).get_bounding_rect().width > 0
+    finally:
+        NPC.use_sprites = True
+        Robot.use_sprites = True
+
+    print("  ✓ Entities still draw with use_sprites off")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("ENTITY SPRITE TESTS")
+    print("=" * 60)
+    print()
+
+    test_direction_from_angle()
+    test_npc_draws_cached_sprite()
+    test_police_uniform()
+    test_robot_levels()
+    test_shape_fallback()
+
+    print("=" * 60)
+    print("ALL ENTITY SPRITE TESTS PASSED!")
+    print("=" * 60)
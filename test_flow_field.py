@@ -0,0 +1,156 @@
+"""
+Tests for the drop-off flow field.
+
+Tests distances against the pathfinder, incremental repair against full
+rebuilds, and robots returning to drop-off buildings.
+"""
+
+import sys
+import os
+import random
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.world.grid import Grid
+from src.world.tile import TileType
+from src.systems.flow_field import FlowField, INFINITY
+from src.systems.pathfinding import Pathfinder, DIAGONAL_COST
+from src.systems.building_manager import BuildingManager
+from src.systems.entity_manager import EntityManager
+from src.systems.resource_manager import ResourceManager
+from src.entities.buildings import Warehouse
+from src.core.constants import RobotState
+
+
+def _path_cost(path):
+    cost = 0.0
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        cost += DIAGONAL_COST if x0 != x1 and y0 != y1 else 1.0
+    return cost
+
+
+def test_distances_match_pathfinder():
+    """Test that following the field gives shortest paths to the ring."""
+    print("Testing field distances...")
+
+    rng = random.Random(3)
+    grid = Grid(30, 20)
+    for _ in range(120):
+        grid.set_tile_type(rng.randrange(30), rng.randrange(20), TileType.BUILDING)
+    for x in range(12, 15):
+        for y in range(8, 11):
+            grid.get_tile(x, y).occupied = True
+
+    field = FlowField(grid)
+    field.set_target('factory', 12, 8, 3, 3)
+    ring = [(x, y) for x in range(11, 16) for y in range(7, 12)
+            if not (12 <= x < 15 and 8 <= y < 11) and grid.is_passable(x, y)]
+
+    pathfinder = Pathfinder(grid, max_nodes=10 ** 6)
+    for _ in range(60):
+        start = (rng.randrange(30), rng.randrange(20))
+        if not grid.is_passable(*start):
+            assert field.distance(*start) == INFINITY
+            continue
+
+        costs = [_path_cost(p) for p in (pathfinder.find_path(start, goal) for goal in ring) if p]
+        expected = min(costs) if costs else INFINITY
+        distance = field.distance(*start)
+        assert distance == expected or abs(distance - expected) < 1e-9
+
+        # Walking the field ends on a drop-off tile
+        tile, steps = start, 0
+        while field.next_step(*tile) is not None:
+            step = field.next_step(*tile)
+            assert step in pathfinder.get_neighbors(tile)
+            tile = step
+            steps += 1
+            assert steps < 600
+        assert field.is_drop_off(*tile) or expected == INFINITY
+
+    print("  ✓ Field distances are optimal")
+    print()
+
+
+def test_incremental_repair_matches_rebuild():
+    """Test that repairing tile changes gives the same field as rebuilding."""
+    print("Testing incremental repair...")
+
+    rng = random.Random(11)
+    grid = Grid(40, 30)
+    field = FlowField(grid)
+    field.set_target('factory', 18, 13, 4, 4)
+    field.set_target('silo', 2, 2, 3, 3)
+    field.sync()
+
+    for round_index in range(40):
+        for _ in range(rng.randint(1, 6)):
+            tile = grid.get_tile(rng.randrange(40), rng.randrange(30))
+            tile.occupied = not tile.occupied
+        field.sync()
+
+        reference = FlowField(grid)
+        reference.targets = dict(field.targets)
+        reference._goals = dict(field._goals)
+        reference.rebuild()
+
+        for a, b in zip(field._dist, reference._dist):
+            assert a == b or abs(a - b) < 1e-9
+
+    assert field.rebuilds == 1
+    assert field.repairs == 40
+
+    print("  ✓ Repaired field matches a full rebuild")
+    print()
+
+
+def test_robots_return_to_nearest_drop_off():
+    """Test that returning robots unload at a warehouse via the field."""
+    print("Testing robots returning to drop-offs...")
+
+    grid = Grid(40, 40)
+    buildings = BuildingManager(grid)
+    entities = EntityManager(grid=grid, resource_manager=ResourceManager())
+    buildings.add_listener(entities.on_building_changed)
+
+    warehouse = Warehouse(30, 30)
+    assert buildings.place_building(warehouse)
+    assert entities.flow_field.has_targets()
+
+    robots = []
+    for i in range(5):
+        robot = entities.create_robot((20 + i) * grid.tile_size + 2, 20 * grid.tile_size + 2)
+        robot.add_material('plastic', 10)
+        robot.state = RobotState.RETURNING_TO_FACTORY
+        robots.append(robot)
+
+    for _ in range(600):
+        entities.update(0.05)
+        if all(robot.current_load == 0 for robot in robots):
+            break
+
+    assert all(robot.current_load == 0 for robot in robots)
+    assert entities.path_service.searches == 0
+    assert entities.flow_field.rebuilds == 1
+
+    buildings.remove_building(warehouse.id)
+    assert not entities.flow_field.has_targets()
+
+    print("  ✓ Robots unloaded using the shared field")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("FLOW FIELD TESTS")
+    print("=" * 60)
+    print()
+
+    test_distances_match_pathfinder()
+    test_incremental_repair_matches_rebuild()
+    test_robots_return_to_nearest_drop_off()
+
+    print("=" * 60)
+    print("ALL FLOW FIELD TESTS PASSED!")
+    print("=" * 60)
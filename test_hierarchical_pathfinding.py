@@ -0,0 +1,142 @@
+"""
+Tests for hierarchical (HPA*) pathfinding.
+
+Tests path validity against plain A*, incremental cluster repair, and
+on-demand refinement of abstract legs.
+"""
+
+import sys
+import os
+import random
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.world.grid import Grid
+from src.world.tile import TileType
+from src.systems.pathfinding import Pathfinder, DIAGONAL_COST
+from src.systems.hierarchical_pathfinding import HierarchicalPathfinder
+from src.systems.path_service import PathService
+
+
+def _path_cost(path):
+    cost = 0.0
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        cost += DIAGONAL_COST if x0 != x1 and y0 != y1 else 1.0
+    return cost
+
+
+def _random_grid(rng, width, height):
+    grid = Grid(width, height)
+    for _ in range(width * height // 4):
+        grid.set_tile_type(rng.randrange(width), rng.randrange(height), TileType.BUILDING)
+    return grid
+
+
+def test_paths_match_astar_reachability():
+    """Test that HPA* finds valid paths exactly when A* does."""
+    print("Testing HPA* against A*...")
+
+    rng = random.Random(5)
+    for _ in range(20):
+        grid = _random_grid(rng, 48, 36)
+        astar = Pathfinder(grid, max_nodes=10 ** 6)
+        hpa = HierarchicalPathfinder(grid, cluster_size=8, max_nodes=10 ** 6)
+
+        for _ in range(15):
+            start = (rng.randrange(48), rng.randrange(36))
+            goal = (rng.randrange(48), rng.randrange(36))
+            expected = astar.find_path(start, goal)
+            path = hpa.find_path(start, goal)
+
+            assert (path is None) == (expected is None)
+            if path is None:
+                continue
+            assert path[0] == start and path[-1] == goal
+            for a, b in zip(path, path[1:]):
+                assert b in astar.get_neighbors(a)
+            assert _path_cost(path) < _path_cost(expected) * 1.6 + 1e-9
+
+    print("  ✓ Valid, near-optimal paths")
+    print()
+
+
+def test_incremental_repair_matches_rebuild():
+    """Test that repairing dirty clusters gives the same graph as rebuilding."""
+    print("Testing cluster repair...")
+
+    rng = random.Random(9)
+    grid = _random_grid(rng, 40, 30)
+    hpa = HierarchicalPathfinder(grid, cluster_size=10)
+    hpa.sync()
+
+    for _ in range(30):
+        for _ in range(rng.randint(1, 5)):
+            tile = grid.get_tile(rng.randrange(40), rng.randrange(30))
+            tile.occupied = not tile.occupied
+        hpa.sync()
+
+    reference = HierarchicalPathfinder(grid, cluster_size=10)
+    reference.sync()
+    assert hpa._intra == reference._intra
+    assert ({k: v for k, v in hpa._inter.items() if v} ==
+            {k: v for k, v in reference._inter.items() if v})
+    assert hpa.rebuilds == 1
+    assert hpa.clusters_repaired > 0
+
+    print("  ✓ Repaired graph matches a full rebuild")
+    print()
+
+
+def test_refine_first_leg_on_demand():
+    """Test that partial refinement can be continued to the goal."""
+    print("Testing on-demand refinement...")
+
+    grid = Grid(80, 60)
+    hpa = HierarchicalPathfinder(grid, cluster_size=10, refine_legs=1)
+    start, goal = (2, 2), (77, 57)
+
+    position, steps = start, 0
+    while position != goal:
+        path = hpa.find_path(position, goal)
+        assert path[0] == position
+        if path[-1] != goal:
+            assert hpa.last_partial
+        position = path[-1]
+        steps += 1
+        assert steps < 50
+    assert steps > 1
+
+    print(f"  ✓ Reached goal in {steps} refinements")
+    print()
+
+
+def test_path_service_uses_hierarchical_planner():
+    """Test that PathService accepts a hierarchical planner."""
+    print("Testing PathService with HPA*...")
+
+    grid = Grid(60, 60)
+    service = PathService(grid, pathfinder=HierarchicalPathfinder(grid))
+    path = service.get_path((1, 1), (58, 58))
+    assert path[0] == (1, 1) and path[-1] == (58, 58)
+    assert service.get_path((1, 1), (58, 58)) == path
+    assert service.searches == 1
+
+    print("  ✓ Cached HPA* paths")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("HIERARCHICAL PATHFINDING TESTS")
+    print("=" * 60)
+    print()
+
+    test_paths_match_astar_reachability()
+    test_incremental_repair_matches_rebuild()
+    test_refine_first_leg_on_demand()
+    test_path_service_uses_hierarchical_planner()
+
+    print("=" * 60)
+    print("ALL HIERARCHICAL PATHFINDING TESTS PASSED!")
+    print("=" * 60)
@@ -0,0 +1,144 @@
+"""
+Tests for the shared path service.
+
+Tests cache hits, suffix reuse, invalidation when buildings change tile
+occupancy, and the per-frame request queue.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.world.grid import Grid
+from src.systems.path_service import PathService
+from src.systems.entity_manager import EntityManager
+from src.core.constants import RobotState
+
+
+def test_cache_hits_and_suffix_reuse():
+    """Test that repeated and overlapping requests reuse cached paths."""
+    print("Testing cache hits...")
+
+    grid = Grid(30, 30)
+    service = PathService(grid)
+
+    path = service.get_path((1, 1), (20, 1))
+    assert path[0] == (1, 1) and path[-1] == (20, 1)
+    assert service.searches == 1
+
+    assert service.get_path((1, 1), (20, 1)) == path
+    assert service.searches == 1
+
+    # A robot part-way along the same route reuses the tail
+    suffix = service.get_path(path[5], (20, 1))
+    assert suffix == path[5:]
+    assert service.searches == 1
+    assert service.get_stats()['hits'] == 2
+
+    print("  ✓ Exact and suffix hits skip the search")
+    print()
+
+
+def test_invalidation_on_occupancy():
+    """Test that blocking or opening a tile drops affected paths."""
+    print("Testing invalidation...")
+
+    grid = Grid(30, 30)
+    service = PathService(grid)
+
+    path = service.get_path((1, 1), (20, 1))
+    service.get_path((1, 20), (20, 20))
+    assert len(service.cache) == 2
+
+    # A building placed on the first route evicts only that path
+    grid.get_tile(*path[10]).occupied = True
+    assert ((1, 1), (20, 1)) not in service.cache
+    assert ((1, 20), (20, 20)) in service.cache
+
+    new_path = service.get_path((1, 1), (20, 1))
+    assert path[10] not in new_path
+
+    # Removing it may open shorter routes, so everything is dropped
+    grid.get_tile(*path[10]).occupied = False
+    assert len(service.cache) == 0
+
+    print("  ✓ Cache follows tile occupancy")
+    print()
+
+
+def test_request_queue_budget():
+    """Test that queued requests are answered over several frames."""
+    print("Testing request queue...")
+
+    grid = Grid(60, 60)
+    service = PathService(grid, frame_budget=0.0)
+
+    results = {}
+    requesters = [object() for _ in range(3)]
+    for i, requester in enumerate(requesters):
+        answered = service.request_path(requester, (0, i), (50, 50),
+                                        lambda path, i=i: results.__setitem__(i, path))
+        assert not answered
+
+    # Re-requesting replaces the pending entry instead of adding one
+    service.request_path(requesters[0], (0, 0), (50, 50),
+                         lambda path: results.__setitem__(0, path))
+    assert len(service.pending) == 3
+
+    # Zero budget still answers one request per frame
+    assert service.process() == 1
+    assert len(results) == 1
+    service.cancel(requesters[2])
+    service.process()
+    assert sorted(results) == [0, 1]
+    assert service.process() == 0
+
+    # Cached answers come back immediately
+    assert service.request_path(object(), (0, 0), (50, 50), lambda path: None)
+
+    print("  ✓ Queue drains within the frame budget")
+    print()
+
+
+def test_robots_use_shared_service():
+    """Test that robots heading for the same object share cached paths."""
+    print("Testing robots with EntityManager...")
+
+    grid = Grid(40, 40)
+    manager = EntityManager(grid=grid)
+    collectible = manager.create_collectible(35 * grid.tile_size, 35 * grid.tile_size, 'plastic', 10)
+
+    robots = []
+    for _ in range(4):
+        robot = manager.create_robot(2 * grid.tile_size + 16, 2 * grid.tile_size + 16)
+        robot.target_object = collectible
+        robot.state = RobotState.MOVING_TO_OBJECT
+        robots.append(robot)
+
+    manager.update(0.016)
+    assert manager.path_service.searches == 1
+    goal = grid.world_to_grid(*collectible.get_center())
+    for robot in robots:
+        assert not robot.path_pending
+        assert robot.path and robot.path[-1] == goal
+
+    print("  ✓ One search served every robot")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("PATH SERVICE TESTS")
+    print("=" * 60)
+    print()
+
+    test_cache_hits_and_suffix_reuse()
+    test_invalidation_on_occupancy()
+    test_request_queue_budget()
+    test_robots_use_shared_service()
+
+    print("=" * 60)
+    print("ALL PATH SERVICE TESTS PASSED!")
+    print("=" * 60)
@@ -0,0 +1,151 @@
+"""
+Tests for the A* pathfinder.
+
+Tests path optimality, corner cutting, node budgets and partial paths.
+"""
+
+import sys
+import os
+import heapq
+import random
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.world.grid import Grid
+from src.world.tile import TileType, TerrainType
+from src.systems.pathfinding import Pathfinder, DIAGONAL_COST
+
+
+def _path_cost(path):
+    cost = 0.0
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        cost += DIAGONAL_COST if x0 != x1 and y0 != y1 else 1.0
+    return cost
+
+
+def _dijkstra_cost(pathfinder, start, goal):
+    """Reference shortest path cost using the pathfinder's neighbour rules."""
+    dist = {start: 0.0}
+    queue = [(0.0, start)]
+    while queue:
+        d, node = heapq.heappop(queue)
+        if node == goal:
+            return d
+        if d > dist[node]:
+            continue
+        for neighbor in pathfinder.get_neighbors(node):
+            step = DIAGONAL_COST if neighbor[0] != node[0] and neighbor[1] != node[1] else 1.0
+            if d + step < dist.get(neighbor, float('inf')):
+                dist[neighbor] = d + step
+                heapq.heappush(queue, (d + step, neighbor))
+    return None
+
+
+def test_paths_are_optimal():
+    """Test that A* finds shortest paths on random obstacle maps."""
+    print("Testing path optimality...")
+
+    rng = random.Random(7)
+    for _ in range(40):
+        grid = Grid(24, 16)
+        for _ in range(120):
+            grid.set_tile_type(rng.randrange(24), rng.randrange(16), TileType.BUILDING)
+
+        start = (rng.randrange(24), rng.randrange(16))
+        goal = (rng.randrange(24), rng.randrange(16))
+        pathfinder = Pathfinder(grid, max_nodes=10 ** 6)
+        path = pathfinder.find_path(start, goal)
+
+        if not grid.is_passable(*start) or not grid.is_passable(*goal):
+            assert path is None
+            continue
+
+        expected = _dijkstra_cost(pathfinder, start, goal)
+        if expected is None:
+            assert path is None
+        else:
+            assert path[0] == start and path[-1] == goal
+            for a, b in zip(path, path[1:]):
+                assert b in pathfinder.get_neighbors(a)
+            assert abs(_path_cost(path) - expected) < 1e-9
+
+    print("  ✓ All paths optimal")
+    print()
+
+
+def test_no_corner_cutting():
+    """Test that diagonal moves never squeeze between blocked tiles."""
+    print("Testing corner cutting...")
+
+    grid = Grid(5, 5)
+    grid.set_tile_type(1, 0, TileType.BUILDING)
+    grid.set_tile_type(0, 1, TileType.BUILDING)
+
+    # (0, 0) is boxed in diagonally
+    path = Pathfinder(grid).find_path((0, 0), (1, 1))
+    assert path is None
+
+    print("  ✓ Diagonal corners blocked")
+    print()
+
+
+def test_occupied_and_water_block():
+    """Test that occupied tiles and water are avoided."""
+    print("Testing occupied tiles and water...")
+
+    grid = Grid(10, 10)
+    for y in range(10):
+        grid.set_terrain_type(5, y, TerrainType.WATER)
+
+    pathfinder = Pathfinder(grid)
+    assert pathfinder.find_path((2, 5), (8, 5)) is None
+
+    grid.set_terrain_type(5, 5, TerrainType.BRIDGE)
+    path = pathfinder.find_path((2, 5), (8, 5))
+    assert path is not None and (5, 5) in path
+
+    grid.get_tile(5, 5).occupied = True
+    assert pathfinder.find_path((2, 5), (8, 5)) is None
+
+    print("  ✓ Path respects walkability changes between searches")
+    print()
+
+
+def test_budget_returns_partial_path():
+    """Test that running out of budget returns a path towards the goal."""
+    print("Testing node budget...")
+
+    grid = Grid(120, 120)
+    start, goal = (2, 2), (117, 117)
+
+    pathfinder = Pathfinder(grid, max_nodes=50)
+    path = pathfinder.find_path(start, goal)
+    assert pathfinder.last_partial
+    assert path[0] == start and path[-1] != goal
+    assert pathfinder.heuristic(path[-1], goal) < pathfinder.heuristic(start, goal)
+
+    strict = Pathfinder(grid, max_nodes=50, allow_partial=False)
+    assert strict.find_path(start, goal) is None
+
+    full = pathfinder.find_path(start, goal, max_nodes=10 ** 6)
+    assert full[-1] == goal and not pathfinder.last_partial
+
+    print("  ✓ Partial path heads towards the goal")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("PATHFINDING TESTS")
+    print("=" * 60)
+    print()
+
+    test_paths_are_optimal()
+    test_no_corner_cutting()
+    test_occupied_and_water_block()
+    test_budget_returns_partial_path()
+
+    print("=" * 60)
+    print("ALL PATHFINDING TESTS PASSED!")
+    print("=" * 60)
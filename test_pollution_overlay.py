@@ -0,0 +1,124 @@
+"""
+Tests for the cached pollution overlay texture.
+
+Tests that the scaled texture matches per-tile drawing and that the
+texture is only rebuilt after pollution changes.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from src.systems.pollution_manager import PollutionManager
+
+
+class FixedCamera:
+    """Camera stand-in with a fixed position."""
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+
+def _make_manager():
+    pm = PollutionManager(40, 30)
+    pm.add_source(10, 10, 20.0)
+    pm.add_source(25, 12, 60.0)
+    pm.add_pollution(30, 20, 95.0)
+    for _ in range(6):
+        pm.update(0.5)
+    pm.overlay_visible = True
+    return pm
+
+
+def _render_reference(pm, camera, size, tile_size):
+    """Per-tile drawing as the overlay used to do it."""
+    surface = pygame.Surface(size)
+    surface.fill((40, 80, 40))
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    for grid_y in range(pm.grid_height):
+        for grid_x in range(pm.grid_width):
+            pollution = pm.get_pollution(grid_x, grid_y)
+            if pollution < 1.0:
+                continue
+            # Same quantization as the lookup table
+            level = int(min(255, pollution * 255.0 / pm.max_pollution)) * pm.max_pollution / 255.0
+            pygame.draw.rect(overlay, pm._get_pollution_color(level),
+                             (grid_x * tile_size - camera.x, grid_y * tile_size - camera.y,
+                              tile_size, tile_size))
+    surface.blit(overlay, (0, 0))
+    return surface
+
+
+def test_overlay_matches_per_tile_drawing():
+    """Test that the scaled texture looks like per-tile rectangles."""
+    print("Testing overlay texture...")
+
+    pygame.init()
+    pm = _make_manager()
+    size = (640, 480)
+    camera = FixedCamera(100, 50, 640, 480)
+
+    surface = pygame.Surface(size)
+    surface.fill((40, 80, 40))
+    pm.render_overlay(surface, camera, 32)
+
+    reference = _render_reference(pm, camera, size, 32)
+    assert pygame.image.tostring(surface, 'RGB') == pygame.image.tostring(reference, 'RGB')
+
+    print("  ✓ Overlay is pixel-identical")
+    print()
+
+
+def test_texture_rebuilt_only_after_changes():
+    """Test that the texture is refreshed once per diffusion step."""
+    print("Testing texture refresh...")
+
+    pygame.init()
+    pm = _make_manager()
+    screen = pygame.Surface((640, 480))
+    camera = FixedCamera(0, 0, 640, 480)
+
+    pm.render_overlay(screen, camera, 32)
+    texture = pm._overlay_texture
+    scaled = pm._overlay_scaled
+    assert not pm._overlay_dirty
+
+    # Same view, no changes: nothing is rebuilt
+    pm.render_overlay(screen, camera, 32)
+    assert pm._overlay_scaled is scaled
+
+    # Updates between diffusion steps don't touch the texture
+    pm.update(0.1)
+    assert not pm._overlay_dirty
+
+    pm.update(0.5)
+    assert pm._overlay_dirty
+    pm.render_overlay(screen, camera, 32)
+    assert pm._overlay_texture is texture
+    assert pm._overlay_scaled is not scaled
+
+    print("  ✓ Texture follows diffusion steps")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("POLLUTION OVERLAY TESTS")
+    print("=" * 60)
+    print()
+
+    test_overlay_matches_per_tile_drawing()
+    test_texture_rebuilt_only_after_changes()
+
+    print("=" * 60)
+    print("ALL POLLUTION OVERLAY TESTS PASSED!")
+    print("=" * 60)
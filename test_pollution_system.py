@@ -215,7 +215,7 @@ def test_save_load():
     # Save
     saved_data = pm1.to_dict()
 
-    print(f"  Saved {len(saved_data['pollution'])} pollution tiles")
+    print(f"  Saved {int((saved_data['levels'] > 0).sum())} pollution tiles")
     print(f"  Saved {len(saved_data['sources'])} sources")
     print(f"  Overlay visible: {saved_data['overlay_visible']}")
 
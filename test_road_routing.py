@@ -0,0 +1,243 @@
+"""
+Tests for road network routing over the node graph.
+
+Tests graph construction, shortest routes against a tile-level BFS, the
+routing table under road changes, and police patrols that follow streets.
+"""
+
+import sys
+import os
+import random
+from collections import deque
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.world.grid import Grid
+from src.world.tile import TileType, TerrainType
+from src.world.bridge_builder import BridgeBuilder
+from src.systems.road_network import RoadNetwork
+from src.systems.police_manager import PoliceManager
+from src.systems.suspicion_manager import SuspicionManager
+
+
+def _road_grid(seed, size=40):
+    """Random city blocks with some missing pieces and a few wide roads."""
+    rng = random.Random(seed)
+    grid = Grid(size, size)
+    for i in range(2, size - 2, 6):
+        for j in range(2, size - 2):
+            grid.set_tile_type(j, i, TileType.ROAD_TAR)
+            grid.set_tile_type(i, j, TileType.ROAD_ASPHALT)
+    for _ in range(40):
+        grid.set_tile_type(rng.randrange(size), rng.randrange(size), TileType.GRASS)
+    for _ in range(60):
+        grid.set_tile_type(rng.randrange(size), rng.randrange(size), TileType.ROAD_DIRT)
+    return grid
+
+
+def _bfs_distance(network, start, goal):
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return distances[goal]
+        for neighbor in ((x, y - 1), (x, y + 1), (x + 1, y), (x - 1, y)):
+            if neighbor in network.road_tiles and neighbor not in distances:
+                distances[neighbor] = distances[(x, y)] + 1
+                queue.append(neighbor)
+    return None
+
+
+def test_graph_structure():
+    """Test that edges are straight road runs between nodes."""
+    print("Testing road graph...")
+
+    network = RoadNetwork(_road_grid(1))
+    assert network.intersections <= set(network.graph)
+    assert len(network.graph) < len(network.road_tiles)
+
+    covered = set(network.graph)
+    for node, edges in network.graph.items():
+        for other, length, direction in edges:
+            assert any(edge[0] == node and edge[1] == length for edge in network.graph[other])
+            run = network.expand_route([node, other])
+            assert len(run) == length + 1
+            assert all(tile in network.road_tiles for tile in run)
+            covered.update(run)
+    assert covered == network.road_tiles
+    assert set(network.tile_edges) == network.road_tiles - set(network.graph)
+
+    print(f"  ✓ {len(network.road_tiles)} road tiles compiled to {network.get_node_count()} nodes")
+    print()
+
+
+def test_routes_are_shortest():
+    """Test routes against a breadth-first search over road tiles."""
+    print("Testing road routes...")
+
+    rng = random.Random(7)
+    for seed in range(4):
+        network = RoadNetwork(_road_grid(seed))
+        roads = sorted(network.road_tiles)
+        for _ in range(150):
+            start = rng.choice(roads)
+            goal = rng.choice(roads)
+            expected = _bfs_distance(network, start, goal)
+            path = network.find_path(start[0], start[1], goal[0], goal[1])
+
+            if expected is None:
+                assert path is None
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert len(path) == expected + 1
+            for (x0, y0), (x1, y1) in zip(path, path[1:]):
+                assert abs(x1 - x0) + abs(y1 - y0) == 1
+                assert (x1, y1) in network.road_tiles
+
+            # The A* route is just as short
+            route = network.find_route(start[0], start[1], goal[0], goal[1])
+            assert len(network.expand_route(route)) == len(path)
+            assert len(route) <= len(path)
+
+    assert network.find_path(0, 0, roads[0][0], roads[0][1]) is None
+
+    print("  ✓ Routes match BFS distances")
+    print()
+
+
+def test_routing_table_follows_road_changes():
+    """Test that table lookups stay shortest while roads change."""
+    print("Testing routing table maintenance...")
+
+    rng = random.Random(12)
+    grid = _road_grid(5)
+    network = RoadNetwork(grid)
+
+    # Fill the table, then break and add roads in small batches
+    roads = sorted(network.road_tiles)
+    for _ in range(300):
+        start, goal = rng.choice(roads), rng.choice(roads)
+        network.find_path(start[0], start[1], goal[0], goal[1])
+    rows_before = len(network.routing_rows)
+
+    for _ in range(25):
+        for _ in range(rng.randint(1, 3)):
+            x, y = rng.randrange(40), rng.randrange(40)
+            if rng.random() < 0.5:
+                grid.get_tile(x, y).occupied = not grid.get_tile(x, y).occupied
+            else:
+                grid.set_tile_type(x, y, rng.choice([TileType.GRASS, TileType.ROAD_TAR]))
+
+        roads = sorted(network.road_tiles)
+        for _ in range(40):
+            start, goal = rng.choice(roads), rng.choice(roads)
+            path = network.find_path(start[0], start[1], goal[0], goal[1])
+            expected = _bfs_distance(network, start, goal)
+            assert (path is None) == (expected is None)
+            if path:
+                assert len(path) == expected + 1
+                assert all(tile in network.road_tiles for tile in path)
+
+    stats = network.get_routing_stats()
+    assert stats['rows_repaired'] > 0
+    assert stats['rows_dropped'] < stats['rows_repaired'] // 10
+
+    # A fresh network over the same tiles agrees
+    fresh = RoadNetwork(grid)
+    assert fresh.road_tiles == network.road_tiles
+    assert fresh.intersections == network.intersections
+    assert fresh.lane_centers == network.lane_centers
+    assert fresh._edge_set() == network._edge_set()
+
+    print(f"  ✓ {rows_before} rows kept up to date ({stats['rows_repaired']} repairs, "
+          f"{stats['rows_dropped']} drops)")
+    print()
+
+
+def test_graph_repairs_match_rebuild():
+    """Test that single road edits only re-walk nearby runs."""
+    print("Testing incremental graph repairs...")
+
+    rng = random.Random(21)
+    grid = _road_grid(8, size=24)
+    network = RoadNetwork(grid)
+
+    for _ in range(120):
+        x, y = rng.randrange(24), rng.randrange(24)
+        grid.set_tile_type(x, y, rng.choice([TileType.GRASS, TileType.ROAD_TAR, TileType.ROAD_DIRT]))
+        network.sync()
+
+        fresh = RoadNetwork(grid)
+        grid.store.remove_listener(fresh._on_tile_changed)
+        assert fresh._edge_set() == network._edge_set()
+        assert fresh.tile_edges == network.tile_edges
+
+    stats = network.get_routing_stats()
+    assert stats['graph_rebuilds'] == 0
+    assert stats['graph_repairs'] > 0
+
+    print(f"  ✓ {stats['graph_repairs']} repairs matched a full rebuild")
+    print()
+
+
+def test_bridges_connect_roads():
+    """Test that a bridge over a flooded road reconnects the network."""
+    print("Testing bridges...")
+
+    grid = Grid(30, 10)
+    for x in range(30):
+        grid.set_tile_type(x, 5, TileType.ROAD_ASPHALT)
+    for x in range(12, 16):
+        grid.set_terrain_type(x, 5, TerrainType.WATER)
+
+    network = RoadNetwork(grid)
+    assert network.find_path(2, 5, 25, 5) is None
+
+    success, _, _ = BridgeBuilder(grid).place_bridge(12, 5, 15, 5, pay_cost=False)
+    assert success
+    path = network.find_path(2, 5, 25, 5)
+    assert path is not None and len(path) == 24
+
+    print("  ✓ Bridged road is routable")
+    print()
+
+
+def test_police_patrols_follow_streets():
+    """Test that patrol waypoints are joined by straight roads."""
+    print("Testing street patrols...")
+
+    grid = _road_grid(3)
+    network = RoadNetwork(grid)
+    police = PoliceManager(grid, SuspicionManager(), network)
+    routes = police._generate_patrol_routes(random.Random(5), count=4)
+
+    assert len(routes) == 4
+    for route in routes:
+        for a, b in zip(route, route[1:] + route[:1]):
+            if a == b:
+                continue
+            assert a[0] == b[0] or a[1] == b[1]
+            assert all(tile in network.road_tiles for tile in network.expand_route([a, b]))
+
+    print("  ✓ Patrols stay on roads")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("ROAD ROUTING TESTS")
+    print("=" * 60)
+    print()
+
+    test_graph_structure()
+    test_routes_are_shortest()
+    test_routing_table_follows_road_changes()
+    test_graph_repairs_match_rebuild()
+    test_bridges_connect_roads()
+    test_police_patrols_follow_streets()
+
+    print("=" * 60)
+    print("ALL ROAD ROUTING TESTS PASSED!")
+    print("=" * 60)
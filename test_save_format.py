@@ -0,0 +1,217 @@
+"""
+Tests for the binary save format.
+
+Tests round-tripping arrays, header-only reads, delta saves, loading old
+JSON saves, and that listing large saves only reads their headers.
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import numpy as np
+from src.systems.save_manager import SaveManager
+from src.systems import save_format
+
+
+def _large_state(width=400, height=300):
+    """Game state with world-sized grids."""
+    rng = np.random.default_rng(7)
+    return {
+        "time": {"day": 12, "hour": 8, "minute": 0},
+        "resources": {"money": 125000, "materials": {"plastic": 40}},
+        "grid": {
+            "width": width,
+            "height": height,
+            "tiles": rng.integers(0, 12, size=(height, width), dtype=np.uint8),
+            "elevation": np.zeros((height, width), dtype=np.float32),
+        },
+        "pollution": {"levels": rng.random((height, width), dtype=np.float32)},
+        "npcs": [{"id": i, "x": float(i), "y": np.float32(i * 2)} for i in range(2000)],
+    }
+
+
+def test_round_trip():
+    """Test that arrays and nested data survive a save and load."""
+    print("Testing round trip...")
+
+    state = _large_state(120, 90)
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_directory=directory)
+        assert manager.save_game(state, "round_trip")
+        loaded = manager.load_game("round_trip")
+
+    assert loaded["time"] == state["time"]
+    assert loaded["npcs"][5] == {"id": 5, "x": 5.0, "y": 10.0}
+    for key in ("tiles", "elevation"):
+        assert loaded["grid"][key].dtype == state["grid"][key].dtype
+        assert np.array_equal(loaded["grid"][key], state["grid"][key])
+    assert np.array_equal(loaded["pollution"]["levels"], state["pollution"]["levels"])
+
+    # Loaded arrays are writable
+    loaded["grid"]["tiles"][0, 0] = 1
+
+    print("  ✓ Arrays, dtypes and nested data preserved")
+    print()
+
+
+def test_header_readable_without_body():
+    """Test that the header holds the save summary."""
+    print("Testing header...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_directory=directory)
+        manager.save_game(_large_state(60, 45), "header")
+        path = manager._get_save_path("header")
+
+        with open(path, 'rb') as f:
+            header = save_format.read_header(f)
+            assert f.tell() == header['body_offset']
+
+        assert header["save_name"] == "header"
+        assert header["day"] == 12
+        assert header["money"] == 125000
+        assert header["entries"]["grid/0"]["shape"] == [45, 60]
+
+        # Damaged and foreign files are rejected
+        with open(path, 'r+b') as f:
+            f.seek(-10, os.SEEK_END)
+            f.write(b'\x00' * 10)
+        assert manager.load_game("header") is None
+        with open(os.path.join(directory, "other.sav"), 'wb') as f:
+            f.write(b'not a save file')
+        assert manager.load_game("other") is None
+
+    print("  ✓ Summary readable from the header, damage detected")
+    print()
+
+
+def test_delta_save():
+    """Test that a delta save only writes changed chunks."""
+    print("Testing delta saves...")
+
+    state = _large_state()
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_directory=directory)
+        assert manager.save_game(state, "world")
+        full_stats = manager.last_save_stats
+        assert not full_stats['delta']
+
+        # Change one row of the pollution grid and the clock
+        state["pollution"]["levels"][150, :] = 0.5
+        state["time"]["day"] = 13
+        assert manager.save_game(state, "world", delta=True)
+        delta_stats = manager.last_save_stats
+        assert delta_stats['delta']
+        assert delta_stats['chunks_reused'] > delta_stats['chunks_written']
+        assert delta_stats['bytes'] < full_stats['bytes'] / 4
+        assert os.path.exists(manager._get_delta_path("world"))
+
+        loaded = manager.load_game("world")
+        assert loaded["time"]["day"] == 13
+        assert np.array_equal(loaded["pollution"]["levels"], state["pollution"]["levels"])
+        assert np.array_equal(loaded["grid"]["tiles"], state["grid"]["tiles"])
+
+        listed = manager.get_save_list()
+        assert [entry["name"] for entry in listed] == ["world"]
+        assert listed[0]["day"] == 13
+
+        # A full save replaces the delta
+        assert manager.save_game(state, "world")
+        assert not os.path.exists(manager._get_delta_path("world"))
+        assert manager.load_game("world")["time"]["day"] == 13
+
+        # Deleting removes every file of the save
+        manager.save_game(state, "world", delta=True)
+        assert manager.delete_save("world")
+        assert os.listdir(directory) == []
+
+    print(f"  Full save: {full_stats['bytes'] / 1024:.0f} KB, "
+          f"delta: {delta_stats['bytes'] / 1024:.0f} KB")
+    print("  ✓ Only changed chunks written")
+    print()
+
+
+def test_legacy_json_saves():
+    """Test that saves in the old JSON format still list and load."""
+    print("Testing legacy JSON saves...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_directory=directory)
+        with open(os.path.join(directory, "old.json"), 'w') as f:
+            json.dump({
+                "version": "1.0",
+                "timestamp": "2024-01-01T00:00:00",
+                "save_name": "old",
+                "game_state": {"time": {"day": 3}, "resources": {"money": 900}},
+            }, f, indent=2)
+
+        listed = manager.get_save_list()
+        assert listed[0]["name"] == "old"
+        assert listed[0]["money"] == 900
+        assert manager.load_game("old")["time"]["day"] == 3
+
+    print("  ✓ Old saves listed and loaded")
+    print()
+
+
+def test_list_reads_headers_only():
+    """Test that listing large saves reads headers and no chunk data."""
+    print("Testing save listing...")
+
+    state = _large_state()
+    read_chunk = save_format._read_chunk
+    read_header = save_format.read_header
+    calls = {'chunks': 0, 'headers': 0}
+
+    def counting_read_chunk(*args):
+        calls['chunks'] += 1
+        return read_chunk(*args)
+
+    def counting_read_header(*args):
+        calls['headers'] += 1
+        return read_header(*args)
+
+    save_format._read_chunk = counting_read_chunk
+    save_format.read_header = counting_read_header
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            manager = SaveManager(save_directory=directory)
+            for i in range(20):
+                manager.save_game(state, f"slot_{i}")
+
+            calls.update(chunks=0, headers=0)
+            listed = manager.get_save_list()
+            assert len(listed) == 20
+            assert calls == {'chunks': 0, 'headers': 20}
+
+            # Loading is what reads (and decompresses) the chunks
+            manager.load_game("slot_0")
+            assert calls['chunks'] > 0
+    finally:
+        save_format._read_chunk = read_chunk
+        save_format.read_header = read_header
+
+    print("  ✓ 20 large saves listed without decompressing any chunk")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("SAVE FORMAT TESTS")
+    print("=" * 60)
+    print()
+
+    test_round_trip()
+    test_header_readable_without_body()
+    test_delta_save()
+    test_legacy_json_saves()
+    test_list_reads_headers_only()
+
+    print("=" * 60)
+    print("ALL SAVE FORMAT TESTS PASSED!")
+    print("=" * 60)
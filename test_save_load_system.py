@@ -14,7 +14,6 @@ Tests:
 
 import sys
 import os
-import json
 import time
 
 # Add src to path
@@ -64,14 +63,14 @@ def test_save_game():
     save_path = save_manager._get_save_path("test_save")
     assert os.path.exists(save_path), f"Save file should exist at {save_path}"
 
-    # Verify file contents
-    with open(save_path, 'r') as f:
-        saved_data = json.load(f)
+    # Verify file header
+    header = SaveManager.read_header(save_path)
 
-    assert saved_data["version"] == "1.0", "Version should be saved"
-    assert saved_data["save_name"] == "test_save", "Save name should be saved"
-    assert "timestamp" in saved_data, "Timestamp should be saved"
-    assert saved_data["game_state"]["time"]["day"] == 5, "Game state should be saved correctly"
+    assert header["version"] == "1.0", "Version should be saved"
+    assert header["save_name"] == "test_save", "Save name should be saved"
+    assert "timestamp" in header, "Timestamp should be saved"
+    assert header["day"] == 5, "Game state summary should be saved correctly"
+    assert save_manager.load_game("test_save")["time"]["day"] == 5, "Game state should be saved correctly"
 
     print("✓ Game saved successfully")
     print(f"  - File: {save_path}")
@@ -0,0 +1,162 @@
+"""
+Tests for the sprite generator's cache.
+
+Tests that the cache stays within its memory budget by dropping the least
+recently used sprites, that zoomed copies are cached per zoom bucket, that
+atlases hold the same pixels as the separate sprites, and that precomputed
+keys find the same sprites as get_sprite.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from graphics import SpriteGenerator, SpriteType, Direction, SpriteAtlas
+from graphics.sprite_generator import surface_bytes
+
+
+def _same_pixels(a, b):
+    """Check that two surfaces have identical size and RGBA pixels."""
+    if a.get_size() != b.get_size():
+        return False
+    return pygame.image.tobytes(a, 'RGBA') == pygame.image.tobytes(b, 'RGBA')
+
+
+def test_hits_and_byte_accounting():
+    """Test that repeated requests hit the cache and bytes add up."""
+    print("Testing cache hits and byte accounting...")
+
+    generator = SpriteGenerator()
+    first = generator.get_sprite(SpriteType.NPC, Direction.EAST, 1, 2)
+    again = generator.get_sprite(SpriteType.NPC, Direction.EAST, 1, 2)
+    assert first is again
+    assert generator.hits == 1 and generator.misses == 1
+
+    generator.get_sprite(SpriteType.CAR, Direction.NORTH, 0, 0, body_color=(200, 0, 0))
+    info = generator.get_cache_info()
+    assert info['cached_sprites'] == 2
+    expected = surface_bytes(first) + surface_bytes(
+        generator.get_sprite(SpriteType.CAR, Direction.NORTH, 0, 0, body_color=(200, 0, 0)))
+    assert info['memory_bytes'] == expected
+
+    generator.clear_cache()
+    assert generator.get_cache_info()['memory_bytes'] == 0
+
+    print("  ✓ Hits counted, memory measured from the surfaces")
+    print()
+
+
+def test_lru_eviction():
+    """Test that the cache drops least recently used sprites beyond its budget."""
+    print("Testing LRU eviction...")
+
+    generator = SpriteGenerator()
+    one_sprite = surface_bytes(generator.get_sprite(SpriteType.NPC, Direction.SOUTH, 0, 0))
+    generator.clear_cache()
+    generator.set_memory_budget(one_sprite * 3)
+
+    a = generator.get_sprite(SpriteType.NPC, Direction.SOUTH, 0, 0)
+    generator.get_sprite(SpriteType.NPC, Direction.SOUTH, 0, 1)
+    generator.get_sprite(SpriteType.NPC, Direction.SOUTH, 0, 2)
+    # Touch the first so the second is now the oldest
+    assert generator.get_sprite(SpriteType.NPC, Direction.SOUTH, 0, 0) is a
+    generator.get_sprite(SpriteType.NPC, Direction.SOUTH, 0, 3)
+
+    assert generator.evictions == 1
+    assert generator.cache_bytes <= generator.max_bytes
+    assert generator.get_sprite(SpriteType.NPC, Direction.SOUTH, 0, 0) is a
+    misses = generator.misses
+    generator.get_sprite(SpriteType.NPC, Direction.SOUTH, 0, 1)
+    assert generator.misses == misses + 1
+
+    generator.set_memory_budget(one_sprite)
+    assert generator.get_cache_info()['cached_sprites'] == 1
+
+    print("  ✓ Oldest sprites dropped, budget respected")
+    print()
+
+
+def test_zoom_variants():
+    """Test that zoomed sprites are scaled once per zoom bucket."""
+    print("Testing zoom variants...")
+
+    generator = SpriteGenerator()
+    base = generator.get_sprite(SpriteType.ROBOT, Direction.WEST, 1, 0)
+    scaled = generator.get_scaled_sprite(SpriteType.ROBOT, Direction.WEST, 1, 0, zoom=2.0)
+    assert scaled.get_size() == (base.get_width() * 2, base.get_height() * 2)
+
+    # Nearby zooms share a bucket
+    assert generator.get_scaled_sprite(SpriteType.ROBOT, Direction.WEST, 1, 0, zoom=2.01) is scaled
+    assert generator.get_scaled_sprite(SpriteType.ROBOT, Direction.WEST, 1, 0, zoom=1.0) is base
+
+    print("  ✓ One scaled copy per zoom bucket")
+    print()
+
+
+def test_atlas():
+    """Test that atlas frames match the separate sprites."""
+    print("Testing sprite atlases...")
+
+    generator = SpriteGenerator()
+    atlas = generator.get_atlas(SpriteType.NPC, range(3), variant=4)
+    assert isinstance(atlas, SpriteAtlas)
+    assert len(atlas.rects) == len(Direction) * 3
+    assert atlas.surface.get_width() <= 1024
+
+    for direction in Direction:
+        for frame in range(3):
+            sprite = generator.get_sprite(SpriteType.NPC, direction, frame, 4)
+            assert _same_pixels(atlas.get_frame(direction, frame), sprite)
+
+    assert generator.get_atlas(SpriteType.NPC, range(3), variant=4) is atlas
+    assert generator.get_cache_info()['atlases'] == 1
+
+    screen = pygame.Surface((64, 64), pygame.SRCALPHA)
+    expected = pygame.Surface((64, 64), pygame.SRCALPHA)
+    atlas.blit(screen, Direction.EAST, 2, (32, 32))
+    sprite = generator.get_sprite(SpriteType.NPC, Direction.EAST, 2, 4)
+    expected.blit(sprite, sprite.get_rect(center=(32, 32)))
+    assert _same_pixels(screen, expected)
+
+    print("  ✓ Atlas frames identical to individual sprites")
+    print()
+
+
+def test_precomputed_keys():
+    """Test that make_key/get_sprite_for_key match get_sprite."""
+    print("Testing precomputed keys...")
+
+    generator = SpriteGenerator()
+    key = generator.make_key(SpriteType.CAR, Direction.NORTHEAST, 0, 1, body_color=(0, 0, 255))
+    sprite = generator.get_sprite_for_key(key)
+    assert generator.get_sprite(SpriteType.CAR, Direction.NORTHEAST, 0, 1, body_color=(0, 0, 255)) is sprite
+
+    zoomed = generator.make_key(SpriteType.CAR, Direction.NORTHEAST, 0, 1, zoom=0.5, body_color=(0, 0, 255))
+    assert generator.get_sprite_for_key(zoomed) is generator.get_scaled_sprite(
+        SpriteType.CAR, Direction.NORTHEAST, 0, 1, zoom=0.5, body_color=(0, 0, 255))
+
+    print("  ✓ Precomputed keys reach the same cache entries")
+    print()
+
+
+if __name__ == '__main__':
+    pygame.init()
+    print("=" * 60)
+    print("SPRITE CACHE TESTS")
+    print("=" * 60)
+    print()
+
+    test_hits_and_byte_accounting()
+    test_lru_eviction()
+    test_zoom_variants()
+    test_atlas()
+    test_precomputed_keys()
+
+    print("=" * 60)
+    print("ALL SPRITE CACHE TESTS PASSED!")
+    print("=" * 60)
@@ -0,0 +1,148 @@
+"""
+Tests for the chunked terrain cache.
+
+Tests that cached chunk rendering matches per-tile rendering and that
+chunks are only redrawn when tiles change.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from src.world.grid import Grid
+from src.world.tile import Tile, TileType, TerrainType
+from src.rendering.camera import Camera
+
+
+class FixedCamera:
+    """Camera stand-in with a fixed position."""
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+
+def _make_grid():
+    grid = Grid(40, 30)
+    for x in range(5, 15):
+        for y in range(5, 10):
+            grid.set_tile_type(x, y, TileType.LANDFILL)
+    for x in range(40):
+        grid.set_terrain_type(x, 28, TerrainType.OCEAN)
+    grid.set_terrain_type(20, 20, TerrainType.BRIDGE)
+    grid.set_terrain_type(21, 20, TerrainType.DOCK)
+    return grid
+
+
+def _render_reference(grid, camera, size):
+    surface = pygame.Surface(size)
+    for grid_y in range(grid.height_tiles):
+        for grid_x in range(grid.width_tiles):
+            Tile.view(grid.store, grid_x, grid_y).render(
+                surface, grid_x * grid.tile_size - camera.x,
+                grid_y * grid.tile_size - camera.y, grid.tile_size, show_grid=False
+            )
+    return surface
+
+
+def _render_cached(grid, camera, size):
+    surface = pygame.Surface(size)
+    grid.render(surface, camera, show_grid=False)
+    return surface
+
+
+def _same_pixels(a, b):
+    return pygame.image.tostring(a, 'RGB') == pygame.image.tostring(b, 'RGB')
+
+
+def test_cached_render_matches_tiles():
+    """Test that chunk blits produce the same image as per-tile drawing."""
+    print("Testing cached terrain matches per-tile rendering...")
+
+    pygame.init()
+    grid = _make_grid()
+    camera = FixedCamera(40, 100, 640, 480)
+    size = (640, 480)
+
+    assert _same_pixels(_render_reference(grid, camera, size), _render_cached(grid, camera, size))
+
+    # Change tiles and advance water, then compare again
+    grid.get_tile(6, 6).add_depletion(0.6)
+    grid.set_tile_type(7, 7, TileType.DIRT)
+    grid.update(2.0)
+    assert _same_pixels(_render_reference(grid, camera, size), _render_cached(grid, camera, size))
+
+    print("  ✓ Cached chunks are pixel-identical")
+    print()
+
+
+def test_only_changed_tiles_redrawn():
+    """Test that a tile change only redraws that tile."""
+    print("Testing dirty tile tracking...")
+
+    pygame.init()
+    grid = Grid(40, 30)
+    camera = FixedCamera(0, 0, 640, 480)
+    screen = pygame.Surface((640, 480))
+
+    grid.render(screen, camera)
+    cache = grid.terrain_cache
+    built = cache.chunks_built
+    assert built > 0
+
+    # Nothing changed: no rebuilds, no redraws
+    grid.render(screen, camera)
+    assert cache.chunks_built == built
+    assert cache.tiles_redrawn == 0
+
+    grid.set_tile_type(3, 3, TileType.ROAD_TAR)
+    grid.render(screen, camera)
+    assert cache.chunks_built == built
+    assert cache.tiles_redrawn == 1
+
+    print("  ✓ Only the changed tile was redrawn")
+    print()
+
+
+def test_chunk_budget():
+    """Test that offscreen chunks are evicted beyond the budget."""
+    print("Testing chunk budget...")
+
+    pygame.init()
+    grid = Grid(200, 200)
+    camera = Camera(640, 480)
+    screen = pygame.Surface((640, 480))
+
+    grid.render(screen, camera)
+    grid.terrain_cache.max_chunks = 4
+    for step in range(10):
+        camera.x = step * 512
+        camera.y = step * 512
+        grid.render(screen, camera)
+    assert len(grid.terrain_cache.chunks) <= 4
+
+    print("  ✓ Chunk count stays within budget")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("TERRAIN CACHE TESTS")
+    print("=" * 60)
+    print()
+
+    test_cached_render_matches_tiles()
+    test_only_changed_tiles_redrawn()
+    test_chunk_budget()
+
+    print("=" * 60)
+    print("ALL TERRAIN CACHE TESTS PASSED!")
+    print("=" * 60)
@@ -0,0 +1,153 @@
+"""
+Tests for the shared font registry and text cache.
+
+Tests that fonts are created once per size, that rendered strings are
+reused with LRU eviction, that cached text looks the same as plain pygame
+rendering, and that entity labels and the HUD go through the cache.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.rendering.text_cache import TextCache, CachedFont, get_font, get_text_cache
+from src.rendering.camera import Camera
+from src.entities.npc import NPC
+from src.ui.hud import HUD
+
+
+def _same_pixels(a, b):
+    """Check that two surfaces have identical size and RGBA pixels."""
+    if a.get_size() != b.get_size():
+        return False
+    return pygame.image.tobytes(a, 'RGBA') == pygame.image.tobytes(b, 'RGBA')
+
+
+def test_font_registry():
+    """Test that each size gets one shared font."""
+    print("Testing font registry...")
+
+    pygame.init()
+    cache = TextCache()
+    font = cache.get_font(20)
+    assert cache.get_font(20) is font
+    assert cache.get_font(24) is not font
+    assert isinstance(font, pygame.font.Font)
+    assert font.get_height() == pygame.font.Font(None, 20).get_height()
+    assert cache.get_stats()['fonts'] == 2
+
+    print("  ✓ Fonts created once per size")
+    print()
+
+
+def test_text_reuse():
+    """Test that identical strings are rendered once."""
+    print("Testing text reuse...")
+
+    cache = TextCache()
+    font = cache.get_font(20)
+    first = font.render("Money: $100", True, (255, 215, 0))
+    assert font.render("Money: $100", True, (255, 215, 0)) is first
+    assert cache.hits == 1 and cache.misses == 1
+
+    # pygame.Color is not hashable, but can still be used
+    gold = font.render("Money: $100", True, pygame.Color(255, 215, 0))
+    assert font.render("Money: $100", True, pygame.Color(255, 215, 0)) is gold
+
+    # Colour, antialias and size are part of the key
+    assert font.render("Money: $100", True, (255, 255, 255)) is not first
+    assert font.render("Money: $100", False, (255, 215, 0)) is not first
+    assert cache.get_font(24).render("Money: $100", True, (255, 215, 0)) is not first
+
+    plain = pygame.font.Font(None, 20).render("Money: $100", True, (255, 215, 0))
+    assert _same_pixels(first, plain)
+
+    print("  ✓ Cached text matches plain rendering")
+    print()
+
+
+def test_lru_eviction():
+    """Test that the least recently used strings are dropped."""
+    print("Testing LRU eviction...")
+
+    cache = TextCache(max_surfaces=3)
+    font = cache.get_font(16)
+    a = font.render("a", True, (255, 255, 255))
+    font.render("b", True, (255, 255, 255))
+    font.render("c", True, (255, 255, 255))
+    assert font.render("a", True, (255, 255, 255)) is a
+    font.render("d", True, (255, 255, 255))
+
+    assert len(cache.surfaces) == 3
+    assert font.render("a", True, (255, 255, 255)) is a
+    misses = cache.misses
+    font.render("b", True, (255, 255, 255))
+    assert cache.misses == misses + 1
+
+    print("  ✓ Oldest strings evicted first")
+    print()
+
+
+def test_registry_survives_reinit():
+    """Test that pygame.quit() empties the registry instead of leaving dead fonts."""
+    print("Testing pygame re-initialization...")
+
+    pygame.init()
+    font = get_font(18)
+    font.render("x", True, (255, 255, 255))
+    pygame.quit()
+    pygame.init()
+
+    fresh = get_font(18)
+    assert fresh is not font
+    assert fresh.render("x", True, (255, 255, 255)).get_width() > 0
+
+    print("  ✓ Fonts recreated after pygame.quit()")
+    print()
+
+
+def test_call_sites_use_cache():
+    """Test that entity labels and the HUD render through the cache."""
+    print("Testing call sites...")
+
+    pygame.init()
+    hud = HUD(800, 600)
+    assert isinstance(hud.font_small, CachedFont)
+
+    camera = Camera(400, 300)
+    npc = NPC(100.0, 80.0, 0, 0)
+    screen = pygame.Surface((400, 300))
+    npc.render(screen, camera)
+
+    cache = get_text_cache()
+    misses = cache.misses
+    fonts = len(cache.fonts)
+    for _ in range(10):
+        npc.render(screen, camera)
+    assert cache.misses == misses
+    assert len(cache.fonts) == fonts
+
+    print("  ✓ No fonts or text re-created on later frames")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("TEXT CACHE TESTS")
+    print("=" * 60)
+    print()
+
+    test_font_registry()
+    test_text_reuse()
+    test_lru_eviction()
+    test_registry_survives_reinit()
+    test_call_sites_use_cache()
+
+    print("=" * 60)
+    print("ALL TEXT CACHE TESTS PASSED!")
+    print("=" * 60)
@@ -0,0 +1,185 @@
+"""
+Tests for the array-backed tile store.
+
+Tests that Grid tiles are views onto per-attribute layers and that the
+bulk layers stay in sync with the per-tile API.
+"""
+
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.world.grid import Grid
+from src.world.tile import Tile, TileType, TerrainType
+from src.world.tile_store import TileStore
+
+
+def test_tile_views_write_through():
+    """Test that changes made through a tile view land in the store layers."""
+    print("Testing tile views write through to the store...")
+
+    grid = Grid(20, 15)
+    tile = grid.get_tile(4, 7)
+
+    tile.set_type(TileType.BUILDING)
+    assert grid.store.tile_type[7, 4] == TileType.BUILDING
+    assert not grid.store.walkable[7, 4]
+
+    tile.occupied = True
+    assert grid.store.occupied[7, 4]
+
+    # A fresh view sees the same data
+    again = grid.get_tile(4, 7)
+    assert again.tile_type == TileType.BUILDING
+    assert again.occupied is True
+    assert again == tile
+
+    print("  ✓ Tile views share state with the grid store")
+    print()
+
+
+def test_walkability_rules():
+    """Test that walkability follows terrain and tile type."""
+    print("Testing walkability rules...")
+
+    grid = Grid(10, 10)
+
+    grid.set_terrain_type(1, 1, TerrainType.WATER)
+    grid.set_terrain_type(2, 1, TerrainType.OCEAN)
+    grid.set_tile_type(3, 1, TileType.FACTORY)
+    grid.set_tile_type(4, 1, TileType.BUILDING)
+    grid.set_terrain_type(4, 1, TerrainType.BRIDGE)
+
+    assert grid.get_tile(1, 1).walkable is False
+    assert grid.get_tile(2, 1).walkable is False
+    assert grid.get_tile(3, 1).walkable is False
+    assert grid.get_tile(4, 1).walkable is True
+    assert grid.get_tile(5, 1).walkable is True
+
+    # Vectorized refresh agrees with the per-tile rule
+    expected = grid.store.walkable.copy()
+    grid.store.refresh_walkability()
+    assert (grid.store.walkable == expected).all()
+
+    print("  ✓ Walkability matches per-tile and vectorized rules")
+    print()
+
+
+def test_passable_and_bulk_queries():
+    """Test bulk queries over the store layers."""
+    print("Testing bulk queries...")
+
+    grid = Grid(8, 6)
+    grid.set_tile_type(2, 3, TileType.LANDFILL)
+    grid.set_tile_type(5, 1, TileType.LANDFILL)
+    grid.get_tile(0, 0).occupied = True
+
+    assert grid.find_tiles(TileType.LANDFILL) == [(5, 1), (2, 3)]
+
+    passable = grid.store.passable_mask()
+    assert not passable[0, 0]
+    assert passable[0, 1]
+    assert grid.is_passable(0, 0) is False
+    assert grid.is_passable(1, 0) is True
+    assert grid.is_passable(-1, 0) is False
+    assert grid.is_passable(8, 0) is False
+
+    print("  ✓ find_tiles and passable mask agree with tile views")
+    print()
+
+
+def test_standalone_tile():
+    """Test that a Tile can still be created outside of a grid."""
+    print("Testing standalone tile...")
+
+    tile = Tile(3, 4, TileType.GRASS, TerrainType.WATER)
+    assert tile.grid_x == 3 and tile.grid_y == 4
+    assert tile.walkable is False
+
+    tile.set_terrain_type(TerrainType.LAND)
+    assert tile.walkable is True
+    assert tile.color == (50, 120, 50)
+
+    print("  ✓ Standalone tiles own a single-tile store")
+    print()
+
+
+def test_water_animation_index():
+    """Test the shared water clock and animated tile index."""
+    print("Testing water animation index...")
+
+    grid = Grid(12, 12)
+    assert grid.store.animated_tiles == set()
+
+    # No water: the clock does not need to run
+    grid.update(1.0)
+    assert grid.store.water_phase == 0.0
+
+    grid.set_terrain_type(2, 2, TerrainType.WATER)
+    grid.set_terrain_type(3, 2, TerrainType.OCEAN)
+    assert grid.store.animated_tiles == {(2, 2), (3, 2)}
+
+    grid.update(1.0)
+    assert grid.get_tile(2, 2).water_anim_frame == grid.get_tile(3, 2).water_anim_frame > 0
+
+    # Bridging a tile removes it from the index
+    grid.set_terrain_type(2, 2, TerrainType.BRIDGE)
+    assert grid.store.animated_tiles == {(3, 2)}
+
+    print("  ✓ Animated tiles tracked, clock advances once per update")
+    print()
+
+
+def test_terrain_data_stays_sparse():
+    """Test that reading terrain_data does not add store entries."""
+    print("Testing sparse terrain data...")
+
+    grid = Grid(10, 10)
+    tile = grid.get_tile(2, 3)
+    assert dict(tile.terrain_data) == {}
+    assert 'ore' not in tile.terrain_data
+    assert grid.store.terrain_data == {}
+    assert grid.store.to_dict()['terrain_data'] == {}
+
+    tile.terrain_data['ore'] = 5
+    assert grid.store.terrain_data == {(2, 3): {'ore': 5}}
+    assert grid.get_tile(2, 3).terrain_data['ore'] == 5
+
+    tile.terrain_data = {}
+    assert grid.store.terrain_data == {}
+
+    print("  ✓ Entries are created only on write")
+    print()
+
+
+def test_large_grid_construction():
+    """Test that large grids are cheap to build."""
+    print("Testing large grid construction...")
+
+    store = TileStore(600, 600)
+    assert store.tile_type.shape == (600, 600)
+    assert store.walkable.all()
+
+    print("  ✓ 600x600 store created")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("TILE STORE TESTS")
+    print("=" * 60)
+    print()
+
+    test_tile_views_write_through()
+    test_walkability_rules()
+    test_passable_and_bulk_queries()
+    test_standalone_tile()
+    test_water_animation_index()
+    test_terrain_data_stays_sparse()
+    test_large_grid_construction()
+
+    print("=" * 60)
+    print("ALL TILE STORE TESTS PASSED!")
+    print("=" * 60)
@@ -0,0 +1,172 @@
+"""
+Tests for the traffic lane-occupancy and pedestrian indexes.
+
+Tests that the index tracks vehicles across tiles, that vehicles react to
+traffic in their own lane and to pedestrians ahead, and that in a busy
+city each vehicle only checks the traffic in its lane ahead.
+"""
+
+import sys
+import os
+import random
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.world.grid import Grid
+from src.world.tile import TileType
+from src.systems.road_network import RoadNetwork
+from src.systems.traffic_manager import TrafficManager, LANE_STEPS
+
+
+class MockNPC:
+    """Mock pedestrian for testing."""
+    def __init__(self, world_x, world_y):
+        self.world_x = world_x
+        self.world_y = world_y
+
+
+def _city(size=60):
+    grid = Grid(size, size)
+    for i in range(2, size - 2, 6):
+        for j in range(2, size - 2):
+            grid.set_tile_type(j, i, TileType.ROAD_TAR)
+            grid.set_tile_type(i, j, TileType.ROAD_ASPHALT)
+    return grid
+
+
+def _check_index(manager):
+    indexed = [vehicle for bucket in manager.lane_occupancy.values() for vehicle in bucket]
+    assert sorted(map(id, indexed)) == sorted(map(id, manager.vehicles))
+    for key, bucket in manager.lane_occupancy.items():
+        for vehicle in bucket:
+            assert manager._occupancy_key(vehicle) == key
+
+
+def test_index_follows_vehicles():
+    """Test that the occupancy index stays consistent while traffic moves."""
+    print("Testing occupancy index...")
+
+    random.seed(2)
+    grid = _city()
+    manager = TrafficManager(grid, RoadNetwork(grid))
+    manager.max_vehicle_count = 100
+    manager.set_target_vehicle_count(40)
+    roads = sorted(manager.road_network.road_tiles)
+    for _ in range(40):
+        manager.spawn_vehicle_at(*random.choice(roads))
+
+    for _ in range(300):
+        manager.update(0.05, npcs=[], time_of_day=12.0)
+        _check_index(manager)
+
+    manager.clear_all_vehicles()
+    assert not manager.lane_occupancy
+
+    print("  ✓ Index matches vehicle positions every frame")
+    print()
+
+
+def test_same_lane_following():
+    """Test that vehicles follow traffic in their own lane only."""
+    print("Testing vehicle ahead detection...")
+
+    grid = Grid(30, 10)
+    for x in range(30):
+        grid.set_tile_type(x, 3, TileType.ROAD_TAR)
+        grid.set_tile_type(x, 5, TileType.ROAD_TAR)
+    manager = TrafficManager(grid, RoadNetwork(grid))
+    manager.target_vehicle_count = 0
+
+    leader = manager.spawn_vehicle_at(8, 3, direction='east')
+    follower = manager.spawn_vehicle_at(7, 3, direction='east')
+    parallel = manager.spawn_vehicle_at(5, 5, direction='east')
+    for vehicle, row in ((leader, 3), (follower, 3), (parallel, 5)):
+        vehicle.set_path([(29, row)])
+    leader.max_speed = leader.target_speed = 0.0
+
+    manager.update(0.016)
+    assert follower.vehicle_ahead is leader
+    assert follower.stopping_for_vehicle
+    assert parallel.vehicle_ahead is None
+    assert leader.vehicle_ahead is None
+
+    print("  ✓ Only same-lane traffic ahead is followed")
+    print()
+
+
+def test_pedestrian_ahead():
+    """Test that vehicles stop for a pedestrian in the lane ahead."""
+    print("Testing pedestrian detection...")
+
+    grid = Grid(30, 10)
+    for x in range(30):
+        grid.set_tile_type(x, 3, TileType.ROAD_TAR)
+    manager = TrafficManager(grid, RoadNetwork(grid))
+    manager.target_vehicle_count = 0
+
+    car = manager.spawn_vehicle_at(5, 3, direction='east')
+    car.set_path([(29, 3)])
+    npcs = [MockNPC(car.world_x + 20, car.world_y), MockNPC(car.world_x - 200, car.world_y)]
+
+    manager.update(0.016, npcs=npcs)
+    assert car.stopping_for_pedestrian
+
+    npcs[0].world_x += 300
+    manager.update(0.016, npcs=npcs)
+    assert not car.stopping_for_pedestrian
+
+    print("  ✓ Pedestrians ahead stop traffic")
+    print()
+
+
+def test_busy_city_lane_ahead():
+    """Test that in a busy city each vehicle only looks at its lane ahead."""
+    print("Testing busy city...")
+
+    random.seed(4)
+    grid = _city(100)
+    manager = TrafficManager(grid, RoadNetwork(grid))
+    manager.max_vehicle_count = 1000
+    manager.target_vehicle_count = 0
+    roads = sorted(manager.road_network.road_tiles)
+    while len(manager.vehicles) < 250:
+        manager.spawn_vehicle_at(*random.choice(roads))
+    npcs = [MockNPC(random.uniform(0, 3200), random.uniform(0, 3200)) for _ in range(400)]
+    for _ in range(5):
+        manager.update(0.016, npcs=npcs, time_of_day=12.0)
+    _check_index(manager)
+
+    largest = 0
+    for vehicle in manager.vehicles:
+        grid_x, grid_y, lane = manager._occupancy_key(vehicle)
+        step_x, step_y = LANE_STEPS.get(lane, (0, 0))
+        look_ahead = int(vehicle.safe_following_distance * 3 // grid.tile_size) + 1
+        ahead = {(grid_x + step_x * i, grid_y + step_y * i) for i in range(look_ahead + 1)}
+
+        candidates = manager._get_lane_ahead(vehicle)
+        for other in candidates:
+            other_x, other_y, other_lane = manager._occupancy_key(other)
+            assert other_lane == lane
+            assert (other_x, other_y) in ahead
+        largest = max(largest, len(candidates))
+    assert largest < len(manager.vehicles) // 10
+
+    print(f"  ✓ {len(manager.vehicles)} vehicles each check at most {largest} others")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("TRAFFIC OCCUPANCY TESTS")
+    print("=" * 60)
+    print()
+
+    test_index_follows_vehicles()
+    test_same_lane_following()
+    test_pedestrian_ahead()
+    test_busy_city_lane_ahead()
+
+    print("=" * 60)
+    print("ALL TRAFFIC OCCUPANCY TESTS PASSED!")
+    print("=" * 60)
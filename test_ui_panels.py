@@ -0,0 +1,179 @@
+"""
+Tests for retained-mode UI panels.
+
+Tests that a Panel repaints only when its inputs change, that an unchanged
+HUD frame repaints no panel, and that the research menu and competitor
+panels reuse their surfaces between frames.
+"""
+
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.ui.panel import Panel
+from src.ui.hud import HUD
+from src.ui.research_ui import ResearchUI
+from src.ui.competitor_ui import MarketPanel
+from src.world.grid import Grid
+from src.systems.resource_manager import ResourceManager
+from src.systems.entity_manager import EntityManager
+from src.systems.building_manager import BuildingManager
+from src.systems.power_manager import PowerManager
+from src.systems.research_manager import ResearchManager
+from src.systems.suspicion_manager import SuspicionManager
+
+
+def _make_hud_game():
+    """Create the managers the HUD reads."""
+    grid = Grid(20, 20, 32)
+    resources = ResourceManager()
+    research = ResearchManager()
+    entities = EntityManager(grid, resources, research)
+    buildings = BuildingManager(grid)
+    power = PowerManager(buildings)
+    suspicion = SuspicionManager()
+    return resources, entities, buildings, power, research, suspicion
+
+
+def test_panel_redraws_on_input_change():
+    """Test that a panel repaints only when its inputs change."""
+    print("Testing panel redraws...")
+
+    pygame.init()
+    calls = []
+    panel = Panel((10, 20, 100, 40), lambda surface, *inputs: calls.append(inputs), (0, 0, 0, 180))
+    screen = pygame.Surface((200, 100))
+
+    assert panel.render(screen, 100, 'Day') is True
+    assert panel.render(screen, 100, 'Day') is False
+    assert panel.render(screen, 100, 'Day') is False
+    assert calls == [(100, 'Day')]
+    print("  ✓ Unchanged inputs reuse the cached surface")
+
+    assert panel.render(screen, 101, 'Day') is True
+    assert calls[-1] == (101, 'Day')
+    panel.invalidate()
+    assert panel.render(screen, 101, 'Day') is True
+    assert panel.redraws == 3
+    print("  ✓ Changed inputs and invalidate() repaint")
+
+    screen.fill((255, 255, 255))
+    panel.move_to(50, 50)
+    assert panel.render(screen, 101, 'Day') is False
+    assert screen.get_at((60, 60))[:3] != (255, 255, 255)
+    assert screen.get_at((15, 25))[:3] == (255, 255, 255)
+    print("  ✓ Moving a panel does not repaint it")
+    print()
+
+
+def test_hud_unchanged_frame():
+    """Test that an unchanged HUD frame repaints nothing."""
+    print("Testing unchanged HUD frames...")
+
+    resources, entities, buildings, power, research, suspicion = _make_hud_game()
+    research.completed_research = {}
+    research.current_research = next(iter(research.research_definitions), None)
+    research.research_total_time = 2.0
+    research.research_progress = 0.5
+
+    hud = HUD(1280, 720)
+    screen = pygame.Surface((1280, 720))
+
+    def frame():
+        hud.render(screen, resources, entities, None, power, buildings, research, suspicion,
+                   day=1, hour=6, minute=30)
+
+    frame()
+    redraws = [panel.redraws for panel in hud.get_panels()]
+
+    frames = 200
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame()
+    per_frame_ms = (time.perf_counter() - start) / frames * 1000
+
+    assert [panel.redraws for panel in hud.get_panels()] == redraws
+    print(f"  ✓ No repaints ({per_frame_ms:.3f}ms per frame)")
+
+    # Only the panel showing the changed value repaints
+    resources.money += 25
+    frame()
+    changed = [panel for panel, before in zip(hud.get_panels(), redraws) if panel.redraws != before]
+    assert changed == [hud.resources_panel]
+
+    # Changes below display precision do not repaint
+    resources.money += 0.001
+    frame()
+    assert hud.resources_panel.redraws == redraws[0] + 1
+    print("  ✓ Only panels whose displayed values changed repaint")
+    print()
+
+
+def test_research_ui_retained():
+    """Test that the research menu reuses its panel between frames."""
+    print("Testing research menu panel...")
+
+    research = ResearchManager()
+    ui = ResearchUI(1280, 720)
+    screen = pygame.Surface((1280, 720))
+
+    ui.render(screen, research, 0.0)
+    assert ui.panel.redraws == 0  # Hidden
+    ui.show()
+    for _ in range(5):
+        ui.render(screen, research, 1000.0)
+    assert ui.panel.redraws == 1
+    print("  ✓ Open menu drawn once while nothing changes")
+
+    ui.selected_category = 'power'
+    ui.render(screen, research, 1000.0)
+    assert ui.panel.redraws == 2
+
+    # Money only matters when it changes what can be afforded
+    ui.render(screen, research, 1000.5)
+    assert ui.panel.redraws == 2
+    costs = sorted({tech.get('cost', 0) for tech in research.research_definitions.values()})
+    if costs:
+        ui.render(screen, research, costs[-1])
+        assert ui.panel.redraws == 3
+    print("  ✓ Category and affordability changes repaint")
+    print()
+
+
+def test_competitor_panel_retained():
+    """Test that competitor panels repaint only on displayed changes."""
+    print("Testing competitor panels...")
+
+    panel = MarketPanel(x=20, y=20)
+    screen = pygame.Surface((400, 300))
+    market = {'market_demand': 1.0, 'price_multiplier': 1.2, 'police_activity': 0.3}
+
+    panel.render(screen, market)
+    panel.render(screen, dict(market, price_multiplier=1.2001))
+    assert panel.panel.redraws == 1
+    panel.render(screen, dict(market, police_activity=0.8))
+    assert panel.panel.redraws == 2
+    print("  ✓ Market panel repaints only when shown values change")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("UI PANEL TESTS")
+    print("=" * 60)
+    print()
+
+    test_panel_redraws_on_input_change()
+    test_hud_unchanged_frame()
+    test_research_ui_retained()
+    test_competitor_panel_retained()
+
+    print("=" * 60)
+    print("ALL UI PANEL TESTS PASSED!")
+    print("=" * 60)
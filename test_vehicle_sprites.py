@@ -0,0 +1,188 @@
+"""
+Tests for cached vehicle sprites.
+
+Tests that cached sprites match the old per-frame drawing, that looks are
+reused across vehicles and frames, and that parked vehicles baked into the
+terrain cache look the same as drawing them every frame.
+"""
+
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.world.grid import Grid
+from src.rendering.camera import Camera
+from src.rendering.terrain_cache import TerrainCache
+from src.rendering.vehicle_sprites import (
+    VehicleSpriteCache, get_vehicle_sprite_cache, draw_vehicle, quantize_angle, ANGLE_STEPS
+)
+from src.entities.traffic_vehicle import TrafficVehicle
+from src.systems.traffic_manager import TrafficManager, ParkedVehicle
+
+
+def _reference_render(vehicle, screen, camera):
+    """Draw a vehicle the old way: fresh surface, rotated every frame."""
+    screen_x, screen_y = camera.world_to_screen(vehicle.world_x, vehicle.world_y)
+    width_px = int(vehicle.width * camera.zoom)
+    height_px = int(vehicle.height * camera.zoom)
+    temp_size = int(max(width_px, height_px) * 1.5)
+    temp = pygame.Surface((temp_size, temp_size), pygame.SRCALPHA)
+    draw_vehicle(temp, temp_size // 2 - width_px // 2, temp_size // 2 - height_px // 2,
+                 width_px, height_px, vehicle.body_color, vehicle.get_light_state())
+    rotated = pygame.transform.rotate(temp, -vehicle.facing_angle)
+    screen.blit(rotated, rotated.get_rect(center=(screen_x, screen_y)).topleft)
+
+
+def _same_pixels(a, b):
+    return pygame.image.tostring(a, 'RGB') == pygame.image.tostring(b, 'RGB')
+
+
+def test_sprites_match_direct_drawing():
+    """Test that cached sprites look like the old per-frame rendering."""
+    print("Testing sprite equivalence...")
+
+    camera = Camera(400, 300)
+    for vehicle_type in TrafficVehicle.VEHICLE_TYPES:
+        for direction in ('east', 'south', 'west', 'north'):
+            vehicle = TrafficVehicle(200, 150, vehicle_type, direction)
+            vehicle.headlights_on = direction in ('east', 'west')
+            vehicle.braking = direction == 'south'
+            vehicle.turn_signal = 'left'
+            vehicle.emergency_active = True
+
+            cached = pygame.Surface((400, 300))
+            direct = pygame.Surface((400, 300))
+            vehicle.render(cached, camera)
+            _reference_render(vehicle, direct, camera)
+            assert _same_pixels(cached, direct), (vehicle_type, direction)
+
+    print("  ✓ Lane headings render exactly as before")
+    print()
+
+
+def test_sprites_are_reused():
+    """Test that vehicles sharing a look share one sprite."""
+    print("Testing sprite reuse...")
+
+    cache = VehicleSpriteCache(max_sprites=8)
+    a = cache.get_sprite('car', 32, 20, (180, 50, 50), 1.0, 90)
+    b = cache.get_sprite('car', 32, 20, (180, 50, 50), 1.0, 91)
+    assert a is b
+    assert cache.get_stats() == {'cached_sprites': 1, 'hits': 1, 'misses': 1}
+
+    # Headings snap to ANGLE_STEPS directions
+    assert quantize_angle(360) == 0
+    assert quantize_angle(-90) == quantize_angle(270) == ANGLE_STEPS * 3 // 4
+
+    # Lights and window style are part of the look
+    assert cache.get_sprite('car', 32, 20, (180, 50, 50), 1.0, 90, lights=1) is not a
+    assert cache.get_sprite('car', 32, 20, (180, 50, 50), 1.0, 90, rear_window=False) is not a
+
+    # Oldest sprites are dropped beyond the budget
+    for angle in range(0, 360, 30):
+        cache.get_sprite('truck', 48, 24, (100, 80, 60), 1.0, angle)
+    assert len(cache.sprites) == 8
+
+    print("  ✓ One sprite per look, bounded cache")
+    print()
+
+
+def test_baked_parked_vehicles():
+    """Test that parked vehicles baked into terrain chunks match direct drawing."""
+    print("Testing baked parked vehicles...")
+
+    grid = Grid(40, 30)
+    camera = Camera(800, 600)
+    manager = TrafficManager(grid, road_network=None)
+
+    # Two of them straddle chunk boundaries
+    chunk_pixels = 16 * grid.tile_size
+    positions = [(100, 100, 'east'), (chunk_pixels, 200, 'north'),
+                 (300, chunk_pixels - 5, 'south'), (600, 400, 'west')]
+    for x, y, direction in positions:
+        manager.parked_vehicles.append(ParkedVehicle(x, y, 'car', direction))
+
+    direct = pygame.Surface((800, 600))
+    grid.render(direct, camera, show_grid=False)
+    manager.render(direct, camera)
+
+    grid.terrain_cache = TerrainCache(grid)
+    manager.bake_parked_vehicles = True
+    baked = pygame.Surface((800, 600))
+    grid.render(baked, camera, show_grid=False)
+    manager.render(baked, camera)
+    assert grid.terrain_cache.get_stats()['decals'] == 4
+
+    # Chunks rebuild with the decals the next frame
+    grid.render(baked, camera, show_grid=False)
+    manager.render(baked, camera)
+    assert _same_pixels(baked, direct)
+
+    # A tile redrawn under a car keeps the car on top
+    grid.get_tile(3, 3).occupied = True
+    grid.get_tile(3, 3).occupied = False
+    grid.render(baked, camera, show_grid=False)
+    assert _same_pixels(baked, direct)
+
+    print("  ✓ Baked decals match per-frame drawing")
+    print()
+
+
+def test_render_speed():
+    """Test that repeated frames render from the cache without drawing sprites."""
+    print("Testing render speed...")
+
+    screen = pygame.Surface((800, 600))
+    camera = Camera(800, 600)
+    vehicles = [TrafficVehicle(40 + (i % 20) * 38, 40 + (i // 20) * 50, 'car',
+                               ('east', 'south', 'west', 'north')[i % 4]) for i in range(200)]
+    cache = get_vehicle_sprite_cache()
+
+    for vehicle in vehicles:
+        vehicle.render(screen, camera)
+    stats = cache.get_stats()
+
+    start = time.perf_counter()
+    for _ in range(5):
+        for vehicle in vehicles:
+            vehicle.render(screen, camera)
+    cached = time.perf_counter() - start
+
+    # Every repeated render is a hit; nothing new is drawn or stored
+    after = cache.get_stats()
+    assert after['misses'] == stats['misses']
+    assert after['hits'] == stats['hits'] + 5 * len(vehicles)
+    assert after['cached_sprites'] == stats['cached_sprites']
+
+    start = time.perf_counter()
+    for _ in range(5):
+        for vehicle in vehicles:
+            _reference_render(vehicle, screen, camera)
+    direct = time.perf_counter() - start
+
+    print(f"  200 vehicles x 5 frames: cached {cached * 1000:.1f} ms, direct {direct * 1000:.1f} ms")
+    print(f"  {cache}")
+
+    print("  ✓ Repeated frames served from the cache")
+    print()
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("VEHICLE SPRITE TESTS")
+    print("=" * 60)
+    print()
+
+    test_sprites_match_direct_drawing()
+    test_sprites_are_reused()
+    test_baked_parked_vehicles()
+    test_render_speed()
+
+    print("=" * 60)
+    print("ALL VEHICLE SPRITE TESTS PASSED!")
+    print("=" * 60)
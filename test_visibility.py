@@ -0,0 +1,181 @@
+"""
+Tests for the shared visibility module.
+
+Tests the DDA ray tracer against a brute-force segment/tile intersection,
+the batched tracer against the single-ray one, bitmap maintenance on tile
+changes, and path smoothing through the shared tracer.
+"""
+
+import sys
+import os
+import math
+import random
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import numpy as np
+from src.world.grid import Grid
+from src.world.tile import TileType
+from src.world.visibility import trace_clear, trace_clear_many, VisibilityMap
+from src.systems.pathfinding import Pathfinder
+
+
+def _segment_hits_tile(x0, y0, x1, y1, tx, ty):
+    """Liang-Barsky clip of a segment against the tile square."""
+    t0, t1 = 0.0, 1.0
+    dx, dy = x1 - x0, y1 - y0
+    for p, q in ((-dx, x0 - tx), (dx, tx + 1 - x0), (-dy, y0 - ty), (dy, ty + 1 - y0)):
+        if p == 0:
+            if q < 0:
+                return False
+        else:
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+    return t0 < t1
+
+
+def _brute_force_clear(blocked, x0, y0, x1, y1):
+    height, width = blocked.shape
+    start = (math.floor(x0), math.floor(y0))
+    end = (math.floor(x1), math.floor(y1))
+    for ty in range(max(min(start[1], end[1]), 0), min(max(start[1], end[1]) + 1, height)):
+        for tx in range(max(min(start[0], end[0]), 0), min(max(start[0], end[0]) + 1, width)):
+            if (tx, ty) in (start, end) or not blocked[ty, tx]:
+                continue
+            if _segment_hits_tile(x0, y0, x1, y1, tx, ty):
+                return False
+    return True
+
+
+def test_trace_matches_brute_force():
+    """Test that the DDA visits exactly the tiles a segment crosses."""
+    print("Testing DDA traversal...")
+
+    rng = random.Random(5)
+    width, height = 25, 18
+    blocked = np.zeros((height, width), dtype=bool)
+    for _ in range(90):
+        blocked[rng.randrange(height), rng.randrange(width)] = True
+    clear = np.pad(~blocked, 1, constant_values=True).astype(np.uint8).tobytes()
+
+    rays = []
+    for _ in range(3000):
+        ray = (rng.uniform(0, width), rng.uniform(0, height),
+               rng.uniform(0, width), rng.uniform(0, height))
+        rays.append(ray)
+        assert trace_clear(clear, width, height, *ray, outside_clear=True) == _brute_force_clear(blocked, *ray)
+
+    # Batched results agree ray for ray
+    batched = trace_clear_many(clear, width, height, *zip(*rays), outside_clear=True)
+    single = [trace_clear(clear, width, height, *ray, outside_clear=True) for ray in rays]
+    assert batched.tolist() == single
+    assert 0 < sum(single) < len(single)
+
+    print("  ✓ Single and batched traces match brute force")
+    print()
+
+
+def test_corners_and_edges():
+    """Test rays through tile corners and beyond the grid."""
+    print("Testing corner cases...")
+
+    blocked = np.zeros((5, 5), dtype=bool)
+    blocked[1, 2] = True
+    clear = np.pad(~blocked, 1, constant_values=True).astype(np.uint8).tobytes()
+
+    # Exactly through the corner shared by (1,1), (2,1), (1,2), (2,2)
+    assert not trace_clear(clear, 5, 5, 1.5, 0.5, 3.5, 2.5)
+    assert trace_clear(clear, 5, 5, 0.5, 2.5, 2.5, 4.5)
+
+    # Outside tiles follow the outside_clear flag
+    assert trace_clear(clear, 5, 5, -2.5, 0.5, 1.5, 0.5, outside_clear=True)
+    assert not trace_clear(clear, 5, 5, -2.5, 0.5, 1.5, 0.5, outside_clear=False)
+    assert trace_clear_many(clear, 5, 5, [1.5, -2.5], [0.5, 0.5], [3.5, 1.5], [2.5, 0.5],
+                            outside_clear=True).tolist() == [False, True]
+
+    print("  ✓ Corners and edges handled")
+    print()
+
+
+def test_map_follows_tile_changes():
+    """Test that the sight bitmap tracks single and bulk tile changes."""
+    print("Testing visibility map maintenance...")
+
+    grid = Grid(20, 20, 32)
+    visibility = grid.get_visibility()
+    assert visibility is grid.get_visibility()
+    assert visibility.has_line_of_sight(0.5, 5.5, 10.5, 5.5)
+    rebuilds = visibility.rebuilds
+
+    grid.set_tile_type(5, 5, TileType.BUILDING)
+    assert visibility.blocks_sight(5, 5)
+    assert not visibility.has_line_of_sight(0.5, 5.5, 10.5, 5.5)
+
+    # Occupancy and roads don't block sight
+    grid.set_tile_type(5, 5, TileType.ROAD_DIRT)
+    grid.get_tile(6, 5).occupied = True
+    assert visibility.has_line_of_sight(0.5, 5.5, 10.5, 5.5)
+    assert visibility.rebuilds == rebuilds
+
+    # Layer writes without events are picked up through the store version
+    grid.store.tile_type[5, 7] = TileType.FACTORY
+    grid.store.refresh_walkability()
+    assert not visibility.has_line_of_sight(0.5, 5.5, 10.5, 5.5)
+    assert visibility.rebuilds == rebuilds + 1
+
+    fresh = VisibilityMap(grid.store)
+    fresh.sync()
+    assert fresh.clear == visibility.clear
+
+    print("  ✓ Bitmap stays in sync")
+    print()
+
+
+def test_smoothed_paths_stay_walkable():
+    """Test that smoothed path segments never cross blocked tiles."""
+    print("Testing path smoothing...")
+
+    rng = random.Random(9)
+    grid = Grid(40, 40, 32)
+    for _ in range(250):
+        grid.get_tile(rng.randrange(40), rng.randrange(40)).occupied = True
+    pathfinder = Pathfinder(grid, max_nodes=10 ** 6)
+
+    blocked = ~grid.store.passable_mask()
+    checked = 0
+    for _ in range(40):
+        start = (rng.randrange(40), rng.randrange(40))
+        goal = (rng.randrange(40), rng.randrange(40))
+        path = pathfinder.find_path(start, goal)
+        if not path:
+            continue
+        smoothed = pathfinder.smooth_path(path)
+        assert smoothed[0] == path[0] and smoothed[-1] == path[-1]
+        assert len(smoothed) <= len(path)
+        for (x0, y0), (x1, y1) in zip(smoothed, smoothed[1:]):
+            assert _brute_force_clear(blocked, x0 + 0.5, y0 + 0.5, x1 + 0.5, y1 + 0.5)
+        checked += 1
+    assert checked > 20
+
+    print("  ✓ Smoothed segments are clear")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("VISIBILITY TESTS")
+    print("=" * 60)
+    print()
+
+    test_trace_matches_brute_force()
+    test_corners_and_edges()
+    test_map_follows_tile_changes()
+    test_smoothed_paths_stay_walkable()
+
+    print("=" * 60)
+    print("ALL VISIBILITY TESTS PASSED!")
+    print("=" * 60)
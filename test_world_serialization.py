@@ -0,0 +1,248 @@
+"""
+Tests for saving and loading a whole game world.
+
+Tests that every manager's state survives a save and load, that loading
+skips world generation, that a loaded game keeps running, and that a save
+can be loaded into a running game.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import numpy as np
+from src.core.game import Game
+from src.world import grid as grid_module
+from src.entities.entity import Entity
+from src.systems.save_manager import SaveManager
+from src.utils.serialization import pack_objects, unpack_objects, SerializationError
+from src.systems.material_inventory import MaterialSource
+
+
+def _played_game(ticks=200):
+    """Headless game that has run for a while, with some extra state."""
+    game = Game(headless=True)
+    for _ in range(ticks):
+        game.tick()
+    game.resources.money = 4321.5
+    game.material_inventory.add_material('copper', 12.0, MaterialSource.WORKING_VEHICLE)
+    game.suspicion.add_suspicion(25.0, "test")
+    game.pollution.levels[10, 10] = 42.0
+    game.hour = 14
+    return game
+
+
+def _save_and_load(game, directory):
+    """Save a game and read the saved state back."""
+    manager = SaveManager(save_directory=directory)
+    assert manager.save_game(SaveManager.serialize_game_state(game), "world")
+    return manager.load_game("world")
+
+
+def test_pack_objects():
+    """Test column-wise saving of plain objects."""
+    print("Testing object packing...")
+
+    class Plain:
+        pass
+
+    first, second = Plain(), Plain()
+    first.__dict__.update(x=1.5, tags={'a'}, pos=(1, 2), name='one')
+    second.__dict__.update(x=2.5, tags=set(), pos=(3, 4))
+    packed = pack_objects([first, second])
+    assert isinstance(packed['groups'][0]['x'], np.ndarray)
+
+    # Classes outside the game's packages are never loaded
+    try:
+        unpack_objects(packed)
+        assert False, "loaded a class from __main__"
+    except SerializationError:
+        pass
+
+    print("  ✓ Columns packed, foreign classes refused")
+    print()
+
+
+def test_round_trip():
+    """Test that a loaded game matches the saved one."""
+    print("Testing world round trip...")
+
+    game = _played_game()
+    with tempfile.TemporaryDirectory() as directory:
+        state = _save_and_load(game, directory)
+    loaded = Game(headless=True, game_state=state)
+
+    assert np.array_equal(loaded.grid.store.terrain_type, game.grid.store.terrain_type)
+    assert loaded.road_network.road_tiles == game.road_network.road_tiles
+    assert len(loaded.grid.city_buildings) == len(game.grid.city_buildings)
+
+    assert loaded.resources.money == 4321.5
+    assert loaded.material_inventory.get_illegal_material_count() == \
+        game.material_inventory.get_illegal_material_count()
+    assert loaded.suspicion.suspicion_level == game.suspicion.suspicion_level
+    assert loaded.pollution.levels[10, 10] == game.pollution.levels[10, 10]
+    assert (loaded.day, loaded.hour, loaded.minute) == (game.day, game.hour, game.minute)
+    assert loaded.tick_count == game.tick_count
+
+    assert sorted(loaded.buildings.buildings) == sorted(game.buildings.buildings)
+    assert loaded.factory is not None and loaded.factory.building_type == 'factory'
+    assert [(r.x, r.y, r.state) for r in loaded.entities.robots] == \
+        [(r.x, r.y, r.state) for r in game.entities.robots]
+    assert len(loaded.entities.collectibles) == len(game.entities.collectibles)
+
+    for name in ('npcs', 'vehicles', 'fences'):
+        saved_items = getattr(getattr(game, name), name)
+        loaded_items = getattr(getattr(loaded, name), name)
+        assert [(type(i), i.world_x, i.world_y) for i in loaded_items] == \
+            [(type(i), i.world_x, i.world_y) for i in saved_items], name
+    assert len(loaded.prop_manager.props) == len(game.prop_manager.props)
+    assert len(loaded.camera_manager.cameras) == len(game.camera_manager.cameras)
+    assert len(loaded.police.police_officers) == len(game.police.police_officers)
+    assert len(loaded.bus_manager.routes) == len(game.bus_manager.routes)
+
+    # References by id point at loaded objects
+    npc_ids = {npc.id for npc in loaded.npcs.npcs}
+    bus_ids = {bus.id for bus in loaded.bus_manager.buses}
+    for bus in loaded.bus_manager.buses:
+        assert bus.passengers <= npc_ids
+    for npc in loaded.npcs.npcs:
+        assert npc.current_bus_id is None or npc.current_bus_id in bus_ids
+
+    print(f"  {len(loaded.npcs.npcs)} NPCs, {len(loaded.prop_manager.props)} props restored")
+    print("  ✓ Every manager restored")
+    print()
+
+
+def test_load_skips_generation():
+    """Test that loading a world does not run the world generators."""
+    print("Testing load without generation...")
+
+    game = Game(headless=True)
+
+    def generator_called(*args, **kwargs):
+        raise AssertionError("world generator used while loading")
+
+    generators = (grid_module.CityGenerator, grid_module.RiverGenerator)
+    with tempfile.TemporaryDirectory() as directory:
+        manager = SaveManager(save_directory=directory)
+        manager.save_game(SaveManager.serialize_game_state(game), "world")
+
+        grid_module.CityGenerator = grid_module.RiverGenerator = generator_called
+        try:
+            loaded = Game(headless=True, game_state=manager.load_game("world"))
+        finally:
+            grid_module.CityGenerator, grid_module.RiverGenerator = generators
+
+    assert np.array_equal(loaded.grid.store.tile_type, game.grid.store.tile_type)
+    assert np.array_equal(loaded.grid.store.terrain_type, game.grid.store.terrain_type)
+
+    print("  ✓ City and river generators never run on load")
+    print()
+
+
+def test_loaded_game_keeps_running():
+    """Test that a loaded game simulates and creates new entities normally."""
+    print("Testing simulation after load...")
+
+    game = _played_game(ticks=50)
+    with tempfile.TemporaryDirectory() as directory:
+        state = _save_and_load(game, directory)
+    loaded = Game(headless=True, game_state=state)
+
+    for _ in range(300):
+        loaded.tick()
+    assert loaded.tick_count == game.tick_count + 300
+
+    existing = {entity.id for entity in loaded.buildings.buildings.values()}
+    existing.update(loaded.entities.entities)
+    robot = loaded.entities.create_robot(100, 100)
+    assert robot.id not in existing
+    assert robot.id < Entity._next_id
+
+    # A loaded game saves again
+    assert SaveManager.serialize_game_state(loaded)["npcs"]
+
+    print("  ✓ Loaded game runs and saves")
+    print()
+
+
+def test_vehicle_references_not_saved():
+    """Test that a vehicle following another one can be saved."""
+    print("Testing vehicle-ahead references...")
+
+    game = Game(headless=True)
+    game.traffic_manager.clear_all_vehicles()
+    road_tiles = sorted(game.road_network.road_tiles)
+    vehicles = []
+    for x, y in road_tiles:
+        vehicle = game.traffic_manager.spawn_vehicle_at(x, y)
+        if vehicle is not None:
+            vehicles.append(vehicle)
+        if len(vehicles) == 2:
+            break
+    assert len(vehicles) == 2
+    vehicles[0].vehicle_ahead = vehicles[1]
+
+    with tempfile.TemporaryDirectory() as directory:
+        state = _save_and_load(game, directory)
+    loaded = Game(headless=True, game_state=state)
+
+    loaded_vehicles = loaded.traffic_manager.vehicles
+    assert len(loaded_vehicles) == len(game.traffic_manager.vehicles) == 2
+    assert all(vehicle.vehicle_ahead is None for vehicle in loaded_vehicles)
+    assert vehicles[0].vehicle_ahead is vehicles[1]
+    for _ in range(20):
+        loaded.tick()
+
+    print("  ✓ vehicle_ahead left out of the save and reset on load")
+    print()
+
+
+def test_load_into_running_game():
+    """Test loading a save over a game in progress."""
+    print("Testing in-place load...")
+
+    game = _played_game(ticks=20)
+    with tempfile.TemporaryDirectory() as directory:
+        game.save_manager = SaveManager(save_directory=directory)
+        assert game.save_game("slot")
+        robots = len(game.entities.robots)
+
+        game.resources.money = 0.0
+        game.entities.create_robot(200, 200)
+        game.buildings.remove_building(game.factory.id)
+        for _ in range(20):
+            game.tick()
+
+        assert game.load_game("slot")
+
+    assert game.resources.money == 4321.5
+    assert len(game.entities.robots) == robots
+    assert game.factory is not None
+    assert game.buildings.get_building_at(game.factory.grid_x, game.factory.grid_y) is game.factory
+    for _ in range(20):
+        game.tick()
+
+    print("  ✓ Running game replaced by the save")
+    print()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("WORLD SERIALIZATION TESTS")
+    print("=" * 60)
+    print()
+
+    test_pack_objects()
+    test_round_trip()
+    test_load_skips_generation()
+    test_loaded_game_keeps_running()
+    test_vehicle_references_not_saved()
+    test_load_into_running_game()
+
+    print("=" * 60)
+    print("ALL WORLD SERIALIZATION TESTS PASSED!")
+    print("=" * 60)